@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""Replay document arrival traces through workflow admission control.
+
+Drives idp_common.admission.AdmissionController the way queue_processor and
+workflow_tracker do, against an in-memory ConcurrencyTable stand-in, one
+simulated second at a time:
+  - arrivals join the queue; queue_processor attempts up to --poll-rate
+    visible messages per second
+  - an admitted document runs for --base-seconds + pages * --seconds-per-page,
+    then its ticket is released
+  - a deferred or throttled message becomes visible again after --visibility
+    seconds (the DocumentQueue visibility timeout)
+The stand-in throttles a counter item past --key-wcu writes per second,
+DynamoDB's per-item write limit; rejected conditional writes count too.
+
+Each admission setting reports, for the same trace:
+  makespan   seconds until the last document completes
+  wait p50/p95 seconds from arrival to admission (overall and per lane)
+  pages peak/avg pages in flight (the Bedrock load the capacity is protecting)
+  hot key    peak writes per second on the busiest counter item
+  throttled  counter writes rejected for exceeding --key-wcu
+
+The trace is synthetic (--docs arrivals at --rate per second, mostly short
+documents with a long tail, 10% high / 70% normal / 20% low priority) unless
+--trace names a CSV of arrival_s,pages[,priority] rows. Local only.
+
+Usage:
+  export PYTHONPATH=$PWD/lib/idp_common_pkg AWS_DEFAULT_REGION=us-east-1
+  python3 benchmarks/micro/admission.py [--docs 6000] [--rate 1500] \
+      [--max-concurrent 100] [--page-capacity 2000] [--trace arrivals.csv]
+"""
+
+import argparse
+import csv
+import heapq
+import logging
+import random
+from collections import defaultdict, deque
+
+from botocore.exceptions import ClientError
+
+from idp_common import admission
+from idp_common.admission import AdmissionController
+
+
+class ConcurrencyTable:
+    """In-memory ConcurrencyTable supporting the controller's counter writes."""
+
+    def __init__(self, key_wcu):
+        self.key_wcu = key_wcu
+        self.counts = defaultdict(int)
+        self.now = 0
+        self.writes = defaultdict(int)  # (second, key) -> writes
+        self.throttled = 0
+
+    def _error(self, code):
+        return ClientError({"Error": {"Code": code, "Message": code}}, "UpdateItem")
+
+    def update_item(self, Key, UpdateExpression, ExpressionAttributeValues, **kwargs):
+        key = Key["counter_id"]
+        if self.writes[(self.now, key)] >= self.key_wcu:
+            self.throttled += 1
+            raise self._error("ProvisionedThroughputExceededException")
+        self.writes[(self.now, key)] += 1
+        values = ExpressionAttributeValues
+        condition = kwargs.get("ConditionExpression")
+        if condition and self.counts[key] > values[":room"]:
+            raise self._error("ConditionalCheckFailedException")
+        self.counts[key] += values[":inc"] if ":inc" in values else values[":dec"]
+        return {"Attributes": {"active_count": self.counts[key]}}
+
+    def hot_key_peak(self):
+        return max(self.writes.values(), default=0)
+
+
+def synthetic_trace(docs, rate, seed):
+    rng = random.Random(seed)
+    trace = []
+    for i in range(docs):
+        roll = rng.random()
+        if roll < 0.80:
+            pages = rng.randint(1, 5)
+        elif roll < 0.99:
+            pages = rng.randint(10, 60)
+        else:
+            pages = rng.randint(100, 400)
+        lane = rng.choices(admission.LANES, weights=(10, 70, 20))[0]
+        trace.append((i // rate, pages, lane))
+    return trace
+
+
+def load_trace(path):
+    trace = []
+    with open(path, newline="") as f:
+        for row in csv.reader(f):
+            if not row or not row[0].strip()[0].isdigit():
+                continue
+            lane = row[2].strip() if len(row) > 2 else admission.LANE_NORMAL
+            trace.append((int(float(row[0])), int(row[1]), lane))
+    return sorted(trace)
+
+
+def percentile(values, q):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(int(len(values) * q), len(values) - 1)]
+
+
+def simulate(trace, controller, args):
+    table = controller.table
+    arrivals = deque((t, i) for i, (t, _, _) in enumerate(trace))
+    visible = deque()
+    retries = []  # (visible_at, doc)
+    running = []  # (finish_at, doc, ticket)
+    admitted_at = {}
+    pages_in_flight = peak_pages = pages_seconds = 0
+    done = 0
+    now = 0
+    while done < len(trace):
+        table.now = now
+        while running and running[0][0] <= now:
+            _, doc, ticket = heapq.heappop(running)
+            controller.release(ticket)
+            pages_in_flight -= trace[doc][1]
+            done += 1
+        while arrivals and arrivals[0][0] <= now:
+            visible.append(arrivals.popleft()[1])
+        while retries and retries[0][0] <= now:
+            visible.append(heapq.heappop(retries)[1])
+        for _ in range(min(args.poll_rate, len(visible))):
+            doc = visible.popleft()
+            _, pages, lane = trace[doc]
+            try:
+                ticket = controller.try_acquire(
+                    f"doc-{doc}", weight=controller.weight(page_count=pages), lane=lane
+                )
+            except ClientError:
+                ticket = None
+            if ticket is None:
+                heapq.heappush(retries, (now + args.visibility, doc))
+                continue
+            admitted_at[doc] = now
+            pages_in_flight += pages
+            finish = now + args.base_seconds + pages * args.seconds_per_page
+            heapq.heappush(running, (int(finish), doc, ticket))
+        peak_pages = max(peak_pages, pages_in_flight)
+        pages_seconds += pages_in_flight
+        now += 1
+
+    waits = defaultdict(list)
+    for doc, start in admitted_at.items():
+        waits["all"].append(start - trace[doc][0])
+        waits[trace[doc][2]].append(start - trace[doc][0])
+    return {
+        "makespan": now,
+        "waits": waits,
+        "peak_pages": peak_pages,
+        "avg_pages": pages_seconds / max(now, 1),
+        "hot_key": table.hot_key_peak(),
+        "throttled": table.throttled,
+    }
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--docs", type=int, default=6000)
+    ap.add_argument("--rate", type=int, default=1500, help="arrivals per second")
+    ap.add_argument("--trace", help="CSV of arrival_s,pages[,priority]")
+    ap.add_argument("--max-concurrent", type=int, default=100)
+    ap.add_argument("--page-capacity", type=int, default=2000)
+    ap.add_argument("--shards", type=int, default=8)
+    ap.add_argument("--lanes", default="normal=0.9,low=0.6")
+    ap.add_argument("--poll-rate", type=int, default=3000)
+    ap.add_argument("--visibility", type=int, default=30)
+    ap.add_argument("--key-wcu", type=int, default=1000)
+    ap.add_argument("--base-seconds", type=float, default=20)
+    ap.add_argument("--seconds-per-page", type=float, default=0.5)
+    ap.add_argument("--seed", type=int, default=7)
+    args = ap.parse_args()
+    logging.getLogger("idp_common.admission").setLevel(logging.ERROR)
+
+    trace = (
+        load_trace(args.trace)
+        if args.trace
+        else synthetic_trace(args.docs, args.rate, args.seed)
+    )
+    lanes = admission.parse_lane_limits(args.lanes)
+    settings = [
+        ("documents x1 (current)", args.max_concurrent, 1, "documents", {}),
+        ("pages x1", args.page_capacity, 1, "pages", {}),
+        (f"pages x{args.shards}", args.page_capacity, args.shards, "pages", {}),
+        (
+            f"pages x{args.shards} lanes",
+            args.page_capacity,
+            args.shards,
+            "pages",
+            lanes,
+        ),
+    ]
+
+    print(
+        f"{len(trace)} documents, {sum(p for _, p, _ in trace)} pages; "
+        f"key limit {args.key_wcu} writes/s, poll {args.poll_rate} msgs/s"
+    )
+    print(
+        f"{'setting':24s} {'makespan':>8s} {'wait p50':>8s} {'p95':>6s} "
+        f"{'high p95':>8s} {'low p95':>7s} {'pages peak':>10s} {'avg':>6s} "
+        f"{'hot key':>7s} {'throttled':>9s}"
+    )
+    for name, capacity, shards, weight_mode, lane_limits in settings:
+        controller = AdmissionController(
+            ConcurrencyTable(args.key_wcu),
+            capacity=capacity,
+            shards=shards,
+            weight_mode=weight_mode,
+            lane_limits=lane_limits,
+        )
+        r = simulate(trace, controller, args)
+        w = r["waits"]
+        print(
+            f"{name:24s} {r['makespan']:8d} {percentile(w['all'], 0.5):8.0f} "
+            f"{percentile(w['all'], 0.95):6.0f} {percentile(w['high'], 0.95):8.0f} "
+            f"{percentile(w['low'], 0.95):7.0f} {r['peak_pages']:10d} "
+            f"{r['avg_pages']:6.0f} {r['hot_key']:7d} {r['throttled']:9d}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""Measure BatchProcessor.download_batch_results throughput.
+
+Puts --files small result objects in a moto OutputBucket, then downloads the
+batch into a temp directory. moto answers in-process, so every download_file
+call is delayed by --s3-ms to stand in for the network round trip that bounds
+a real download. Modes:
+  sequential      max_workers=1 (previous one-at-a-time behavior)
+  N workers       max_workers=N for each --workers value
+  re-run          the same output directory again: every file is unchanged
+                  and skipped without a request
+Reports wall time and files/sec. Local only: uses moto.
+
+Usage:
+  export PYTHONPATH=$PWD/lib/idp_sdk AWS_DEFAULT_REGION=us-east-1
+  python3 benchmarks/micro/batch_download.py [--files 400] [--s3-ms 40] \
+      [--workers 4,16,32]
+"""
+
+import argparse
+import functools
+import logging
+import os
+import tempfile
+import time
+from unittest.mock import patch
+
+import boto3
+from moto import mock_aws
+
+# Benchmarks the download engine directly, below the IDPClient surface
+from idp_sdk._core.batch_processor import BatchProcessor  # noqa: TID251
+
+
+def with_latency(fn, seconds):
+    @functools.wraps(fn)
+    def call(*args, **kwargs):
+        time.sleep(seconds)
+        return fn(*args, **kwargs)
+
+    return call
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--files", type=int, default=400)
+    ap.add_argument("--s3-ms", type=float, default=40)
+    ap.add_argument("--workers", default="4,16,32")
+    args = ap.parse_args()
+    logging.disable(logging.INFO)
+
+    with (
+        mock_aws(),
+        tempfile.TemporaryDirectory() as tmp,
+        patch("idp_sdk._core.batch_processor.StackInfo") as stack_info,
+    ):
+        stack_info.return_value.validate_stack.return_value = True
+        stack_info.return_value.get_resources.return_value = {
+            "InputBucket": "bench-input",
+            "OutputBucket": "bench-output",
+        }
+        s3 = boto3.client("s3")
+        s3.create_bucket(Bucket="bench-output")
+        for i in range(args.files):
+            s3.put_object(
+                Bucket="bench-output",
+                Key=f"bench/doc-{i // 4:05d}.pdf/sections/{i % 4}/result.json",
+                Body=os.urandom(4096),
+            )
+
+        processor = BatchProcessor("bench-stack")
+        processor.s3.download_file = with_latency(
+            processor.s3.download_file, args.s3_ms / 1000
+        )
+
+        def run(output_dir, workers):
+            t0 = time.perf_counter()
+            result = processor.download_batch_results(
+                "bench", output_dir, ["all"], max_workers=workers
+            )
+            elapsed = time.perf_counter() - t0
+            return elapsed, result["files_listed"] / elapsed
+
+        print(f"{args.files} files, {args.s3_ms:.0f} ms per S3 request")
+        rows = []
+        modes = [("sequential", 1)] + [
+            (f"{w} workers", int(w)) for w in args.workers.split(",")
+        ]
+        for i, (name, workers) in enumerate(modes):
+            rows.append((name, *run(os.path.join(tmp, f"out-{i}"), workers)))
+        last = os.path.join(tmp, f"out-{len(modes) - 1}")
+        rows.append(("re-run", *run(last, modes[-1][1])))
+
+        print(f"{'mode':14s} {'wall s':>8s} {'files/sec':>10s}")
+        for name, elapsed, rate in rows:
+            print(f"{name:14s} {elapsed:8.2f} {rate:10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""Measure BatchProcessor submission throughput with the parallel worker pool.
+
+Writes --docs small local files, then submits them with
+process_batch_from_directory against moto buckets. moto answers in-process,
+so every upload_file / copy_object / put_object call is delayed by --s3-ms to
+stand in for the network round trip that bounds a real submission. Modes:
+  sequential      max_workers=1 (previous one-at-a-time behavior)
+  N workers       max_workers=N for each --workers value
+  resume          the same batch with --resume after 90% was journaled:
+                  only the missing tail is submitted
+Reports wall time and docs/sec. Local only: uses moto.
+
+Usage:
+  export PYTHONPATH=$PWD/lib/idp_sdk AWS_DEFAULT_REGION=us-east-1
+  python3 benchmarks/micro/batch_submit.py [--docs 400] [--s3-ms 40] \
+      [--workers 4,16,32]
+"""
+
+import argparse
+import functools
+import logging
+import os
+import tempfile
+import time
+from unittest.mock import patch
+
+import boto3
+from moto import mock_aws
+
+# Benchmarks the submission engine directly, below the IDPClient surface
+from idp_sdk._core.batch_processor import (  # noqa: TID251
+    BatchProcessor,
+    SubmissionJournal,
+)
+
+
+def with_latency(fn, seconds):
+    @functools.wraps(fn)
+    def call(*args, **kwargs):
+        time.sleep(seconds)
+        return fn(*args, **kwargs)
+
+    return call
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--docs", type=int, default=400)
+    ap.add_argument("--s3-ms", type=float, default=40)
+    ap.add_argument("--workers", default="4,16,32")
+    args = ap.parse_args()
+    logging.disable(logging.INFO)
+
+    with (
+        mock_aws(),
+        tempfile.TemporaryDirectory() as tmp,
+        patch("idp_sdk._core.batch_processor.StackInfo") as stack_info,
+    ):
+        stack_info.return_value.validate_stack.return_value = True
+        stack_info.return_value.get_resources.return_value = {
+            "InputBucket": "bench-input",
+            "OutputBucket": "bench-output",
+        }
+        s3 = boto3.client("s3")
+        s3.create_bucket(Bucket="bench-input")
+        s3.create_bucket(Bucket="bench-output")
+        docs_dir = os.path.join(tmp, "docs")
+        os.makedirs(docs_dir)
+        for i in range(args.docs):
+            with open(os.path.join(docs_dir, f"doc-{i:05d}.pdf"), "wb") as f:
+                f.write(b"%PDF-1.4 " + os.urandom(2048))
+
+        processor = BatchProcessor("bench-stack")
+        delay = args.s3_ms / 1000
+        for name in ("upload_file", "copy_object", "put_object"):
+            setattr(
+                processor.s3, name, with_latency(getattr(processor.s3, name), delay)
+            )
+        journals = os.path.join(tmp, "journals")
+
+        def run(batch_id, workers, resume=False):
+            t0 = time.perf_counter()
+            result = processor.process_batch_from_directory(
+                docs_dir,
+                batch_id=batch_id,
+                max_workers=workers,
+                resume=resume,
+                checkpoint_dir=journals,
+            )
+            elapsed = time.perf_counter() - t0
+            submitted = result["queued"] - result["resumed"]
+            return elapsed, submitted / elapsed
+
+        print(f"{args.docs} documents, {args.s3_ms:.0f} ms per S3 request")
+        print(f"{'mode':14s} {'wall s':>8s} {'docs/sec':>9s}")
+        modes = [("sequential", 1)] + [
+            (f"{w} workers", int(w)) for w in args.workers.split(",")
+        ]
+        for i, (name, workers) in enumerate(modes):
+            elapsed, rate = run(f"bench-{i}", workers)
+            print(f"{name:14s} {elapsed:8.2f} {rate:9.1f}")
+
+        # Resume: keep the first 90% of a finished journal, resubmit the rest
+        journal = SubmissionJournal.for_batch(f"bench-{len(modes) - 1}", journals)
+        with open(journal.path) as f:
+            lines = f.readlines()
+        with open(journal.path, "w") as f:
+            f.writelines(lines[: int(len(lines) * 0.9)])
+        elapsed, rate = run(f"bench-{len(modes) - 1}", modes[-1][1], resume=True)
+        print(f"{'resume (10%)':14s} {elapsed:8.2f} {rate:9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""Simulate a Bedrock throttling storm with and without adaptive concurrency.
+
+A fake Converse endpoint serves at most --capacity calls at a time (--latency-ms
+each) and answers anything beyond that with ThrottlingException after
+--throttle-ms, like a model whose quota is exhausted. Three caller pools share
+the model the way a processing Lambda does, each with its own BedrockClient:
+classification (--classification threads), OCR (--ocr) and assessment
+(--assessment), together issuing --calls invocations. Modes:
+  unlimited       BEDROCK_ADAPTIVE_CONCURRENCY=false (per-call backoff only)
+  adaptive        the shared per-model AIMD limiter
+Reports wall time, goodput (successful calls/sec), throttles returned by the
+fake endpoint, p50/p95 end-to-end call latency and the final model limit.
+Retry backoff is scaled by --backoff-scale so a run takes seconds, not minutes.
+Local only: no AWS calls.
+
+Usage:
+  export PYTHONPATH=$PWD/lib/idp_common_pkg AWS_DEFAULT_REGION=us-east-1
+  python3 benchmarks/micro/bedrock_concurrency.py [--calls 600] [--capacity 8] \
+      [--latency-ms 200] [--backoff-scale 0.1]
+"""
+
+import argparse
+import logging
+import os
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from botocore.exceptions import ClientError
+
+from idp_common.bedrock import concurrency
+from idp_common.bedrock.client import BedrockClient
+
+MODEL = "us.anthropic.claude-sonnet-5"
+
+
+class FakeBedrock:
+    """Converse endpoint that throttles calls beyond ``capacity`` in flight."""
+
+    def __init__(self, capacity, latency, throttle_latency):
+        self.capacity = capacity
+        self.latency = latency
+        self.throttle_latency = throttle_latency
+        self.in_flight = 0
+        self.throttles = 0
+        self.lock = threading.Lock()
+
+    def converse(self, **kwargs):
+        with self.lock:
+            admitted = self.in_flight < self.capacity
+            if admitted:
+                self.in_flight += 1
+            else:
+                self.throttles += 1
+        if not admitted:
+            time.sleep(self.throttle_latency)
+            raise ClientError(
+                {"Error": {"Code": "ThrottlingException", "Message": "Rate exceeded"}},
+                "Converse",
+            )
+        try:
+            time.sleep(self.latency)
+            return {
+                "output": {"message": {"content": [{"text": "ok"}]}},
+                "usage": {"inputTokens": 10, "outputTokens": 5, "totalTokens": 15},
+            }
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+
+def run(args, adaptive):
+    os.environ["BEDROCK_ADAPTIVE_CONCURRENCY"] = "true" if adaptive else "false"
+    concurrency.reset_model_limiters()
+    fake = FakeBedrock(args.capacity, args.latency_ms / 1000, args.throttle_ms / 1000)
+    pools = {
+        "classification": args.classification,
+        "ocr": args.ocr,
+        "assessment": args.assessment,
+    }
+    total_threads = sum(pools.values())
+    latencies = []
+    latencies_lock = threading.Lock()
+
+    def caller(client, calls):
+        for _ in range(calls):
+            t0 = time.perf_counter()
+            client.invoke_model(MODEL, "sys", [{"text": "hi"}])
+            with latencies_lock:
+                latencies.append(time.perf_counter() - t0)
+
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=total_threads) as pool:
+        futures = []
+        for threads in pools.values():
+            client = BedrockClient(
+                region="us-east-1",
+                metrics_enabled=False,
+                max_retries=30,
+                initial_backoff=2 * args.backoff_scale,
+                max_backoff=300 * args.backoff_scale,
+            )
+            client._client = fake
+            backoff = client._calculate_backoff
+            client._calculate_backoff = lambda n, b=backoff: b(n) * args.backoff_scale
+            for _ in range(threads):
+                futures.append(pool.submit(caller, client, args.calls // total_threads))
+        for future in futures:
+            future.result()
+    elapsed = time.perf_counter() - t0
+
+    latencies.sort()
+    snapshot = concurrency.get_limiter_snapshots().get(MODEL, {})
+    return {
+        "wall": elapsed,
+        "goodput": len(latencies) / elapsed,
+        "throttles": fake.throttles,
+        "p50": statistics.median(latencies),
+        "p95": latencies[int(len(latencies) * 0.95) - 1],
+        "limit": snapshot.get("limit", "-"),
+    }
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--calls", type=int, default=600)
+    ap.add_argument("--capacity", type=int, default=8)
+    ap.add_argument("--latency-ms", type=float, default=200)
+    ap.add_argument("--throttle-ms", type=float, default=20)
+    ap.add_argument("--classification", type=int, default=20)
+    ap.add_argument("--ocr", type=int, default=20)
+    ap.add_argument("--assessment", type=int, default=8)
+    ap.add_argument("--backoff-scale", type=float, default=0.1)
+    args = ap.parse_args()
+    logging.disable(logging.WARNING)
+
+    print(
+        f"{args.calls} calls from {args.classification}+{args.ocr}+{args.assessment} "
+        f"threads, model serves {args.capacity} at a time, "
+        f"{args.latency_ms:.0f} ms per call"
+    )
+    print(
+        f"{'mode':10s} {'wall s':>7s} {'calls/sec':>10s} {'throttles':>10s} "
+        f"{'p50 s':>7s} {'p95 s':>7s} {'limit':>6s}"
+    )
+    for name, adaptive in (("unlimited", False), ("adaptive", True)):
+        r = run(args, adaptive)
+        print(
+            f"{name:10s} {r['wall']:7.2f} {r['goodput']:10.1f} {r['throttles']:10d} "
+            f"{r['p50']:7.2f} {r['p95']:7.2f} {r['limit']!s:>6s}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""Measure bulk document deletion against one-document-at-a-time deletion.
+
+Seeds --documents documents (a document record, a list entry, --runs run
+records, an input object and --outputs output object versions each) in an
+in-memory tracking table and S3 fake where every API call takes --latency-ms
+and --throttle-pct of BatchWriteItem deletes come back unprocessed. Modes:
+  sequential      delete_documents (GetItem/DeleteItem/DeleteObject per item)
+  bulk            bulk_delete_documents (BatchGetItem, 25-item BatchWriteItem,
+                  1000-key DeleteObjects, --workers chunks of --chunk-size)
+Reports wall time, documents per second and API calls, and the dry-run
+preview of the bulk deletion.
+Local only: no AWS calls.
+
+Usage:
+  export PYTHONPATH=$PWD/lib/idp_common_pkg AWS_DEFAULT_REGION=us-east-1
+  python3 benchmarks/micro/bulk_delete.py [--documents 500] [--latency-ms 10] \
+      [--workers 8]
+"""
+
+import argparse
+import logging
+import random
+import threading
+import time
+from collections import Counter
+
+from idp_common import delete_documents as dd
+
+
+def _conditions(condition):
+    """Flatten a boto3 Key condition into [(operator, attribute, value)]."""
+    expression = condition.get_expression()
+    if expression["operator"] == "AND":
+        return [c for sub in expression["values"] for c in _conditions(sub)]
+    key, value = expression["values"]
+    return [(expression["operator"], key.name, value)]
+
+
+class FakeStore:
+    def __init__(self, latency, throttle, seed=7):
+        self.latency = latency
+        self.throttle = throttle
+        self.items = {}
+        self.objects = {}
+        self.calls = Counter()
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+
+    def call(self, name):
+        with self.lock:
+            self.calls[name] += 1
+        time.sleep(self.latency)
+
+
+class FakeTableClient:
+    def __init__(self, store):
+        self.store = store
+
+    def batch_get_item(self, RequestItems):
+        self.store.call("BatchGetItem")
+        ((table, request),) = RequestItems.items()
+        found = [
+            self.store.items[(k["PK"], k["SK"])]
+            for k in request["Keys"]
+            if (k["PK"], k["SK"]) in self.store.items
+        ]
+        return {"Responses": {table: found}, "UnprocessedKeys": {}}
+
+    def batch_write_item(self, RequestItems):
+        self.store.call("BatchWriteItem")
+        ((table, requests),) = RequestItems.items()
+        unprocessed = []
+        for request in requests:
+            with self.store.lock:
+                throttled = self.store.rng.random() < self.store.throttle
+            if throttled:
+                unprocessed.append(request)
+            else:
+                key = request["DeleteRequest"]["Key"]
+                self.store.items.pop((key["PK"], key["SK"]), None)
+        return {"UnprocessedItems": {table: unprocessed} if unprocessed else {}}
+
+    def query(self, KeyConditionExpression, ExpressionAttributeValues=None, **_):
+        self.store.call("Query")
+        items = list(self.store.items.values())
+        for operator, name, value in _conditions(KeyConditionExpression):
+            if operator == "=":
+                items = [i for i in items if i[name] == value]
+            else:
+                items = [i for i in items if i[name].startswith(value)]
+        if ExpressionAttributeValues:
+            obj_key = ExpressionAttributeValues[":obj_key"]
+            obj_id = ExpressionAttributeValues[":obj_id"]
+            items = [
+                i for i in items if i.get("ObjectKey") == obj_key or obj_id in i["SK"]
+            ]
+        return {"Items": items}
+
+
+class FakeTable:
+    name = "TrackingTable"
+
+    def __init__(self, store):
+        self.store = store
+        self.meta = type("Meta", (), {"client": FakeTableClient(store)})()
+
+    def get_item(self, Key):
+        self.store.call("GetItem")
+        item = self.store.items.get((Key["PK"], Key["SK"]))
+        return {"Item": item} if item else {}
+
+    def delete_item(self, Key, ReturnValues=None):
+        self.store.call("DeleteItem")
+        item = self.store.items.pop((Key["PK"], Key["SK"]), None)
+        return {"Attributes": item} if item and ReturnValues else {}
+
+    def query(self, **kwargs):
+        return self.meta.client.query(**kwargs)
+
+
+class FakeS3:
+    def __init__(self, store):
+        self.store = store
+
+    def delete_object(self, Bucket, Key):
+        self.store.call("DeleteObject")
+        self.store.objects.pop((Bucket, Key, None), None)
+
+    def delete_objects(self, Bucket, Delete):
+        self.store.call("DeleteObjects")
+        for obj in Delete["Objects"]:
+            self.store.objects.pop((Bucket, obj["Key"], obj.get("VersionId")), None)
+        return {}
+
+    def get_paginator(self, name):
+        return self
+
+    def paginate(self, Bucket, Prefix):
+        self.store.call("ListObjectVersions")
+        versions = [
+            {"Key": key, "VersionId": version}
+            for bucket, key, version in list(self.store.objects)
+            if bucket == Bucket and key.startswith(Prefix)
+        ]
+        yield {"Versions": versions}
+
+
+def seed(store, args):
+    keys = []
+    for i in range(args.documents):
+        key = f"bench/doc-{i:05d}.pdf"
+        queued = f"2025-09-10T{i % 24:02d}:{i % 60:02d}:00+00:00"
+        date_part, shard = dd.calculate_shard(queued)
+        list_key = (f"list#{date_part}#s#{shard}", f"ts#{queued}#id#{key}")
+        records = [(f"doc#{key}", "none"), list_key]
+        records += [(f"doc#{key}", f"run#{r}") for r in range(args.runs)]
+        for pk, sk in records:
+            store.items[(pk, sk)] = {
+                "PK": pk,
+                "SK": sk,
+                "ObjectKey": key,
+                "QueuedTime": queued,
+            }
+        store.objects[("input", key, None)] = b""
+        for v in range(args.outputs):
+            store.objects[("output", f"{key}/out/{v % 3}.json", f"v{v}")] = b""
+        keys.append(key)
+    return keys
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--documents", type=int, default=500)
+    ap.add_argument("--runs", type=int, default=2)
+    ap.add_argument("--outputs", type=int, default=6)
+    ap.add_argument("--latency-ms", type=float, default=10)
+    ap.add_argument("--throttle-pct", type=float, default=2)
+    ap.add_argument("--workers", type=int, default=8)
+    ap.add_argument("--chunk-size", type=int, default=dd.DEFAULT_BULK_CHUNK_SIZE)
+    args = ap.parse_args()
+    logging.disable(logging.WARNING)
+
+    print(
+        f"{args.documents} documents ({args.runs} runs, {args.outputs} output "
+        f"versions each), {args.latency_ms:.0f} ms per API call, "
+        f"{args.throttle_pct:.0f}% of batched deletes throttled"
+    )
+    print(f"{'mode':12s} {'wall s':>8s} {'docs/s':>8s} {'API calls':>10s} {'ok':>6s}")
+    for name in ("sequential", "bulk"):
+        store = FakeStore(args.latency_ms / 1000, args.throttle_pct / 100)
+        keys = seed(store, args)
+        table, s3 = FakeTable(store), FakeS3(store)
+        t0 = time.perf_counter()
+        if name == "sequential":
+            result = dd.delete_documents(keys, table, s3, "input", "output")
+        else:
+            result = dd.bulk_delete_documents(
+                iter(keys),
+                table,
+                s3,
+                "input",
+                "output",
+                workers=args.workers,
+                chunk_size=args.chunk_size,
+            )
+        wall = time.perf_counter() - t0
+        clean = not store.items and not store.objects
+        print(
+            f"{name:12s} {wall:8.2f} {args.documents / wall:8.0f} "
+            f"{sum(store.calls.values()):10d} {str(clean and result['success']):>6s}"
+        )
+
+    store = FakeStore(0, 0)
+    keys = seed(store, args)
+    preview = dd.bulk_delete_documents(
+        keys, FakeTable(store), FakeS3(store), "input", "output", dry_run=True
+    )["preview"]
+    print(
+        f"dry run: {preview['dynamodb_items']} DynamoDB items, "
+        f"{preview['input_objects'] + preview['output_object_versions']} S3 objects, "
+        f"{preview['bulk_request_count']} bulk vs "
+        f"{preview['per_document_request_count']} per-document requests, "
+        f"~${preview['estimated_cost_usd']:.4f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
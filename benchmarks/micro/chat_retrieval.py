@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""Measure Chat-with-Document prompt size with and without page retrieval.
+
+Builds a synthetic --pages page statement (about --page-words words per page,
+in the <page-number> full-text format chat uses) and asks --questions
+questions about facts planted on single pages. Modes:
+  full text       every turn sends the whole document (the previous behaviour)
+  retrieval       ChatPageIndex built once, each turn sends the --top-k pages
+                  most relevant to the question plus the document header
+Reports index build time, per-turn retrieval latency, document tokens sent per
+turn (about 4 characters per token) and how often the page holding the answer
+was among the pages sent.
+Local only: no AWS calls.
+
+Usage:
+  export PYTHONPATH=$PWD/lib/idp_common_pkg AWS_DEFAULT_REGION=us-east-1
+  python3 benchmarks/micro/chat_retrieval.py [--pages 300] [--top-k 8] \
+      [--questions 50]
+"""
+
+import argparse
+import random
+import time
+
+from idp_common.chat_page_index import ChatPageIndex, estimate_tokens
+
+WORDS = (
+    "account balance deposit withdrawal transfer interest statement period "
+    "branch customer payment reference fee charge credit debit available "
+    "opening closing summary transaction posted pending service"
+).split()
+
+
+def build_document(rng, pages, page_words, questions):
+    facts = {}
+    texts = []
+    for page in range(1, pages + 1):
+        words = [rng.choice(WORDS) for _ in range(page_words)]
+        texts.append(f"Statement page {page} of {pages}. " + " ".join(words))
+    for q in range(questions):
+        page = rng.randrange(2, pages + 1)
+        code = f"contract{q:03d}"
+        texts[page - 1] += f" Wire to counterparty {code} settled on this page."
+        facts[code] = str(page)
+    texts[0] = "FIRST NATIONAL BANK quarterly statement for Jane Doe. " + texts[0]
+    full_text = "\n".join(
+        f"<page-number>{i}</page-number>\n{text}\n"
+        for i, text in enumerate(texts, start=1)
+    )
+    return full_text, facts
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--pages", type=int, default=300)
+    ap.add_argument("--page-words", type=int, default=400)
+    ap.add_argument("--questions", type=int, default=50)
+    ap.add_argument("--top-k", type=int, default=8)
+    args = ap.parse_args()
+
+    rng = random.Random(7)
+    full_text, facts = build_document(rng, args.pages, args.page_words, args.questions)
+
+    t0 = time.perf_counter()
+    index = ChatPageIndex.from_full_text(full_text)
+    build_ms = (time.perf_counter() - t0) * 1000
+
+    latencies = []
+    sent = []
+    hits = 0
+    for code, page in facts.items():
+        question = f"When was the wire to counterparty {code} settled?"
+        t0 = time.perf_counter()
+        page_ids = index.search(question, top_k=args.top_k)
+        context = index.render(page_ids)
+        latencies.append((time.perf_counter() - t0) * 1000)
+        sent.append(estimate_tokens(context))
+        hits += page in page_ids
+
+    full_tokens = estimate_tokens(full_text)
+    print(
+        f"{args.pages} pages, ~{full_tokens} tokens, {len(facts)} questions, "
+        f"top {args.top_k} pages; index built in {build_ms:.0f} ms"
+    )
+    print(
+        f"{'mode':10s} {'tokens/turn':>12s} {'retrieval ms':>13s} {'answer sent':>12s}"
+    )
+    print(f"{'full text':10s} {full_tokens:12d} {0.0:13.1f} {len(facts):>12d}")
+    print(
+        f"{'retrieval':10s} {sum(sent) // len(sent):12d} "
+        f"{sum(latencies) / len(latencies):13.1f} {hits:>12d}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""Compare exact and scalable k-selection in ClusteringService.
+
+Generates synthetic document embeddings (Gaussian blobs around --true-k
+random centers, L2-normalized like Bedrock embeddings) at each --sizes
+count and clusters them with:
+  exact     KMeans(n_init=10) + full O(n^2) silhouette for every k in 2..20
+  scalable  MiniBatchKMeans + stratified-sample silhouette, k in parallel
+Reports wall time, chosen k and adjusted Rand index against the generating
+labels. Exact mode is skipped above --exact-max documents, where its
+silhouette pass dominates. Local only: no AWS calls.
+
+Usage:
+  export PYTHONPATH=$PWD/lib/idp_common_pkg AWS_DEFAULT_REGION=us-east-1
+  python3 benchmarks/micro/cluster_k_selection.py [--sizes 1000,10000,50000] \
+      [--dim 256] [--true-k 8] [--exact-max 10000]
+"""
+
+import argparse
+import time
+
+import numpy as np
+from sklearn.metrics import adjusted_rand_score
+
+from idp_common.discovery.clustering_service import ClusteringService
+
+
+def make_embeddings(n_docs, dim, true_k, seed=0):
+    """Return (embeddings, generating labels) for n_docs synthetic documents."""
+    rng = np.random.RandomState(seed)
+    centers = rng.randn(true_k, dim)
+    labels = rng.randint(0, true_k, size=n_docs)
+    points = centers[labels] + rng.randn(n_docs, dim) * 0.6
+    points /= np.linalg.norm(points, axis=1, keepdims=True)
+    return points.astype(np.float32), labels
+
+
+def run(mode, embeddings, truth):
+    service = ClusteringService(k_selection=mode)
+    t0 = time.perf_counter()
+    result = service.cluster(embeddings)
+    elapsed = time.perf_counter() - t0
+    return (
+        elapsed,
+        result.num_clusters,
+        adjusted_rand_score(truth, result.cluster_labels),
+    )
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--sizes", default="1000,10000,50000")
+    ap.add_argument("--dim", type=int, default=256)
+    ap.add_argument("--true-k", type=int, default=8)
+    ap.add_argument("--exact-max", type=int, default=10000)
+    args = ap.parse_args()
+
+    print(f"dim={args.dim} true_k={args.true_k}")
+    print(f"{'docs':>6s} {'mode':9s} {'seconds':>8s} {'k':>3s} {'ARI':>6s}")
+    for n_docs in (int(v) for v in args.sizes.split(",")):
+        embeddings, truth = make_embeddings(n_docs, args.dim, args.true_k)
+        for mode in ("exact", "scalable"):
+            if mode == "exact" and n_docs > args.exact_max:
+                print(f"{n_docs:6d} {mode:9s} {'skipped':>8s}")
+                continue
+            elapsed, k, ari = run(mode, embeddings, truth)
+            print(f"{n_docs:6d} {mode:9s} {elapsed:8.2f} {k:3d} {ari:6.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""Compare JSON and idp-docstate/1 Document state objects.
+
+Builds a synthetic Document with --pages pages split into sections of
+--pages-per-section (page text URIs, forms, tables and extraction
+attributes roughly the size the pipeline carries) and reports for each
+state format:
+  bytes      size of the object Document.compress writes to S3
+  encode ms  to_dict -> stored bytes
+  full ms    stored bytes -> Document with every section
+  lazy ms    stored bytes -> Document with one section (a Map iteration)
+Timings are the best of --repeat runs. Local only: no AWS calls.
+
+Usage:
+  export PYTHONPATH=$PWD/lib/idp_common_pkg AWS_DEFAULT_REGION=us-east-1
+  python3 benchmarks/micro/document_state.py [--pages 50,500,2000] \
+      [--pages-per-section 5] [--repeat 5]
+"""
+
+import argparse
+import json
+import time
+
+from idp_common import document_state
+from idp_common.models import Document, Page, Section, Status
+
+
+def make_document(num_pages, pages_per_section):
+    document = Document(
+        id="bench-doc",
+        input_bucket="input-bucket",
+        input_key="bench/doc.pdf",
+        output_bucket="output-bucket",
+        status=Status.EXTRACTING,
+        num_pages=num_pages,
+    )
+    for number in range(1, num_pages + 1):
+        page_id = str(number)
+        prefix = f"s3://output-bucket/bench/doc.pdf/pages/{page_id}"
+        document.pages[page_id] = Page(
+            page_id=page_id,
+            image_uri=f"{prefix}/image.jpg",
+            raw_text_uri=f"{prefix}/rawText.json",
+            parsed_text_uri=f"{prefix}/result.json",
+            text_confidence_uri=f"{prefix}/textConfidence.json",
+            classification="Invoice" if number % 3 else "Payslip",
+            confidence=0.97,
+            forms={f"field_{i}": f"value {i} on page {page_id}" for i in range(10)},
+            tables=[{"rows": [[f"r{r}c{c}" for c in range(4)] for r in range(6)]}],
+        )
+    for start in range(1, num_pages + 1, pages_per_section):
+        section_id = str(len(document.sections) + 1)
+        page_ids = [
+            str(p) for p in range(start, min(start + pages_per_section, num_pages + 1))
+        ]
+        document.sections.append(
+            Section(
+                section_id=section_id,
+                classification="Invoice",
+                page_ids=page_ids,
+                extraction_result_uri=(
+                    f"s3://output-bucket/bench/doc.pdf/sections/{section_id}/result.json"
+                ),
+                attributes={f"attr_{i}": f"extracted value {i}" for i in range(20)},
+                confidence_threshold_alerts=[
+                    {"attribute_name": "attr_1", "confidence": 0.4}
+                ],
+            )
+        )
+    return document
+
+
+def best_ms(fn, repeat):
+    best = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        elapsed = (time.perf_counter() - t0) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def load_json(data, section_ids=None):
+    document_dict = json.loads(data.decode("utf-8"))
+    if section_ids is not None:
+        document_dict = document_state.filter_sections(document_dict, section_ids)
+    return Document.from_dict(document_dict)
+
+
+def load_binary(data, section_ids=None):
+    return Document.from_dict(document_state.decode(data, section_ids))
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--pages", default="50,500,2000")
+    ap.add_argument("--pages-per-section", type=int, default=5)
+    ap.add_argument("--repeat", type=int, default=5)
+    args = ap.parse_args()
+
+    formats = {
+        "json": (
+            lambda d: json.dumps(d.to_dict(), default=str).encode("utf-8"),
+            load_json,
+        ),
+        "binary": (lambda d: document_state.encode(d.to_dict()), load_binary),
+    }
+
+    print(f"pages per section={args.pages_per_section} best of {args.repeat}")
+    print(
+        f"{'pages':>5s} {'format':6s} {'KB':>8s} {'encode ms':>10s} "
+        f"{'full ms':>8s} {'lazy ms':>8s}"
+    )
+    for num_pages in (int(v) for v in args.pages.split(",")):
+        document = make_document(num_pages, args.pages_per_section)
+        middle = [document.sections[len(document.sections) // 2].section_id]
+        for name, (encode, load) in formats.items():
+            data = encode(document)
+            assert load(data).to_dict() == document.to_dict()
+            encode_ms = best_ms(lambda: encode(document), args.repeat)
+            full_ms = best_ms(lambda: load(data), args.repeat)
+            lazy_ms = best_ms(lambda: load(data, middle), args.repeat)
+            print(
+                f"{num_pages:5d} {name:6s} {len(data) / 1024:8.1f} "
+                f"{encode_ms:10.1f} {full_ms:8.1f} {lazy_ms:8.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""Measure agentic extraction checkpointing on the agent's critical path.
+
+Replays an agentic table extraction that grows to --rows rows over --patches
+incremental patches, with --think-ms of model time between patches. After each
+patch the agent checkpoints the whole extraction, as
+agentic_idp._invoke_checkpoint_callback does; a save serializes it like
+save_extraction_checkpoint and "uploads" it (--upload-ms plus size at
+--upload-mbps). Modes:
+  synchronous     the save runs inline (the previous behaviour)
+  coalescing      CoalescingCheckpointWriter (debounce --debounce-s, max delay
+                  --max-delay-s), closed at the end as the Lambda does on error
+Reports time the agent spent blocked in checkpointing, uploads and bytes
+uploaded, and whether the last saved checkpoint is the final state.
+Local only: no AWS calls.
+
+Usage:
+  export PYTHONPATH=$PWD/lib/idp_common_pkg AWS_DEFAULT_REGION=us-east-1
+  python3 benchmarks/micro/extraction_checkpoints.py [--rows 3000] \
+      [--patches 40] [--think-ms 150]
+"""
+
+import argparse
+import json
+import logging
+import time
+
+from idp_common.extraction.checkpoint_writer import CoalescingCheckpointWriter
+
+
+class Uploader:
+    def __init__(self, upload_s, bytes_per_s):
+        self.upload_s = upload_s
+        self.bytes_per_s = bytes_per_s
+        self.uploads = 0
+        self.bytes = 0
+        self.last = None
+
+    def __call__(self, extraction_data):
+        body = json.dumps({"extraction_data": extraction_data}, default=str).encode()
+        time.sleep(self.upload_s + len(body) / self.bytes_per_s)
+        self.uploads += 1
+        self.bytes += len(body)
+        self.last = extraction_data
+
+
+def row(i):
+    return {
+        "date": f"2024-03-{i % 28 + 1:02d}",
+        "description": f"Wire transfer reference INV-{i:06d} consulting services",
+        "amount": f"{(i * 37) % 100000 / 100:.2f}",
+        "balance": f"{(i * 91) % 10000000 / 100:.2f}",
+    }
+
+
+def replay(args, sink):
+    rows = []
+    per_patch = -(-args.rows // args.patches)
+    blocked = 0.0
+    for _ in range(args.patches):
+        time.sleep(args.think_ms / 1000)
+        rows.extend(row(len(rows) + j) for j in range(per_patch))
+        checkpoint = {"source": "current_extraction", "data": {"rows": list(rows)}}
+        t0 = time.perf_counter()
+        sink(checkpoint)
+        blocked += time.perf_counter() - t0
+    return blocked, checkpoint
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--rows", type=int, default=3000)
+    ap.add_argument("--patches", type=int, default=40)
+    ap.add_argument("--think-ms", type=float, default=150)
+    ap.add_argument("--upload-ms", type=float, default=60)
+    ap.add_argument("--upload-mbps", type=float, default=20)
+    ap.add_argument("--debounce-s", type=float, default=2.0)
+    ap.add_argument("--max-delay-s", type=float, default=10.0)
+    args = ap.parse_args()
+    logging.disable(logging.INFO)
+
+    print(
+        f"{args.patches} patches to {args.rows} rows, {args.think_ms:.0f} ms model "
+        f"time per patch, upload {args.upload_ms:.0f} ms + {args.upload_mbps} MB/s"
+    )
+    print(
+        f"{'mode':12s} {'blocked s':>10s} {'uploads':>8s} {'MB uploaded':>12s} "
+        f"{'latest saved':>13s}"
+    )
+    for name in ("synchronous", "coalescing"):
+        uploader = Uploader(args.upload_ms / 1000, args.upload_mbps * 1e6)
+        if name == "synchronous":
+            blocked, final = replay(args, uploader)
+        else:
+            writer = CoalescingCheckpointWriter(
+                uploader,
+                debounce_seconds=args.debounce_s,
+                max_delay_seconds=args.max_delay_s,
+            )
+            blocked, final = replay(args, writer)
+            writer.close()
+        print(
+            f"{name:12s} {blocked:10.2f} {uploader.uploads:8d} "
+            f"{uploader.bytes / 1e6:12.1f} {str(uploader.last == final):>13s}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""Measure per-call put_metric overhead under concurrent worker threads.
+
+Runs N threads that each call idp_common.metrics.put_metric M times against a
+fake CloudWatch client that sleeps for --latency-ms per PutMetricData call,
+once per publishing mode:
+  direct    one synchronous PutMetricData call per put_metric (legacy path)
+  buffered  put_metric inside @batch_metrics, flushed in batches at the end
+  emf       buffered, flushed as Embedded Metric Format lines (to /dev/null)
+Reports wall time, mean per-call overhead and the number of CloudWatch calls.
+Local only: no AWS calls.
+
+Usage:
+  export PYTHONPATH=$PWD/lib/idp_common_pkg AWS_DEFAULT_REGION=us-east-1
+  python3 benchmarks/micro/metrics_overhead.py [--threads 32] [--calls 50] \
+      [--latency-ms 20]
+"""
+
+import argparse
+import contextlib
+import os
+import threading
+import time
+from unittest.mock import patch
+
+from idp_common import metrics
+
+
+class FakeCloudWatch:
+    def __init__(self, latency_s):
+        self.latency_s = latency_s
+        self.calls = 0
+        self.datapoints = 0
+        self._lock = threading.Lock()
+
+    def put_metric_data(self, Namespace, MetricData):
+        time.sleep(self.latency_s)
+        with self._lock:
+            self.calls += 1
+            self.datapoints += sum(int(sum(d.get("Counts", [1]))) for d in MetricData)
+
+
+def run(mode, threads, calls, latency_s):
+    client = FakeCloudWatch(latency_s)
+    os.environ["METRICS_MODE"] = "direct" if mode == "direct" else mode
+
+    def worker():
+        for i in range(calls):
+            metrics.put_metric("BenchRequests", 1)
+            metrics.put_metric("BenchLatency", i % 20, "Milliseconds")
+
+    @metrics.batch_metrics
+    def handler():
+        pool = [threading.Thread(target=worker) for _ in range(threads)]
+        for t in pool:
+            t.start()
+        for t in pool:
+            t.join()
+
+    with (
+        patch.object(metrics, "get_cloudwatch_client", return_value=client),
+        open(os.devnull, "w") as devnull,
+        contextlib.redirect_stdout(devnull),
+    ):
+        t0 = time.perf_counter()
+        handler()
+        elapsed = time.perf_counter() - t0
+    return elapsed, client.calls
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--threads", type=int, default=32)
+    ap.add_argument("--calls", type=int, default=50, help="put_metric pairs per thread")
+    ap.add_argument("--latency-ms", type=float, default=20.0)
+    args = ap.parse_args()
+
+    total = args.threads * args.calls * 2
+    print(
+        f"{args.threads} threads x {args.calls * 2} put_metric calls "
+        f"({total} total), simulated PutMetricData latency {args.latency_ms:.0f} ms"
+    )
+    print(f"{'mode':<10}{'wall s':>10}{'us/call':>12}{'CW calls':>10}")
+    for mode in ("direct", "buffered", "emf"):
+        elapsed, cw_calls = run(mode, args.threads, args.calls, args.latency_ms / 1000)
+        print(f"{mode:<10}{elapsed:>10.2f}{elapsed / total * 1e6:>12.1f}{cw_calls:>10}")
+
+
+if __name__ == "__main__":
+    main()
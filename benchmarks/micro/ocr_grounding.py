@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""Measure OCR grounding of a large extracted table against its pageData.
+
+Builds a --rows x 6 column transaction table spread over --pages pages of OCR
+lines, where each column reaches a different match tier the way real
+statements do: an amount re-rendered with currency and thousands separators
+(EXACT via format variants), a reference number embedded in a longer line
+(SUBSTRING), a payee wrapped over two lines (SPAN), a date printed in another
+format (TYPED), a description with an OCR misread (LEVENSHTEIN) and a status
+repeated on every row (EXACT, row-order tie-break). Times ground_assessment_geometry
+in ocr_only mode:
+  per value       match_value_to_geometry once per leaf (inverted page index,
+                  no sharing between leaves)
+  batch           ground_assessment_geometry (index + per-pass candidate cache)
+  baseline        the same call on ocr_grounding.py from --baseline <git-ref>,
+                  e.g. the commit before the inverted index; its output is
+                  checked to be identical
+Every mode starts from fresh page dicts, so index build time is included.
+Local only: no AWS calls.
+
+Usage:
+  export PYTHONPATH=$PWD/lib/idp_common_pkg AWS_DEFAULT_REGION=us-east-1
+  python3 benchmarks/micro/ocr_grounding.py [--rows 300] [--pages 6] \
+      [--baseline <git-ref>]
+"""
+
+import argparse
+import copy
+import logging
+import os
+import random
+import subprocess
+import time
+import types
+
+REPO = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+MODULE_PATH = "lib/idp_common_pkg/idp_common/assessment/ocr_grounding.py"
+COLUMNS = ["date", "reference", "payee", "description", "amount", "status"]
+PAYEES = ["Acme Corp", "Globex Supply", "Initech", "Umbrella Health", "Stark Ind"]
+ITEMS = ["office supplies", "freight charges", "consulting fees", "cloud hosting"]
+
+
+def line(text, left, top):
+    return {
+        "text": text,
+        "confidence": 98.0,
+        "geometrySource": "line",
+        "geometry": {
+            "boundingBox": {"left": left, "top": top, "width": 0.1, "height": 0.01}
+        },
+    }
+
+
+def build_table(rows, pages, rng):
+    per_page = -(-rows // pages)
+    page_data = {}
+    extracted = []
+    for row in range(rows):
+        page, slot = divmod(row, per_page)
+        top = 0.05 + slot * 0.9 / per_page
+        day = rng.randint(1, 28)
+        amount = rng.randint(100, 999_999) / 100
+        ref = f"{rng.randint(0, 999_999):06d}"
+        payee = rng.choice(PAYEES)
+        item = f"{rng.choice(ITEMS)} order {rng.randint(1000, 9999)}"
+        lines = page_data.setdefault(page + 1, {"geometryAvailable": True})
+        lines = lines.setdefault("lines", [])
+        lines += [
+            line(f"Mar {day} 2022", 0.02, top),
+            line(f"Ref INV-{ref}", 0.15, top),
+            line(payee, 0.3, top),
+            line(f"Branch {row}", 0.3, top + 0.005),
+            line(item.replace("o", "0", 1), 0.45, top),
+            line(f"${amount:,.2f}", 0.7, top),
+            line("PAID", 0.85, top),
+        ]
+        extracted.append(
+            {
+                "date": f"2022-03-{day:02d}",
+                "reference": ref,
+                "payee": f"{payee} Branch {row}",
+                "description": item,
+                "amount": f"{amount:.2f}",
+                "status": "PAID",
+            }
+        )
+    return page_data, {"Transactions": extracted}
+
+
+def assessment_for(extraction):
+    return {
+        "Transactions": [
+            {col: {"confidence": 0.9} for col in COLUMNS}
+            for _ in extraction["Transactions"]
+        ]
+    }
+
+
+def load_baseline(ref):
+    source = subprocess.run(
+        ["git", "show", f"{ref}:{MODULE_PATH}"],
+        cwd=REPO,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    module = types.ModuleType("ocr_grounding_baseline")
+    exec(compile(source, f"{ref}:{MODULE_PATH}", "exec"), module.__dict__)
+    return module
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--rows", type=int, default=300)
+    ap.add_argument("--pages", type=int, default=6)
+    ap.add_argument("--baseline", help="git ref of the ocr_grounding.py to compare")
+    args = ap.parse_args()
+    logging.disable(logging.INFO)
+
+    from idp_common.assessment import ocr_grounding
+
+    page_data, extraction = build_table(args.rows, args.pages, random.Random(5))
+    schema = {
+        "properties": {
+            "Transactions": {
+                "type": "array",
+                "items": {"properties": {"date": {"format": "date"}}},
+            }
+        }
+    }
+
+    def per_value(pages):
+        item_schema = schema["properties"]["Transactions"]["items"]
+        for i, row in enumerate(extraction["Transactions"]):
+            for col in COLUMNS:
+                ocr_grounding.match_value_to_geometry(
+                    row[col],
+                    pages,
+                    None,
+                    i,
+                    ocr_grounding._field_schema_for(item_schema, col),
+                )
+
+    def grounded_by(module):
+        def run(pages):
+            return module.ground_assessment_geometry(
+                assessment_for(extraction), extraction, pages, "ocr_only", schema
+            )
+
+        return run
+
+    modes = [
+        ("per value", per_value),
+        ("batch", grounded_by(ocr_grounding)),
+    ]
+    if args.baseline:
+        modes.append(
+            (f"baseline {args.baseline}", grounded_by(load_baseline(args.baseline)))
+        )
+
+    lines = sum(len(p["lines"]) for p in page_data.values())
+    print(
+        f"{args.rows} rows x {len(COLUMNS)} columns, {args.pages} pages, "
+        f"{lines} OCR lines"
+    )
+    print(f"{'mode':24s} {'wall s':>8s} {'values/sec':>11s}")
+    outputs = {}
+    for name, run in modes:
+        pages = copy.deepcopy(page_data)
+        t0 = time.perf_counter()
+        outputs[name] = run(pages)
+        elapsed = time.perf_counter() - t0
+        rate = args.rows * len(COLUMNS) / elapsed
+        print(f"{name:24s} {elapsed:8.2f} {rate:11.0f}")
+    if args.baseline:
+        same = outputs["batch"] == outputs[modes[-1][0]]
+        print(f"batch output identical to baseline: {same}")
+
+
+if __name__ == "__main__":
+    main()
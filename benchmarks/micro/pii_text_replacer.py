@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""Measure the pii-anonymizer text replacer: sequential vs single pass.
+
+Builds a synthetic --pages page contract (~3,000 characters per page) in which
+PII values from a generated mapping recur throughout, including short values
+(initials, two-digit codes), values that only match after whitespace/colon
+normalization, and values absent from the text. For each --mappings size it
+times the upstream per-entry loop (_replace_pii_in_text_sequential) against the
+Aho-Corasick path (_replace_pii_in_text_single_pass) and checks that both
+return identical results. Local only: no AWS calls.
+
+Usage:
+  python3 benchmarks/micro/pii_text_replacer.py [--pages 200] \
+      [--mappings 100,300,600]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+REPO = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+sys.path.insert(
+    0, os.path.join(REPO, "feature-platform/pii-anonymizer/hook/vendor/pii_anonymizer")
+)
+
+from core import text_replacer  # noqa: E402
+
+FIRST = ["James", "Maria", "Wei", "Aisha", "Carlos", "Yuki", "Olga", "Samuel"]
+LAST = ["Okafor", "Lindqvist", "Tanaka", "Moreau", "Patel", "Novak", "Silva"]
+FILLER = (
+    "the party shall deliver all notices in writing to the address set out "
+    "below and any amendment to this agreement requires consent of both "
+    "parties section clause term payment schedule liability indemnity "
+).split()
+
+
+def build_mapping(size, rng):
+    mapping = {}
+    while len(mapping) < size:
+        kind = rng.random()
+        if kind < 0.35:
+            value = f"{rng.choice(FIRST)} {rng.choice(LAST)} {len(mapping)}"
+        elif kind < 0.55:
+            value = f"{rng.randint(100, 999)}-{rng.randint(10, 99)}-{len(mapping):04d}"
+        elif kind < 0.7:
+            value = (
+                f"{rng.randint(1, 9999)} {rng.choice(LAST)} Street Apt {len(mapping)}"
+            )
+        elif kind < 0.8:
+            value = f"{rng.choice('ABCDEFGH')}{rng.choice('JKLMNPQR')}"  # initials
+        elif kind < 0.9:
+            value = f"Account No: {len(mapping):08d}"
+        else:
+            value = f"absent-{len(mapping)}-{rng.random():.6f}"
+        mapping[value] = f"SYNTH-{len(mapping)}"
+    return mapping
+
+
+def build_text(pages, mapping, rng):
+    values = [v for v in mapping if not v.startswith("absent-")]
+    words = []
+    for _ in range(pages * 480):
+        if rng.random() < 0.03:
+            value = rng.choice(values)
+            if value.startswith("Account") and rng.random() < 0.5:
+                value = value.replace(": ", "  :\n ")  # normalized-only form
+            words.append(value)
+        else:
+            words.append(rng.choice(FILLER))
+    return " ".join(words)
+
+
+def timed(fn, *args):
+    t0 = time.perf_counter()
+    result = fn(*args)
+    return time.perf_counter() - t0, result
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--pages", type=int, default=200)
+    ap.add_argument("--mappings", default="100,300,600")
+    args = ap.parse_args()
+
+    rng = random.Random(0)
+    print(f"{args.pages} pages")
+    print(
+        f"{'mappings':>8s} {'chars':>9s} {'sequential s':>13s} {'single s':>9s} {'speedup':>8s}"
+    )
+    for size in (int(m) for m in args.mappings.split(",")):
+        mapping = build_mapping(size, rng)
+        text = build_text(args.pages, mapping, rng)
+        seq_s, expected = timed(
+            text_replacer._replace_pii_in_text_sequential, text, mapping
+        )
+        text_replacer._compile_originals.cache_clear()  # include the build
+        one_s, result = timed(
+            text_replacer._replace_pii_in_text_single_pass, text, mapping
+        )
+        assert result == expected, "single-pass result differs from sequential"
+        print(
+            f"{size:8d} {len(text):9d} {seq_s:13.2f} {one_s:9.2f} {seq_s / one_s:7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""Measure queue_processor batch drain time with and without the routing cache.
+
+Imports src/lambda/queue_processor/index.py against moto, stores a library
+config version in a moto ConfigurationTable, and runs start_workflow for a
+batch of --records documents with StartExecution replaced by a sleep of
+--sfn-ms (the Step Functions call the drain should be bounded by). Modes:
+  uncached sequential    previous behavior: a new ConfigurationManager and a
+                         full get_merged_configuration per record, one record
+                         at a time
+  cached sequential      routing info resolved once per version, sequential
+  cached concurrent      routing cache plus RECORD_CONCURRENCY workers
+Reports batch wall time, records/s, and the per-record config resolution
+cost. Local only: uses moto.
+
+Usage:
+  export PYTHONPATH=$PWD/lib/idp_common_pkg AWS_DEFAULT_REGION=us-east-1
+  python3 benchmarks/micro/queue_drain.py [--records 50] [--sfn-ms 60] \
+      [--workers 10] [--config config_library/unified/lending-package-sample/config.yaml]
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import boto3
+import yaml
+from moto import mock_aws
+
+REPO = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+CONFIG_TABLE = "bench-config"
+VERSION = "bench"
+
+
+class Doc:
+    def __init__(self, index):
+        self.id = f"bench/doc-{index}.pdf"
+        self.config_version = VERSION
+        self.status = None
+        self.start_time = None
+        self.workflow_execution_arn = None
+
+    def to_dict(self):
+        return {"document_id": self.id, "config_version": self.config_version}
+
+
+def load_queue_processor():
+    os.environ.update(
+        CONCURRENCY_TABLE="bench-concurrency",
+        STATE_MACHINE_ARN="arn:aws:states:us-east-1:123456789012:stateMachine:b",
+        TRACKING_TABLE="bench-tracking",
+        DOCUMENT_TRACKING_MODE="dynamodb",
+        CONFIG_TABLE=CONFIG_TABLE,
+        AWS_XRAY_SDK_ENABLED="false",
+        LOG_LEVEL="ERROR",
+    )
+    os.environ.pop("WORKING_BUCKET", None)
+    sys.path.insert(0, os.path.join(REPO, "src", "lambda", "queue_processor"))
+    import index
+
+    return index
+
+
+def seed_config(config_path):
+    from idp_common.config.configuration_manager import ConfigurationManager
+
+    boto3.client("dynamodb").create_table(
+        TableName=CONFIG_TABLE,
+        KeySchema=[{"AttributeName": "Configuration", "KeyType": "HASH"}],
+        AttributeDefinitions=[{"AttributeName": "Configuration", "AttributeType": "S"}],
+        BillingMode="PAY_PER_REQUEST",
+    )
+    with open(config_path) as f:
+        config = yaml.safe_load(f)
+    ConfigurationManager(table_name=CONFIG_TABLE).save_configuration(
+        "Config", config, version=VERSION
+    )
+
+
+def uncached_start(index, document):
+    """start_workflow's routing lookup as it was before the cache."""
+    manager = index.ConfigurationManager(table_name=CONFIG_TABLE)
+    config = manager.get_merged_configuration(document.config_version)
+    if getattr(config, "use_bda", False):
+        manager.get_bda_project_arn(document.config_version)
+    index.sfn.start_execution(stateMachineArn=index.state_machine_arn, input="{}")
+
+
+def drain(fn, documents, workers):
+    t0 = time.perf_counter()
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(fn, documents))
+    else:
+        for document in documents:
+            fn(document)
+    return time.perf_counter() - t0
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--records", type=int, default=50)
+    ap.add_argument("--sfn-ms", type=float, default=60)
+    ap.add_argument("--workers", type=int, default=10)
+    ap.add_argument(
+        "--config",
+        default=os.path.join(
+            REPO, "config_library/unified/lending-package-sample/config.yaml"
+        ),
+    )
+    args = ap.parse_args()
+
+    with mock_aws():
+        index = load_queue_processor()
+        seed_config(args.config)
+        index.sfn = MagicMock()
+        index.sfn.start_execution.side_effect = lambda **_: (
+            time.sleep(args.sfn_ms / 1000) or {"executionArn": "arn:bench"}
+        )
+        documents = [Doc(i) for i in range(args.records)]
+
+        t0 = time.perf_counter()
+        index.get_routing(index.get_config_manager(CONFIG_TABLE), VERSION)
+        resolve_ms = (time.perf_counter() - t0) * 1000
+        t0 = time.perf_counter()
+        for _ in range(1000):
+            index.get_routing(index.get_config_manager(CONFIG_TABLE), VERSION)
+        hit_us = (time.perf_counter() - t0) * 1000
+
+        modes = [
+            ("uncached sequential", lambda d: uncached_start(index, d), 1),
+            ("cached sequential", index.start_workflow, 1),
+            ("cached concurrent", index.start_workflow, args.workers),
+        ]
+        print(
+            f"{args.records} records, StartExecution {args.sfn_ms:.0f} ms; "
+            f"config resolve {resolve_ms:.1f} ms, cache hit {hit_us:.1f} us"
+        )
+        print(f"{'mode':20s} {'batch s':>8s} {'records/s':>10s}")
+        for name, fn, workers in modes:
+            elapsed = drain(fn, documents, workers)
+            print(f"{name:20s} {elapsed:8.2f} {args.records / elapsed:10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""Compare serial vs multi-process PDF page rendering on the synthetic corpus.
+
+Renders every page of each corpus PDF with idp_common.ocr.page_renderer, once
+in-process and once per requested worker-process count, and reports wall time
+and pages/sec. Parallel output is checked byte-for-byte against serial output.
+Local only: no AWS calls.
+
+Usage:
+  export PYTHONPATH=$PWD/lib/idp_common_pkg AWS_DEFAULT_REGION=us-east-1
+  python3 benchmarks/harness/gen_corpus.py          # once, builds corpus/docs/
+  python3 benchmarks/micro/render_pages.py [--processes 2,4,8] [--dpi 150] \
+      [--only <id,id>] [--repeat 3]
+"""
+
+import argparse
+import glob
+import os
+import time
+
+import pypdfium2 as pdfium
+
+from idp_common.ocr.page_renderer import iter_rendered_pages
+
+BENCH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DOCS = os.path.join(BENCH, "corpus", "docs")
+
+# Same default page bounds OcrService applies when no image sizing is configured
+RESIZE = {"target_width": 951, "target_height": 1268}
+
+
+def render_all(pdf_bytes, dpi, processes):
+    pdf_document = pdfium.PdfDocument(pdf_bytes)
+    pdf_document.init_forms()
+    try:
+        t0 = time.perf_counter()
+        pages = dict(
+            iter_rendered_pages(
+                pdf_document,
+                list(range(len(pdf_document))),
+                dpi=dpi,
+                resize_config=RESIZE,
+                pdf_bytes=pdf_bytes,
+                processes=processes,
+            )
+        )
+        return time.perf_counter() - t0, pages
+    finally:
+        pdf_document.close()
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--processes", default="2,4", help="comma-separated counts")
+    ap.add_argument("--dpi", type=int, default=150)
+    ap.add_argument("--only", default=None, help="comma-separated doc ids")
+    ap.add_argument("--repeat", type=int, default=3, help="best-of-N timing")
+    args = ap.parse_args()
+    counts = [int(p) for p in args.processes.split(",")]
+    only = set(args.only.split(",")) if args.only else None
+
+    paths = sorted(glob.glob(os.path.join(DOCS, "*.pdf")))
+    if only:
+        paths = [p for p in paths if os.path.basename(p)[:-4] in only]
+    if not paths:
+        raise SystemExit(f"no PDFs in {DOCS} - run benchmarks/harness/gen_corpus.py")
+
+    print(f"cpus={os.cpu_count()} dpi={args.dpi} best of {args.repeat}")
+    header = f"{'doc':16s} {'pages':>5s} {'serial s':>9s}"
+    for n in counts:
+        header += f" {f'{n}p s':>8s} {'speedup':>7s}"
+    print(header)
+    for path in paths:
+        pdf_bytes = open(path, "rb").read()
+        serial_s, serial_pages = min(
+            (render_all(pdf_bytes, args.dpi, 1) for _ in range(args.repeat)),
+            key=lambda r: r[0],
+        )
+        line = (
+            f"{os.path.basename(path)[:-4]:16s} {len(serial_pages):5d} {serial_s:9.2f}"
+        )
+        for n in counts:
+            par_s, par_pages = min(
+                (render_all(pdf_bytes, args.dpi, n) for _ in range(args.repeat)),
+                key=lambda r: r[0],
+            )
+            assert par_pages == serial_pages, f"{path}: {n}-process output differs"
+            line += f" {par_s:8.2f} {serial_s / par_s:6.2f}x"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""Compare the default and fast resize paths of idp_common.image.resize_image.
+
+Renders pages of each corpus PDF at --dpi (300 by default, the size OCR
+sources typically come in at) as both JPEG and PNG, then resizes each page to
+the configured model image bounds with:
+  default  full decode + LANCZOS, quality 95, optimize=True (prepare_image default)
+  fast     draft/reduce + LANCZOS, quality 95, optimize=False (IMAGE_FAST_RESIZE)
+Reports CPU time per page, output bytes, and checks that output dimensions,
+which determine image token counts, are identical. Local only: no AWS calls.
+
+Usage:
+  export PYTHONPATH=$PWD/lib/idp_common_pkg AWS_DEFAULT_REGION=us-east-1
+  python3 benchmarks/harness/gen_corpus.py          # once, builds corpus/docs/
+  python3 benchmarks/micro/resize_images.py [--dpi 300] [--size 951x1268] \
+      [--pages 10] [--repeat 3]
+"""
+
+import argparse
+import glob
+import io
+import os
+import time
+
+import pypdfium2 as pdfium
+from PIL import Image, ImageChops, ImageStat
+
+from idp_common.image import resize_image
+
+BENCH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DOCS = os.path.join(BENCH, "corpus", "docs")
+
+MODES = {
+    "default": {"fast": False, "optimize": True},
+    "fast": {"fast": True, "optimize": False},
+}
+
+
+def render_pages(dpi, max_pages):
+    """Yield (label, format, bytes) page renders from the corpus PDFs."""
+    paths = sorted(glob.glob(os.path.join(DOCS, "*.pdf")))
+    if not paths:
+        raise SystemExit(f"no PDFs in {DOCS} - run benchmarks/harness/gen_corpus.py")
+    for path in paths:
+        pdf = pdfium.PdfDocument(path)
+        try:
+            for index in range(min(len(pdf), max_pages)):
+                pil_img = pdf[index].render(scale=dpi / 72).to_pil().convert("RGB")
+                for fmt in ("JPEG", "PNG"):
+                    buffer = io.BytesIO()
+                    pil_img.save(buffer, format=fmt, quality=95)
+                    yield os.path.basename(path)[:-4], fmt, buffer.getvalue()
+        finally:
+            pdf.close()
+
+
+def time_resize(data, width, height, repeat, **kwargs):
+    best = None
+    for _ in range(repeat):
+        t0 = time.process_time()
+        out = resize_image(data, width, height, **kwargs)
+        elapsed = time.process_time() - t0
+        best = elapsed if best is None else min(best, elapsed)
+    return best, out
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--dpi", type=int, default=300)
+    ap.add_argument("--size", default="951x1268", help="target WIDTHxHEIGHT")
+    ap.add_argument("--pages", type=int, default=10, help="max pages per PDF")
+    ap.add_argument("--repeat", type=int, default=3, help="best-of-N CPU timing")
+    args = ap.parse_args()
+    width, height = (int(v) for v in args.size.split("x"))
+
+    totals = {(fmt, mode): 0.0 for fmt in ("JPEG", "PNG") for mode in MODES}
+    counts = {"JPEG": 0, "PNG": 0}
+    sizes = {(fmt, mode): 0 for fmt in ("JPEG", "PNG") for mode in MODES}
+    max_diff = 0.0
+    for label, fmt, data in render_pages(args.dpi, args.pages):
+        outputs = {}
+        for mode, kwargs in MODES.items():
+            cpu_s, out = time_resize(data, width, height, args.repeat, **kwargs)
+            totals[(fmt, mode)] += cpu_s
+            sizes[(fmt, mode)] += len(out)
+            outputs[mode] = Image.open(io.BytesIO(out))
+        assert outputs["fast"].size == outputs["default"].size, (
+            f"{label} {fmt}: fast output {outputs['fast'].size} != "
+            f"default {outputs['default'].size}"
+        )
+        diff = ImageChops.difference(
+            outputs["default"].convert("L"), outputs["fast"].convert("L")
+        )
+        max_diff = max(max_diff, ImageStat.Stat(diff).mean[0])
+        counts[fmt] += 1
+
+    print(f"dpi={args.dpi} target={width}x{height} best of {args.repeat} (CPU time)")
+    print(
+        f"{'format':6s} {'pages':>5s} {'default ms':>11s} {'fast ms':>8s} "
+        f"{'speedup':>7s} {'default KB':>11s} {'fast KB':>8s}"
+    )
+    for fmt, n in counts.items():
+        if not n:
+            continue
+        default_ms = totals[(fmt, "default")] / n * 1000
+        fast_ms = totals[(fmt, "fast")] / n * 1000
+        print(
+            f"{fmt:6s} {n:5d} {default_ms:11.1f} {fast_ms:8.1f} "
+            f"{default_ms / fast_ms:6.2f}x "
+            f"{sizes[(fmt, 'default')] / n / 1024:11.1f} "
+            f"{sizes[(fmt, 'fast')] / n / 1024:8.1f}"
+        )
+    print(
+        "output dimensions identical on all pages; "
+        f"max mean abs pixel difference {max_diff:.2f}/255"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""Measure a reprocessing pass replayed from the Bedrock response cache.
+
+Sends --requests page classification requests (each with its own --image-kb
+PNG-sized payload) through BedrockClient.invoke_model against a fake Converse
+endpoint that takes --latency-ms and bills --input-tokens per call, then sends
+the same requests again, as `idp-cli reprocess` or a test-set rerun does. Modes:
+  no cache        BEDROCK_RESPONSE_CACHE unset; both passes call the model
+  cold            first pass with a SQLite cache (fingerprint + write cost)
+  warm            second pass with the same cache (every call replayed)
+Reports wall time, model calls and metered input tokens per pass.
+Local only: no AWS calls.
+
+Usage:
+  export PYTHONPATH=$PWD/lib/idp_common_pkg AWS_DEFAULT_REGION=us-east-1
+  python3 benchmarks/micro/response_cache.py [--requests 200] [--image-kb 300] \
+      [--latency-ms 50]
+"""
+
+import argparse
+import logging
+import os
+import random
+import tempfile
+import time
+
+from idp_common.bedrock import response_cache
+from idp_common.bedrock.client import BedrockClient
+
+MODEL = "us.amazon.nova-lite-v1:0"
+
+
+class FakeBedrock:
+    def __init__(self, latency, input_tokens):
+        self.latency = latency
+        self.input_tokens = input_tokens
+        self.calls = 0
+
+    def converse(self, **kwargs):
+        self.calls += 1
+        time.sleep(self.latency)
+        return {
+            "output": {"message": {"content": [{"text": '{"class": "invoice"}'}]}},
+            "stopReason": "end_turn",
+            "usage": {
+                "inputTokens": self.input_tokens,
+                "outputTokens": 12,
+                "totalTokens": self.input_tokens + 12,
+            },
+        }
+
+
+def run_pass(client, pages):
+    fake = client._client
+    calls_before = fake.calls
+    tokens = 0
+    t0 = time.perf_counter()
+    for page in pages:
+        result = client.invoke_model(
+            MODEL,
+            "Classify the document page.",
+            [
+                {"text": "Which class is this page?"},
+                {"image": {"format": "png", "source": {"bytes": page}}},
+            ],
+            temperature=0.0,
+            top_p=None,
+            context="Classification",
+            cache_scope="bench",
+        )
+        for usage in result["metering"].values():
+            tokens += usage["inputTokens"]
+    return time.perf_counter() - t0, fake.calls - calls_before, tokens
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--requests", type=int, default=200)
+    ap.add_argument("--image-kb", type=int, default=300)
+    ap.add_argument("--latency-ms", type=float, default=50)
+    ap.add_argument("--input-tokens", type=int, default=1800)
+    args = ap.parse_args()
+    logging.disable(logging.WARNING)
+    os.environ["BEDROCK_ADAPTIVE_CONCURRENCY"] = "false"
+
+    rng = random.Random(7)
+    pages = [rng.randbytes(args.image_kb * 1024) for _ in range(args.requests)]
+
+    def new_client():
+        client = BedrockClient(region="us-east-1", metrics_enabled=False)
+        client._client = FakeBedrock(args.latency_ms / 1000, args.input_tokens)
+        return client
+
+    print(
+        f"{args.requests} requests x 2 passes, {args.image_kb} KB image each, "
+        f"{args.latency_ms:.0f} ms per model call"
+    )
+    print(f"{'mode':10s} {'wall s':>8s} {'calls':>6s} {'input tokens':>13s}")
+
+    os.environ.pop("BEDROCK_RESPONSE_CACHE", None)
+    client = new_client()
+    for _ in range(2):
+        wall, calls, tokens = run_pass(client, pages)
+        print(f"{'no cache':10s} {wall:8.2f} {calls:6d} {tokens:13d}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["BEDROCK_RESPONSE_CACHE"] = f"sqlite://{tmp}/cache.db"
+        response_cache.reset_response_cache()
+        client = new_client()
+        for name in ("cold", "warm"):
+            wall, calls, tokens = run_pass(client, pages)
+            print(f"{name:10s} {wall:8.2f} {calls:6d} {tokens:13d}")
+        response_cache.reset_response_cache()
+
+
+if __name__ == "__main__":
+    main()
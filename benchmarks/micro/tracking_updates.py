@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""Replay the pipeline's tracking-table writes with full and changed-field updates.
+
+Replays the update_document calls one document makes through the unified
+pattern (queue, OCR, classification, per-section extraction/assessment
+writes, process-results, summarization, workflow tracker), passing the
+document between steps through to_dict/from_dict like Step Functions does,
+against a moto TrackingTable. Each replay runs twice:
+  full     every update_document call writes every attribute (the default)
+  changed  each call passes the changed= set its Lambda passes; the
+           workflow tracker's final write stays whole in both modes
+Reports, per mode, update_document calls that reached DynamoDB, request
+bytes, and write capacity units. WCU follow DynamoDB's UpdateItem rule -
+ceil(max(item size before, item size after) / 1 KB) - with item sizes
+estimated from the stored item, so they count what a provisioned or
+on-demand table would bill, not the request size. Local only: uses moto.
+
+Usage:
+  export PYTHONPATH=$PWD/lib/idp_common_pkg AWS_DEFAULT_REGION=us-east-1
+  python3 benchmarks/micro/tracking_updates.py [--sections 5,30,100] [--documents 2]
+"""
+
+import argparse
+import json
+import math
+from decimal import Decimal
+
+import boto3
+from moto import mock_aws
+
+from idp_common.dynamodb.client import DynamoDBClient
+from idp_common.dynamodb.service import DocumentDynamoDBService
+from idp_common.models import Document, Page, Section, Status
+
+TABLE = "bench-tracking"
+
+
+def item_size(value):
+    """Approximate DynamoDB size in bytes of an attribute value."""
+    if isinstance(value, str):
+        return len(value.encode("utf-8"))
+    if isinstance(value, bool) or value is None:
+        return 1
+    if isinstance(value, (int, float, Decimal)):
+        return len(str(value).lstrip("-").replace(".", "")) // 2 + 2
+    if isinstance(value, dict):
+        return 3 + sum(len(k) + item_size(v) + 1 for k, v in value.items())
+    if isinstance(value, (list, tuple, set)):
+        return 3 + sum(item_size(v) + 1 for v in value)
+    return len(str(value))
+
+
+class Meter:
+    """Wraps DynamoDBClient.update_item to count calls, bytes and WCU."""
+
+    def __init__(self, client, table):
+        self.calls = 0
+        self.request_bytes = 0
+        self.wcu = 0
+        self._table = table
+        self._update_item = client.update_item
+        client.update_item = self.update_item
+
+    def _size(self, key):
+        item = self._table.get_item(Key=key).get("Item") or {}
+        return sum(len(k) + item_size(v) for k, v in item.items())
+
+    def update_item(self, **kwargs):
+        before = self._size(kwargs["key"])
+        response = self._update_item(**kwargs)
+        after = self._size(kwargs["key"])
+        self.calls += 1
+        self.request_bytes += len(
+            json.dumps(
+                [
+                    kwargs["update_expression"],
+                    kwargs.get("expression_attribute_names"),
+                    kwargs.get("expression_attribute_values"),
+                ],
+                default=str,
+            )
+        )
+        self.wcu += math.ceil(max(before, after) / 1024)
+        return response
+
+
+def new_document(index, num_sections):
+    return Document(
+        id=f"bench/doc-{index}.pdf",
+        input_key=f"bench/doc-{index}.pdf",
+        input_bucket="input",
+        output_bucket="output",
+        queued_time="2026-01-01T00:00:00Z",
+        initial_event_time="2026-01-01T00:00:00Z",
+        num_pages=num_sections * 2,
+    )
+
+
+def hop(document):
+    """Pass a document to the next Step Functions task."""
+    return Document.from_dict(json.loads(json.dumps(document.to_dict(), default=str)))
+
+
+def replay(service, document, num_sections, full):
+    def update(doc, *changed):
+        service.update_document(doc, changed=None if full else set(changed))
+
+    service.create_document(document)  # queue_sender
+    document.status = Status.RUNNING  # queue_processor
+    document.start_time = "2026-01-01T00:00:01Z"
+    document.workflow_execution_arn = "arn:aws:states:us-east-1:1:execution:sm:run"
+    document.config_version = "default"
+    document.trace_id = "1-00000000-000000000000000000000000"
+    update(
+        document,
+        "status",
+        "start_time",
+        "workflow_execution_arn",
+        "config_version",
+        "trace_id",
+    )
+
+    doc = hop(document)  # OCR
+    doc.status = Status.OCR
+    update(doc, "status", "workflow_execution_arn")
+    prefix = f"s3://output/{doc.input_key}/pages"
+    for n in range(1, num_sections * 2 + 1):
+        doc.pages[str(n)] = Page(
+            page_id=str(n),
+            image_uri=f"{prefix}/{n}/image.jpg",
+            parsed_text_uri=f"{prefix}/{n}/result.json",
+            ocr_page_data_uri=f"{prefix}/{n}/ocr.json",
+        )
+    doc.metering = {"OCR/textract/analyze_document": {"pages": len(doc.pages)}}
+
+    doc = hop(doc)  # classification
+    doc.status = Status.CLASSIFYING
+    update(doc, "status", "workflow_execution_arn", "pages", "num_pages", "metering")
+    for page in doc.pages.values():
+        page.classification = "Invoice"
+    for s in range(num_sections):
+        doc.sections.append(
+            Section(
+                section_id=str(s + 1),
+                classification="Invoice",
+                page_ids=[str(2 * s + 1), str(2 * s + 2)],
+            )
+        )
+    doc.metering["Classification/bedrock/model"] = {"inputTokens": 1000}
+    update(doc, "status", "pages", "num_pages", "sections", "metering")
+    classified = hop(doc)
+
+    # Extraction + assessment Map iterations (same calls in both modes)
+    for index, section in enumerate(classified.sections):
+        service.update_document_status(classified.input_key, Status.EXTRACTING)
+        section.extraction_result_uri = (
+            f"s3://output/{doc.input_key}/sections/{section.section_id}/result.json"
+        )
+        service.update_document_section(classified.input_key, index, section)
+
+    doc = hop(classified)  # process results
+    doc.status = Status.POSTPROCESSING
+    update(doc, "status")
+    for section in doc.sections:
+        section.extraction_result_uri = (
+            f"s3://output/{doc.input_key}/sections/{section.section_id}/result.json"
+        )
+        section.confidence_threshold_alerts = [
+            {"attribute_name": "total", "confidence": 0.6, "confidence_threshold": 0.8}
+        ]
+    doc.confidence_alert_count = len(doc.sections)
+    doc.metering["Extraction/bedrock/model"] = {"inputTokens": 5000}
+    update(
+        doc,
+        "status",
+        "pages",
+        "sections",
+        "metering",
+        "hitl_status",
+        "hitl_sections_pending",
+        "hitl_sections_completed",
+        "confidence_alert_count",
+    )
+
+    doc = hop(doc)  # summarization
+    doc.status = Status.SUMMARIZING
+    update(doc, "status")
+    doc.summary_report_uri = f"s3://output/{doc.input_key}/summary/summary.md"
+
+    doc = hop(doc)  # workflow tracker: the final document is written whole
+    doc.status = Status.COMPLETED
+    doc.completion_time = "2026-01-01T00:05:00Z"
+    service.update_document(doc)
+
+
+def run(num_sections, num_documents, full):
+    with mock_aws():
+        boto3.client("dynamodb").create_table(
+            TableName=TABLE,
+            KeySchema=[
+                {"AttributeName": "PK", "KeyType": "HASH"},
+                {"AttributeName": "SK", "KeyType": "RANGE"},
+            ],
+            AttributeDefinitions=[
+                {"AttributeName": "PK", "AttributeType": "S"},
+                {"AttributeName": "SK", "AttributeType": "S"},
+            ],
+            BillingMode="PAY_PER_REQUEST",
+        )
+        client = DynamoDBClient(table_name=TABLE)
+        service = DocumentDynamoDBService(dynamodb_client=client)
+        table = boto3.resource("dynamodb").Table(TABLE)
+        # Meter only update_document; the Map-iteration calls are identical
+        meter = Meter(client, table)
+        status, section = (
+            service.update_document_status,
+            service.update_document_section,
+        )
+
+        def unmetered(fn):
+            def call(*args, **kwargs):
+                client.update_item = meter._update_item
+                try:
+                    return fn(*args, **kwargs)
+                finally:
+                    client.update_item = meter.update_item
+
+            return call
+
+        service.update_document_status = unmetered(status)
+        service.update_document_section = unmetered(section)
+        for index in range(num_documents):
+            replay(service, new_document(index, num_sections), num_sections, full)
+        return meter
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--sections", default="5,30,100")
+    ap.add_argument("--documents", type=int, default=2)
+    args = ap.parse_args()
+
+    print(f"{args.documents} documents per row, update_document calls only")
+    print(
+        f"{'sections':>8s} {'mode':7s} {'writes':>7s} {'request KB':>11s} "
+        f"{'WCU':>7s} {'WCU/doc':>8s}"
+    )
+    for num_sections in (int(v) for v in args.sections.split(",")):
+        for mode in ("full", "changed"):
+            meter = run(num_sections, args.documents, mode == "full")
+            print(
+                f"{num_sections:8d} {mode:7s} {meter.calls:7d} "
+                f"{meter.request_bytes / 1024:11.1f} {meter.wcu:7d} "
+                f"{meter.wcu / args.documents:8.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""Equivalence of the single-pass PII replacer with the upstream sequential one.
+
+The vendored text_replacer matches long texts with an Aho-Corasick automaton
+(a local modification, see vendor/PROVENANCE.md). Redaction correctness rests
+on it returning exactly what the upstream per-entry loop returns: the text,
+found originals, placeholder count, match types and occurrence counts.
+"""
+
+import os
+import random
+import sys
+
+import pytest
+
+VENDOR_ROOT = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..", "vendor", "pii_anonymizer")
+)
+if VENDOR_ROOT not in sys.path:
+    sys.path.insert(0, VENDOR_ROOT)
+
+from core import text_replacer  # noqa: E402
+from core.aho_corasick import AhoCorasick  # noqa: E402
+
+
+def _assert_equivalent(text, mapping):
+    expected = text_replacer._replace_pii_in_text_sequential(text, mapping)
+    assert text_replacer._single_pass_supported(text, mapping)
+    assert text_replacer._replace_pii_in_text_single_pass(text, mapping) == expected
+
+
+def test_aho_corasick_finds_overlapping_occurrences():
+    patterns = ["he", "she", "his", "hers", "s"]
+
+    found = AhoCorasick(patterns).find_all("ushers his")
+
+    assert found == [[2], [1], [7], [2], [1, 5, 9]]
+
+
+@pytest.mark.parametrize(
+    "text, mapping",
+    [
+        # longest match wins, the shorter value is not replaced inside it
+        ("John Smith met John.", {"John": "Mark", "John Smith": "Al Jones"}),
+        # short values only match on word boundaries
+        ("ID 42 in 1423 and A42", {"42": "99"}),
+        # a short value adjacent to a replaced one sees a non-word neighbour
+        ("Ann42 Ann", {"Ann": "Zoe", "42": "77", "Ann42": "Bob"}),
+        ("x42Ann", {"Ann": "Zoe", "42": "77"}),
+        # short value present but never on a boundary: counted as 0, not found
+        ("abcdef", {"cd": "zz"}),
+        # repeated and self-overlapping values
+        ("aaaa aaa", {"aa": "b", "aaaa": "c"}),
+        # normalized match across whitespace and colons
+        ("Name :  Jane\n  Doe, SSN:123", {"Jane Doe": "Sue Roe", "SSN : 123": "x"}),
+        # normalized check passes but the raw pattern does not match
+        ("key:value", {"key : value": "redacted"}),
+        # synthetic values that contain other originals are not re-replaced
+        ("Alice and Bob", {"Alice": "Bob Jr", "Bob": "Alice Sr"}),
+        ("", {"a": "b"}),
+        ("nothing here", {}),
+    ],
+)
+def test_matches_sequential_on_edge_cases(text, mapping):
+    _assert_equivalent(text, mapping)
+
+
+def test_matches_sequential_on_random_documents():
+    rng = random.Random(7)
+    alphabet = "ab1_: \n-."
+    for _ in range(2000):
+        values = {
+            "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 6)))
+            for _ in range(rng.randint(1, 10))
+        }
+        mapping = {v: f"<{i}>" for i, v in enumerate(values)}
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 80)))
+        _assert_equivalent(text, mapping)
+
+
+@pytest.mark.parametrize(
+    "text, mapping",
+    [
+        ("Jane Doe \ue000\ue001\ue000", {"Jane Doe": "Sue Roe"}),
+        ("Jane Doe", {"Jane Doe": "Sue \ue001"}),
+        ("Jane Doe", {"": "x", "Jane Doe": "Sue Roe"}),
+        ("Jane Doe", {"Jane Doe": None}),
+    ],
+)
+def test_inputs_that_could_diverge_use_the_sequential_loop(monkeypatch, text, mapping):
+    monkeypatch.setattr(
+        text_replacer,
+        "_replace_pii_in_text_single_pass",
+        lambda *args: pytest.fail("single pass used"),
+    )
+    monkeypatch.setattr(
+        text_replacer, "_replace_pii_in_text_sequential", lambda *args: "sequential"
+    )
+
+    assert text_replacer.replace_pii_in_text(text, mapping) == "sequential"
@@ -1312,6 +1312,13 @@ def delete(
     is_flag=True,
     help="Skip confirmation prompt",
 )
+@click.option(
+    "--workers",
+    type=int,
+    default=8,
+    show_default=True,
+    help="Chunks of documents deleted concurrently",
+)
 @click.option("--region", help="AWS region (optional)")
 def delete_documents_cmd(
     stack_name: str,
@@ -1321,6 +1328,7 @@ def delete_documents_cmd(
     status_filter: Optional[str],
     dry_run: bool,
     force: bool,
+    workers: int,
     region: Optional[str],
 ):
     """
@@ -1332,6 +1340,11 @@ def delete_documents_cmd(
     - DynamoDB tracking records
     - List entries in tracking table
 
+    Documents are deleted in bulk: S3 objects 1000 per DeleteObjects call and
+    tracking items 25 per BatchWriteItem call, several chunks at a time. A dry
+    run reports the items and requests the deletion would take and its
+    estimated cost.
+
     ⚠️  WARNING: This action cannot be undone.
 
     Examples:
@@ -1362,7 +1375,7 @@ def delete_documents_cmd(
         import boto3
 
         from idp_common.delete_documents import (
-            delete_documents,
+            bulk_delete_documents,
             get_documents_by_batch,
             get_documents_by_pattern,
         )
@@ -1477,22 +1490,46 @@ def delete_documents_cmd(
 
         # Perform deletion
         console.print()
-        with console.status(f"[bold red]Deleting {len(doc_list)} document(s)..."):
-            result = delete_documents(
+        with console.status(
+            f"[bold red]Deleting {len(doc_list)} document(s)..."
+        ) as status:
+            result = bulk_delete_documents(
                 object_keys=doc_list,
                 tracking_table=tracking_table,
                 s3_client=s3_client,
                 input_bucket=input_bucket,
                 output_bucket=output_bucket,
                 dry_run=dry_run,
-                continue_on_error=True,
+                workers=workers,
+                progress_callback=lambda done, _deleted: status.update(
+                    f"[bold red]Deleting {len(doc_list)} document(s)... "
+                    f"{done}/{len(doc_list)}"
+                ),
             )
 
         # Show results
         console.print()
         if dry_run:
+            preview = result["preview"]
             console.print("[bold yellow]DRY RUN COMPLETE[/bold yellow]")
-            console.print(f"Would delete {result['total_count']} document(s)")
+            console.print(f"Would delete {result['total_count']} document(s):")
+            console.print(
+                f"  S3: {preview['input_objects']} input object(s), "
+                f"{preview['output_object_versions']} output object version(s)"
+            )
+            console.print(
+                f"  DynamoDB: {preview['document_records']} document record(s), "
+                f"{preview['list_entries']} list entries, "
+                f"{preview['run_records']} run record(s)"
+            )
+            console.print(
+                f"  Requests: {preview['bulk_request_count']} in bulk "
+                f"(vs {preview['per_document_request_count']} one document at a time)"
+            )
+            console.print(
+                f"  Estimated cost: ${preview['estimated_cost_usd']:.6f} "
+                "(on-demand list prices, us-east-1)"
+            )
         elif result["success"]:
             console.print(
                 f"[green]✓ Successfully deleted {result['deleted_count']} document(s)[/green]"
@@ -1502,6 +1539,11 @@ def delete_documents_cmd(
                 f"[yellow]⚠ Deleted {result['deleted_count']}/{result['total_count']} document(s)[/yellow]"
             )
             console.print(f"[red]  {result['failed_count']} failed[/red]")
+        if not dry_run:
+            console.print(
+                f"  {result['elapsed_seconds']:.1f}s, "
+                f"{result['documents_per_second']:.1f} documents/s"
+            )
 
         # Show details for failures
         if result.get("results"):
@@ -1541,6 +1583,8 @@ def _process_impl(
     region: Optional[str],
     number_of_files: Optional[int],
     config_version: Optional[str],
+    workers: Optional[int] = None,
+    resume: bool = False,
 ):
     """Implementation for process and run_inference commands"""
     try:
@@ -1558,6 +1602,13 @@ def _process_impl(
             console.print("[red]✗ Error: Cannot specify multiple input sources[/red]")
             sys.exit(1)
 
+        if resume and (not batch_id or test_set):
+            console.print(
+                "[red]✗ Error: --resume requires --batch-id of the interrupted batch "
+                "(not supported with --test-set)[/red]"
+            )
+            sys.exit(1)
+
         from idp_sdk import IDPClient
 
         client = IDPClient(stack_name=stack_name, region=region)
@@ -1589,6 +1640,8 @@ def _process_impl(
                     batch_id=batch_id,
                     number_of_files=number_of_files,
                     config_version=config_version,
+                    max_workers=workers,
+                    resume=resume,
                 )
             elif directory:
                 result = client.batch.process(
@@ -1599,6 +1652,8 @@ def _process_impl(
                     batch_id=batch_id,
                     number_of_files=number_of_files,
                     config_version=config_version,
+                    max_workers=workers,
+                    resume=resume,
                 )
             elif s3_uri:
                 result = client.batch.process(
@@ -1609,6 +1664,8 @@ def _process_impl(
                     batch_id=batch_id,
                     number_of_files=number_of_files,
                     config_version=config_version,
+                    max_workers=workers,
+                    resume=resume,
                 )
             else:
                 raise ValueError("No input source specified")
@@ -1617,6 +1674,16 @@ def _process_impl(
             result_queued = result.documents_queued
             result_uploaded = result.documents_uploaded
             result_failed = result.documents_failed
+            if result.documents_resumed:
+                console.print(
+                    f"Skipped {result.documents_resumed} documents already submitted "
+                    "by the interrupted run"
+                )
+            if result.docs_per_second is not None:
+                console.print(
+                    f"Submitted in {result.elapsed_seconds:.1f}s "
+                    f"({result.docs_per_second:.1f} docs/sec)"
+                )
 
         # Show results
         console.print()
@@ -1703,6 +1770,18 @@ def _process_impl(
     "--config-version",
     help="Configuration version to use for processing (e.g., v1, v2)",
 )
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=16,
+    help="Documents uploaded/copied concurrently (default: 16)",
+)
+@click.option(
+    "--resume",
+    is_flag=True,
+    help="Resume the interrupted batch given by --batch-id, skipping documents "
+    "it already submitted",
+)
 def process(
     stack_name: str,
     manifest: Optional[str],
@@ -1720,6 +1799,8 @@ def process(
     region: Optional[str],
     number_of_files: Optional[int],
     config_version: Optional[str],
+    workers: int,
+    resume: bool,
 ):
     """
     Process documents
@@ -1769,6 +1850,9 @@ def process(
 
       # Process manifest with baselines (automatically creates "idp-cli" test set for Test Studio integration)
       idp-cli process --stack-name my-stack --manifest docs_with_baselines.csv --monitor
+
+      # Resume a large submission that was interrupted (same source, same batch ID)
+      idp-cli process --stack-name my-stack --manifest big.csv --batch-id big-run-1 --resume
     """
     return _process_impl(
         stack_name,
@@ -1787,6 +1871,8 @@ def process(
         region,
         number_of_files,
         config_version,
+        workers=workers,
+        resume=resume,
     )
 
 
@@ -2482,6 +2568,17 @@ def list_batches(stack_name: str, limit: int, region: Optional[str]):
     default="all",
     help="File types to download: pages, sections, summary, evaluation, or 'all' (default: all)",
 )
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=16,
+    help="Files downloaded concurrently (default: 16)",
+)
+@click.option(
+    "--force",
+    is_flag=True,
+    help="Download every file, even ones whose local copy is already current",
+)
 @click.option("--region", help="AWS region (optional)")
 def download_results(
     stack_name: str,
@@ -2490,6 +2587,8 @@ def download_results(
     run_id: Optional[str],
     output_dir: str,
     file_types: str,
+    workers: int,
+    force: bool,
     region: Optional[str],
 ):
     """
@@ -2503,6 +2602,9 @@ def download_results(
       # Download only extraction results (sections)
       idp-cli download-results --stack-name my-stack --batch-id <id> --output-dir ./results/ --file-types sections
 
+      # Re-running is incremental: files already downloaded and unchanged are skipped
+      idp-cli download-results --stack-name my-stack --batch-id <id> --output-dir ./results/ --workers 32
+
       # Download a specific document VERSION (exact bytes of one processing run)
       idp-cli download-results --stack-name my-stack --document-id loan-123/package.pdf \\
           --run-id 20250707T141530Z-exec-abc --output-dir ./results/
@@ -2548,13 +2650,29 @@ def download_results(
 
         # Download results
         result = client.batch.download_results(
-            batch_id=batch_id, output_dir=output_dir, file_types=types_list
+            batch_id=batch_id,
+            output_dir=output_dir,
+            file_types=types_list,
+            max_workers=workers,
+            skip_unchanged=not force,
         )
 
         console.print(
             f"\n[green]✓ Downloaded {result.files_downloaded} files to {output_dir}[/green]"
         )
+        if result.files_skipped:
+            console.print(f"  Unchanged (skipped): {result.files_skipped}")
+        if result.files_failed:
+            console.print(
+                f"[red]  Failed: {result.files_failed} (re-run to retry)[/red]"
+            )
         console.print(f"  Documents: {result.documents_downloaded}")
+        if result.elapsed_seconds is not None:
+            console.print(
+                f"  Throughput: {result.files_per_second} files/sec, "
+                f"{result.megabytes_per_second} MiB/sec "
+                f"({result.elapsed_seconds:.1f}s)"
+            )
         console.print(f"  Output: {output_dir}/{batch_id}/")
         console.print()
 
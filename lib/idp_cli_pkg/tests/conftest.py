@@ -8,6 +8,8 @@ Test configuration and fixtures for idp_cli tests
 import sys
 from pathlib import Path
 
+import pytest
+
 # Add idp_common_pkg to Python path for testing
 # This mirrors the production code's approach of dynamically adding the path
 # Since idp_cli_pkg is in lib/, we go up to lib/ level and find idp_common_pkg there
@@ -20,3 +22,9 @@ else:
     raise RuntimeError(
         f"idp_common_pkg not found at expected location: {idp_common_path}"
     )
+
+
+@pytest.fixture(autouse=True)
+def _checkpoint_dir(tmp_path, monkeypatch):
+    """Keep batch submission journals out of the user's home directory."""
+    monkeypatch.setenv("IDP_CHECKPOINT_DIR", str(tmp_path / "checkpoints"))
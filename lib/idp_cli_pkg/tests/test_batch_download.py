@@ -0,0 +1,143 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Tests for concurrent, incremental batch result downloads in the batch processor
+"""
+
+import json
+import os
+from unittest.mock import patch
+
+import boto3
+import pytest
+from moto import mock_aws
+
+from idp_sdk._core.batch_processor import _DOWNLOAD_STATE_FILE, BatchProcessor
+
+OUTPUT_BUCKET = "output-bucket"
+
+
+@pytest.fixture
+def processor(monkeypatch):
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+    with mock_aws(), patch("idp_sdk._core.batch_processor.StackInfo") as stack_info:
+        stack_info.return_value.validate_stack.return_value = True
+        stack_info.return_value.get_resources.return_value = {
+            "InputBucket": "input-bucket",
+            "OutputBucket": OUTPUT_BUCKET,
+        }
+        s3 = boto3.client("s3", region_name="us-east-1")
+        s3.create_bucket(Bucket=OUTPUT_BUCKET)
+        for doc in range(3):
+            for part in ("pages/1/result.json", "sections/1/result.json"):
+                s3.put_object(
+                    Bucket=OUTPUT_BUCKET,
+                    Key=f"b1/doc-{doc}.pdf/{part}",
+                    Body=json.dumps({"doc": doc, "part": part}).encode(),
+                )
+        yield BatchProcessor("test-stack", region="us-east-1")
+
+
+def _download(processor, output_dir, **kwargs):
+    return processor.download_batch_results(
+        "b1", str(output_dir), ["all"], max_workers=4, **kwargs
+    )
+
+
+@pytest.mark.unit
+class TestDownloadBatchResults:
+    def test_downloads_every_matching_file(self, processor, tmp_path):
+        result = _download(processor, tmp_path)
+
+        assert result["files_listed"] == result["files_downloaded"] == 6
+        assert result["files_skipped"] == result["files_failed"] == 0
+        assert result["documents_downloaded"] == 3
+        assert result["bytes_downloaded"] > 0
+        assert result["files_per_second"] > 0
+        body = (tmp_path / "b1/doc-2.pdf/sections/1/result.json").read_text()
+        assert json.loads(body) == {"doc": 2, "part": "sections/1/result.json"}
+
+    def test_file_types_filter(self, processor, tmp_path):
+        result = processor.download_batch_results(
+            "b1", str(tmp_path), ["sections"], max_workers=2
+        )
+
+        assert result["files_downloaded"] == 3
+        assert not (tmp_path / "b1/doc-0.pdf/pages").exists()
+
+    def test_rerun_skips_unchanged_files(self, processor, tmp_path):
+        _download(processor, tmp_path)
+
+        with patch.object(
+            processor, "_download_object", wraps=processor._download_object
+        ) as download:
+            result = _download(processor, tmp_path)
+
+        download.assert_not_called()
+        assert result["files_skipped"] == 6
+        assert result["files_downloaded"] == 0
+
+    def test_changed_object_is_downloaded_again(self, processor, tmp_path):
+        _download(processor, tmp_path)
+        processor.s3.put_object(
+            Bucket=OUTPUT_BUCKET,
+            Key="b1/doc-1.pdf/pages/1/result.json",
+            Body=b'{"doc": 1, "reprocessed": true}',
+        )
+
+        result = _download(processor, tmp_path)
+
+        assert result["files_downloaded"] == 1
+        assert result["files_skipped"] == 5
+        body = (tmp_path / "b1/doc-1.pdf/pages/1/result.json").read_text()
+        assert json.loads(body)["reprocessed"] is True
+
+    def test_locally_modified_file_is_downloaded_again(self, processor, tmp_path):
+        _download(processor, tmp_path)
+        local = tmp_path / "b1/doc-0.pdf/pages/1/result.json"
+        original = local.read_bytes()
+        # Same size, different content: only the recorded mtime gives it away
+        local.write_bytes(b"x" * len(original))
+        stat = os.stat(local)
+        os.utime(local, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        result = _download(processor, tmp_path)
+
+        assert result["files_downloaded"] == 1
+        assert local.read_bytes() == original
+
+    def test_unrecorded_single_part_files_are_matched_by_md5(self, processor, tmp_path):
+        _download(processor, tmp_path)
+        os.remove(tmp_path / _DOWNLOAD_STATE_FILE)
+
+        result = _download(processor, tmp_path)
+
+        assert result["files_skipped"] == 6
+        assert (tmp_path / _DOWNLOAD_STATE_FILE).exists()
+
+    def test_force_downloads_everything(self, processor, tmp_path):
+        _download(processor, tmp_path)
+
+        result = _download(processor, tmp_path, skip_unchanged=False)
+
+        assert result["files_downloaded"] == 6
+
+    def test_failures_are_counted_and_retried_on_rerun(self, processor, tmp_path):
+        original = processor._download_object
+
+        def flaky(bucket, s3_key, local_path):
+            if s3_key.startswith("b1/doc-1.pdf/"):
+                raise ConnectionError("network dropped")
+            return original(bucket, s3_key, local_path)
+
+        with patch.object(processor, "_download_object", flaky):
+            first = _download(processor, tmp_path)
+        assert first["files_failed"] == 2
+        assert first["files_downloaded"] == 4
+
+        second = _download(processor, tmp_path)
+
+        assert second["files_downloaded"] == 2
+        assert second["files_skipped"] == 4
+        assert second["files_failed"] == 0
@@ -0,0 +1,251 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Tests for concurrent, resumable batch submission in the batch processor
+"""
+
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import boto3
+import pytest
+from botocore.exceptions import ClientError
+from moto import mock_aws
+
+from idp_sdk._core.batch_processor import BatchProcessor, SubmissionJournal
+
+INPUT_BUCKET = "input-bucket"
+OUTPUT_BUCKET = "output-bucket"
+
+
+@pytest.fixture
+def processor(monkeypatch):
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+    with mock_aws(), patch("idp_sdk._core.batch_processor.StackInfo") as stack_info:
+        stack_info.return_value.validate_stack.return_value = True
+        stack_info.return_value.get_resources.return_value = {
+            "InputBucket": INPUT_BUCKET,
+            "OutputBucket": OUTPUT_BUCKET,
+        }
+        s3 = boto3.client("s3", region_name="us-east-1")
+        s3.create_bucket(Bucket=INPUT_BUCKET)
+        s3.create_bucket(Bucket=OUTPUT_BUCKET)
+        yield BatchProcessor("test-stack", region="us-east-1")
+
+
+@pytest.fixture
+def docs_dir(tmp_path):
+    directory = tmp_path / "docs"
+    directory.mkdir()
+    for i in range(12):
+        (directory / f"doc-{i:02d}.pdf").write_bytes(b"%PDF-" + bytes([i]))
+    return directory
+
+
+def _input_keys(processor):
+    response = processor.s3.list_objects_v2(Bucket=INPUT_BUCKET)
+    return sorted(obj["Key"] for obj in response.get("Contents", []))
+
+
+@pytest.mark.unit
+class TestConcurrentSubmission:
+    def test_submits_every_document_in_source_order(
+        self, processor, docs_dir, tmp_path
+    ):
+        result = processor.process_batch_from_directory(
+            str(docs_dir),
+            batch_id="b1",
+            max_workers=4,
+            checkpoint_dir=str(tmp_path / "journals"),
+        )
+
+        scanned = processor._scan_local_directory(str(docs_dir), "*.pdf", True)
+        assert result["document_ids"] == [f"b1/{d['relative_path']}" for d in scanned]
+        assert _input_keys(processor) == [f"b1/doc-{i:02d}.pdf" for i in range(12)]
+        assert result["queued"] == result["uploaded"] == 12
+        assert result["failed"] == 0
+        assert result["docs_per_second"] > 0
+        journal = SubmissionJournal.for_batch("b1", str(tmp_path / "journals"))
+        assert len(journal.load()) == 12
+
+    def test_config_version_is_set_as_object_metadata(
+        self, processor, docs_dir, tmp_path
+    ):
+        processor.process_batch_from_directory(
+            str(docs_dir),
+            batch_id="b1",
+            number_of_files=1,
+            config_version="v2",
+            checkpoint_dir=str(tmp_path),
+        )
+
+        key = _input_keys(processor)[0]
+        head = processor.s3.head_object(Bucket=INPUT_BUCKET, Key=key)
+        assert head["Metadata"] == {"config-version": "v2"}
+
+
+@pytest.mark.unit
+class TestResume:
+    def test_resume_submits_only_what_the_interrupted_run_missed(
+        self, processor, docs_dir, tmp_path
+    ):
+        journals = str(tmp_path / "journals")
+        original = processor._process_document_with_base
+
+        def flaky(doc, *args):
+            if doc["filename"] in ("doc-03.pdf", "doc-07.pdf"):
+                raise ConnectionError("network dropped")
+            return original(doc, *args)
+
+        with patch.object(processor, "_process_document_with_base", flaky):
+            first = processor.process_batch_from_directory(
+                str(docs_dir), batch_id="b1", checkpoint_dir=journals
+            )
+        assert first["failed"] == 2
+
+        with patch.object(
+            processor,
+            "_process_document_with_base",
+            side_effect=original,
+        ) as submit:
+            resumed = processor.process_batch_from_directory(
+                str(docs_dir), batch_id="b1", resume=True, checkpoint_dir=journals
+            )
+
+        submitted = sorted(call.args[0]["filename"] for call in submit.call_args_list)
+        assert submitted == ["doc-03.pdf", "doc-07.pdf"]
+        assert resumed["resumed"] == 10
+        assert resumed["queued"] == 12
+        assert resumed["failed"] == 0
+        assert len(_input_keys(processor)) == 12
+
+        # The stored batch metadata describes the whole batch, not just the tail
+        body = processor.s3.get_object(
+            Bucket=OUTPUT_BUCKET, Key="cli-batches/b1/metadata.json"
+        )["Body"].read()
+        assert len(json.loads(body)["document_ids"]) == 12
+
+    def test_interrupted_run_journals_uploads_that_finish_during_shutdown(
+        self, processor, docs_dir, tmp_path
+    ):
+        journals = str(tmp_path / "journals")
+        original = processor._process_document_with_base
+
+        def interrupted(doc, *args):
+            if doc["filename"] == "doc-02.pdf":
+                raise KeyboardInterrupt
+            # Still uploading when the interrupt reaches the main thread
+            time.sleep(0.1)
+            return original(doc, *args)
+
+        with patch.object(processor, "_process_document_with_base", interrupted):
+            with pytest.raises(KeyboardInterrupt):
+                processor.process_batch_from_directory(
+                    str(docs_dir), batch_id="b1", max_workers=4, checkpoint_dir=journals
+                )
+        uploaded = set(_input_keys(processor))
+        assert uploaded
+        assert len(SubmissionJournal.for_batch("b1", journals).load()) == len(uploaded)
+
+        with patch.object(
+            processor,
+            "_process_document_with_base",
+            side_effect=original,
+        ) as submit:
+            resumed = processor.process_batch_from_directory(
+                str(docs_dir), batch_id="b1", resume=True, checkpoint_dir=journals
+            )
+
+        resubmitted = {
+            f"b1/{call.args[0]['filename']}" for call in submit.call_args_list
+        }
+        assert not resubmitted & uploaded
+        assert resubmitted | uploaded == set(_input_keys(processor))
+        assert resumed["queued"] == 12
+
+    def test_submissions_in_flight_are_bounded(self, processor, docs_dir, tmp_path):
+        queued = []
+        submit = ThreadPoolExecutor.submit
+
+        def counting_submit(executor, *args, **kwargs):
+            queued.append(executor._work_queue.qsize())
+            return submit(executor, *args, **kwargs)
+
+        with (
+            patch.object(ThreadPoolExecutor, "submit", counting_submit),
+            patch.object(
+                processor,
+                "_submit_document",
+                side_effect=lambda doc, *a: (
+                    time.sleep(0.02)
+                    or {"s3_key": doc["filename"], "uploaded": True, "baseline": False}
+                ),
+            ),
+        ):
+            result = processor.process_batch_from_directory(
+                str(docs_dir),
+                batch_id="b1",
+                max_workers=1,
+                checkpoint_dir=str(tmp_path),
+            )
+
+        assert result["queued"] == 12
+        assert max(queued) < 4
+
+    def test_truncated_journal_line_is_resubmitted(self, processor, docs_dir, tmp_path):
+        journal = SubmissionJournal.for_batch("b1", str(tmp_path))
+        journal.open(append=False)
+        journal.record(str(docs_dir / "doc-00.pdf"), "b1/doc-00.pdf", True, False)
+        journal.close()
+        with open(journal.path, "a") as f:
+            f.write('{"source": "' + str(docs_dir / "doc-01.pdf"))
+
+        result = processor.process_batch_from_directory(
+            str(docs_dir), batch_id="b1", resume=True, checkpoint_dir=str(tmp_path)
+        )
+
+        assert result["resumed"] == 1
+        assert "b1/doc-01.pdf" in _input_keys(processor)
+
+    def test_resume_without_journal_fails(self, processor, docs_dir, tmp_path):
+        with pytest.raises(ValueError, match="no checkpoint journal"):
+            processor.process_batch_from_directory(
+                str(docs_dir),
+                batch_id="unknown",
+                resume=True,
+                checkpoint_dir=str(tmp_path),
+            )
+
+
+@pytest.mark.unit
+def test_copy_falls_back_to_multipart_copy_for_large_objects():
+    with (
+        patch("idp_sdk._core.batch_processor.StackInfo") as stack_info,
+        patch("boto3.client") as mock_client,
+        patch("boto3.resource"),
+    ):
+        stack_info.return_value.validate_stack.return_value = True
+        stack_info.return_value.get_resources.return_value = {
+            "InputBucket": INPUT_BUCKET
+        }
+        mock_s3 = MagicMock()
+        mock_s3.copy_object.side_effect = ClientError(
+            {"Error": {"Code": "InvalidRequest", "Message": "larger than 5 GB"}},
+            "CopyObject",
+        )
+        mock_client.return_value = mock_s3
+        processor = BatchProcessor("test-stack")
+
+        key = processor._copy_s3_file(
+            {"path": "s3://lake/big.pdf", "filename": "big.pdf", "type": "s3"},
+            "b1",
+            config_version="v3",
+        )
+
+        assert key == "b1/big.pdf"
+        args, kwargs = mock_s3.copy.call_args
+        assert args[:3] == ({"Bucket": "lake", "Key": "big.pdf"}, INPUT_BUCKET, key)
+        assert kwargs["ExtraArgs"]["Metadata"] == {"config-version": "v3"}
@@ -191,6 +191,37 @@ class TestProgressMonitor:
         assert len(status_data["completed"]) == 2
         assert status_data["all_complete"] is True
 
+    @patch("boto3.client")
+    def test_get_batch_status_chunks_large_batches(self, mock_boto_client):
+        """Large batches are looked up in chunks; a failed chunk falls back alone"""
+        mock_lambda = MagicMock()
+        mock_boto_client.return_value = mock_lambda
+        batch_sizes = []
+
+        def mock_invoke(FunctionName, InvocationType, Payload):
+            payload_data = json.loads(Payload)
+            if "object_key" in payload_data:
+                result = {"status": "RUNNING"}
+            else:
+                keys = payload_data["object_keys"]
+                batch_sizes.append(len(keys))
+                if "doc-2400" in keys:
+                    raise ConnectionError("lookup unavailable")
+                result = {
+                    "results": [{"object_key": k, "status": "COMPLETED"} for k in keys]
+                }
+            return {"Payload": MagicMock(read=lambda: json.dumps(result).encode())}
+
+        mock_lambda.invoke.side_effect = mock_invoke
+
+        monitor = ProgressMonitor("test-stack", {"LookupFunctionName": "test-function"})
+        status_data = monitor.get_batch_status([f"doc-{i}" for i in range(2500)])
+
+        assert sorted(batch_sizes) == [500, 1000, 1000]
+        assert len(status_data["completed"]) == 2000
+        assert len(status_data["running"]) == 500
+        assert len(monitor.finished_docs) == 2000
+
     @patch("boto3.client")
     def test_calculate_statistics(self, mock_boto_client):
         """Test statistics calculation"""
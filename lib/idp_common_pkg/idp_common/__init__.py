@@ -39,6 +39,9 @@ def __getattr__(name):
         "reporting",
         "agents",
         "delete_documents",
+        "page_artifacts",
+        "document_state",
+        "admission",
     ]:
         if name not in _submodules:
             _submodules[name] = __import__(f"idp_common.{name}", fromlist=["*"])
@@ -0,0 +1,316 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Workflow admission control over the ConcurrencyTable.
+
+``queue_processor`` admits a document into the workflow only while the
+in-flight total stays within a capacity, and ``workflow_tracker`` releases it
+when the execution ends. The total is held in counter items of the
+ConcurrencyTable (``counter_id`` / ``active_count``) and updated with
+conditional ``ADD`` writes.
+
+The controller extends the original single ``workflow_counter`` item in
+three ways, each off by default:
+
+* **Shards** - the capacity is split across ``shards`` counter items
+  (``workflow_counter``, ``workflow_counter#1``, ...), so a burst of admissions
+  no longer serializes on one hot key. A document starts at the shard its id
+  hashes to and probes up to ``probes`` shards before it is deferred.
+* **Weights** - a document costs ``1`` (``documents``), its page count
+  (``pages``) or its page count times ``tokens_per_page`` (``tokens``), so the
+  capacity tracks the work in flight rather than the number of executions.
+  Page counts come from the uploader (``page-count`` S3 metadata) or are
+  estimated from the object size. A weight is clamped to one shard's capacity,
+  so an oversized document is still admitted into an idle shard.
+* **Lanes** - each priority lane may fill a shard only up to a fraction of its
+  capacity (``lane_limits``), keeping headroom for higher-priority work.
+
+With one shard, document weights and no lane limits, the controller issues
+exactly the writes the original counter did. The :class:`AdmissionTicket`
+returned on admission travels with the execution input, so the release
+decrements the same shard by the same weight.
+"""
+
+import logging
+import math
+import os
+import zlib
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from botocore.exceptions import ClientError
+
+logger = logging.getLogger(__name__)
+
+COUNTER_ID = "workflow_counter"
+COUNT_ATTRIBUTE = "active_count"
+
+WEIGHT_DOCUMENTS = "documents"
+WEIGHT_PAGES = "pages"
+WEIGHT_TOKENS = "tokens"
+WEIGHT_MODES = (WEIGHT_DOCUMENTS, WEIGHT_PAGES, WEIGHT_TOKENS)
+
+LANE_HIGH = "high"
+LANE_NORMAL = "normal"
+LANE_LOW = "low"
+LANES = (LANE_HIGH, LANE_NORMAL, LANE_LOW)
+
+DEFAULT_BYTES_PER_PAGE = 100 * 1024
+DEFAULT_TOKENS_PER_PAGE = 1500
+
+
+def shard_id(index: int) -> str:
+    """Counter item id of shard ``index`` (shard 0 is the original counter)."""
+    return COUNTER_ID if index == 0 else f"{COUNTER_ID}#{index}"
+
+
+def parse_lane_limits(value: Optional[str]) -> Dict[str, float]:
+    """
+    Parse ``"normal=0.8,low=0.5"`` into lane capacity fractions.
+
+    Unknown lanes and malformed entries are ignored with a warning; fractions
+    are clamped to ``(0, 1]``.
+    """
+    limits: Dict[str, float] = {}
+    for entry in (value or "").split(","):
+        if not entry.strip():
+            continue
+        lane, _, fraction = entry.partition("=")
+        lane = lane.strip().lower()
+        try:
+            parsed = float(fraction)
+        except ValueError:
+            parsed = 0.0
+        if lane not in LANES or parsed <= 0:
+            logger.warning(f"Ignoring invalid admission lane limit '{entry}'")
+            continue
+        limits[lane] = min(parsed, 1.0)
+    return limits
+
+
+@dataclass
+class AdmissionTicket:
+    """Record of one admission: the shard charged and the weight charged."""
+
+    shard_id: str
+    weight: int
+    lane: str = LANE_NORMAL
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"shard_id": self.shard_id, "weight": self.weight, "lane": self.lane}
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, Any]]) -> "AdmissionTicket":
+        """
+        Rebuild a ticket from execution input.
+
+        Executions started before admission tickets existed carry none; they
+        were charged one unit on the original counter, so that is released.
+        """
+        if not data:
+            return cls(shard_id=COUNTER_ID, weight=1)
+        return cls(
+            shard_id=data.get("shard_id") or COUNTER_ID,
+            weight=int(data.get("weight", 1)),
+            lane=data.get("lane") or LANE_NORMAL,
+        )
+
+
+class AdmissionController:
+    """Sharded, weighted admission over ConcurrencyTable counter items."""
+
+    def __init__(
+        self,
+        table: Any,
+        capacity: int,
+        shards: int = 1,
+        weight_mode: str = WEIGHT_DOCUMENTS,
+        lane_limits: Optional[Dict[str, float]] = None,
+        probes: Optional[int] = None,
+        bytes_per_page: int = DEFAULT_BYTES_PER_PAGE,
+        tokens_per_page: int = DEFAULT_TOKENS_PER_PAGE,
+    ):
+        """
+        Initialize the controller.
+
+        Args:
+            table: boto3 DynamoDB Table resource for the ConcurrencyTable
+            capacity: Total admitted weight across all shards
+            shards: Number of counter items the capacity is split across
+            weight_mode: ``documents``, ``pages`` or ``tokens``
+            lane_limits: Fraction of shard capacity each lane may fill
+                (lanes not listed may fill the whole shard)
+            probes: Shards tried before a document is deferred
+                (default: two, or one when there is a single shard)
+            bytes_per_page: Object bytes per page when estimating page counts
+            tokens_per_page: Tokens per page for the ``tokens`` weight mode
+        """
+        if weight_mode not in WEIGHT_MODES:
+            raise ValueError(
+                f"Unsupported admission weight mode '{weight_mode}', "
+                f"expected one of {', '.join(WEIGHT_MODES)}"
+            )
+        self.table = table
+        self.capacity = max(int(capacity), 1)
+        # Every shard must be able to admit at least one unit
+        self.shards = min(max(int(shards), 1), self.capacity)
+        self.weight_mode = weight_mode
+        self.lane_limits = lane_limits or {}
+        self.probes = min(max(int(probes or 2), 1), self.shards)
+        self.bytes_per_page = max(int(bytes_per_page), 1)
+        self.tokens_per_page = max(int(tokens_per_page), 1)
+
+    @classmethod
+    def from_environment(cls, table: Any) -> "AdmissionController":
+        """
+        Build a controller from the Lambda environment.
+
+        ``MAX_CONCURRENT`` remains the capacity in document mode;
+        ``ADMISSION_CAPACITY`` overrides it and is required to be meaningful
+        for the page and token weight modes.
+        """
+        capacity = os.environ.get("ADMISSION_CAPACITY") or os.environ.get(
+            "MAX_CONCURRENT", "5"
+        )
+        return cls(
+            table=table,
+            capacity=int(capacity),
+            shards=int(os.environ.get("ADMISSION_SHARDS", "1")),
+            weight_mode=os.environ.get("ADMISSION_WEIGHT", WEIGHT_DOCUMENTS)
+            .strip()
+            .lower(),
+            lane_limits=parse_lane_limits(os.environ.get("ADMISSION_LANE_LIMITS")),
+            probes=int(os.environ.get("ADMISSION_PROBES", "2")),
+            bytes_per_page=int(
+                os.environ.get("ADMISSION_BYTES_PER_PAGE", DEFAULT_BYTES_PER_PAGE)
+            ),
+            tokens_per_page=int(
+                os.environ.get("ADMISSION_TOKENS_PER_PAGE", DEFAULT_TOKENS_PER_PAGE)
+            ),
+        )
+
+    def shard_ids(self) -> List[str]:
+        """Counter item ids of every shard."""
+        return [shard_id(index) for index in range(self.shards)]
+
+    def shard_capacity(self, index: int) -> int:
+        """Capacity of shard ``index``; the remainder goes to the first shards."""
+        base, remainder = divmod(self.capacity, self.shards)
+        return base + (1 if index < remainder else 0)
+
+    def estimate_pages(
+        self, page_count: Optional[int] = None, object_size: Optional[int] = None
+    ) -> int:
+        """Page count if known, otherwise an estimate from the object size."""
+        if page_count and page_count > 0:
+            return int(page_count)
+        if object_size and object_size > 0:
+            return max(math.ceil(object_size / self.bytes_per_page), 1)
+        return 1
+
+    def weight(
+        self, page_count: Optional[int] = None, object_size: Optional[int] = None
+    ) -> int:
+        """Admission weight of a document under the configured weight mode."""
+        if self.weight_mode == WEIGHT_DOCUMENTS:
+            return 1
+        pages = self.estimate_pages(page_count, object_size)
+        if self.weight_mode == WEIGHT_TOKENS:
+            return pages * self.tokens_per_page
+        return pages
+
+    def _room(self, index: int, weight: int, lane: str) -> int:
+        """Highest shard count at which ``weight`` may still be admitted."""
+        capacity = self.shard_capacity(index)
+        room = capacity - weight
+        fraction = self.lane_limits.get(lane)
+        if fraction is not None and fraction < 1.0:
+            # The lane may start work only while the shard is below its share
+            room = min(room, max(math.floor(capacity * fraction), 1) - 1)
+        return room
+
+    def _probe_order(self, key: str) -> List[int]:
+        start = zlib.crc32(key.encode("utf-8")) % self.shards
+        return [(start + offset) % self.shards for offset in range(self.probes)]
+
+    def try_acquire(
+        self, key: str, weight: int = 1, lane: str = LANE_NORMAL
+    ) -> Optional[AdmissionTicket]:
+        """
+        Charge ``weight`` to the first probed shard with room for it.
+
+        Args:
+            key: Document id, used to pick the first shard
+            weight: Admission weight (see :meth:`weight`)
+            lane: Priority lane (``high``, ``normal`` or ``low``)
+
+        Returns:
+            AdmissionTicket if admitted, None if every probed shard is full
+
+        Raises:
+            ClientError: If a DynamoDB operation fails for another reason
+        """
+        lane = lane if lane in LANES else LANE_NORMAL
+        for index in self._probe_order(key):
+            charged = min(max(int(weight), 1), self.shard_capacity(index))
+            room = self._room(index, charged, lane)
+            if room < 0:
+                continue
+            update_args = {
+                "Key": {"counter_id": shard_id(index)},
+                "UpdateExpression": f"ADD {COUNT_ATTRIBUTE} :inc",
+                "ConditionExpression": f"{COUNT_ATTRIBUTE} <= :room",
+                "ExpressionAttributeValues": {":inc": charged, ":room": room},
+                "ReturnValues": "UPDATED_NEW",
+            }
+            if index > 0:
+                # Shard 0 is created by the stack; the others are created on
+                # first use
+                update_args["ConditionExpression"] = (
+                    f"attribute_not_exists({COUNT_ATTRIBUTE}) OR "
+                    f"{COUNT_ATTRIBUTE} <= :room"
+                )
+            try:
+                self.table.update_item(**update_args)
+            except ClientError as e:
+                if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
+                    continue
+                raise
+            ticket = AdmissionTicket(shard_id(index), charged, lane)
+            logger.info(f"Admitted {key} with {ticket}")
+            return ticket
+        logger.warning(
+            f"Admission capacity reached for {key} (weight {weight}, lane {lane})"
+        )
+        return None
+
+    def release(self, ticket: AdmissionTicket) -> Optional[int]:
+        """Return a ticket's weight to its shard (see :func:`release`)."""
+        return release(self.table, ticket)
+
+
+def release(table: Any, ticket: AdmissionTicket) -> Optional[int]:
+    """
+    Return a ticket's weight to its shard.
+
+    Needs no controller settings, so the releasing side (``workflow_tracker``)
+    stays consistent with whatever configuration admitted the document.
+
+    Args:
+        table: boto3 DynamoDB Table resource for the ConcurrencyTable
+        ticket: Ticket returned by :meth:`AdmissionController.try_acquire`
+
+    Returns:
+        The shard's new count
+
+    Raises:
+        ClientError: If the DynamoDB operation fails
+    """
+    response = table.update_item(
+        Key={"counter_id": ticket.shard_id},
+        UpdateExpression=f"ADD {COUNT_ATTRIBUTE} :dec",
+        ExpressionAttributeValues={":dec": -ticket.weight},
+        ReturnValues="UPDATED_NEW",
+    )
+    return response.get("Attributes", {}).get(COUNT_ATTRIBUTE)
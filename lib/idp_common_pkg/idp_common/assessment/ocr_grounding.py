@@ -30,6 +30,8 @@ Design notes (see scratch/assessment-ocr-grounding-plan.md):
 
 import logging
 import re
+from collections import Counter
+from itertools import chain
 from typing import Any, Dict, List, Optional, Tuple
 
 from idp_common import s3
@@ -168,6 +170,25 @@ def _levenshtein_sim(a: str, b: str) -> float:
         return 0.0
 
 
+def _levenshtein_sims(value: str, texts: List[str], min_score: float) -> List[float]:
+    """Batched ``_levenshtein_sim`` of one value against many texts.
+
+    Texts that cannot reach ``min_score`` score 0.0. Same guards as the
+    single-pair version: empty strings and import failure score 0.0.
+    """
+    if not value:
+        return [0.0] * len(texts)
+    try:
+        from idp_common.evaluation.text_matching import fuzz_scores
+
+        return [
+            score if text else 0.0
+            for text, score in zip(texts, fuzz_scores(value, texts, min_score))
+        ]
+    except Exception:  # noqa: BLE001 - keep grounding resilient if eval is absent
+        return [0.0] * len(texts)
+
+
 def _infer_hint(value: Any) -> str:
     """Infer a field's logical type from the value itself (heuristic fallback).
 
@@ -468,6 +489,202 @@ def _ensure_page_indexes(page_data: Dict[str, Any]) -> Dict[str, List[Dict[str,
     return idx
 
 
+def _trigrams(text: str) -> set:
+    """Distinct character trigrams of ``text`` (empty below 3 chars)."""
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+def _typed_key(text: Any, hint: str) -> Any:
+    """Index key under which ``_type_equal`` can match ``text``, or None.
+
+    Dates and numbers key on the parsed value. Phones key on the last 7 digits,
+    which equal and suffix matches both share.
+    """
+    if hint == HINT_DATE:
+        return _parse_date(text)
+    if hint == HINT_NUMBER:
+        return _parse_number(text)
+    if hint == HINT_PHONE:
+        digits = _digits(text)
+        return digits[-7:] if len(digits) >= 7 else None
+    return None
+
+
+class _PageNgramIndex:
+    """Inverted indexes over one page's normalized lines (see ``_ensure_ngram_index``).
+
+    Lines are referred to by their position in ``__norm_lines_cache__``. Every
+    lookup returns ascending positions, so candidates are emitted in the same
+    line order as a linear scan (tie-breaking downstream depends on that order).
+    Each lookup is a superset of the lines that can match; callers still apply
+    the tier's own comparison to every line returned.
+    """
+
+    __slots__ = (
+        "texts",
+        "nonempty",
+        "raw_texts",
+        "positions",
+        "grams",
+        "gram_counts",
+        "short_lines",
+        "tokens",
+        "line_tokens",
+        "typed",
+        "levenshtein",
+    )
+
+    def __init__(self, norm_lines: List[Tuple[str, Dict[str, Any]]]):
+        self.texts = [nt for nt, _ in norm_lines]
+        self.nonempty = [i for i, nt in enumerate(self.texts) if nt]
+        self.raw_texts = [line.get("text") for _, line in norm_lines]
+        self.positions: Dict[str, List[int]] = {}
+        self.grams: Dict[str, List[int]] = {}
+        self.gram_counts: List[int] = []
+        self.short_lines: List[int] = []
+        self.tokens: Dict[str, List[int]] = {}
+        self.line_tokens: List[set] = []
+        for i, nt in enumerate(self.texts):
+            grams = _trigrams(nt)
+            toks = _tokens(nt)
+            self.gram_counts.append(len(grams))
+            self.line_tokens.append(toks)
+            if not nt:
+                continue
+            self.positions.setdefault(nt, []).append(i)
+            if len(nt) < 3:
+                self.short_lines.append(i)
+            for gram in grams:
+                self.grams.setdefault(gram, []).append(i)
+            for tok in toks:
+                self.tokens.setdefault(tok, []).append(i)
+        # Built on first use: most values never reach the TYPED/LEVENSHTEIN tiers.
+        self.typed: Dict[str, Dict[Any, List[int]]] = {}
+        self.levenshtein: Optional[Tuple[List[str], Dict[str, List[int]]]] = None
+
+    def text_candidates(self, norm_variant: str) -> List[int]:
+        """Lines that can be an EXACT/SUBSTRING/PARTIAL match for a variant.
+
+        A line containing the variant has all of its trigrams; a line (3+ chars)
+        contained in it has only trigrams of the variant; shorter lines have no
+        trigrams and are always returned. A variant under 3 chars has nothing to
+        look up and returns every non-empty line.
+        """
+        grams = _trigrams(norm_variant)
+        if not grams:
+            return self.nonempty
+        hits = Counter(chain.from_iterable(self.grams.get(g, ()) for g in grams))
+        found = [
+            i for i, h in hits.items() if h == len(grams) or h == self.gram_counts[i]
+        ]
+        return sorted(found + self.short_lines)
+
+    def typed_candidates(self, raw_value: Any, hint: str) -> List[int]:
+        """Lines whose date/number/phone parse can equal ``raw_value``'s."""
+        key = _typed_key(raw_value, hint)
+        if key is None:
+            return []
+        table = self.typed.get(hint)
+        if table is None:
+            table = {}
+            for i, nt in enumerate(self.texts):
+                line_key = _typed_key(self.raw_texts[i], hint) if nt else None
+                if line_key is not None:
+                    table.setdefault(line_key, []).append(i)
+            self.typed[hint] = table
+        return table.get(key, [])
+
+    def span_starts(self, norm_value: str) -> List[int]:
+        """Lines that can start a multi-line span equal to ``norm_value``.
+
+        A span's first line is the value up to (not including) one of its spaces.
+        """
+        starts: List[int] = []
+        for pos, ch in enumerate(norm_value):
+            if ch == " ":
+                starts.extend(self.positions.get(norm_value[:pos], ()))
+        return sorted(set(starts))
+
+    def token_candidates(self, value_tokens: set) -> List[int]:
+        """Lines sharing at least one token with the value (Jaccard above 0)."""
+        return sorted(
+            set(chain.from_iterable(self.tokens.get(t, ()) for t in value_tokens))
+        )
+
+    def levenshtein_candidates(self, norm_value: str, min_score: float) -> List[int]:
+        """Lines whose Levenshtein similarity to ``norm_value`` can reach ``min_score``.
+
+        Uses the q-gram lemma on the punctuation-stripped texts ``fuzz_scores``
+        compares: within edit distance ``d``, at least ``m - 2 - 3d`` of the
+        value's ``m - 2`` trigram positions occur unchanged in the line. ``d`` is
+        bounded by the longest line that can still reach ``min_score``; when that
+        bound leaves no trigram guaranteed (short values) every line is returned.
+        """
+        every_line = self.nonempty
+        try:
+            from idp_common.evaluation.text_matching import (
+                _max_distance_for,
+                strip_punctuation_space,
+            )
+        except Exception:  # noqa: BLE001 - the tier is inert without the evaluator
+            return every_line
+        query = strip_punctuation_space(norm_value)
+        m = len(query)
+        if not 0 < min_score <= 1 or m < 3:
+            return every_line
+
+        # Longest line length n >= m that can still score: n - m <= d(n).
+        n = m
+        while n + 1 - m <= _max_distance_for(min_score, n + 1):
+            n += 1
+        required = m - 2 - 3 * _max_distance_for(min_score, n)
+        if required <= 0:
+            return every_line
+
+        if self.levenshtein is None:
+            stripped = [strip_punctuation_space(nt) if nt else "" for nt in self.texts]
+            postings: Dict[str, List[int]] = {}
+            for i, text in enumerate(stripped):
+                for gram in _trigrams(text):
+                    postings.setdefault(gram, []).append(i)
+            self.levenshtein = (stripped, postings)
+        stripped, postings = self.levenshtein
+
+        # A line's hits count the value's trigram positions (not distinct
+        # trigrams) whose trigram the line contains.
+        positions = Counter(query[i : i + 3] for i in range(m - 2))
+        hits = Counter(
+            chain.from_iterable(
+                postings.get(gram, ()) * count for gram, count in positions.items()
+            )
+        )
+        found = []
+        for i, h in hits.items():
+            if h < required:
+                continue
+            max_d = _max_distance_for(min_score, max(m, len(stripped[i])))
+            if abs(m - len(stripped[i])) <= max_d and h >= m - 2 - 3 * max_d:
+                found.append(i)
+        return sorted(found)
+
+
+def _ensure_ngram_index(page_data: Dict[str, Any]) -> _PageNgramIndex:
+    """Build (once, cached on ``page_data``) the page's inverted line indexes.
+
+    The EXACT index only serves verbatim hits; every other tier used to scan all
+    normalized lines per value, so a table whose cells are reformatted (dates,
+    amounts) or OCR-noisy paid O(values × lines) string work. This index maps
+    character trigrams, word tokens and parsed typed values back to lines so
+    each tier only compares against the few lines that can match.
+    """
+    index = page_data.get("__ngram_index_cache__")
+    if index is None:
+        _ensure_page_indexes(page_data)
+        index = _PageNgramIndex(page_data.get("__norm_lines_cache__") or [])
+        page_data["__ngram_index_cache__"] = index
+    return index
+
+
 def _collect_candidates_in_page(
     norm_value: str,
     value_tokens: set,
@@ -506,18 +723,20 @@ def _collect_candidates_in_page(
     # (format-bridged) match and is tagged accordingly.
     norm_variant_list = _dedup_norm_variants(norm_variants, norm_value)
 
-    # Normalized lines + EXACT index are built (once) and cached on page_data.
+    # Normalized lines + EXACT index are built (once) and cached on page_data, as
+    # is the inverted index each tier below draws its candidate lines from.
     _ensure_page_indexes(page_data)
     norm_lines = page_data.get("__norm_lines_cache__") or []
+    index = _ensure_ngram_index(page_data)
+    texts = index.texts
 
     candidates: List[Tuple[int, Dict[str, Any], str, Optional[float]]] = []
 
-    for norm_text, line in norm_lines:
-        if not norm_text:
-            continue
-        best_tier = None
-        is_variant_only = True
-        for i, nv in enumerate(norm_variant_list):
+    # Best text tier per line, and the first variant reaching it.
+    text_hits: Dict[int, Tuple[int, int]] = {}
+    for i, nv in enumerate(norm_variant_list):
+        for pos in index.text_candidates(nv):
+            norm_text = texts[pos]
             if norm_text == nv:
                 tier = _TIER_EXACT
             elif nv in norm_text:
@@ -526,25 +745,34 @@ def _collect_candidates_in_page(
                 tier = _TIER_PARTIAL
             else:
                 continue
-            if best_tier is None or tier < best_tier:
-                best_tier = tier
-                # primary value (i==0) keeps real "ocr" provenance; a non-primary
-                # variant hit is a format-normalized match.
-                is_variant_only = i != 0
-        if best_tier is not None:
-            src = _SOURCE_NORMALIZED if is_variant_only else None
-            match = _build_match(line, page_num, best_tier, src)
-            if match is not None:
-                candidates.append(match)
-            continue
+            best = text_hits.get(pos)
+            if best is None or tier < best[0]:
+                text_hits[pos] = (tier, i)
+
+    # TYPED equality: same logical date/number/phone despite formatting, only for
+    # lines without a text-tier hit.
+    typed_hits: List[int] = []
+    if hint in (HINT_DATE, HINT_NUMBER, HINT_PHONE):
+        typed_hits = [
+            pos
+            for pos in index.typed_candidates(raw_value, hint)
+            if pos not in text_hits
+            and _type_equal(raw_value, norm_lines[pos][1].get("text"), hint)
+        ]
 
-        # TYPED equality: same logical date/number/phone despite formatting.
-        if hint in (HINT_DATE, HINT_NUMBER, HINT_PHONE) and _type_equal(
-            raw_value, line.get("text"), hint
-        ):
+    for pos in sorted(chain(text_hits, typed_hits)):
+        line = norm_lines[pos][1]
+        if pos in text_hits:
+            tier, i = text_hits[pos]
+            # primary value (i==0) keeps real "ocr" provenance; a non-primary
+            # variant hit is a format-normalized match.
+            match = _build_match(
+                line, page_num, tier, _SOURCE_NORMALIZED if i else None
+            )
+        else:
             match = _build_match(line, page_num, _TIER_TYPED, _SOURCE_NORMALIZED)
-            if match is not None:
-                candidates.append(match)
+        if match is not None:
+            candidates.append(match)
 
     # Tier-aware early-out. The caller keeps only the MOST PRECISE tier that
     # matched, so a pass that can only produce a WORSE tier than what we already
@@ -558,7 +786,11 @@ def _collect_candidates_in_page(
     best_so_far = min((t for t, *_ in candidates), default=None)
     if best_so_far is None or best_so_far > _TIER_SPAN:
         # Multi-line spans (value == concatenation of consecutive lines).
-        candidates.extend(_collect_span_candidates(norm_value, norm_lines, page_num))
+        candidates.extend(
+            _collect_span_candidates(
+                norm_value, norm_lines, page_num, index.span_starts(norm_value)
+            )
+        )
         best_so_far = min((t for t, *_ in candidates), default=None)
 
     if candidates:
@@ -566,20 +798,24 @@ def _collect_candidates_in_page(
         return candidates
 
     # Token-overlap fuzzy.
-    for norm_text, line in norm_lines:
-        if not norm_text:
-            continue
-        if _jaccard(value_tokens, _tokens(norm_text)) >= _FUZZY_MATCH_THRESHOLD:
-            match = _build_match(line, page_num, _TIER_FUZZY)
+    for pos in index.token_candidates(value_tokens):
+        if _jaccard(value_tokens, index.line_tokens[pos]) >= _FUZZY_MATCH_THRESHOLD:
+            match = _build_match(norm_lines[pos][1], page_num, _TIER_FUZZY)
             if match is not None:
                 candidates.append(match)
 
-    # Character-level Levenshtein near-miss (last resort; OCR noise).
-    for norm_text, line in norm_lines:
-        if not norm_text:
-            continue
-        if _levenshtein_sim(norm_value, norm_text) >= _LEVENSHTEIN_MATCH_THRESHOLD:
-            match = _build_match(line, page_num, _TIER_LEVENSHTEIN, _SOURCE_FUZZY)
+    # Character-level Levenshtein near-miss (last resort; OCR noise). Only lines
+    # that can reach the threshold are scored, in one batch so the rest of them
+    # exit early too.
+    positions = index.levenshtein_candidates(norm_value, _LEVENSHTEIN_MATCH_THRESHOLD)
+    sims = _levenshtein_sims(
+        norm_value, [texts[pos] for pos in positions], _LEVENSHTEIN_MATCH_THRESHOLD
+    )
+    for pos, sim in zip(positions, sims):
+        if sim >= _LEVENSHTEIN_MATCH_THRESHOLD:
+            match = _build_match(
+                norm_lines[pos][1], page_num, _TIER_LEVENSHTEIN, _SOURCE_FUZZY
+            )
             if match is not None:
                 candidates.append(match)
 
@@ -590,11 +826,15 @@ def _collect_span_candidates(
     norm_value: str,
     norm_lines: List[Tuple[str, Dict[str, Any]]],
     page_num: int,
+    starts: Optional[List[int]] = None,
 ) -> List[Tuple[int, Dict[str, Any], str, Optional[float]]]:
-    """Collect multi-line span matches (consecutive lines whose text joins to value)."""
+    """Collect multi-line span matches (consecutive lines whose text joins to value).
+
+    ``starts`` restricts (ascending) the first lines tried; all lines by default.
+    """
     results: List[Tuple[int, Dict[str, Any], str, Optional[float]]] = []
     n = len(norm_lines)
-    for i in range(n):
+    for i in range(n) if starts is None else starts:
         if not norm_lines[i][0]:
             continue
         combined = norm_lines[i][0]
@@ -739,12 +979,59 @@ def match_value_to_geometry(
         ``{"boundingBox": {...0-1...}, "page": <int>}``, or None when no confident,
         unambiguous match is found.
     """
+    return _match_value_to_geometry(
+        value, page_data_by_page, preferred_geometry, occurrence_index, schema_hint
+    )
+
+
+def _match_value_to_geometry(
+    value: Any,
+    page_data_by_page: Dict[int, Dict[str, Any]],
+    preferred_geometry: Optional[Dict[str, Any]] = None,
+    occurrence_index: Optional[int] = None,
+    schema_hint: Optional[Dict[str, Any]] = None,
+    candidate_cache: Optional[Dict[Tuple[str, str, str], list]] = None,
+) -> Optional[Tuple[Dict[str, Any], str, Optional[float]]]:
+    """:func:`match_value_to_geometry`, optionally sharing candidate lookups.
+
+    The best-tier candidates depend only on the value's text and its schema
+    type/format, not on the leaf's position, so a whole-document grounding pass
+    looks each distinct value up once in ``candidate_cache`` and only repeats the
+    per-leaf disambiguation. Returned geometries are always fresh dicts.
+    """
     if value is None or not page_data_by_page:
         return None
 
     norm_value = _normalize(value)
     if not norm_value:
         return None
+
+    if isinstance(schema_hint, dict):
+        cache_key = (
+            str(value),
+            str(schema_hint.get("format", "")).lower(),
+            str(schema_hint.get("type", "")).lower(),
+        )
+    else:
+        cache_key = (str(value), "", "")
+    if candidate_cache is not None and cache_key in candidate_cache:
+        best = candidate_cache[cache_key]
+    else:
+        best = _best_candidates(value, norm_value, page_data_by_page, schema_hint)
+        if candidate_cache is not None:
+            candidate_cache[cache_key] = best
+    if not best:
+        return None
+    return _disambiguate(best, norm_value, preferred_geometry, occurrence_index)
+
+
+def _best_candidates(
+    value: Any,
+    norm_value: str,
+    page_data_by_page: Dict[int, Dict[str, Any]],
+    schema_hint: Optional[Dict[str, Any]],
+) -> List[Tuple[int, Dict[str, Any], str, Optional[float]]]:
+    """All candidates of the most precise tier ``value`` matched, across pages."""
     value_tokens = _tokens(norm_value)
 
     # Resolve the logical type (schema hint first, else infer) and build the
@@ -753,8 +1040,6 @@ def match_value_to_geometry(
     hint = _resolve_hint(value, schema_hint)
     variants = _value_variants(value, hint)
 
-    ref = _ref_from_llm_geometry(preferred_geometry)
-
     norm_variant_list = _dedup_norm_variants(variants, norm_value)
 
     # FAST PATH — EXACT index lookup across ALL pages first. EXACT (tier 1) is the
@@ -777,9 +1062,7 @@ def match_value_to_geometry(
                 )
                 if m is not None:
                     candidates.append(m)
-    if candidates:
-        best_tier = _TIER_EXACT  # by construction
-    else:
+    if not candidates:
         # Full (slower) collection across all pages: substring/span/typed/fuzzy.
         for page_num in sorted(page_data_by_page):
             candidates.extend(
@@ -795,16 +1078,25 @@ def match_value_to_geometry(
             )
 
     if not candidates:
-        return None
+        return []
 
     # Keep only the most precise tier that matched (exact beats substring beats
     # span beats fuzzy), so a high-precision hit is never displaced by fuzzy noise.
     best_tier = min(tier for tier, *_ in candidates)
-    best = [c for c in candidates if c[0] == best_tier]
+    return [c for c in candidates if c[0] == best_tier]
+
+
+def _disambiguate(
+    best: List[Tuple[int, Dict[str, Any], str, Optional[float]]],
+    norm_value: str,
+    preferred_geometry: Optional[Dict[str, Any]],
+    occurrence_index: Optional[int],
+) -> Optional[Tuple[Dict[str, Any], str, Optional[float]]]:
+    """Pick one of the best-tier candidates (see :func:`match_value_to_geometry`)."""
+    ref = _ref_from_llm_geometry(preferred_geometry)
 
     if len(best) == 1:
-        _, geometry, source, ocr_conf = best[0]
-        return (geometry, source, ocr_conf)
+        return _as_match(best[0])
 
     # Ambiguous: multiple equally-good text matches (e.g. a value repeated across
     # table rows).
@@ -817,8 +1109,7 @@ def match_value_to_geometry(
         idx = occurrence_index if occurrence_index < len(ordered) else len(ordered) - 1
         if idx < 0:
             idx = 0
-        _, geometry, source, ocr_conf = ordered[idx]
-        return (geometry, source, ocr_conf)
+        return _as_match(ordered[idx])
 
     # Spatial disambiguation (llm_grounded mode): proximity to the
     # LLM-estimated box, which sits at a roughly-correct distinct position per
@@ -836,8 +1127,7 @@ def match_value_to_geometry(
 
         nearest = min(pool, key=_distance)
         if _distance(nearest) != float("inf"):
-            _, geometry, source, ocr_conf = nearest
-            return (geometry, source, ocr_conf)
+            return _as_match(nearest)
 
     # A usable LLM reference was supplied (llm_grounded mode) but
     # couldn't disambiguate -> stay ambiguous and KEEP the LLM box (return None),
@@ -856,9 +1146,19 @@ def match_value_to_geometry(
     # A scalar's value is identical wherever it appears, so the FIRST occurrence in
     # reading order is a sound, deterministic choice — better than no geometry.
     # (List items never reach here: they always pass an occurrence_index.)
-    first = sorted(best, key=_reading_order_key)[0]
-    _, geometry, source, ocr_conf = first
-    return (geometry, source, ocr_conf)
+    return _as_match(sorted(best, key=_reading_order_key)[0])
+
+
+def _as_match(
+    candidate: Tuple[int, Dict[str, Any], str, Optional[float]],
+) -> Tuple[Dict[str, Any], str, Optional[float]]:
+    """``(geometry, source, ocr_confidence)`` with a geometry the caller may own."""
+    _, geometry, source, ocr_conf = candidate
+    return (
+        {"boundingBox": dict(geometry["boundingBox"]), "page": geometry["page"]},
+        source,
+        ocr_conf,
+    )
 
 
 def _field_schema_for(schema_node: Any, key: str) -> Optional[Dict[str, Any]]:
@@ -888,6 +1188,7 @@ def _ground_node(
     occurrence_index: Optional[int] = None,
     schema_node: Optional[Dict[str, Any]] = None,
     skip_grounded: bool = False,
+    candidate_cache: Optional[Dict[Tuple[str, str, str], list]] = None,
 ) -> None:
     """
     Recursively walk an assessment subtree, grounding leaf geometries in place.
@@ -900,7 +1201,8 @@ def _ground_node(
     values. ``schema_node`` is the JSON-Schema fragment for the current node (its
     ``format``/``type`` give the format-matching hint), descended in parallel.
     ``skip_grounded`` leaves already-grounded leaves untouched (see
-    :func:`ground_assessment_geometry`).
+    :func:`ground_assessment_geometry`). ``candidate_cache`` is shared by every
+    leaf of one grounding pass (see :func:`_match_value_to_geometry`).
     """
     if isinstance(assessment_node, dict):
         if "confidence" in assessment_node:
@@ -913,6 +1215,7 @@ def _ground_node(
                 geometry_mode,
                 occurrence_index,
                 schema_node,
+                candidate_cache,
             )
             return
         # Group: descend into each child alongside the matching extraction value.
@@ -950,6 +1253,7 @@ def _ground_node(
                 occurrence_index,
                 _field_schema_for(schema_node, key),
                 skip_grounded,
+                candidate_cache,
             )
     elif isinstance(assessment_node, list):
         item_schema = _item_schema_of(schema_node)
@@ -969,6 +1273,7 @@ def _ground_node(
                 idx,
                 item_schema,
                 skip_grounded,
+                candidate_cache,
             )
 
 
@@ -979,6 +1284,7 @@ def _ground_leaf(
     geometry_mode: str = "llm_grounded",
     occurrence_index: Optional[int] = None,
     schema_node: Optional[Dict[str, Any]] = None,
+    candidate_cache: Optional[Dict[Tuple[str, str, str], list]] = None,
 ) -> None:
     """Ground a single leaf assessment (has a ``confidence`` key) in place."""
     existing_geometry = leaf.get("geometry")
@@ -987,8 +1293,13 @@ def _ground_leaf(
         # Derive geometry purely from OCR value-matching; the LLM box (if any) is
         # NOT used as a reference — repeated values are disambiguated by row order
         # via occurrence_index. Match found -> real OCR box; no match -> no box.
-        match = match_value_to_geometry(
-            value, page_data_by_page, None, occurrence_index, schema_node
+        match = _match_value_to_geometry(
+            value,
+            page_data_by_page,
+            None,
+            occurrence_index,
+            schema_node,
+            candidate_cache,
         )
         if match is None:
             # No OCR match: drop any stray LLM-provided box so we never emit
@@ -1013,8 +1324,8 @@ def _ground_leaf(
     ):
         preferred_geometry = existing_geometry[0]
 
-    match = match_value_to_geometry(
-        value, page_data_by_page, preferred_geometry, None, schema_node
+    match = _match_value_to_geometry(
+        value, page_data_by_page, preferred_geometry, None, schema_node, candidate_cache
     )
     if match is None:
         # No OCR match -> keep the LLM box. Tag provenance only if a box exists.
@@ -1064,9 +1375,14 @@ def ground_assessment_geometry(
             leaves (e.g. reconcile-padded placeholder rows, or the non-sharded
             single-agent path that grounds only once at the end).
 
+    Values are grounded as one batch: each distinct value (and schema type) is
+    matched against the pages once, and leaves repeating it (the same date or
+    currency on every table row) only redo the row-order / proximity choice.
+
     Returns:
         The same ``enhanced_assessment`` dict, grounded in place.
     """
+    candidate_cache: Dict[Tuple[str, str, str], list] = {}
     try:
         for attr_name, attr_assessment in enhanced_assessment.items():
             extraction_value = (
@@ -1082,6 +1398,7 @@ def ground_assessment_geometry(
                 None,
                 _field_schema_for(class_schema, attr_name),
                 skip_grounded,
+                candidate_cache,
             )
     except Exception as e:
         # Grounding is best-effort enrichment; never fail assessment over it.
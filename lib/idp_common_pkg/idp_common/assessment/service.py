@@ -34,6 +34,7 @@ from idp_common.config.schema_constants import (
     X_AWS_IDP_LIST_ITEM_DESCRIPTION,
 )
 from idp_common.models import Document
+from idp_common.page_artifacts import IMAGE, TEXT, PageArtifactLoader
 from idp_common.utils import extract_json_from_text, repair_truncated_json
 
 logger = logging.getLogger(__name__)
@@ -114,6 +115,7 @@ class AssessmentService:
         self,
         region: str | None = None,
         config: Union[Dict[str, Any], IDPConfig, None] = None,
+        cache_scope: Optional[str] = None,
     ):
         """
         Initialize the assessment service.
@@ -121,6 +123,8 @@ class AssessmentService:
         Args:
             region: AWS region for Bedrock
             config: Configuration dictionary or IDPConfig model
+            cache_scope: Optional Bedrock response cache scope (normally the
+                document's config version)
         """
         # Convert config to IDPConfig if needed
         if config is None:
@@ -141,6 +145,7 @@ class AssessmentService:
 
         self.config = config_model
         self.region = region or os.environ.get("AWS_REGION")
+        self.cache_scope = cache_scope
 
         # Get model_id from typed config for logging (v0.6: extraction.confidence)
         model_id = self.config.extraction.confidence.model
@@ -676,16 +681,23 @@ class AssessmentService:
         # Return text content only - no images unless DOCUMENT_IMAGE placeholder is used
         return [{"text": task_prompt}]
 
-    def _get_text_confidence_data(self, page) -> str:
+    def _get_text_confidence_data(
+        self, page, text_confidence_data: Optional[Dict[str, Any]] = None
+    ) -> str:
         """
         Get text confidence data for a page from pre-generated text confidence files.
 
         Args:
             page: Page object containing OCR URIs
+            text_confidence_data: Text confidence file content already loaded
+                for the page, if any
 
         Returns:
             JSON string of text confidence data, or empty string if unavailable
         """
+        if text_confidence_data is not None:
+            return json.dumps(text_confidence_data, indent=2)
+
         # First try to use the pre-generated text confidence file
         if hasattr(page, "text_confidence_uri") and page.text_confidence_uri:
             try:
@@ -986,6 +998,7 @@ class AssessmentService:
             context="Assessment",
             model_lambda_hook_arn=confidence_cfg.model_lambda_hook_arn,
             reasoning_effort=reasoning_effort,
+            cache_scope=self.cache_scope,
         )
 
         total_duration = time.time() - request_start_time
@@ -1323,61 +1336,44 @@ class AssessmentService:
             t1 = time.time()
             logger.info(f"Time taken to read extraction results: {t1 - t0:.2f} seconds")
 
-            # Read document text from all pages in order
-            document_texts = []
-            for page_id in sorted_page_ids:
-                if page_id not in document.pages:
-                    error_msg = f"Page {page_id} not found in document"
-                    logger.error(error_msg)
-                    document.errors.append(error_msg)
-                    continue
-
-                page = document.pages[page_id]
-                text_path = page.parsed_text_uri
-                page_text = s3.get_text_content(text_path)
-                document_texts.append(page_text)
-
-            document_text = "\n".join(document_texts)
-            t2 = time.time()
-            logger.info(f"Time taken to read text content: {t2 - t1:.2f} seconds")
-
-            # Read page images with configurable dimensions (v0.6: confidence.image)
-            target_width = self.config.extraction.confidence.image.target_width
-            target_height = self.config.extraction.confidence.image.target_height
-
-            page_images = []
-            for page_id in sorted_page_ids:
-                if page_id not in document.pages:
-                    continue
-
-                page = document.pages[page_id]
-                image_uri = page.image_uri
-                # Just pass the values directly - prepare_image handles empty strings/None
-                image_content = image.prepare_image(
-                    image_uri, target_width, target_height
-                )
-                page_images.append(image_content)
-
-            t3 = time.time()
-            logger.info(f"Time taken to read images: {t3 - t2:.2f} seconds")
+            # Read page text, images (v0.6: confidence.image dimensions) and
+            # text confidence data for all pages in one concurrent pass
+            artifacts = PageArtifactLoader(step="assessment").load(
+                document,
+                sorted_page_ids,
+                text=True,
+                images=True,
+                image_size=(
+                    self.config.extraction.confidence.image.target_width,
+                    self.config.extraction.confidence.image.target_height,
+                ),
+                confidence="json",
+            )
+            for page_id in artifacts.missing_page_ids:
+                error_msg = f"Page {page_id} not found in document"
+                logger.error(error_msg)
+                document.errors.append(error_msg)
+            artifacts.raise_for_errors(TEXT)
+            artifacts.raise_for_errors(IMAGE)
+
+            document_text = "\n".join(
+                page_artifacts.text or "" for page_artifacts in artifacts.pages.values()
+            )
+            page_images = artifacts.images()
 
-            # Read text confidence data for confidence information
             ocr_text_confidence = ""
-            for page_id in sorted_page_ids:
-                if page_id not in document.pages:
-                    continue
-
-                page = document.pages[page_id]
-                text_confidence_data_str = self._get_text_confidence_data(page)
+            for page_id, page_artifacts in artifacts.pages.items():
+                # Falls back to the raw OCR output when the text confidence
+                # file is missing or unreadable
+                text_confidence_data_str = self._get_text_confidence_data(
+                    document.pages[page_id], page_artifacts.confidence
+                )
                 if text_confidence_data_str:
                     ocr_text_confidence += (
                         f"\n--- Page {page_id} Text Confidence Data ---\n"
                     )
                     ocr_text_confidence += text_confidence_data_str
 
-            t4 = time.time()
-            logger.info(f"Time taken to read raw OCR results: {t4 - t3:.2f} seconds")
-
             # Run the pure inference + enhancement core (shared with the agentic
             # in-shard assessment path), batching large list fields so the model
             # reliably enumerates every row. A single call over a big list (e.g. a
@@ -26,12 +26,31 @@ from botocore.exceptions import (
 )
 from urllib3.exceptions import ReadTimeoutError as Urllib3ReadTimeoutError
 
+from .concurrency import (
+    adaptive_concurrency_enabled,
+    OUTCOME_ERROR,
+    OUTCOME_SUCCESS,
+    OUTCOME_THROTTLED,
+    get_model_limiter,
+    max_concurrency,
+)
 from .model_utils import (
     get_model_max_output_tokens,
     parse_max_tokens_limit_from_error,
     parse_model_id,
 )
 from .openai_responses import invoke_responses_api, is_openai_responses_model
+from .response_cache import (
+    MODE_REFRESH,
+    ResponseCacheBackend,
+    get_response_cache,
+    is_cacheable_request,
+    is_cacheable_response,
+    request_fingerprint,
+    response_cache_mode,
+    response_cache_scope,
+    response_cache_ttl_seconds,
+)
 from .session import get_bedrock_session
 
 # Sentinel value for LambdaHook model selection
@@ -71,6 +90,15 @@ DEFAULT_MAX_RETRIES = 7
 DEFAULT_INITIAL_BACKOFF = 2  # seconds
 DEFAULT_MAX_BACKOFF = 300  # 5 minutes
 
+# Error codes that mean the model is over capacity for this caller; they cut the
+# model's shared concurrency limit (see concurrency.py).
+THROTTLING_ERROR_CODES = {
+    "ThrottlingException",
+    "TooManyRequestsException",
+    "RequestLimitExceeded",
+    "ServiceQuotaExceededException",
+}
+
 
 # Claude 4.7 and later model base names that don't support
 # temperature/top_k/top_p parameters. These parameters are deprecated for these
@@ -303,6 +331,11 @@ class BedrockClient:
         config = Config(
             connect_timeout=10,
             read_timeout=300,  # allow plenty of time for large extraction or assessment inferences
+            # One connection per call the model limiters can admit (botocore's
+            # default pool of 10 is smaller than the classification pool).
+            max_pool_connections=(
+                max(10, max_concurrency()) if adaptive_concurrency_enabled() else 10
+            ),
         )
         if self._client is None:
             self._client = get_bedrock_session(self.region).client(
@@ -436,6 +469,7 @@ class BedrockClient:
         service_tier: Optional[str] = None,
         model_lambda_hook_arn: Optional[str] = None,
         reasoning_effort: Optional[str] = None,
+        cache_scope: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Make the instance callable with the same signature as the original function.
@@ -452,6 +486,7 @@ class BedrockClient:
             max_tokens: Optional max_tokens parameter (int or string)
             max_retries: Optional override for the instance's max_retries setting
             service_tier: Optional service tier (priority, standard, flex)
+            cache_scope: Response cache scope (normally the config version)
 
         Returns:
             Bedrock response object with metering information
@@ -474,6 +509,7 @@ class BedrockClient:
             service_tier=service_tier,
             model_lambda_hook_arn=model_lambda_hook_arn,
             reasoning_effort=reasoning_effort,
+            cache_scope=cache_scope,
         )
 
     def _preprocess_content_for_cachepoint(
@@ -568,6 +604,7 @@ class BedrockClient:
         service_tier: Optional[str] = None,
         model_lambda_hook_arn: Optional[str] = None,
         reasoning_effort: Optional[str] = None,
+        cache_scope: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Invoke a Bedrock model or custom Lambda hook with retry logic.
@@ -590,6 +627,9 @@ class BedrockClient:
             model_lambda_hook_arn: Lambda function ARN (required when model_id is 'LambdaHook')
             reasoning_effort: Reasoning effort for OpenAI Responses models
                 (minimal/low/medium/high). Ignored by other model families.
+            cache_scope: Scope of the opt-in response cache entry (normally
+                the document's config version); defaults to
+                ``BEDROCK_RESPONSE_CACHE_SCOPE``
 
         Returns:
             Response object with metering information (same format for both Bedrock and Lambda)
@@ -895,6 +935,18 @@ class BedrockClient:
         if guardrail_config:
             converse_params["guardrailConfig"] = guardrail_config
 
+        # Replay an identical earlier request from the response cache (opt-in)
+        cache = get_response_cache()
+        fingerprint = None
+        scope = response_cache_scope(cache_scope)
+        if cache is not None and is_cacheable_request(converse_params):
+            fingerprint = request_fingerprint(converse_params)
+            cached = self._get_cached_response(
+                cache, scope, fingerprint, model_id, context
+            )
+            if cached is not None:
+                return cached
+
         # Start timing the entire request
         request_start_time = time.time()
 
@@ -908,8 +960,78 @@ class BedrockClient:
             context=context,
         )
 
+        if fingerprint is not None:
+            self._store_cached_response(cache, scope, fingerprint, model_id, result)
+
         return result
 
+    def _get_cached_response(
+        self,
+        cache: ResponseCacheBackend,
+        scope: str,
+        fingerprint: str,
+        model_id: str,
+        context: str,
+    ) -> Optional[Dict[str, Any]]:
+        """Look up a cached response; metered as a cache hit with zero tokens.
+
+        Cache failures are logged and treated as misses, never raised.
+        """
+        if response_cache_mode() == MODE_REFRESH:
+            return None
+        try:
+            record = cache.get(scope, fingerprint)
+        except Exception as e:
+            logger.warning(f"Bedrock response cache lookup failed: {e}")
+            record = None
+        if record is None:
+            self._put_metric("BedrockResponseCacheMisses", 1)
+            return None
+
+        logger.info(
+            f"Bedrock response cache hit for {model_id} "
+            f"(scope {scope}, fingerprint {fingerprint[:12]})"
+        )
+        self._put_metric("BedrockResponseCacheHits", 1)
+        zero_usage = {"inputTokens": 0, "outputTokens": 0, "totalTokens": 0}
+        return {
+            "response": {**record["response"], "usage": zero_usage},
+            "metering": {
+                f"{context}/bedrock/{model_id}": {
+                    **zero_usage,
+                    "requests": 0,
+                    "responseCacheHits": 1,
+                }
+            },
+        }
+
+    def _store_cached_response(
+        self,
+        cache: ResponseCacheBackend,
+        scope: str,
+        fingerprint: str,
+        model_id: str,
+        result: Dict[str, Any],
+    ) -> None:
+        """Store a complete response for later replay; failures are logged."""
+        response = result["response"]
+        if not is_cacheable_response(response):
+            return
+        record = {
+            "response": {k: v for k, v in response.items() if k != "ResponseMetadata"},
+            "model_id": model_id,
+            "created_at": time.time(),
+        }
+        try:
+            cache.put(
+                scope,
+                fingerprint,
+                record,
+                response_cache_ttl_seconds(),
+            )
+        except Exception as e:
+            logger.warning(f"Bedrock response cache write failed: {e}")
+
     @staticmethod
     def _apply_max_tokens_limit(converse_params: Dict[str, Any], limit: int) -> bool:
         """Clamp the request's maxTokens to `limit` in place, if it exceeds it.
@@ -988,8 +1110,8 @@ class BedrockClient:
             # Start timing this attempt
             attempt_start_time = time.time()
 
-            # Make the API call
-            response = self.client.converse(**converse_params)
+            # Make the API call (admitted by the model's shared concurrency limit)
+            response = self._converse(converse_params)
 
             # Calculate duration
             duration = time.time() - attempt_start_time
@@ -1199,6 +1321,40 @@ class BedrockClient:
             self._put_metric("BedrockUnexpectedErrors", 1)
             raise
 
+    def _converse(self, converse_params: Dict[str, Any]) -> Dict[str, Any]:
+        """Call Converse once, within the model's process-wide concurrency limit.
+
+        Waits for a slot when the model's limit is reached, and reports the
+        outcome so the limit adapts: throttles cut it, fast successes raise it.
+        """
+        limiter = get_model_limiter(converse_params["modelId"])
+        if limiter is None:
+            return self.client.converse(**converse_params)
+
+        permit = limiter.acquire()
+        if permit.wait_seconds > 0:
+            self._put_metric(
+                "BedrockConcurrencyWaitTime",
+                permit.wait_seconds * 1000,
+                "Milliseconds",
+            )
+        outcome = OUTCOME_ERROR
+        try:
+            response = self.client.converse(**converse_params)
+            outcome = OUTCOME_SUCCESS
+            return response
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in THROTTLING_ERROR_CODES:
+                outcome = OUTCOME_THROTTLED
+            raise
+        finally:
+            if limiter.release(permit, outcome):
+                logger.info(
+                    f"Concurrency limit for {converse_params['modelId']} is now "
+                    f"{limiter.limit}"
+                )
+                self._put_metric("BedrockConcurrencyLimit", limiter.limit)
+
     def get_guardrail_config(self) -> Optional[Dict[str, str]]:
         """
         Get guardrail configuration from environment if available.
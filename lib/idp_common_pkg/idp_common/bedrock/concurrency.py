@@ -0,0 +1,238 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""Process-wide adaptive concurrency limits for Bedrock model calls.
+
+Classification threads, the OCR pool and the assessment batcher all call the
+same model through their own ``BedrockClient`` instances. Each retries a
+throttled call with its own backoff, so when a model's quota is exhausted every
+thread keeps hammering it and the throttling storm feeds itself. This module
+keeps one limiter per model ID / inference profile for the whole process and
+caps how many calls to that model may be in flight at once.
+
+The cap adapts AIMD-style (the TCP congestion-control rule):
+
+- **Slow start** — until the model first throttles, every successful call that
+  started with the cap at least half in use raises it by one, so a fresh process reaches its
+  working concurrency within a few rounds of calls.
+- **Additive increase** — after that, each such call adds ``1 / limit``, so
+  the cap grows by one per round of calls. A call whose latency is well above
+  the model's smoothed latency holds the cap instead: the service is slowing
+  down before it starts throttling.
+- **Multiplicative decrease** — a throttled call halves the cap. Only calls
+  that started after the last decrease count, so one burst of throttles from
+  calls already in flight cuts the cap once, not once per call.
+
+The limiter is opt-in. Without it, calls are only bounded by the callers'
+own thread pools, as before. Settings come from the environment when a
+model's limiter is first created:
+
+- ``BEDROCK_ADAPTIVE_CONCURRENCY`` — ``true`` enables the limiter.
+- ``BEDROCK_CONCURRENCY_INITIAL`` / ``BEDROCK_CONCURRENCY_MIN`` /
+  ``BEDROCK_CONCURRENCY_MAX`` — starting cap and its bounds (8 / 1 / 64).
+  ``BedrockClient`` sizes its connection pool to the maximum.
+"""
+
+import logging
+import math
+import os
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INITIAL_LIMIT = 8
+DEFAULT_MIN_LIMIT = 1
+DEFAULT_MAX_LIMIT = 64
+
+# Multiplier applied to the cap on a throttle.
+_DECREASE_FACTOR = 0.5
+# A successful call slower than this multiple of the smoothed latency holds the
+# cap instead of raising it.
+_LATENCY_TOLERANCE = 2.0
+# Weight of the newest sample in the smoothed (EWMA) latency.
+_LATENCY_SMOOTHING = 0.2
+
+# Outcomes passed to AdaptiveConcurrencyLimiter.release.
+OUTCOME_SUCCESS = "success"
+OUTCOME_THROTTLED = "throttled"
+OUTCOME_ERROR = "error"
+
+
+class Permit:
+    """One admitted call, handed back to ``release`` when the call finishes."""
+
+    __slots__ = ("started_at", "wait_seconds", "in_flight")
+
+    def __init__(self, started_at: float, wait_seconds: float, in_flight: int):
+        self.started_at = started_at
+        self.wait_seconds = wait_seconds
+        self.in_flight = in_flight
+
+
+class AdaptiveConcurrencyLimiter:
+    """Thread-safe AIMD cap on the number of in-flight calls to one model."""
+
+    def __init__(
+        self,
+        initial_limit: int = DEFAULT_INITIAL_LIMIT,
+        min_limit: int = DEFAULT_MIN_LIMIT,
+        max_limit: int = DEFAULT_MAX_LIMIT,
+        decrease_factor: float = _DECREASE_FACTOR,
+        latency_tolerance: float = _LATENCY_TOLERANCE,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if not 1 <= min_limit <= max_limit:
+            raise ValueError(
+                f"Invalid concurrency bounds: min={min_limit}, max={max_limit}"
+            )
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.decrease_factor = decrease_factor
+        self.latency_tolerance = latency_tolerance
+        self._clock = clock
+        self._cond = threading.Condition()
+        self._limit = float(min(max(initial_limit, min_limit), max_limit))
+        self._in_flight = 0
+        self._waiting = 0
+        self._last_decrease = -math.inf
+        self._latency: Optional[float] = None
+        self._slow_start = True
+        self._stats = {
+            "calls": 0,
+            "queued": 0,
+            "wait_seconds": 0.0,
+            "throttles": 0,
+            "decreases": 0,
+        }
+
+    @property
+    def limit(self) -> int:
+        """Current cap on in-flight calls."""
+        return int(self._limit)
+
+    def acquire(self) -> Permit:
+        """Block until a call may start; returns its permit."""
+        with self._cond:
+            start = self._clock()
+            if self._in_flight >= int(self._limit):
+                self._waiting += 1
+                self._stats["queued"] += 1
+                try:
+                    while self._in_flight >= int(self._limit):
+                        self._cond.wait()
+                finally:
+                    self._waiting -= 1
+            now = self._clock()
+            self._in_flight += 1
+            self._stats["calls"] += 1
+            self._stats["wait_seconds"] += now - start
+            return Permit(now, now - start, self._in_flight)
+
+    def release(self, permit: Permit, outcome: str) -> bool:
+        """Finish a call and adapt the cap; returns True if the cap changed."""
+        with self._cond:
+            self._in_flight -= 1
+            before = int(self._limit)
+            if outcome == OUTCOME_THROTTLED:
+                self._stats["throttles"] += 1
+                if permit.started_at >= self._last_decrease:
+                    self._limit = max(
+                        float(self.min_limit), self._limit * self.decrease_factor
+                    )
+                    self._last_decrease = self._clock()
+                    self._slow_start = False
+                    self._stats["decreases"] += 1
+            elif outcome == OUTCOME_SUCCESS:
+                latency = self._clock() - permit.started_at
+                slow = (
+                    self._latency is not None
+                    and latency > self._latency * self.latency_tolerance
+                )
+                # Only a cap that was at least half in use when the call started
+                # is raised; an idle process must not drift up to the maximum
+                # without ever testing it.
+                if permit.in_flight * 2 >= self._limit and not slow:
+                    step = 1.0 if self._slow_start else 1.0 / self._limit
+                    self._limit = min(float(self.max_limit), self._limit + step)
+                self._latency = (
+                    latency
+                    if self._latency is None
+                    else self._latency + _LATENCY_SMOOTHING * (latency - self._latency)
+                )
+            changed = int(self._limit) != before
+            self._cond.notify(max(1, int(self._limit) - self._in_flight))
+            return changed
+
+    def snapshot(self) -> Dict[str, float]:
+        """Current cap, load and counters (for metrics and logs)."""
+        with self._cond:
+            return {
+                "limit": int(self._limit),
+                "in_flight": self._in_flight,
+                "waiting": self._waiting,
+                "latency_seconds": self._latency or 0.0,
+                **self._stats,
+            }
+
+
+_limiters: Dict[str, AdaptiveConcurrencyLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.environ.get(name, default))
+    except ValueError:
+        logger.warning(f"Ignoring non-integer {name}; using {default}")
+        return default
+
+
+def adaptive_concurrency_enabled() -> bool:
+    """Whether model calls go through the per-model limiters (off by default)."""
+    value = os.environ.get("BEDROCK_ADAPTIVE_CONCURRENCY", "false")
+    return value.strip().lower() in ("true", "1", "yes", "on")
+
+
+def max_concurrency() -> int:
+    """Upper bound of every model's cap (``BEDROCK_CONCURRENCY_MAX``)."""
+    return max(1, _env_int("BEDROCK_CONCURRENCY_MAX", DEFAULT_MAX_LIMIT))
+
+
+def get_model_limiter(model_id: str) -> Optional[AdaptiveConcurrencyLimiter]:
+    """The process-wide limiter for ``model_id``, or None when disabled."""
+    if not adaptive_concurrency_enabled():
+        return None
+    limiter = _limiters.get(model_id)
+    if limiter is None:
+        with _limiters_lock:
+            limiter = _limiters.get(model_id)
+            if limiter is None:
+                max_limit = max_concurrency()
+                min_limit = min(
+                    max(1, _env_int("BEDROCK_CONCURRENCY_MIN", DEFAULT_MIN_LIMIT)),
+                    max_limit,
+                )
+                limiter = AdaptiveConcurrencyLimiter(
+                    initial_limit=_env_int(
+                        "BEDROCK_CONCURRENCY_INITIAL", DEFAULT_INITIAL_LIMIT
+                    ),
+                    min_limit=min_limit,
+                    max_limit=max_limit,
+                )
+                _limiters[model_id] = limiter
+    return limiter
+
+
+def get_limiter_snapshots() -> Dict[str, Dict[str, float]]:
+    """``snapshot()`` of every model limiter created in this process."""
+    with _limiters_lock:
+        limiters = dict(_limiters)
+    return {model_id: limiter.snapshot() for model_id, limiter in limiters.items()}
+
+
+def reset_model_limiters() -> None:
+    """Drop all model limiters (tests, or after changing the settings)."""
+    with _limiters_lock:
+        _limiters.clear()
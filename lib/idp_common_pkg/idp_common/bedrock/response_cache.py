@@ -0,0 +1,303 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""Opt-in cache of Bedrock Converse responses keyed by request fingerprint.
+
+Reprocessing a document, re-running a test set or sweeping a benchmark sends
+byte-identical requests (same model, system prompt, content and images) through
+``BedrockClient.invoke_model`` again and again. With the cache enabled, the
+first response is stored and every identical request afterwards is answered
+from the cache with zero-token metering.
+
+The fingerprint is a SHA-256 of the canonical JSON of the Converse parameters
+(image and document bytes are replaced by their own SHA-256), excluding only
+the service tier, which does not change the answer. Only requests that pin
+``temperature`` to 0 without ``topP`` are cached: a request without an
+explicit temperature (e.g. one that sets ``topP``, or a Claude 4.7+ request,
+which accepts neither) samples at the service default. Truncated or
+guardrail-blocked responses are never cached.
+
+Entries are grouped by a *scope*, normally the configuration version the
+document is processed with, passed with each request
+(``invoke_model(..., cache_scope=...)``), so a new configuration version
+starts from an empty cache and old versions can be dropped as a unit.
+
+Settings come from the environment:
+
+- ``BEDROCK_RESPONSE_CACHE`` — backend URI; unset disables the cache.
+  ``sqlite:///path/to/cache.db`` (local disk), ``s3://bucket/prefix`` or
+  ``dynamodb://table`` (a PK/SK table with TTL on ``ExpiresAfter``, such as
+  the tracking table).
+- ``BEDROCK_RESPONSE_CACHE_MODE`` — ``use`` (default: read and write),
+  ``refresh`` (skip reads, overwrite entries) or ``bypass`` (neither).
+- ``BEDROCK_RESPONSE_CACHE_SCOPE`` — scope for requests that do not pass
+  one (default ``default``).
+- ``BEDROCK_RESPONSE_CACHE_TTL_DAYS`` — entry lifetime (default 30).
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional, Protocol, runtime_checkable
+
+import boto3
+from botocore.exceptions import ClientError
+
+logger = logging.getLogger(__name__)
+
+MODE_USE = "use"
+MODE_REFRESH = "refresh"
+MODE_BYPASS = "bypass"
+_MODES = (MODE_USE, MODE_REFRESH, MODE_BYPASS)
+
+DEFAULT_SCOPE = "default"
+DEFAULT_TTL_DAYS = 30
+
+# Parameters that do not change the model's answer.
+_UNKEYED_PARAMS = ("serviceTier",)
+# Responses that must be recomputed rather than replayed.
+_UNCACHEABLE_STOP_REASONS = ("max_tokens", "guardrail_intervened", "content_filtered")
+# Bumped when the fingerprint or record format changes.
+_FINGERPRINT_VERSION = "v1"
+
+
+@runtime_checkable
+class ResponseCacheBackend(Protocol):
+    """Storage for cached responses.
+
+    ``get`` returns the record stored for ``(scope, fingerprint)``, or ``None``
+    when there is none or it has expired; ``put`` overwrites it.
+    """
+
+    def get(self, scope: str, fingerprint: str) -> Optional[Dict[str, Any]]: ...
+
+    def put(
+        self, scope: str, fingerprint: str, record: Dict[str, Any], ttl_seconds: int
+    ) -> None: ...
+
+
+class SQLiteResponseCache:
+    """Responses in a local SQLite file (notebooks, CLI runs, benchmarks)."""
+
+    def __init__(self, path: str):
+        self.path = path
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "scope TEXT NOT NULL, fingerprint TEXT NOT NULL, "
+                "record TEXT NOT NULL, expires_at REAL NOT NULL, "
+                "PRIMARY KEY (scope, fingerprint))"
+            )
+
+    def get(self, scope: str, fingerprint: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT record FROM responses "
+                "WHERE scope = ? AND fingerprint = ? AND expires_at > ?",
+                (scope, fingerprint, time.time()),
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put(
+        self, scope: str, fingerprint: str, record: Dict[str, Any], ttl_seconds: int
+    ) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)",
+                (scope, fingerprint, json.dumps(record), time.time() + ttl_seconds),
+            )
+
+
+class S3ResponseCache:
+    """Responses as ``{prefix}/{scope}/{fingerprint}.json`` objects.
+
+    Expiry is checked on read; add a lifecycle rule on the prefix to delete
+    expired objects.
+    """
+
+    def __init__(self, bucket: str, prefix: str = "bedrock-response-cache"):
+        self.bucket = bucket
+        self.prefix = prefix.strip("/")
+        self._s3_client = None
+
+    @property
+    def s3_client(self):
+        if self._s3_client is None:
+            self._s3_client = boto3.client("s3")
+        return self._s3_client
+
+    def _key(self, scope: str, fingerprint: str) -> str:
+        return f"{self.prefix}/{scope}/{fingerprint}.json"
+
+    def get(self, scope: str, fingerprint: str) -> Optional[Dict[str, Any]]:
+        try:
+            obj = self.s3_client.get_object(
+                Bucket=self.bucket, Key=self._key(scope, fingerprint)
+            )
+        except ClientError as e:
+            if e.response["Error"]["Code"] in ("NoSuchKey", "404"):
+                return None
+            raise
+        record = json.loads(obj["Body"].read())
+        if record.get("expires_at", 0) <= time.time():
+            return None
+        return record
+
+    def put(
+        self, scope: str, fingerprint: str, record: Dict[str, Any], ttl_seconds: int
+    ) -> None:
+        body = {**record, "expires_at": time.time() + ttl_seconds}
+        self.s3_client.put_object(
+            Bucket=self.bucket,
+            Key=self._key(scope, fingerprint),
+            Body=json.dumps(body).encode("utf-8"),
+            ContentType="application/json",
+        )
+
+
+class DynamoDBResponseCache:
+    """Responses as items in a PK/SK table, expired by its ``ExpiresAfter`` TTL."""
+
+    def __init__(self, table_name: str):
+        self.table_name = table_name
+        self._table = None
+
+    @property
+    def table(self):
+        if self._table is None:
+            self._table = boto3.resource("dynamodb").Table(self.table_name)
+        return self._table
+
+    @staticmethod
+    def _key(scope: str, fingerprint: str) -> Dict[str, str]:
+        return {"PK": f"llmcache#{scope}#{fingerprint}", "SK": "response"}
+
+    def get(self, scope: str, fingerprint: str) -> Optional[Dict[str, Any]]:
+        item = self.table.get_item(Key=self._key(scope, fingerprint)).get("Item")
+        # TTL deletion is lazy, so an expired item can still be returned.
+        if not item or int(item.get("ExpiresAfter", 0)) <= time.time():
+            return None
+        return json.loads(item["Record"])
+
+    def put(
+        self, scope: str, fingerprint: str, record: Dict[str, Any], ttl_seconds: int
+    ) -> None:
+        self.table.put_item(
+            Item={
+                **self._key(scope, fingerprint),
+                "Record": json.dumps(record),
+                "ExpiresAfter": int(time.time() + ttl_seconds),
+            }
+        )
+
+
+def backend_from_uri(uri: str) -> ResponseCacheBackend:
+    """Build the backend named by a ``BEDROCK_RESPONSE_CACHE`` URI."""
+    if uri.startswith("sqlite://"):
+        return SQLiteResponseCache(uri[len("sqlite://") :])
+    if uri.startswith("s3://"):
+        bucket, _, prefix = uri[len("s3://") :].partition("/")
+        return S3ResponseCache(bucket, prefix) if prefix else S3ResponseCache(bucket)
+    if uri.startswith("dynamodb://"):
+        return DynamoDBResponseCache(uri[len("dynamodb://") :])
+    raise ValueError(
+        f"Unsupported BEDROCK_RESPONSE_CACHE URI '{uri}' "
+        "(expected sqlite://, s3:// or dynamodb://)"
+    )
+
+
+def _encode_binary(value: Any) -> Any:
+    if isinstance(value, (bytes, bytearray)):
+        return {"sha256": hashlib.sha256(value).hexdigest(), "size": len(value)}
+    raise TypeError(f"Cannot fingerprint {type(value).__name__}")
+
+
+def request_fingerprint(converse_params: Dict[str, Any]) -> str:
+    """SHA-256 of the canonical form of a Converse request."""
+    keyed = {k: v for k, v in converse_params.items() if k not in _UNKEYED_PARAMS}
+    canonical = json.dumps(
+        keyed,
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=_encode_binary,
+    )
+    digest = hashlib.sha256(f"{_FINGERPRINT_VERSION}\n{canonical}".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def is_cacheable_request(converse_params: Dict[str, Any]) -> bool:
+    """Whether a request is deterministic enough to replay: ``temperature``
+    explicitly 0 and no ``topP``."""
+    inference_config = converse_params.get("inferenceConfig") or {}
+    return (
+        "topP" not in inference_config
+        and "temperature" in inference_config
+        and inference_config["temperature"] == 0
+    )
+
+
+def is_cacheable_response(response: Dict[str, Any]) -> bool:
+    """Whether a response is complete enough to replay."""
+    return response.get("stopReason") not in _UNCACHEABLE_STOP_REASONS
+
+
+_backends: Dict[str, ResponseCacheBackend] = {}
+_backends_lock = threading.Lock()
+
+
+def response_cache_mode() -> str:
+    """``use``, ``refresh`` or ``bypass`` (``BEDROCK_RESPONSE_CACHE_MODE``)."""
+    mode = os.environ.get("BEDROCK_RESPONSE_CACHE_MODE", MODE_USE).strip().lower()
+    if mode not in _MODES:
+        logger.warning(
+            f"Ignoring unknown BEDROCK_RESPONSE_CACHE_MODE '{mode}'; using '{MODE_USE}'"
+        )
+        return MODE_USE
+    return mode
+
+
+def response_cache_ttl_seconds() -> int:
+    """Entry lifetime (``BEDROCK_RESPONSE_CACHE_TTL_DAYS``)."""
+    try:
+        days = float(
+            os.environ.get("BEDROCK_RESPONSE_CACHE_TTL_DAYS", DEFAULT_TTL_DAYS)
+        )
+    except ValueError:
+        days = DEFAULT_TTL_DAYS
+    return int(days * 86400)
+
+
+def response_cache_scope(scope: Optional[str] = None) -> str:
+    """The scope a request's lookup and entry use: ``scope`` (normally the
+    config version) or ``BEDROCK_RESPONSE_CACHE_SCOPE``."""
+    return scope or os.environ.get("BEDROCK_RESPONSE_CACHE_SCOPE") or DEFAULT_SCOPE
+
+
+def get_response_cache() -> Optional[ResponseCacheBackend]:
+    """The process-wide backend, or None when the cache is off or bypassed."""
+    uri = os.environ.get("BEDROCK_RESPONSE_CACHE", "").strip()
+    if not uri or response_cache_mode() == MODE_BYPASS:
+        return None
+    backend = _backends.get(uri)
+    if backend is None:
+        with _backends_lock:
+            backend = _backends.get(uri)
+            if backend is None:
+                backend = backend_from_uri(uri)
+                _backends[uri] = backend
+    return backend
+
+
+def reset_response_cache() -> None:
+    """Drop cached backends (tests, or after changing settings)."""
+    with _backends_lock:
+        _backends.clear()
@@ -0,0 +1,245 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Page retrieval index for Chat-with-Document.
+
+Chat used to send the whole document text with every turn. For long documents
+that means slow first tokens, large input-token bills and, past the model's
+context window, no answer at all. ``ChatPageIndex`` is built once per document
+from the cached full text (``<objectKey>/summary/fulltext.txt``) and picks the
+pages relevant to each question:
+
+- **BM25** over the words of each page (the pages are the retrieval chunks, so
+  the model still sees whole pages with their page numbers).
+- **Embeddings** (optional) — when page vectors are supplied, the BM25 and
+  cosine rankings are merged with reciprocal rank fusion.
+- **Header** — the start of the first page (title, parties, dates) is kept
+  with the index and sent with every turn, so the model always knows what
+  document it is looking at.
+
+The index serializes to JSON (page texts, header and optional vectors); BM25
+statistics are recomputed on load, which takes milliseconds even for hundreds
+of pages.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from collections import Counter
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+INDEX_FORMAT_VERSION = 1
+DEFAULT_TOP_K_PAGES = 8
+DEFAULT_MIN_PAGES = 20
+DEFAULT_HEADER_CHARS = 1500
+
+# BM25 parameters (the usual defaults) and the reciprocal rank fusion constant.
+BM25_K1 = 1.5
+BM25_B = 0.75
+RRF_K = 60
+
+_PAGE_TAG = re.compile(r"<page-number>([^<]*)</page-number>\n?")
+_TOKEN = re.compile(r"\w+")
+_STOPWORDS = frozenset(
+    "a an and are as at be by did do does for from has have how i in is it its "
+    "me my of on or that the their there this to was were what when where which "
+    "who why will with you your".split()
+)
+
+
+def tokenize(text: str) -> List[str]:
+    """Lower-cased word tokens without stopwords and single letters."""
+    return [
+        token
+        for token in _TOKEN.findall(text.lower())
+        if token not in _STOPWORDS and (len(token) > 1 or token.isdigit())
+    ]
+
+
+def pages_from_full_text(full_text: str) -> List[Tuple[str, str]]:
+    """
+    Split full text assembled as ``<page-number>N</page-number>`` blocks
+    (the chat processor and summarization format) into ``(page_id, text)``.
+
+    Text without page tags becomes a single page ``"1"``.
+    """
+    parts = _PAGE_TAG.split(full_text)
+    if len(parts) == 1:
+        return [("1", full_text.strip())] if full_text.strip() else []
+    return [
+        (parts[i].strip(), parts[i + 1].strip()) for i in range(1, len(parts) - 1, 2)
+    ]
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough input-token count (about 4 characters per token)."""
+    return (len(text) + 3) // 4
+
+
+class ChatPageIndex:
+    """BM25 (and optionally embedding) index over the pages of one document."""
+
+    def __init__(
+        self,
+        pages: Sequence[Tuple[str, str]],
+        header: str = "",
+        embeddings: Optional[Sequence[Optional[Sequence[float]]]] = None,
+        embedding_model: Optional[str] = None,
+        source: str = "",
+    ):
+        self.page_ids = [str(page_id) for page_id, _ in pages]
+        self.texts = [text for _, text in pages]
+        self.header = header
+        self.embeddings = list(embeddings) if embeddings else None
+        self.embedding_model = embedding_model if self.embeddings else None
+        # Identifies the full text the index was built from (e.g. its ETag).
+        self.source = source
+
+        self._term_freqs = [Counter(tokenize(text)) for text in self.texts]
+        self._lengths = [sum(tf.values()) for tf in self._term_freqs]
+        self._avg_length = (sum(self._lengths) / len(self._lengths)) or 1.0
+        doc_freqs: Counter = Counter()
+        for tf in self._term_freqs:
+            doc_freqs.update(tf.keys())
+        count = len(self.texts)
+        self._idf = {
+            term: math.log(1 + (count - df + 0.5) / (df + 0.5))
+            for term, df in doc_freqs.items()
+        }
+
+    @classmethod
+    def from_full_text(
+        cls,
+        full_text: str,
+        header_chars: int = DEFAULT_HEADER_CHARS,
+        embed_pages: Optional[
+            Callable[[List[str]], Sequence[Optional[Sequence[float]]]]
+        ] = None,
+        embedding_model: Optional[str] = None,
+        source: str = "",
+    ) -> "ChatPageIndex":
+        """
+        Build the index from the chat full text.
+
+        Args:
+            full_text: ``<page-number>``-tagged document text
+            header_chars: Leading characters of the first page kept as header
+            embed_pages: Optional callable returning one vector (or None) per
+                page text, e.g. backed by ``BedrockClient.generate_embeddings_batch``
+            embedding_model: Model the vectors come from (stored with the index)
+            source: Identifier of ``full_text`` used to detect a stale index
+        """
+        pages = pages_from_full_text(full_text)
+        header = pages[0][1][:header_chars] if pages else ""
+        embeddings = embed_pages([text for _, text in pages]) if embed_pages else None
+        return cls(pages, header, embeddings, embedding_model, source)
+
+    @property
+    def page_count(self) -> int:
+        return len(self.page_ids)
+
+    def full_text_tokens(self) -> int:
+        """Estimated tokens of the text the whole-document prompt would contain."""
+        return sum(estimate_tokens(text) for text in self.texts)
+
+    def bm25_scores(self, query: str) -> List[float]:
+        terms = set(tokenize(query))
+        scores = []
+        for tf, length in zip(self._term_freqs, self._lengths):
+            norm = BM25_K1 * (1 - BM25_B + BM25_B * length / self._avg_length)
+            scores.append(
+                sum(
+                    self._idf[term] * tf[term] * (BM25_K1 + 1) / (tf[term] + norm)
+                    for term in terms
+                    if term in tf
+                )
+            )
+        return scores
+
+    def search(
+        self,
+        query: str,
+        top_k: int = DEFAULT_TOP_K_PAGES,
+        query_embedding: Optional[Sequence[float]] = None,
+    ) -> List[str]:
+        """
+        Page ids of the ``top_k`` pages most relevant to ``query``, best first.
+
+        Uses BM25, fused with cosine similarity when the index has page vectors
+        and ``query_embedding`` is given. When nothing matches (e.g. "summarize
+        this"), the leading pages are returned.
+        """
+        bm25 = self.bm25_scores(query)
+        rankings = []
+        if any(score > 0 for score in bm25):
+            rankings.append([i for i in _rank(bm25) if bm25[i] > 0])
+        if self.embeddings and query_embedding:
+            similarities = [
+                _cosine(vector, query_embedding) if vector else -1.0
+                for vector in self.embeddings
+            ]
+            rankings.append(_rank(similarities))
+        if not rankings:
+            return self.page_ids[:top_k]
+        fused: Dict[int, float] = {}
+        for ranking in rankings:
+            for rank, i in enumerate(ranking):
+                fused[i] = fused.get(i, 0.0) + 1.0 / (RRF_K + rank + 1)
+        best = sorted(fused, key=lambda i: (-fused[i], i))[:top_k]
+        return [self.page_ids[i] for i in best]
+
+    def render(self, page_ids: Sequence[str]) -> str:
+        """
+        Prompt text for the selected pages: a note on what is included, the
+        header (unless the first page is included) and the pages in document
+        order, in the same ``<page-number>`` format as the full text.
+        """
+        selected = set(page_ids)
+        parts = [
+            f"The document has {self.page_count} pages. Only the "
+            f"{len(selected)} pages most relevant to the question are included "
+            "below; if the answer may be on other pages, say so."
+        ]
+        if self.header and self.page_ids and self.page_ids[0] not in selected:
+            parts.append(f"<document-header>\n{self.header}\n</document-header>")
+        for page_id, text in zip(self.page_ids, self.texts):
+            if page_id in selected:
+                parts.append(f"<page-number>{page_id}</page-number>\n{text}")
+        return "\n\n".join(parts) + "\n"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "version": INDEX_FORMAT_VERSION,
+            "source": self.source,
+            "header": self.header,
+            "pages": [
+                {"id": page_id, "text": text}
+                for page_id, text in zip(self.page_ids, self.texts)
+            ],
+            "embedding_model": self.embedding_model,
+            "embeddings": self.embeddings,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ChatPageIndex":
+        if data.get("version") != INDEX_FORMAT_VERSION:
+            raise ValueError(f"Unsupported chat index version: {data.get('version')}")
+        return cls(
+            [(page["id"], page["text"]) for page in data["pages"]],
+            data.get("header", ""),
+            data.get("embeddings"),
+            data.get("embedding_model"),
+            data.get("source", ""),
+        )
+
+
+def _rank(scores: Sequence[float]) -> List[int]:
+    return sorted(range(len(scores)), key=lambda i: (-scores[i], i))
+
+
+def _cosine(a: Sequence[float], b: Sequence[float]) -> float:
+    dot = sum(x * y for x, y in zip(a, b))
+    norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+    return dot / norm if norm else 0.0
@@ -53,6 +53,7 @@ from idp_common.config.schema_constants import (
     X_AWS_IDP_PAGE_CONTENT_REGEX,
 )
 from idp_common.models import Document, Section, Status
+from idp_common.page_artifacts import IMAGE, TEXT, PageArtifactLoader
 from idp_common.utils import extract_json_from_text, extract_structured_data_from_text
 from idp_common.utils.few_shot_example_builder import build_few_shot_examples_content
 
@@ -95,6 +96,7 @@ class ClassificationService:
         config: dict[str, Any] | IDPConfig | None = None,
         backend: str = "bedrock",
         cache_table: str | None = None,
+        cache_scope: str | None = None,
     ):
         """
         Initialize the classification service.
@@ -105,6 +107,8 @@ class ClassificationService:
             config: Configuration dictionary or IDPConfig model
             backend: Classification backend to use ('bedrock' or 'sagemaker')
             cache_table: Optional DynamoDB table name for caching classification results
+            cache_scope: Optional Bedrock response cache scope (normally the
+                document's config version)
         """
         # Convert dict to IDPConfig if needed
         if config is not None and isinstance(config, dict):
@@ -116,6 +120,7 @@ class ClassificationService:
 
         self.config = config_model
         self.region = region or os.environ.get("AWS_REGION")
+        self.cache_scope = cache_scope
         self.max_workers = max_workers
         self.document_types = self._load_document_types()
         self.valid_doc_types: Set[str] = {dt.type_name for dt in self.document_types}
@@ -446,40 +451,33 @@ class ClassificationService:
         Returns:
             Dictionary mapping page_id to PageContextData with loaded content
         """
-        page_content_cache: Dict[str, PageContextData] = {}
-
         # Type-safe access to image config
         target_width = self.config.classification.image.target_width
         target_height = self.config.classification.image.target_height
 
-        for page_id, page in document.pages.items():
-            text_content = None
-            image_content = None
-
-            # Load text content
-            if page.parsed_text_uri:
-                try:
-                    text_content = s3.get_text_content(page.parsed_text_uri)
-                except Exception as e:
-                    logger.warning(
-                        f"Failed to load text content for page {page_id}: {e}"
-                    )
-
-            # Load image content
-            if page.image_uri:
-                try:
-                    image_content = image.prepare_image(
-                        page.image_uri, target_width, target_height
-                    )
-                except Exception as e:
-                    logger.warning(
-                        f"Failed to load image content for page {page_id}: {e}"
-                    )
+        bundle = PageArtifactLoader(step="classification").load(
+            document,
+            text=True,
+            images=True,
+            image_size=(target_width, target_height),
+        )
 
+        page_content_cache: Dict[str, PageContextData] = {}
+        for page_id, artifacts in bundle.pages.items():
+            if TEXT in artifacts.errors:
+                logger.warning(
+                    f"Failed to load text content for page {page_id}: "
+                    f"{artifacts.errors[TEXT]}"
+                )
+            if IMAGE in artifacts.errors:
+                logger.warning(
+                    f"Failed to load image content for page {page_id}: "
+                    f"{artifacts.errors[IMAGE]}"
+                )
             page_content_cache[page_id] = PageContextData(
                 page_id=page_id,
-                text_content=text_content,
-                image_content=image_content,
+                text_content=artifacts.text,
+                image_content=artifacts.image,
             )
 
         logger.info(
@@ -1956,6 +1954,7 @@ class ClassificationService:
             context="Classification",
             model_lambda_hook_arn=self.config.classification.model_lambda_hook_arn,
             reasoning_effort=config.get("reasoning_effort"),
+            cache_scope=self.cache_scope,
         )
 
     def _create_unclassified_result(
@@ -2835,19 +2834,22 @@ class ClassificationService:
         Returns:
             Dictionary mapping page_id to text content
         """
-        pages_content = {}
+        bundle = PageArtifactLoader(step="holistic classification").load(
+            document, text=True
+        )
 
+        pages_content = {}
         for page_id, page in document.pages.items():
-            # Fetch page text content from S3 if available
-            if page.parsed_text_uri:
-                try:
-                    pages_content[page_id] = s3.get_text_content(page.parsed_text_uri)
-                except Exception as e:
-                    logger.warning(
-                        f"Failed to load text content from {page.parsed_text_uri}: {e}"
-                    )
-                    # Continue with empty content
-                    pages_content[page_id] = f"[Error loading page {page_id} content]"
+            artifacts = bundle.pages[page_id]
+            if TEXT in artifacts.errors:
+                logger.warning(
+                    f"Failed to load text content from {page.parsed_text_uri}: "
+                    f"{artifacts.errors[TEXT]}"
+                )
+                # Continue with empty content
+                pages_content[page_id] = f"[Error loading page {page_id} content]"
+            elif page.parsed_text_uri:
+                pages_content[page_id] = artifacts.text
             else:
                 # Page has no text content
                 pages_content[page_id] = f"[No text content for page {page_id}]"
@@ -5,9 +5,14 @@ from __future__ import annotations
 
 import boto3
 import gzip
+import hashlib
 import json
 import os
-from typing import Dict, Any, Optional, Union, List
+import pickle  # nosec B403 - only reads files this module wrote to its own cache dir
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Any, Optional, Union, List, Tuple
 from botocore.exceptions import ClientError
 import logging
 from boto3.dynamodb.types import Binary
@@ -51,6 +56,123 @@ _DYNAMODB_ITEM_SIZE_WARNING = 350 * 1024  # Warn at 350KB
 _MIN_FULL_CONFIG_KEYS = 4
 
 
+# ===== Merged configuration cache =====
+#
+# get_merged_configuration is called by every Lambda step for every document.
+# Validated full configs are cached per (table, version) for the life of the
+# process, tagged with a stamp of the stored item: a digest of the compressed
+# config blob (or of the inline attributes for legacy items). Each call still
+# does one GetItem to compare stamps, so a write from any process - including
+# ones that bypass this class - is picked up on the next call; only the
+# gunzip and Pydantic validation are skipped. MERGED_CONFIG_CACHE_TTL_SECONDS
+# (default 0) lets a hit skip that GetItem too, trading staleness for latency.
+# MERGED_CONFIG_CACHE_DIR (e.g. /tmp/idp-config-cache) additionally persists
+# entries as pickles, so a fresh process sharing the filesystem skips
+# validation on its first read as well.
+_MERGED_CACHE_TTL_ENV = "MERGED_CONFIG_CACHE_TTL_SECONDS"
+_MERGED_CACHE_DIR_ENV = "MERGED_CONFIG_CACHE_DIR"
+
+
+@dataclass
+class _CachedConfig:
+    stamp: str
+    config: IDPConfig
+    checked_at: float
+
+
+_merged_cache: Dict[Tuple[str, str], _CachedConfig] = {}
+_merged_cache_lock = threading.Lock()
+
+
+def _merged_cache_ttl() -> float:
+    try:
+        return max(0.0, float(os.environ.get(_MERGED_CACHE_TTL_ENV, "0")))
+    except ValueError:
+        return 0.0
+
+
+def _item_stamp(item: Dict[str, Any]) -> str:
+    """Digest of the stored configuration content of a raw DynamoDB item."""
+    digest = hashlib.blake2b(digest_size=16)
+    compressed = item.get(_COMPRESSED_DATA_FIELD)
+    if item.get(_COMPRESSED_STORAGE_MARKER) == _COMPRESSED_STORAGE_VALUE and compressed is not None:
+        digest.update(bytes(compressed) if isinstance(compressed, (Binary, bytes)) else str(compressed).encode())
+    else:
+        content = {k: v for k, v in item.items() if k not in _DYNAMODB_METADATA_FIELDS}
+        digest.update(json.dumps(content, sort_keys=True, default=str).encode())
+    return digest.hexdigest()
+
+
+def _cache_file(table_name: str, version: str) -> Optional[str]:
+    cache_dir = os.environ.get(_MERGED_CACHE_DIR_ENV)
+    if not cache_dir:
+        return None
+    name = hashlib.sha256(f"{table_name}#{version}".encode()).hexdigest()[:32]
+    return os.path.join(cache_dir, f"config-{name}.pkl")
+
+
+def _read_cache_file(table_name: str, version: str, stamp: str) -> Optional[IDPConfig]:
+    path = _cache_file(table_name, version)
+    if not path or not os.path.exists(path):
+        return None
+    try:
+        with open(path, "rb") as f:
+            cached_stamp, config = pickle.load(f)  # nosec B301 - written by _write_cache_file
+    except Exception as e:
+        logger.debug(f"Ignoring unreadable config cache file {path}: {e}")
+        return None
+    if cached_stamp != stamp or not isinstance(config, IDPConfig):
+        return None
+    return config
+
+
+def _write_cache_file(table_name: str, version: str, stamp: str, config: IDPConfig) -> None:
+    path = _cache_file(table_name, version)
+    if not path:
+        return
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump((stamp, config), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except Exception as e:
+        logger.warning(f"Could not persist config cache file {path}: {e}")
+
+
+def invalidate_merged_config_cache(table_name: Optional[str] = None, version: Optional[str] = None) -> None:
+    """
+    Drop cached merged configurations, in memory and in MERGED_CONFIG_CACHE_DIR.
+
+    Args:
+        table_name: Only drop entries for this configuration table (default: all)
+        version: Only drop this version (default: every version of the table)
+    """
+    with _merged_cache_lock:
+        keys = [
+            key for key in _merged_cache
+            if (table_name is None or key[0] == table_name) and (version is None or key[1] == version)
+        ]
+        for key in keys:
+            del _merged_cache[key]
+    cache_dir = os.environ.get(_MERGED_CACHE_DIR_ENV)
+    if not cache_dir or not os.path.isdir(cache_dir):
+        return
+    if table_name is not None and version is not None:
+        paths = [_cache_file(table_name, version)]
+    else:
+        # File names are hashed, so a partial invalidation clears the directory
+        paths = [os.path.join(cache_dir, n) for n in os.listdir(cache_dir) if n.startswith("config-")]
+    for path in paths:
+        try:
+            if path:
+                os.remove(path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Could not remove config cache file {path}: {e}")
+
+
 def _is_full_config(raw_dict: Dict[str, Any]) -> bool:
     """
     Detect whether a raw config dict is a full configuration or a legacy sparse delta.
@@ -242,14 +364,10 @@ class ConfigurationManager:
 
         # Try reading as a full config first (new format + default version)
         try:
-            config = self.get_configuration(CONFIG_TYPE_CONFIG, version)
-            if config is not None and isinstance(config, IDPConfig):
-                # Check if this is truly a full config by examining the raw data
-                raw = self.get_raw_configuration(CONFIG_TYPE_CONFIG, version)
-                if raw and _is_full_config(raw):
-                    logger.info(f"Loaded full configuration for version: {version}")
-                    return config
-                # else: Pydantic filled defaults - it's actually sparse, fall through to legacy path
+            config = self._get_full_configuration(version)
+            if config is not None:
+                return config
+            # else: missing or sparse (Pydantic would fill defaults), fall through to legacy path
         except Exception as e:
             logger.debug(f"Could not load version {version} as full config: {e}")
 
@@ -300,6 +418,65 @@ class ConfigurationManager:
 
         return merged_config
 
+    def _get_full_configuration(self, version: str) -> Optional[IDPConfig]:
+        """
+        Load a full-format Config version through the process-wide cache.
+
+        Reads the item once and compares its stamp with the cached entry;
+        on a match the cached IDPConfig is returned without decompressing
+        or re-validating. Callers get a deep copy, so mutating the result
+        never leaks into the cache.
+
+        Args:
+            version: Config version to load
+
+        Returns:
+            IDPConfig, or None if the version is missing or a legacy sparse delta
+        """
+        key = (self.table_name, version)
+        with _merged_cache_lock:
+            entry = _merged_cache.get(key)
+        ttl = _merged_cache_ttl()
+        if entry is not None and ttl and time.monotonic() - entry.checked_at < ttl:
+            return entry.config.model_copy(deep=True)
+
+        item = self.table.get_item(Key={"Configuration": f"{CONFIG_TYPE_CONFIG}#{version}"}).get("Item")
+        if item is None:
+            return None
+        stamp = _item_stamp(item)
+
+        if entry is None or entry.stamp != stamp:
+            config = _read_cache_file(self.table_name, version, stamp)
+            if config is None:
+                item = self._decompress_item(item)
+                raw = {k: v for k, v in item.items() if k not in _DYNAMODB_METADATA_FIELDS}
+                if not _is_full_config(raw):
+                    return None
+                config = ConfigurationRecord.from_dynamodb_item(item).config
+                if not isinstance(config, IDPConfig):
+                    return None
+                _write_cache_file(self.table_name, version, stamp, config)
+                logger.info(f"Loaded full configuration for version: {version}")
+            entry = _CachedConfig(stamp=stamp, config=config, checked_at=time.monotonic())
+        else:
+            entry.checked_at = time.monotonic()
+        with _merged_cache_lock:
+            _merged_cache[key] = entry
+        return entry.config.model_copy(deep=True)
+
+    def invalidate_cache(self, version: Optional[str] = None) -> None:
+        """
+        Drop this table's cached merged configurations.
+
+        Called after every write made through this class. Writes made
+        elsewhere are still detected by the stamp check on the next read,
+        unless MERGED_CONFIG_CACHE_TTL_SECONDS is set.
+
+        Args:
+            version: Only drop this version (default: every version)
+        """
+        invalidate_merged_config_cache(self.table_name, version)
+
     def save_configuration(
         self,
         config_type: str,
@@ -387,6 +564,8 @@ class ConfigurationManager:
 
         # Write to DynamoDB (adds full config marker automatically)
         self._write_record(record)
+        if config_type == CONFIG_TYPE_CONFIG:
+            self.invalidate_cache(version)
 
     def activate_version(self, version: str) -> None:
         """
@@ -420,6 +599,7 @@ class ConfigurationManager:
                 UpdateExpression="SET IsActive = :true",
                 ExpressionAttributeValues={":true": True}
             )
+            self.invalidate_cache()
             logger.info(f"Activated Config version {version}")
         except ClientError as e:
             logger.error(f"Error activating version {version}: {e}")
@@ -514,6 +694,39 @@ class ConfigurationManager:
             logger.error(f"Error listing config versions: {e}")
             return []
 
+    def get_version_metadata(self, version: str) -> Optional[Dict[str, Any]]:
+        """
+        Read one config version's metadata without its configuration body.
+
+        A projected GetItem, so it costs the same whatever the size of the
+        stored configuration. Callers that cache a resolved configuration use
+        ``updatedAt`` (set by every save_configuration) to tell whether their
+        copy is still current.
+
+        Args:
+            version: Config version name
+
+        Returns:
+            Dict with versionName, isActive, updatedAt and bdaProjectArn, or
+            None if the version does not exist
+
+        Raises:
+            ClientError: If DynamoDB operation fails
+        """
+        response = self.table.get_item(
+            Key={"Configuration": f"{CONFIG_TYPE_CONFIG}#{version}"},
+            ProjectionExpression="IsActive, UpdatedAt, BdaProjectArn",
+        )
+        item = response.get("Item")
+        if item is None:
+            return None
+        return {
+            "versionName": version,
+            "isActive": item.get("IsActive"),
+            "updatedAt": item.get("UpdatedAt"),
+            "bdaProjectArn": item.get("BdaProjectArn"),
+        }
+
     # ===== BDA Project Tracking Methods =====
 
     def get_bda_project_arn(self, version: str) -> Optional[str]:
@@ -636,6 +849,8 @@ class ConfigurationManager:
             else:
                 key = config_type
             self.table.delete_item(Key={"Configuration": key})
+            if config_type == CONFIG_TYPE_CONFIG:
+                self.invalidate_cache(version)
             logger.info(f"Deleted configuration: {key}")
         except ClientError as e:
             logger.error(f"Error deleting configuration {config_type}: {e}")
@@ -1229,9 +1229,9 @@ class ChatConfig(BaseModel):
         default="us.anthropic.claude-opus-4-8:1m",
         description=(
             "Bedrock model ID used for Chat-with-Document. A large-context "
-            "model is recommended because the entire document text is sent "
-            "in a single prompt. Use 'LambdaHook' to invoke a custom Lambda "
-            "function instead of Bedrock."
+            "model is recommended because the entire text of documents below "
+            "retrieval_min_pages is sent in a single prompt. Use 'LambdaHook' "
+            "to invoke a custom Lambda function instead of Bedrock."
         ),
     )
     model_lambda_hook_arn: Optional[str] = Field(
@@ -1272,6 +1272,27 @@ class ChatConfig(BaseModel):
             "without an effort control (Nova, Sonnet 4.5, Haiku 4.5)."
         ),
     )
+    retrieval_min_pages: int = Field(
+        default=20,
+        ge=0,
+        description=(
+            "Documents with at least this many pages send only the pages most "
+            "relevant to each question (BM25 page retrieval) plus a document "
+            "header instead of the entire text. 0 disables page retrieval."
+        ),
+    )
+    retrieval_top_k_pages: int = Field(
+        default=8,
+        gt=0,
+        description="Pages sent per turn when page retrieval is used",
+    )
+    retrieval_embedding_model: Optional[str] = Field(
+        default=None,
+        description=(
+            "Optional Bedrock embedding model (e.g. amazon.titan-embed-text-v2:0). "
+            "When set, page retrieval fuses BM25 with embedding similarity."
+        ),
+    )
 
     @field_validator("temperature", "top_p", "top_k", mode="before")
     @classmethod
@@ -1287,6 +1308,18 @@ class ChatConfig(BaseModel):
         """Parse optional max_tokens (empty/0 -> None = use model max)."""
         return _parse_optional_max_tokens(v)
 
+    @field_validator("retrieval_min_pages", "retrieval_top_k_pages", mode="before")
+    @classmethod
+    def parse_retrieval_int(cls, v: Any, info: ValidationInfo) -> int:
+        """Parse int from string or number (empty/None -> field default)."""
+        return _parse_required_int(v, info, cls)
+
+    @field_validator("retrieval_embedding_model", mode="before")
+    @classmethod
+    def parse_embedding_model(cls, v: Any) -> Optional[str]:
+        """Empty string -> None (BM25 only)."""
+        return v or None
+
 
 class OCRFeature(BaseModel):
     """OCR feature configuration"""
@@ -1343,6 +1376,25 @@ class OCRConfig(BaseModel):
         default_factory=list, description="Textract features to enable"
     )
     max_workers: int = Field(default=20, gt=0, description="Max concurrent workers")
+    max_inflight_pages: Optional[int] = Field(
+        default=None,
+        gt=0,
+        description=(
+            "Maximum number of rendered PDF page images held in memory while "
+            "waiting for OCR. Rendering blocks once this many pages are in "
+            "flight. Defaults to 2 x max_workers when unset."
+        ),
+    )
+    render_processes: int = Field(
+        default=1,
+        ge=0,
+        description=(
+            "Number of worker processes used to render PDF pages to images. "
+            "1 renders in the OCR Lambda's main process; 0 uses one process per "
+            "available vCPU. Only documents with enough pages to amortize "
+            "process start-up are rendered in parallel."
+        ),
+    )
     image: ImageConfig = Field(default_factory=ImageConfig)
 
     @field_validator("max_workers", mode="before")
@@ -1353,6 +1405,22 @@ class OCRConfig(BaseModel):
             return int(v) if v else 20
         return int(v)
 
+    @field_validator("render_processes", mode="before")
+    @classmethod
+    def parse_render_processes(cls, v: Any) -> int:
+        """Parse render_processes from string or number"""
+        if v is None or (isinstance(v, str) and not v.strip()):
+            return 1
+        return int(v)
+
+    @field_validator("max_inflight_pages", mode="before")
+    @classmethod
+    def parse_max_inflight_pages(cls, v: Any) -> Optional[int]:
+        """Parse max_inflight_pages from string or number, treating empty as unset"""
+        if v is None or (isinstance(v, str) and not v.strip()):
+            return None
+        return int(v)
+
 
 class ErrorAnalyzerParameters(BaseModel):
     """Error analyzer parameters configuration"""
@@ -2324,6 +2392,12 @@ class MultiDocumentDiscoveryConfig(BaseModel):
         gt=0,
         description="Minimum documents required to form a cluster",
     )
+    k_selection: Literal["auto", "exact", "scalable"] = Field(
+        default="auto",
+        description="Cluster count selection: 'exact' (KMeans + full silhouette), "
+        "'scalable' (MiniBatchKMeans + sampled silhouette, parallel over k) or "
+        "'auto' (scalable above 5,000 documents)",
+    )
     num_sample_documents: int = Field(
         default=3,
         gt=0,
@@ -2339,6 +2413,12 @@ class MultiDocumentDiscoveryConfig(BaseModel):
         gt=0,
         description="Maximum concurrent embedding API requests",
     )
+    embedding_cache: bool = Field(
+        default=True,
+        description="Reuse stored embeddings of documents unchanged since a "
+        "previous discovery run (keyed by S3 ETag, embedding model and image "
+        "preprocessing); only new or changed documents are embedded",
+    )
     max_concurrent_clusters: int = Field(
         default=3,
         gt=0,
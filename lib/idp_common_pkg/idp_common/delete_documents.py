@@ -8,11 +8,23 @@ This module provides robust document deletion functions that handle:
 - S3 input/output file deletion
 - DynamoDB tracking record deletion
 - List entry cleanup with timestamp-aware shard handling
+- Bulk deletion of many documents with batched, concurrent requests
+  (``bulk_delete_documents``)
 """
 
 import fnmatch
+import itertools
 import logging
-from typing import Any, Dict, List, Optional, Tuple
+import random
+import time
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 from boto3.dynamodb.conditions import Key
 
@@ -524,6 +536,591 @@ def delete_documents(
     }
 
 
+# Service maxima for the batched bulk deletion APIs.
+S3_DELETE_BATCH_SIZE = 1000  # DeleteObjects keys per request
+DYNAMODB_WRITE_BATCH_SIZE = 25  # BatchWriteItem requests per call
+DYNAMODB_GET_BATCH_SIZE = 100  # BatchGetItem keys per call
+BATCH_MAX_ATTEMPTS = 8  # attempts per batch while items come back unprocessed
+
+DEFAULT_BULK_WORKERS = 8
+DEFAULT_BULK_CHUNK_SIZE = 100
+
+# List prices (us-east-1, on-demand) used by the dry-run cost preview. S3
+# DELETE requests are free; reads and writes are estimated at one request unit
+# per item, which holds for tracking items (well under 1 KB).
+DYNAMODB_WRITE_REQUEST_UNIT_USD = 0.625 / 1_000_000
+DYNAMODB_READ_REQUEST_UNIT_USD = 0.125 / 1_000_000
+S3_LIST_REQUEST_USD = 0.005 / 1000
+
+_REQUEST_TYPES = (
+    "BatchGetItem",
+    "BatchWriteItem",
+    "Query",
+    "ListObjectVersions",
+    "DeleteObjects",
+)
+
+
+def _batch_backoff(attempt: int) -> None:
+    time.sleep(min(0.05 * 2**attempt, 1.0) * (0.5 + random.random() / 2))  # nosec B311
+
+
+def _batch_get_keys(
+    table_client,
+    table_name: str,
+    keys: List[Tuple[str, str]],
+    requests: Dict[str, int],
+) -> Tuple[Dict[Tuple[str, str], Dict[str, Any]], Dict[Tuple[str, str], str]]:
+    """
+    Read (PK, SK) keys with BatchGetItem, retrying UnprocessedKeys.
+
+    Returns:
+        tuple: (items found by key, {key: error} for keys that could not be read)
+    """
+    found: Dict[Tuple[str, str], Dict[str, Any]] = {}
+    errors: Dict[Tuple[str, str], str] = {}
+    for start in range(0, len(keys), DYNAMODB_GET_BATCH_SIZE):
+        batch = keys[start : start + DYNAMODB_GET_BATCH_SIZE]
+        request: Dict[str, Any] = {
+            table_name: {
+                "Keys": [{"PK": pk, "SK": sk} for pk, sk in batch],
+                "ConsistentRead": True,
+            }
+        }
+        try:
+            for attempt in range(BATCH_MAX_ATTEMPTS):
+                requests["BatchGetItem"] += 1
+                response = table_client.batch_get_item(RequestItems=request)
+                for item in response.get("Responses", {}).get(table_name, []):
+                    found[(item["PK"], item["SK"])] = item
+                request = response.get("UnprocessedKeys") or {}
+                if not request:
+                    break
+                _batch_backoff(attempt)
+            for key in request.get(table_name, {}).get("Keys", []):
+                errors[(key["PK"], key["SK"])] = "throttled (unprocessed key)"
+        except Exception as e:
+            for key in batch:
+                errors.setdefault(key, str(e))
+    return found, errors
+
+
+def _batch_delete_keys(
+    table_client,
+    table_name: str,
+    keys: List[Tuple[str, str]],
+    requests: Dict[str, int],
+) -> Dict[Tuple[str, str], str]:
+    """
+    Delete (PK, SK) keys with BatchWriteItem, retrying UnprocessedItems.
+
+    Returns:
+        Dict: {key: error} for keys that were not deleted
+    """
+    errors: Dict[Tuple[str, str], str] = {}
+    for start in range(0, len(keys), DYNAMODB_WRITE_BATCH_SIZE):
+        batch = keys[start : start + DYNAMODB_WRITE_BATCH_SIZE]
+        request: Dict[str, Any] = {
+            table_name: [
+                {"DeleteRequest": {"Key": {"PK": pk, "SK": sk}}} for pk, sk in batch
+            ]
+        }
+        try:
+            for attempt in range(BATCH_MAX_ATTEMPTS):
+                requests["BatchWriteItem"] += 1
+                response = table_client.batch_write_item(RequestItems=request)
+                request = response.get("UnprocessedItems") or {}
+                if not request:
+                    break
+                _batch_backoff(attempt)
+            for entry in request.get(table_name, []):
+                key = entry["DeleteRequest"]["Key"]
+                errors[(key["PK"], key["SK"])] = "throttled (unprocessed item)"
+        except Exception as e:
+            for key in batch:
+                errors.setdefault(key, str(e))
+    return errors
+
+
+def _delete_s3_objects(
+    s3_client, bucket: str, objects: List[Dict[str, str]], requests: Dict[str, int]
+) -> Dict[str, str]:
+    """
+    Delete objects (``{"Key", "VersionId"?}``) with DeleteObjects.
+
+    Returns:
+        Dict: {key: error} for objects that were not deleted
+    """
+    errors: Dict[str, str] = {}
+    for start in range(0, len(objects), S3_DELETE_BATCH_SIZE):
+        batch = objects[start : start + S3_DELETE_BATCH_SIZE]
+        try:
+            requests["DeleteObjects"] += 1
+            response = s3_client.delete_objects(
+                Bucket=bucket, Delete={"Objects": batch, "Quiet": True}
+            )
+            for error in response.get("Errors", []):
+                errors[error["Key"]] = f"{error.get('Code')}: {error.get('Message')}"
+        except Exception as e:
+            for obj in batch:
+                errors.setdefault(obj["Key"], str(e))
+    return errors
+
+
+def _query_keys(
+    table_client, table_name: str, requests: Dict[str, int], **query_kwargs
+) -> List[Dict[str, Any]]:
+    """All PK/SK (and ObjectKey) projections of a paginated query."""
+    items: List[Dict[str, Any]] = []
+    while True:
+        requests["Query"] += 1
+        response = table_client.query(TableName=table_name, **query_kwargs)
+        items.extend(response.get("Items", []))
+        if "LastEvaluatedKey" not in response:
+            return items
+        query_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+
+def _find_shard_list_entries(
+    table_client,
+    table_name: str,
+    list_pks: List[str],
+    object_keys: set,
+    requests: Dict[str, int],
+) -> Dict[str, List[Tuple[str, str]]]:
+    """
+    Find list entries of several documents with one query per shard
+    (``_query_shard_for_object_key`` does one query per document and shard).
+    """
+    matches: Dict[str, List[Tuple[str, str]]] = {}
+    for list_pk in list_pks:
+        try:
+            items = _query_keys(
+                table_client,
+                table_name,
+                requests,
+                KeyConditionExpression=Key("PK").eq(list_pk),
+                ProjectionExpression="PK, SK, ObjectKey",
+            )
+        except Exception as e:
+            logger.error(f"Error querying shard {list_pk}: {str(e)}")
+            continue
+        for item in items:
+            sk = item["SK"]
+            for key in {item.get("ObjectKey"), sk.partition("#id#")[2]}:
+                if key in object_keys:
+                    matches.setdefault(key, []).append((item["PK"], sk))
+    return matches
+
+
+def _bulk_delete_chunk(
+    object_keys: List[str],
+    table_client,
+    table_name: str,
+    s3_client,
+    input_bucket: str,
+    output_bucket: str,
+    dry_run: bool,
+) -> Tuple[List[Dict[str, Any]], Dict[str, int], Dict[str, int]]:
+    """
+    Delete one chunk of documents with batched requests.
+
+    Mirrors ``delete_single_document`` step for step, but every step covers
+    the whole chunk: batched reads, one query per list shard, pooled
+    DeleteObjects for input and output objects and BatchWriteItem for the
+    tracking items, with the document records deleted last.
+
+    Returns:
+        tuple: (per-document results, API request counts, items to delete)
+    """
+    requests = dict.fromkeys(_REQUEST_TYPES, 0)
+    planned = {
+        "input_objects": 0,
+        "output_object_versions": 0,
+        "list_entries": 0,
+        "run_records": 0,
+        "document_records": 0,
+        "delete_objects_requests": 0,
+        "batch_write_requests": 0,
+    }
+    results = {
+        key: {
+            "success": True,
+            "object_key": key,
+            "deleted": {
+                "input_file": False,
+                "output_files": 0,
+                "list_entries": False,
+                "document_record": False,
+                "run_records": 0,
+            },
+            "errors": [],
+        }
+        for key in dict.fromkeys(object_keys)
+    }
+
+    # Document metadata
+    doc_keys = {key: (f"doc#{key}", "none") for key in results}
+    found, read_errors = _batch_get_keys(
+        table_client, table_name, list(doc_keys.values()), requests
+    )
+    metadata: Dict[str, Dict[str, Any]] = {}
+    for key, doc_key in doc_keys.items():
+        if doc_key in found:
+            metadata[key] = found[doc_key]
+        elif doc_key in read_errors:
+            results[key]["errors"].append(
+                f"Error getting document metadata: {read_errors[doc_key]}"
+            )
+        else:
+            logger.warning(f"Document metadata not found for {key}")
+
+    # List entries: exact timestamp match, then the calculated shard, then the
+    # adjacent shards (as delete_list_entries_robust)
+    list_items: Dict[str, List[Tuple[str, str]]] = {}
+    shards: Dict[str, Tuple[str, str]] = {}
+    exact: Dict[str, Tuple[str, str]] = {}
+    for key, item in metadata.items():
+        event_time = item.get("QueuedTime") or item.get("InitialEventTime")
+        if not event_time:
+            continue
+        try:
+            shards[key] = calculate_shard(event_time)
+        except ValueError as e:
+            logger.error(f"Error in exact timestamp deletion: {str(e)}")
+            continue
+        date_part, shard_str = shards[key]
+        exact[key] = (f"list#{date_part}#s#{shard_str}", f"ts#{event_time}#id#{key}")
+    found, _ = _batch_get_keys(table_client, table_name, list(exact.values()), requests)
+    for key, list_key in exact.items():
+        if list_key in found:
+            list_items[key] = [list_key]
+    for adjacent in (False, True):
+        missing = {key for key in shards if key not in list_items}
+        if not missing:
+            break
+        list_pks: Dict[str, None] = {}
+        for key in missing:
+            date_part, shard_str = shards[key]
+            if adjacent:
+                list_pks.update(
+                    dict.fromkeys(_get_adjacent_shards(date_part, shard_str))
+                )
+            else:
+                list_pks[f"list#{date_part}#s#{shard_str}"] = None
+        list_items.update(
+            _find_shard_list_entries(
+                table_client, table_name, list(list_pks), missing, requests
+            )
+        )
+
+    # Document version (run) records
+    run_items: Dict[str, List[Tuple[str, str]]] = {}
+    for key in results:
+        try:
+            items = _query_keys(
+                table_client,
+                table_name,
+                requests,
+                KeyConditionExpression=Key("PK").eq(f"doc#{key}")
+                & Key("SK").begins_with("run#"),
+                ProjectionExpression="PK, SK",
+            )
+            run_items[key] = [(item["PK"], item["SK"]) for item in items]
+        except Exception as e:
+            results[key]["errors"].append(f"Error deleting run records: {str(e)}")
+
+    # Output object versions (and delete markers) under each document prefix
+    output_objects: List[Dict[str, str]] = []
+    output_owner: Dict[str, str] = {}
+    output_counts: Dict[str, int] = dict.fromkeys(results, 0)
+    paginator = s3_client.get_paginator("list_object_versions")
+    for key in results:
+        try:
+            for page in paginator.paginate(Bucket=output_bucket, Prefix=key):
+                requests["ListObjectVersions"] += 1
+                entries = page.get("Versions", []) + page.get("DeleteMarkers", [])
+                for entry in entries:
+                    if entry.get("VersionId"):
+                        output_objects.append(
+                            {"Key": entry["Key"], "VersionId": entry["VersionId"]}
+                        )
+                        output_owner[entry["Key"]] = key
+                        output_counts[key] += 1
+        except Exception as e:
+            output_counts[key] = 0
+            results[key]["errors"].append(
+                f"Error deleting from output bucket: {str(e)}"
+            )
+
+    planned["input_objects"] = len(results)
+    planned["output_object_versions"] = len(output_objects)
+    planned["list_entries"] = sum(len(items) for items in list_items.values())
+    planned["run_records"] = sum(len(items) for items in run_items.values())
+    planned["document_records"] = len(metadata)
+    planned["delete_objects_requests"] = -(
+        -planned["input_objects"] // S3_DELETE_BATCH_SIZE
+    ) + -(-planned["output_object_versions"] // S3_DELETE_BATCH_SIZE)
+    planned["batch_write_requests"] = -(
+        -(planned["list_entries"] + planned["run_records"]) // DYNAMODB_WRITE_BATCH_SIZE
+    ) + -(-planned["document_records"] // DYNAMODB_WRITE_BATCH_SIZE)
+
+    if dry_run:
+        for result in results.values():
+            result["success"] = not result["errors"]
+        return list(results.values()), requests, planned
+
+    # Input objects
+    input_errors = _delete_s3_objects(
+        s3_client, input_bucket, [{"Key": key} for key in results], requests
+    )
+    for key, result in results.items():
+        if key in input_errors:
+            result["errors"].append(
+                f"Error deleting from input bucket: {input_errors[key]}"
+            )
+        else:
+            result["deleted"]["input_file"] = True
+
+    # Output object versions
+    output_errors = _delete_s3_objects(
+        s3_client, output_bucket, output_objects, requests
+    )
+    failed_outputs: Dict[str, List[str]] = {}
+    for obj in output_objects:
+        if obj["Key"] in output_errors:
+            failed_outputs.setdefault(output_owner[obj["Key"]], []).append(obj["Key"])
+    for key, result in results.items():
+        result["deleted"]["output_files"] = output_counts[key] - len(
+            failed_outputs.get(key, [])
+        )
+        if key in failed_outputs:
+            first = failed_outputs[key][0]
+            result["errors"].append(
+                f"Error deleting from output bucket: {len(failed_outputs[key])} "
+                f"object versions not deleted ({first}: {output_errors[first]})"
+            )
+
+    # List entries and run records, then the document records
+    owner: Dict[Tuple[str, str], str] = {}
+    for key, items in list_items.items():
+        owner.update(dict.fromkeys(items, key))
+    for key, items in run_items.items():
+        owner.update(dict.fromkeys(items, key))
+    item_errors = _batch_delete_keys(table_client, table_name, list(owner), requests)
+    for item_key, key in owner.items():
+        result = results[key]
+        if item_key in item_errors:
+            label = "run records" if item_key[1].startswith("run#") else "list entry"
+            result["errors"].append(
+                f"Error deleting {label} {item_key[1]}: {item_errors[item_key]}"
+            )
+        elif item_key[1].startswith("run#"):
+            result["deleted"]["run_records"] += 1
+        else:
+            result["deleted"]["list_entries"] = True
+
+    doc_errors = _batch_delete_keys(
+        table_client, table_name, [doc_keys[key] for key in metadata], requests
+    )
+    for key in metadata:
+        if doc_keys[key] in doc_errors:
+            results[key]["errors"].append(
+                f"Error deleting document record: {doc_errors[doc_keys[key]]}"
+            )
+        else:
+            results[key]["deleted"]["document_record"] = True
+
+    for result in results.values():
+        result["success"] = not result["errors"]
+    return list(results.values()), requests, planned
+
+
+def estimate_deletion_cost(
+    planned: Dict[str, int], requests: Dict[str, int]
+) -> Dict[str, Any]:
+    """
+    Estimate the requests and cost of deleting the ``planned`` items in bulk
+    and one request per item (``delete_documents``).
+
+    Args:
+        planned: Item counts from a dry run (documents, input_objects,
+            output_object_versions, list_entries, run_records, document_records)
+            and the DeleteObjects and BatchWriteItem requests they take
+            (delete_objects_requests, batch_write_requests)
+        requests: Read requests the dry run made (BatchGetItem, Query,
+            ListObjectVersions)
+
+    Returns:
+        Dict with the planned counts, request counts for both approaches and
+        the estimated cost in USD
+    """
+    ddb_items = (
+        planned["list_entries"] + planned["run_records"] + planned["document_records"]
+    )
+    bulk_requests = {
+        **{name: requests.get(name, 0) for name in _REQUEST_TYPES},
+        "DeleteObjects": planned["delete_objects_requests"],
+        "BatchWriteItem": planned["batch_write_requests"],
+    }
+    # Per document: GetItem, DeleteObject, the exact list entry DeleteItem and
+    # the run record Query, a DeleteObjects per ListObjectVersions page, and a
+    # DeleteItem per run record and document record.
+    per_document_requests = (
+        planned["documents"] * 4
+        + requests.get("ListObjectVersions", 0) * 2
+        + planned["run_records"]
+        + planned["document_records"]
+    )
+    # Consistent BatchGetItem reads of the document records and exact list
+    # entries, and a read unit per query page.
+    read_units = (
+        planned["documents"] + planned["document_records"] + requests.get("Query", 0)
+    )
+    estimated_cost = (
+        ddb_items * DYNAMODB_WRITE_REQUEST_UNIT_USD
+        + read_units * DYNAMODB_READ_REQUEST_UNIT_USD
+        + requests.get("ListObjectVersions", 0) * S3_LIST_REQUEST_USD
+    )
+    return {
+        **planned,
+        "dynamodb_items": ddb_items,
+        "bulk_requests": bulk_requests,
+        "bulk_request_count": sum(bulk_requests.values()),
+        "per_document_request_count": per_document_requests,
+        "estimated_cost_usd": round(estimated_cost, 6),
+    }
+
+
+def bulk_delete_documents(
+    object_keys: Iterable[str],
+    tracking_table,
+    s3_client,
+    input_bucket: str,
+    output_bucket: str,
+    dry_run: bool = False,
+    workers: int = DEFAULT_BULK_WORKERS,
+    chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+) -> Dict[str, Any]:
+    """
+    Delete many documents with batched, concurrent requests.
+
+    Deletes the same data as ``delete_documents`` but streams ``object_keys``
+    in chunks of ``chunk_size`` and deletes up to ``workers`` chunks at once.
+    Each chunk reads its tracking items with BatchGetItem, finds list entries
+    with one query per shard, deletes S3 objects 1000 keys per DeleteObjects
+    call and tracking items 25 per BatchWriteItem call (retrying unprocessed
+    items with backoff), and deletes document records last so a failed run
+    can be repeated. Errors never stop other documents (continue_on_error).
+
+    Args:
+        object_keys: Document object keys (any iterable, consumed lazily)
+        tracking_table: DynamoDB table resource
+        s3_client: boto3 S3 client
+        input_bucket: Input S3 bucket name
+        output_bucket: Output S3 bucket name
+        dry_run: If True, delete nothing and return a cost preview
+        workers: Chunks deleted concurrently
+        chunk_size: Documents per chunk
+        progress_callback: Called with (processed_count, deleted_count) after
+            each chunk
+
+    Returns:
+        Dict with the ``delete_documents`` fields plus:
+        - elapsed_seconds: float
+        - documents_per_second: float (documents processed per second)
+        - requests: Dict with API request counts
+        - preview: Dict from ``estimate_deletion_cost`` (dry run only)
+    """
+    table_client = tracking_table.meta.client
+    table_name = tracking_table.name
+    workers = max(1, workers)
+    keys = iter(object_keys)
+    chunks = iter(lambda: list(itertools.islice(keys, max(1, chunk_size))), [])
+
+    results: List[Dict[str, Any]] = []
+    requests = dict.fromkeys(_REQUEST_TYPES, 0)
+    planned = {
+        "documents": 0,
+        "input_objects": 0,
+        "output_object_versions": 0,
+        "list_entries": 0,
+        "run_records": 0,
+        "document_records": 0,
+        "delete_objects_requests": 0,
+        "batch_write_requests": 0,
+    }
+    deleted_count = 0
+    start = time.monotonic()
+
+    def collect(future: Future, chunk: List[str]) -> None:
+        nonlocal deleted_count
+        try:
+            chunk_results, chunk_requests, chunk_planned = future.result()
+        except Exception as e:
+            logger.error(f"Error deleting {len(chunk)} documents: {str(e)}")
+            chunk_results = [
+                {"success": False, "object_key": key, "errors": [str(e)]}
+                for key in chunk
+            ]
+            chunk_requests, chunk_planned = {}, {}
+        results.extend(chunk_results)
+        deleted_count += sum(1 for r in chunk_results if r["success"])
+        for name, count in chunk_requests.items():
+            requests[name] += count
+        for name, count in chunk_planned.items():
+            planned[name] += count
+        planned["documents"] += len(chunk_results)
+        if progress_callback:
+            progress_callback(len(results), deleted_count)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        in_flight: Dict[Future, List[str]] = {}
+        for chunk in chunks:
+            future = executor.submit(
+                _bulk_delete_chunk,
+                chunk,
+                table_client,
+                table_name,
+                s3_client,
+                input_bucket,
+                output_bucket,
+                dry_run,
+            )
+            in_flight[future] = chunk
+            # Bound the keys held in memory while the input is still streaming
+            if len(in_flight) >= workers * 2:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    collect(future, in_flight.pop(future))
+        for future in as_completed(list(in_flight)):
+            collect(future, in_flight.pop(future))
+
+    elapsed = time.monotonic() - start
+    total_count = len(results)
+    failed_count = total_count - deleted_count
+    logger.info(
+        f"{'[DRY RUN] ' if dry_run else ''}Bulk deleted {deleted_count}/"
+        f"{total_count} documents in {elapsed:.1f}s "
+        f"({total_count / elapsed if elapsed else 0:.1f} documents/s)"
+    )
+    response = {
+        "success": failed_count == 0,
+        "deleted_count": deleted_count,
+        "failed_count": failed_count,
+        "total_count": total_count,
+        "results": results,
+        "dry_run": dry_run,
+        "elapsed_seconds": elapsed,
+        "documents_per_second": total_count / elapsed if elapsed > 0 else 0.0,
+        "requests": requests,
+    }
+    if dry_run:
+        response["preview"] = estimate_deletion_cost(planned, requests)
+    return response
+
+
 def _scan_all_document_keys(
     tracking_table, status_filter: Optional[str] = None
 ) -> List[Dict[str, Any]]:
@@ -10,13 +10,26 @@ embedding similarity, and representative samples are selected for each cluster.
 """
 
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# k-selection strategies for ClusteringService
+K_SELECTION_EXACT = "exact"
+K_SELECTION_SCALABLE = "scalable"
+K_SELECTION_AUTO = "auto"
+K_SELECTION_MODES = (K_SELECTION_EXACT, K_SELECTION_SCALABLE, K_SELECTION_AUTO)
+
+# "auto" switches to the scalable strategy above this many documents
+SCALABLE_K_SELECTION_THRESHOLD = 5000
+DEFAULT_SILHOUETTE_SAMPLE_SIZE = 2000
+MINIBATCH_SIZE = 1024
+
 
 @dataclass
 class ClusterResult:
@@ -66,6 +79,17 @@ class ClusteringService:
     efficient nearest-neighbor search. Automatically determines the optimal
     number of clusters using the elbow method / silhouette analysis.
 
+    Two k-selection strategies are available:
+
+    - ``exact``: full ``KMeans(n_init=10)`` and a full O(n^2) silhouette score
+      for every candidate k. Best quality; practical up to a few thousand docs.
+    - ``scalable``: ``MiniBatchKMeans`` per candidate k, silhouette scored on a
+      stratified sample, candidates evaluated in parallel threads, and the
+      final clustering warm-started from the winning candidate's centers.
+
+    ``auto`` (default) uses ``exact`` up to 5,000 documents and ``scalable``
+    above that.
+
     Example:
         >>> service = ClusteringService(min_cluster_size=2)
         >>> result = service.cluster(embeddings)
@@ -78,6 +102,9 @@ class ClusteringService:
         max_clusters: Optional[int] = None,
         num_sample_documents: int = 3,
         random_state: int = 42,
+        k_selection: str = K_SELECTION_AUTO,
+        silhouette_sample_size: int = DEFAULT_SILHOUETTE_SAMPLE_SIZE,
+        max_workers: Optional[int] = None,
     ):
         """
         Initialize the clustering service.
@@ -87,13 +114,30 @@ class ClusteringService:
             max_clusters: Maximum number of clusters (default: auto-detect)
             num_sample_documents: Default number of documents to sample per cluster
             random_state: Random seed for reproducibility
+            k_selection: "exact", "scalable" or "auto" (see class docstring)
+            silhouette_sample_size: Documents scored per candidate k in scalable mode
+            max_workers: Threads evaluating candidate k values in scalable
+                mode (default: available CPUs)
+
+        Raises:
+            ValueError: If k_selection is not a supported mode
         """
+        if k_selection not in K_SELECTION_MODES:
+            raise ValueError(
+                f"Unsupported k_selection '{k_selection}'. "
+                f"Expected one of: {', '.join(K_SELECTION_MODES)}"
+            )
         self.min_cluster_size = min_cluster_size
         self.max_clusters = max_clusters
         self.num_sample_documents = num_sample_documents
         self.random_state = random_state
+        self.k_selection = k_selection
+        self.silhouette_sample_size = silhouette_sample_size
+        self.max_workers = max_workers
 
-    def cluster(self, embeddings: np.ndarray) -> ClusterResult:
+    def cluster(
+        self, embeddings: np.ndarray, k_selection: Optional[str] = None
+    ) -> ClusterResult:
         """
         Cluster documents based on their embedding vectors.
 
@@ -102,13 +146,22 @@ class ClusteringService:
 
         Args:
             embeddings: 2D numpy array of shape (n_documents, embedding_dim)
+            k_selection: Override the service's k-selection strategy for this
+                call ("exact", "scalable" or "auto")
 
         Returns:
             ClusterResult with cluster assignments and metadata
 
         Raises:
-            ValueError: If embeddings is empty or has wrong dimensions
+            ValueError: If embeddings is empty or has wrong dimensions, or
+                k_selection is not a supported mode
         """
+        if k_selection is not None and k_selection not in K_SELECTION_MODES:
+            raise ValueError(
+                f"Unsupported k_selection '{k_selection}'. "
+                f"Expected one of: {', '.join(K_SELECTION_MODES)}"
+            )
+
         if embeddings.size == 0:
             raise ValueError("Cannot cluster empty embeddings")
 
@@ -125,12 +178,17 @@ class ClusteringService:
                 labels=np.array([0]),
             )
 
-        # Determine optimal number of clusters
-        k = self._determine_optimal_k(embeddings)
-        logger.info(f"Optimal number of clusters: {k}")
+        if self._use_scalable_k_selection(n_docs, k_selection or self.k_selection):
+            k, init_centers = self._determine_optimal_k_scalable(embeddings)
+            logger.info(f"Optimal number of clusters: {k}")
+            labels = self._minibatch_kmeans(embeddings, k, init_centers)
+        else:
+            # Determine optimal number of clusters
+            k = self._determine_optimal_k(embeddings)
+            logger.info(f"Optimal number of clusters: {k}")
 
-        # Run KMeans clustering
-        labels = self._kmeans(embeddings, k)
+            # Run KMeans clustering
+            labels = self._kmeans(embeddings, k)
 
         # Filter out small clusters as noise
         labels = self._filter_small_clusters(labels)
@@ -169,33 +227,31 @@ class ClusteringService:
         # Find the document closest to centroid
         cluster_embeddings = embeddings[indices]
         distances_to_centroid = np.linalg.norm(cluster_embeddings - centroid, axis=1)
-        sorted_by_distance = np.argsort(distances_to_centroid)
-
-        # Start with closest to centroid
-        selected = [indices[sorted_by_distance[0]]]
-
-        # Add diverse documents using max-min distance
-        remaining = set(range(len(indices))) - {sorted_by_distance[0]}
-
-        while len(selected) < num_samples and remaining:
-            max_min_dist = -1
-            best_idx = None
-
-            for r_idx in remaining:
-                # Min distance from this candidate to all selected
-                min_dist = min(
-                    np.linalg.norm(cluster_embeddings[r_idx] - embeddings[s_idx])
-                    for s_idx in selected
-                )
-                if min_dist > max_min_dist:
-                    max_min_dist = min_dist
-                    best_idx = r_idx
-
-            if best_idx is not None:
-                selected.append(indices[best_idx])
-                remaining.remove(best_idx)
+        first = int(np.argsort(distances_to_centroid)[0])
+
+        # Add diverse documents using max-min distance (farthest-point sampling).
+        # min_dist[i] is the distance from candidate i to its nearest selected
+        # document; each round picks the candidate that maximizes it, then folds
+        # the new selection in with a single vectorized distance computation.
+        # Already-selected documents are masked with -inf; ties resolve to the
+        # lowest index, as in a scan over the candidates in index order.
+        selected_positions = [first]
+        min_dist = np.linalg.norm(
+            cluster_embeddings - cluster_embeddings[first], axis=1
+        )
+        min_dist[first] = -np.inf
+
+        while len(selected_positions) < num_samples:
+            best = int(np.argmax(min_dist))
+            selected_positions.append(best)
+            np.minimum(
+                min_dist,
+                np.linalg.norm(cluster_embeddings - cluster_embeddings[best], axis=1),
+                out=min_dist,
+            )
+            min_dist[selected_positions] = -np.inf
 
-        return selected
+        return [indices[pos] for pos in selected_positions]
 
     def get_docs_by_distance_to_centroid(
         self,
@@ -218,17 +274,13 @@ class ClusteringService:
         centroid = cluster_result.centroids[cluster_id]
         embeddings = cluster_result.embeddings
 
-        docs_with_distance = []
-        for idx in indices:
-            distance = float(np.linalg.norm(embeddings[idx] - centroid))
-            docs_with_distance.append({"doc_id": idx, "distance": distance})
-
-        docs_with_distance.sort(key=lambda x: x["distance"])
+        distances = np.linalg.norm(embeddings[indices] - centroid, axis=1)
+        order = np.argsort(distances, kind="stable")
 
         if max_docs is not None:
-            docs_with_distance = docs_with_distance[:max_docs]
+            order = order[:max_docs]
 
-        return docs_with_distance
+        return [{"doc_id": indices[i], "distance": float(distances[i])} for i in order]
 
     def _determine_optimal_k(self, embeddings: np.ndarray) -> int:
         """
@@ -246,12 +298,7 @@ class ClusteringService:
         n_docs = embeddings.shape[0]
 
         # Bounds for k
-        min_k = 2
-        max_k = min(
-            self.max_clusters or (n_docs // self.min_cluster_size),
-            n_docs - 1,
-            20,  # Cap at 20 to keep computation reasonable
-        )
+        min_k, max_k = self._k_bounds(n_docs)
 
         if max_k < min_k:
             return 1 if n_docs == 1 else min_k
@@ -282,6 +329,141 @@ class ClusteringService:
         logger.info(f"Selected k={best_k} with silhouette score={best_score:.4f}")
         return best_k
 
+    @staticmethod
+    def _use_scalable_k_selection(n_docs: int, k_selection: str) -> bool:
+        if k_selection == K_SELECTION_AUTO:
+            return n_docs > SCALABLE_K_SELECTION_THRESHOLD
+        return k_selection == K_SELECTION_SCALABLE
+
+    def _k_bounds(self, n_docs: int) -> Tuple[int, int]:
+        """Candidate k range shared by both k-selection strategies."""
+        min_k = 2
+        max_k = min(
+            self.max_clusters or (n_docs // self.min_cluster_size),
+            n_docs - 1,
+            20,  # Cap at 20 to keep computation reasonable
+        )
+        return min_k, max_k
+
+    def _determine_optimal_k_scalable(
+        self, embeddings: np.ndarray
+    ) -> Tuple[int, Optional[np.ndarray]]:
+        """
+        Determine the optimal number of clusters for large corpora.
+
+        Fits MiniBatchKMeans for each candidate k in parallel threads (the
+        scikit-learn kernels release the GIL) and scores each labeling with a
+        silhouette computed on a stratified sample, so memory and time stay
+        linear in the number of documents.
+
+        Args:
+            embeddings: 2D embedding matrix
+
+        Returns:
+            Tuple of (optimal k, cluster centers of the winning candidate to
+            warm-start the final clustering; None for a single cluster)
+        """
+        from sklearn.cluster import MiniBatchKMeans
+        from sklearn.metrics import silhouette_score
+
+        n_docs = embeddings.shape[0]
+        min_k, max_k = self._k_bounds(n_docs)
+        if max_k < min_k:
+            return (1 if n_docs == 1 else min_k), None
+
+        def evaluate(k: int) -> Tuple[int, float, Optional[np.ndarray]]:
+            try:
+                kmeans = MiniBatchKMeans(
+                    n_clusters=k,
+                    random_state=self.random_state,
+                    batch_size=MINIBATCH_SIZE,
+                    n_init=3,
+                )
+                labels = kmeans.fit_predict(embeddings)
+                sample = self._stratified_sample(labels)
+                score = float(silhouette_score(embeddings[sample], labels[sample]))
+                logger.debug(f"k={k}: sampled silhouette_score={score:.4f}")
+                return k, score, kmeans.cluster_centers_
+            except Exception as e:
+                logger.debug(f"k={k}: failed - {e}")
+                return k, -1.0, None
+
+        candidates = range(min_k, max_k + 1)
+        workers = min(self.max_workers or os.cpu_count() or 1, len(candidates))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(evaluate, candidates))
+
+        # Ties resolve to the smallest k, as in the exact strategy
+        best_k, best_score, best_centers = min_k, -1.0, None
+        for k, score, centers in results:
+            if score > best_score:
+                best_k, best_score, best_centers = k, score, centers
+
+        logger.info(
+            f"Selected k={best_k} with sampled silhouette score={best_score:.4f} "
+            f"({len(results)} candidates on {workers} threads)"
+        )
+        return best_k, best_centers
+
+    def _stratified_sample(self, labels: np.ndarray) -> np.ndarray:
+        """
+        Indices of a label-stratified sample for silhouette scoring.
+
+        Each cluster contributes in proportion to its size, and at least two
+        documents when it has them, so small clusters stay represented.
+        """
+        n_docs = labels.shape[0]
+        if n_docs <= self.silhouette_sample_size:
+            return np.arange(n_docs)
+
+        rng = np.random.RandomState(self.random_state)
+        fraction = self.silhouette_sample_size / n_docs
+        sample = []
+        for label in np.unique(labels):
+            members = np.flatnonzero(labels == label)
+            take = min(len(members), max(2, int(round(len(members) * fraction))))
+            sample.append(rng.choice(members, size=take, replace=False))
+        return np.sort(np.concatenate(sample))
+
+    def _minibatch_kmeans(
+        self,
+        embeddings: np.ndarray,
+        k: int,
+        init_centers: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """
+        Run MiniBatchKMeans clustering, warm-started from init_centers if given.
+
+        Args:
+            embeddings: 2D embedding matrix
+            k: Number of clusters
+            init_centers: Optional (k, dim) initial cluster centers
+
+        Returns:
+            Array of cluster labels
+        """
+        from sklearn.cluster import MiniBatchKMeans
+
+        if init_centers is not None and init_centers.shape[0] == k:
+            kmeans = MiniBatchKMeans(
+                n_clusters=k,
+                init=init_centers,
+                n_init=1,
+                random_state=self.random_state,
+                batch_size=MINIBATCH_SIZE,
+            )
+        else:
+            kmeans = MiniBatchKMeans(
+                n_clusters=k,
+                random_state=self.random_state,
+                batch_size=MINIBATCH_SIZE,
+                n_init=3,
+            )
+        labels = kmeans.fit_predict(embeddings)
+
+        logger.info(f"MiniBatchKMeans clustering complete: {k} clusters assigned")
+        return labels
+
     def _kmeans(self, embeddings: np.ndarray, k: int) -> np.ndarray:
         """
         Run KMeans clustering.
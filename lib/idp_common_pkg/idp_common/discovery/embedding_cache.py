@@ -0,0 +1,287 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Persistent embedding cache for multi-document discovery.
+
+Re-running discovery on a growing bucket used to re-download, re-render and
+re-embed every document. ``EmbeddingCache`` stores each document's embedding
+keyed by a content identity (S3 ETag and size, or a SHA-256 of local file
+bytes), so only new or changed documents are sent to Bedrock.
+
+Embeddings are only comparable when they come from the same model, input type
+and image preprocessing, so each combination of those has its own directory
+``<location>/embeddings-<digest>/``. ``location`` is an ``s3://`` prefix or a
+local directory. Entries are spread over shard files (``00.npz`` ...) by a
+hash of the content identity, each holding a ``content_ids`` string array and
+a float32 ``vectors`` matrix, so a save rewrites only the shards it added to.
+
+Concurrent discovery runs sharing a location merge rather than overwrite each
+other: a shard is written only if it is still the version that was read (S3
+``If-Match`` / ``If-None-Match``), otherwise it is re-read, merged and written
+again. Local directories compare the file's modification time and size
+instead, which narrows but does not close the race.
+"""
+
+import hashlib
+import io
+import json
+import logging
+import math
+import os
+import tempfile
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from botocore.exceptions import ClientError
+
+from ..s3 import get_s3_client
+from ..utils import parse_s3_uri
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on stored embeddings; entries not used by the current run are
+# dropped first when a save would exceed it.
+DEFAULT_MAX_ENTRIES = 50000
+
+# Shard files per namespace
+DEFAULT_SHARDS = 16
+
+# Writes of one shard before a save gives up on it when concurrent runs keep
+# updating the same shard; its new entries are then recomputed next run.
+MAX_SAVE_ATTEMPTS = 5
+
+
+class ShardChangedError(Exception):
+    """A shard file was replaced since this cache read it."""
+
+
+class EmbeddingCache:
+    """Content-keyed store of document embeddings, persisted as sharded .npz files."""
+
+    def __init__(
+        self,
+        location: str,
+        namespace: Dict[str, Any],
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        shards: int = DEFAULT_SHARDS,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            location: ``s3://bucket/prefix`` or local directory for cache files
+            namespace: Everything that makes embeddings comparable (model ID,
+                input type, preprocessing parameters); each distinct
+                namespace is stored in its own directory
+            max_entries: Maximum number of embeddings kept on save
+            shards: Number of shard files the namespace is spread over
+        """
+        digest = hashlib.sha256(
+            json.dumps(namespace, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()[:16]
+        self.uri = f"{location.rstrip('/')}/embeddings-{digest}"
+        self.max_entries = max_entries
+        self.shards = max(1, shards)
+        self._vectors: Dict[int, Dict[str, np.ndarray]] = {}
+        self._versions: Dict[int, Optional[str]] = {}
+        self._added: Dict[int, Dict[str, np.ndarray]] = {}
+        self._used: set = set()
+
+    def shard_of(self, content_id: str) -> int:
+        """Shard holding ``content_id``."""
+        digest = hashlib.sha256(content_id.encode("utf-8")).hexdigest()
+        return int(digest[:8], 16) % self.shards
+
+    def shard_uri(self, shard: int) -> str:
+        """URI of one shard file."""
+        return f"{self.uri}/{shard:02d}.npz"
+
+    # --- lookups --------------------------------------------------------------
+
+    def get_many(self, content_ids: Iterable[str]) -> Dict[str, np.ndarray]:
+        """
+        Look up embeddings by content identity.
+
+        Only the shards of the requested identities are read.
+
+        Args:
+            content_ids: Content identities to look up
+
+        Returns:
+            Mapping of content identity -> embedding for the identities found
+        """
+        found = {}
+        for content_id in content_ids:
+            vector = self._load(self.shard_of(content_id)).get(content_id)
+            if vector is not None:
+                found[content_id] = vector
+                self._used.add(content_id)
+        return found
+
+    def put_many(self, embeddings: Dict[str, Sequence[float]]) -> None:
+        """Add or replace embeddings (call ``save`` to persist them)."""
+        for content_id, embedding in embeddings.items():
+            shard = self.shard_of(content_id)
+            vector = np.asarray(embedding, dtype=np.float32)
+            self._load(shard)[content_id] = vector
+            self._added.setdefault(shard, {})[content_id] = vector
+            self._used.add(content_id)
+
+    # --- persistence ----------------------------------------------------------
+
+    def save(self) -> bool:
+        """
+        Persist the shards that received new embeddings.
+
+        Returns:
+            True if every changed shard was written, False if there was
+            nothing to write or a shard could not be written
+        """
+        if not self._added:
+            return False
+        saved = [self._save_shard(shard) for shard in sorted(self._added)]
+        return all(saved)
+
+    def _save_shard(self, shard: int) -> bool:
+        uri = self.shard_uri(shard)
+        for _ in range(MAX_SAVE_ATTEMPTS):
+            content_ids = self._retained_ids(shard)
+            try:
+                version = self._write(
+                    uri, self._encode(shard, content_ids), self._versions.get(shard)
+                )
+            except ShardChangedError:
+                # Another run saved this shard since it was read: take its
+                # entries and lay this run's new ones over them
+                added = self._added[shard]
+                self._vectors.pop(shard, None)
+                self._load(shard).update(added)
+                continue
+            except Exception as e:
+                logger.warning(f"Failed to save embedding cache {uri}: {e}")
+                return False
+            self._versions[shard] = version
+            del self._added[shard]
+            logger.info(f"Saved {len(content_ids)} embeddings to {uri}")
+            return True
+        logger.warning(
+            f"Gave up saving embedding cache {uri} after {MAX_SAVE_ATTEMPTS} "
+            "concurrent updates"
+        )
+        return False
+
+    def _retained_ids(self, shard: int) -> List[str]:
+        """IDs to persist: this run's entries first, then older ones up to the cap."""
+        vectors = self._vectors[shard]
+        cap = max(1, math.ceil(self.max_entries / self.shards))
+        used = [c for c in vectors if c in self._used]
+        unused = [c for c in vectors if c not in self._used]
+        return (used + unused)[:cap]
+
+    def _encode(self, shard: int, content_ids: List[str]) -> bytes:
+        vectors = self._vectors[shard]
+        dims = {vectors[content_id].shape[0] for content_id in content_ids}
+        if len(dims) > 1:
+            # Same namespace should never yield mixed dimensions; keep this run's
+            logger.warning(f"Mixed embedding dimensions {dims} in {self.uri}")
+            content_ids = [c for c in content_ids if c in self._used]
+        buffer = io.BytesIO()
+        np.savez(
+            buffer,
+            content_ids=np.array(content_ids, dtype=str),
+            vectors=np.stack([vectors[c] for c in content_ids]),
+        )
+        return buffer.getvalue()
+
+    def _load(self, shard: int) -> Dict[str, np.ndarray]:
+        vectors = self._vectors.get(shard)
+        if vectors is not None:
+            return vectors
+
+        vectors = self._vectors[shard] = {}
+        uri = self.shard_uri(shard)
+        data, self._versions[shard] = self._read(uri)
+        if data is None:
+            logger.debug(f"No embedding cache at {uri}")
+            return vectors
+        try:
+            with np.load(io.BytesIO(data), allow_pickle=False) as npz:
+                for content_id, vector in zip(npz["content_ids"], npz["vectors"]):
+                    vectors[str(content_id)] = vector
+            logger.debug(f"Loaded {len(vectors)} embeddings from {uri}")
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable embedding cache {uri}: {e}")
+            vectors.clear()
+        return vectors
+
+    @staticmethod
+    def _local_version(path: str) -> str:
+        stat = os.stat(path)
+        return f"{stat.st_mtime_ns}-{stat.st_size}"
+
+    def _read(self, uri: str) -> Tuple[Optional[bytes], Optional[str]]:
+        """Shard bytes and the version they were read at, or (None, None)."""
+        try:
+            if uri.startswith("s3://"):
+                bucket, key = parse_s3_uri(uri)
+                response = get_s3_client().get_object(Bucket=bucket, Key=key)
+                return response["Body"].read(), response.get("ETag")
+            with open(uri, "rb") as f:
+                return f.read(), self._local_version(uri)
+        except Exception:
+            # Missing shard (NoSuchKey / FileNotFoundError) is the cold start
+            return None, None
+
+    def _write(self, uri: str, data: bytes, version: Optional[str]) -> Optional[str]:
+        """
+        Replace a shard if it is still at ``version`` (None: must not exist).
+
+        Returns:
+            The version written
+
+        Raises:
+            ShardChangedError: If the shard was created or replaced meanwhile
+        """
+        if uri.startswith("s3://"):
+            bucket, key = parse_s3_uri(uri)
+            condition = {"IfMatch": version} if version else {"IfNoneMatch": "*"}
+            try:
+                response = get_s3_client().put_object(
+                    Bucket=bucket, Key=key, Body=data, **condition
+                )
+            except ClientError as e:
+                code = e.response.get("Error", {}).get("Code")
+                if code in ("PreconditionFailed", "ConditionalRequestConflict"):
+                    raise ShardChangedError(uri) from e
+                raise
+            return response.get("ETag")
+
+        directory = os.path.dirname(uri) or "."
+        os.makedirs(directory, exist_ok=True)
+        try:
+            current = self._local_version(uri)
+        except FileNotFoundError:
+            current = None
+        if current != version:
+            raise ShardChangedError(uri)
+        # Write-then-rename so a crashed run never leaves a truncated cache
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, uri)
+        except Exception:
+            os.unlink(tmp_path)
+            raise
+        return self._local_version(uri)
+
+
+def file_content_id(data: bytes) -> str:
+    """Content identity of local file bytes."""
+    return "sha256:" + hashlib.sha256(data).hexdigest()
+
+
+def s3_content_id(etag: str, size: int) -> str:
+    """Content identity of an S3 object from its HeadObject/ListObjects metadata."""
+    return f"etag:{etag.strip(chr(34))}:{size}"
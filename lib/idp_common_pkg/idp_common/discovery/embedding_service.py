@@ -11,12 +11,14 @@ throttle handling via the existing BedrockClient retry logic.
 
 import io
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import numpy as np
 
 from idp_common.bedrock.client import BedrockClient
+from idp_common.discovery.embedding_cache import EmbeddingCache, s3_content_id
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +39,12 @@ class EmbeddingResult:
     embedding_dim: int
     """Dimensionality of the embeddings."""
 
+    num_reused: int = 0
+    """Embeddings served from the embedding cache."""
+
+    num_computed: int = 0
+    """Embeddings generated by the embedding model in this run."""
+
     def to_serializable(self) -> Dict[str, Any]:
         """Convert to JSON-serializable dict for Step Functions state passing."""
         return {
@@ -46,6 +54,8 @@ class EmbeddingResult:
             "embedding_dim": self.embedding_dim,
             "num_valid": len(self.valid_keys),
             "num_failed": len(self.failed_keys),
+            "num_reused": self.num_reused,
+            "num_computed": self.num_computed,
         }
 
 
@@ -79,12 +89,23 @@ class EmbeddingService:
     # Maximum image pixel dimension for Titan Embed Image (2048x2048)
     MAX_IMAGE_DIMENSION = 2048
 
+    # PDF first-page render resolution
+    PDF_RENDER_DPI = 150
+
+    # Bump when image preparation changes in a way that alters embeddings,
+    # so cached embeddings from the old preparation are not reused.
+    PREPROCESSING_VERSION = 1
+
+    # Concurrent HeadObject calls when identifying documents for the cache
+    MAX_HEAD_WORKERS = 16
+
     def __init__(
         self,
         bedrock_client: BedrockClient,
         model_id: Optional[str] = None,
         max_concurrent: int = 5,
         input_type: str = "search_document",
+        cache_location: Optional[str] = None,
     ):
         """
         Initialize the embedding service.
@@ -95,11 +116,30 @@ class EmbeddingService:
             max_concurrent: Maximum concurrent embedding requests
             input_type: Input type for Cohere models (search_document, search_query,
                        classification, clustering)
+            cache_location: Optional ``s3://`` prefix or local directory of a
+                persistent embedding cache; unchanged documents are then not
+                re-embedded across runs
         """
         self.client = bedrock_client
         self.model_id = model_id or self.DEFAULT_MODEL_ID
         self.max_concurrent = max_concurrent
         self.input_type = input_type
+        self.cache: Optional[EmbeddingCache] = (
+            EmbeddingCache(cache_location, self.cache_namespace())
+            if cache_location
+            else None
+        )
+
+    def cache_namespace(self) -> Dict[str, Any]:
+        """Everything that determines an embedding besides document content."""
+        return {
+            "model_id": self.model_id,
+            "input_type": self.input_type,
+            "preprocessing_version": self.PREPROCESSING_VERSION,
+            "pdf_render_dpi": self.PDF_RENDER_DPI,
+            "max_image_dimension": self.MAX_IMAGE_DIMENSION,
+            "max_image_size": self.MAX_IMAGE_SIZE,
+        }
 
     def embed_document_images(
         self,
@@ -111,7 +151,9 @@ class EmbeddingService:
         Generate embeddings for document images stored in S3.
 
         Downloads each image from S3, compresses it if needed, and generates
-        embeddings using the configured Bedrock model.
+        embeddings using the configured Bedrock model. With an embedding cache,
+        documents whose ETag and size are unchanged since a previous run reuse
+        their stored embedding and are not downloaded.
 
         Args:
             bucket: S3 bucket name
@@ -121,6 +163,23 @@ class EmbeddingService:
         Returns:
             EmbeddingResult with embeddings matrix and metadata
         """
+        if self.cache is not None:
+            return self.embed_with_cache(
+                keys=s3_keys,
+                content_ids=self._s3_content_ids(bucket, s3_keys),
+                embed_keys=lambda keys: self._embed_s3_keys(
+                    bucket, keys, progress_callback
+                ),
+            )
+        return self._embed_s3_keys(bucket, s3_keys, progress_callback)
+
+    def _embed_s3_keys(
+        self,
+        bucket: str,
+        s3_keys: List[str],
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+    ) -> EmbeddingResult:
+        """Download, prepare and embed S3 documents (no cache)."""
         logger.info(
             f"Generating embeddings for {len(s3_keys)} documents "
             f"using model {self.model_id}"
@@ -202,8 +261,113 @@ class EmbeddingService:
             valid_keys=valid_keys,
             failed_keys=failed_keys,
             embedding_dim=embedding_dim,
+            num_computed=len(valid_keys),
+        )
+
+    def embed_with_cache(
+        self,
+        keys: List[str],
+        content_ids: Dict[str, str],
+        embed_keys: Callable[[List[str]], EmbeddingResult],
+    ) -> EmbeddingResult:
+        """
+        Embed documents, reusing cached embeddings of unchanged content.
+
+        Args:
+            keys: Document keys (S3 keys or local paths), in result order
+            content_ids: Mapping of key -> content identity; keys without an
+                identity (e.g. HeadObject failed) are always embedded
+            embed_keys: Callable that embeds a subset of keys without the cache
+
+        Returns:
+            EmbeddingResult in ``keys`` order, with reused/computed counts
+        """
+        assert self.cache is not None
+        cached = self.cache.get_many(
+            content_ids[key] for key in keys if key in content_ids
+        )
+        vectors: Dict[str, np.ndarray] = {
+            key: cached[content_ids[key]]
+            for key in keys
+            if content_ids.get(key) in cached
+        }
+        to_embed = [key for key in keys if key not in vectors]
+        num_reused = len(vectors)
+        logger.info(
+            f"Embedding cache: {num_reused} of {len(keys)} documents unchanged, "
+            f"embedding {len(to_embed)}"
         )
 
+        computed = embed_keys(to_embed) if to_embed else None
+        if computed is not None and computed.valid_keys:
+            new_vectors = {
+                key: np.asarray(row, dtype=np.float32)
+                for key, row in zip(computed.valid_keys, computed.embeddings)
+            }
+            vectors.update(new_vectors)
+            self.cache.put_many(
+                {
+                    content_ids[key]: vector
+                    for key, vector in new_vectors.items()
+                    if key in content_ids
+                }
+            )
+            self.cache.save()
+
+        valid_keys = [key for key in keys if key in vectors]
+        failed_keys = [key for key in keys if key not in vectors]
+        num_computed = len(computed.valid_keys) if computed is not None else 0
+        logger.info(
+            f"Embeddings: {num_reused} reused from cache, {num_computed} computed, "
+            f"{len(failed_keys)} failed"
+        )
+        if not valid_keys:
+            return EmbeddingResult(
+                embeddings=np.array([]),
+                valid_keys=[],
+                failed_keys=list(keys),
+                embedding_dim=0,
+            )
+
+        # Cached rows are float32; widen all rows the same way so a run with
+        # a warm cache yields exactly the matrix a cold run produced.
+        embeddings_array = np.stack([vectors[key] for key in valid_keys]).astype(
+            np.float64
+        )
+        return EmbeddingResult(
+            embeddings=embeddings_array,
+            valid_keys=valid_keys,
+            failed_keys=failed_keys,
+            embedding_dim=embeddings_array.shape[1],
+            num_reused=num_reused,
+            num_computed=num_computed,
+        )
+
+    def _s3_content_ids(self, bucket: str, s3_keys: List[str]) -> Dict[str, str]:
+        """Content identity (ETag + size) of each S3 key, via HeadObject."""
+        import boto3
+
+        s3_client = boto3.client("s3", region_name=self.client.region)
+
+        def head(key: str) -> Optional[str]:
+            try:
+                response = s3_client.head_object(Bucket=bucket, Key=key)
+                return s3_content_id(response["ETag"], response["ContentLength"])
+            except Exception as e:
+                logger.debug(f"Cannot identify {key} for embedding cache: {e}")
+                return None
+
+        if not s3_keys:
+            return {}
+        workers = min(self.MAX_HEAD_WORKERS, len(s3_keys))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            identities = list(executor.map(head, s3_keys))
+        return {
+            key: identity
+            for key, identity in zip(s3_keys, identities)
+            if identity is not None
+        }
+
     def embed_images_from_bytes(
         self,
         images: List[bytes],
@@ -308,7 +472,7 @@ class EmbeddingService:
 
             page = pdf[0]
             # Render at 150 DPI for good quality without being too large
-            bitmap = page.render(scale=150 / 72)
+            bitmap = page.render(scale=self.PDF_RENDER_DPI / 72)
             pil_image = bitmap.to_pil()
             pdf.close()
 
@@ -26,6 +26,7 @@ import boto3
 from idp_common.bedrock.client import BedrockClient
 from idp_common.discovery.clustering_service import ClusteringService, ClusterResult
 from idp_common.discovery.discovery_agent import DiscoveredClass, DiscoveryAgent
+from idp_common.discovery.embedding_cache import file_content_id
 from idp_common.discovery.embedding_service import EmbeddingResult, EmbeddingService
 
 logger = logging.getLogger(__name__)
@@ -134,16 +135,25 @@ class MultiDocumentDiscovery:
         self.max_concurrent_embeddings = self.config.get("max_concurrent_embeddings", 5)
         self.max_concurrent_clusters = self.config.get("max_concurrent_clusters", 3)
         self.max_sample_size = self.config.get("max_sample_size", 5)
+        # s3:// prefix or local directory; unset disables the embedding cache
+        self.embedding_cache_location = (
+            self.config.get("embedding_cache_location")
+            if self.config.get("embedding_cache", True)
+            else None
+        )
+        self.k_selection = self.config.get("k_selection", "auto")
 
         # Initialize services
         self.embedding_service = EmbeddingService(
             bedrock_client=self.bedrock_client,
             model_id=self.embedding_model_id,
             max_concurrent=self.max_concurrent_embeddings,
+            cache_location=self.embedding_cache_location,
         )
         self.clustering_service = ClusteringService(
             min_cluster_size=self.min_cluster_size,
             num_sample_documents=self.num_sample_documents,
+            k_selection=self.k_selection,
         )
         self.discovery_agent = DiscoveryAgent(
             analysis_model_id=self.analysis_model_id,
@@ -234,17 +244,25 @@ class MultiDocumentDiscovery:
     def cluster_documents(
         self,
         embedding_result: EmbeddingResult,
+        k_selection: Optional[str] = None,
     ) -> ClusterResult:
         """
         Cluster documents based on embeddings.
 
         Args:
             embedding_result: Result from generate_embeddings()
+            k_selection: Optional k-selection strategy override: "exact"
+                (full KMeans + silhouette), "scalable" (MiniBatchKMeans +
+                sampled silhouette, parallel over k) or "auto" (scalable
+                above 5,000 documents). Defaults to the ``k_selection``
+                config value.
 
         Returns:
             ClusterResult with cluster assignments
         """
-        return self.clustering_service.cluster(embedding_result.embeddings)
+        return self.clustering_service.cluster(
+            embedding_result.embeddings, k_selection=k_selection
+        )
 
     # ---- Step 4: Analyze Cluster (one per Step Functions Map iteration) ----
 
@@ -535,6 +553,27 @@ class MultiDocumentDiscovery:
             EmbeddingResult with embeddings matrix and metadata.
             valid_keys contains the file paths that succeeded.
         """
+        if self.embedding_service.cache is None:
+            return self._embed_local_files(file_paths, progress_callback)
+
+        content_ids: Dict[str, str] = {}
+        for fp in file_paths:
+            try:
+                content_ids[fp] = file_content_id(Path(fp).read_bytes())
+            except Exception as e:
+                logger.warning(f"Failed to read file {fp}: {e}")
+        return self.embedding_service.embed_with_cache(
+            keys=file_paths,
+            content_ids=content_ids,
+            embed_keys=lambda paths: self._embed_local_files(paths, progress_callback),
+        )
+
+    def _embed_local_files(
+        self,
+        file_paths: List[str],
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+    ) -> EmbeddingResult:
+        """Read, prepare and embed local documents (no cache)."""
         images: List[bytes] = []
         path_mapping: List[str] = []
 
@@ -590,6 +629,7 @@ class MultiDocumentDiscovery:
             valid_keys=valid_keys,
             failed_keys=failed_keys,
             embedding_dim=embedding_dim,
+            num_computed=len(valid_keys),
         )
 
     def _load_local_images(
@@ -12,7 +12,7 @@ import datetime
 import json
 import logging
 from decimal import Decimal
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 from idp_common.dynamodb.client import DynamoDBClient
 from idp_common.models import Document, Page, ProcessingIssue, Section, Status
@@ -20,6 +20,34 @@ from idp_common.models import Document, Page, ProcessingIssue, Section, Status
 logger = logging.getLogger(__name__)
 
 
+# Tracking item attributes written for each Document field, for
+# update_document(changed=...). Derived attributes (WorkflowStatus, the
+# processing-issue counters, the HITLPendingReview GSI key) follow the field
+# they are computed from.
+FIELD_ATTRIBUTES: Dict[str, tuple] = {
+    "status": ("ObjectStatus", "WorkflowStatus"),
+    "queued_time": ("QueuedTime",),
+    "start_time": ("WorkflowStartTime",),
+    "completion_time": ("CompletionTime",),
+    "workflow_execution_arn": ("WorkflowExecutionArn",),
+    "config_version": ("ConfigVersion",),
+    "num_pages": ("PageCount",),
+    "pages": ("Pages",),
+    "sections": ("Sections", "ProcessingIssueCount", "HasProcessingIssues"),
+    "processing_issues": ("ProcessingIssueCount", "HasProcessingIssues"),
+    "metering": ("Metering",),
+    "evaluation_status": ("EvaluationStatus",),
+    "evaluation_report_uri": ("EvaluationReportUri",),
+    "summary_report_uri": ("SummaryReportUri",),
+    "rule_validation_result": ("RuleValidationResult", "RuleValidationResultUri"),
+    "trace_id": ("TraceId",),
+    "hitl_status": ("HITLStatus", "HITLPendingReview"),
+    "hitl_sections_pending": ("HITLSectionsPending",),
+    "hitl_sections_completed": ("HITLSectionsCompleted",),
+    "confidence_alert_count": ("ConfidenceAlertCount",),
+}
+
+
 def convert_floats_to_decimal(obj):
     """
     Recursively convert float values to Decimal for DynamoDB compatibility.
@@ -185,56 +213,43 @@ class DocumentDynamoDBService:
 
         return item
 
-    def _document_to_update_expressions(
+    def _document_to_attributes(
         self, document: Document
-    ) -> tuple[str, Dict[str, str], Dict[str, Any]]:
+    ) -> tuple[Dict[str, Any], List[str]]:
         """
-        Convert a Document object to DynamoDB update expressions.
+        Convert a Document object to the tracking item attributes it owns.
 
         Args:
             document: The Document object to convert
 
         Returns:
-            Tuple of (update_expression, expression_attribute_names, expression_attribute_values)
+            Tuple of (attributes to SET, attribute names to REMOVE); values are
+            already converted to DynamoDB types
         """
-        set_expressions = []
-        expression_names = {}
-        expression_values = {}
+        attributes: Dict[str, Any] = {}
 
         # Always update ObjectStatus
-        set_expressions.append("#ObjectStatus = :ObjectStatus")
-        expression_names["#ObjectStatus"] = "ObjectStatus"
-        expression_values[":ObjectStatus"] = document.status.value
+        attributes["ObjectStatus"] = document.status.value
 
         # Add optional fields if they exist
         if document.queued_time:
-            set_expressions.append("#QueuedTime = :QueuedTime")
-            expression_names["#QueuedTime"] = "QueuedTime"
-            expression_values[":QueuedTime"] = document.queued_time
+            attributes["QueuedTime"] = document.queued_time
 
         if document.start_time:
-            set_expressions.append("#WorkflowStartTime = :WorkflowStartTime")
-            expression_names["#WorkflowStartTime"] = "WorkflowStartTime"
-            expression_values[":WorkflowStartTime"] = document.start_time
+            attributes["WorkflowStartTime"] = document.start_time
 
         if document.completion_time:
-            set_expressions.append("#CompletionTime = :CompletionTime")
-            expression_names["#CompletionTime"] = "CompletionTime"
-            expression_values[":CompletionTime"] = document.completion_time
+            attributes["CompletionTime"] = document.completion_time
 
         if document.workflow_execution_arn:
-            set_expressions.append("#WorkflowExecutionArn = :WorkflowExecutionArn")
-            expression_names["#WorkflowExecutionArn"] = "WorkflowExecutionArn"
-            expression_values[":WorkflowExecutionArn"] = document.workflow_execution_arn
+            attributes["WorkflowExecutionArn"] = document.workflow_execution_arn
 
         # Persist the configuration version (read from the input object's
         # `config-version` S3 metadata at queue time) so the UI/GSI can display
         # which config each document was processed with. Without this the tracking
         # item never carries ConfigVersion and the UI shows "N/A".
         if document.config_version:
-            set_expressions.append("#ConfigVersion = :ConfigVersion")
-            expression_names["#ConfigVersion"] = "ConfigVersion"
-            expression_values[":ConfigVersion"] = document.config_version
+            attributes["ConfigVersion"] = document.config_version
 
         # Set workflow status based on document status
         if document.status == Status.FAILED:
@@ -246,14 +261,10 @@ class DocumentDynamoDBService:
         else:
             workflow_status = "RUNNING"
 
-        set_expressions.append("#WorkflowStatus = :WorkflowStatus")
-        expression_names["#WorkflowStatus"] = "WorkflowStatus"
-        expression_values[":WorkflowStatus"] = workflow_status
+        attributes["WorkflowStatus"] = workflow_status
 
         if document.num_pages > 0:
-            set_expressions.append("#PageCount = :PageCount")
-            expression_names["#PageCount"] = "PageCount"
-            expression_values[":PageCount"] = document.num_pages
+            attributes["PageCount"] = document.num_pages
 
         # Convert pages
         if document.pages:
@@ -276,9 +287,7 @@ class DocumentDynamoDBService:
                 pages_data.append(page_data)
 
             if pages_data:
-                set_expressions.append("#Pages = :Pages")
-                expression_names["#Pages"] = "Pages"
-                expression_values[":Pages"] = pages_data
+                attributes["Pages"] = pages_data
 
         # Convert sections
         if document.sections:
@@ -316,37 +325,25 @@ class DocumentDynamoDBService:
                 sections_data.append(section_data)
 
             if sections_data:
-                set_expressions.append("#Sections = :Sections")
-                expression_names["#Sections"] = "Sections"
-                expression_values[":Sections"] = sections_data
+                attributes["Sections"] = sections_data
 
         # Add metering data if available
         if document.metering:
-            set_expressions.append("#Metering = :Metering")
-            expression_names["#Metering"] = "Metering"
-            expression_values[":Metering"] = json.dumps(document.metering, default=str)
+            attributes["Metering"] = json.dumps(document.metering, default=str)
 
         # Add evaluation status & report if available
         if document.evaluation_status:
-            set_expressions.append("#EvaluationStatus = :EvaluationStatus")
-            expression_names["#EvaluationStatus"] = "EvaluationStatus"
-            expression_values[":EvaluationStatus"] = document.evaluation_status
+            attributes["EvaluationStatus"] = document.evaluation_status
 
         if document.evaluation_report_uri:
-            set_expressions.append("#EvaluationReportUri = :EvaluationReportUri")
-            expression_names["#EvaluationReportUri"] = "EvaluationReportUri"
-            expression_values[":EvaluationReportUri"] = document.evaluation_report_uri
+            attributes["EvaluationReportUri"] = document.evaluation_report_uri
 
         # Add summary report if available
         if document.summary_report_uri:
-            set_expressions.append("#SummaryReportUri = :SummaryReportUri")
-            expression_names["#SummaryReportUri"] = "SummaryReportUri"
-            expression_values[":SummaryReportUri"] = document.summary_report_uri
+            attributes["SummaryReportUri"] = document.summary_report_uri
 
         # Add rule validation result if available
         if document.rule_validation_result:
-            set_expressions.append("#RuleValidationResult = :RuleValidationResult")
-            expression_names["#RuleValidationResult"] = "RuleValidationResult"
             # Store as JSON string to preserve structure
             rule_validation_dict = {
                 "request_id": document.rule_validation_result.request_id,
@@ -358,7 +355,7 @@ class DocumentDynamoDBService:
                 "matched_policy_types": document.rule_validation_result.matched_policy_types,
                 "matched_page_ids": document.rule_validation_result.matched_page_ids,
             }
-            expression_values[":RuleValidationResult"] = json.dumps(
+            attributes["RuleValidationResult"] = json.dumps(
                 rule_validation_dict, default=str
             )
             # Also persist the flat URI scalar the schema/UI read directly
@@ -370,56 +367,36 @@ class DocumentDynamoDBService:
             # set RuleValidationResultUri = output_uri "for backward
             # compatibility"; that line was lost in the move to DynamoDB writes.
             if document.rule_validation_result.output_uri:
-                set_expressions.append(
-                    "#RuleValidationResultUri = :RuleValidationResultUri"
-                )
-                expression_names["#RuleValidationResultUri"] = "RuleValidationResultUri"
-                expression_values[":RuleValidationResultUri"] = (
+                attributes["RuleValidationResultUri"] = (
                     document.rule_validation_result.output_uri
                 )
 
         # Add trace_id if available
         if document.trace_id:
-            set_expressions.append("#TraceId = :TraceId")
-            expression_names["#TraceId"] = "TraceId"
-            expression_values[":TraceId"] = document.trace_id
+            attributes["TraceId"] = document.trace_id
 
         # Add Review Status fields if available
         if document.hitl_status:
-            set_expressions.append("#HITLStatus = :HITLStatus")
-            expression_names["#HITLStatus"] = "HITLStatus"
-            expression_values[":HITLStatus"] = document.hitl_status
+            attributes["HITLStatus"] = document.hitl_status
             # Maintain sparse GSI attribute for pending review queries
             # "PendingReview" = initial trigger, "Review Pending" = after release_review,
             # "InProgress" = after claim_review
             pending_statuses = ("PendingReview", "Review Pending", "InProgress")
             if document.hitl_status in pending_statuses:
-                set_expressions.append("#HITLPendingReview = :HITLPendingReview")
-                expression_names["#HITLPendingReview"] = "HITLPendingReview"
-                expression_values[":HITLPendingReview"] = "true"
+                attributes["HITLPendingReview"] = "true"
         if document.hitl_sections_pending:
-            set_expressions.append("#HITLSectionsPending = :HITLSectionsPending")
-            expression_names["#HITLSectionsPending"] = "HITLSectionsPending"
-            expression_values[":HITLSectionsPending"] = document.hitl_sections_pending
+            attributes["HITLSectionsPending"] = document.hitl_sections_pending
         if document.hitl_sections_completed:
-            set_expressions.append("#HITLSectionsCompleted = :HITLSectionsCompleted")
-            expression_names["#HITLSectionsCompleted"] = "HITLSectionsCompleted"
-            expression_values[":HITLSectionsCompleted"] = (
-                document.hitl_sections_completed
-            )
+            attributes["HITLSectionsCompleted"] = document.hitl_sections_completed
 
         # Always persist confidence alert count (even 0) so GSI has it for listDocuments
-        set_expressions.append("#ConfidenceAlertCount = :ConfidenceAlertCount")
-        expression_names["#ConfidenceAlertCount"] = "ConfidenceAlertCount"
-        expression_values[":ConfidenceAlertCount"] = document.confidence_alert_count
+        attributes["ConfidenceAlertCount"] = document.confidence_alert_count
 
         # Always persist processing-issue count (even 0) so the document list can
         # show/filter on it, mirroring ConfidenceAlertCount (the authoritative
         # filterable source of truth).
         issue_count = document.processing_issue_count
-        set_expressions.append("#ProcessingIssueCount = :ProcessingIssueCount")
-        expression_names["#ProcessingIssueCount"] = "ProcessingIssueCount"
-        expression_values[":ProcessingIssueCount"] = issue_count
+        attributes["ProcessingIssueCount"] = issue_count
 
         # Sparse GSI attribute for cheap "has processing issues" filtering — SET
         # only when there ARE issues (mirrors the HITLPendingReview sparse pattern).
@@ -427,26 +404,63 @@ class DocumentDynamoDBService:
         # written, above) is the authoritative filter source, and avoiding a REMOVE
         # here keeps the update-expression additive.
         if issue_count > 0:
-            set_expressions.append("#HasProcessingIssues = :HasProcessingIssues")
-            expression_names["#HasProcessingIssues"] = "HasProcessingIssues"
-            expression_values[":HasProcessingIssues"] = "true"
-
-        # Build update expression with optional REMOVE clause
-        update_expression = "SET " + ", ".join(set_expressions)
+            attributes["HasProcessingIssues"] = "true"
 
         # Remove HITLPendingReview GSI attribute when review is completed/skipped
-        remove_expressions = []
+        remove_attributes = []
         if document.hitl_status:
             pending_statuses = ("PendingReview", "Review Pending", "InProgress")
             if document.hitl_status not in pending_statuses:
-                remove_expressions.append("HITLPendingReview")
-        if remove_expressions:
-            update_expression += " REMOVE " + ", ".join(remove_expressions)
+                remove_attributes.append("HITLPendingReview")
 
         # Convert any float values to Decimal for DynamoDB compatibility
-        expression_values = convert_floats_to_decimal(expression_values)  # type: ignore[assignment]
+        attributes = convert_floats_to_decimal(attributes)
+
+        return attributes, remove_attributes
+
+    def _document_to_update_expressions(
+        self, document: Document, changed: Optional[Iterable[str]] = None
+    ) -> tuple[str, Dict[str, str], Dict[str, Any]]:
+        """
+        Convert a Document object to DynamoDB update expressions.
 
-        return update_expression, expression_names, expression_values
+        Args:
+            document: The Document object to convert
+            changed: Optional Document field names (keys of ``FIELD_ATTRIBUTES``)
+                to write; all attributes are written when omitted
+
+        Returns:
+            Tuple of (update_expression, expression_attribute_names,
+            expression_attribute_values); the expression is empty when
+            ``changed`` is empty
+        """
+        attributes, remove_attributes = self._document_to_attributes(document)
+        if changed is not None:
+            changed = set(changed)
+            unknown = sorted(changed - FIELD_ATTRIBUTES.keys())
+            if unknown:
+                raise ValueError(f"Unknown document fields: {', '.join(unknown)}")
+            selected = {
+                name for field_name in changed for name in FIELD_ATTRIBUTES[field_name]
+            }
+            attributes = {k: v for k, v in attributes.items() if k in selected}
+            remove_attributes = [n for n in remove_attributes if n in selected]
+
+        set_expressions = []
+        expression_names: Dict[str, str] = {}
+        expression_values: Dict[str, Any] = {}
+        for name, value in attributes.items():
+            set_expressions.append(f"#{name} = :{name}")
+            expression_names[f"#{name}"] = name
+            expression_values[f":{name}"] = value
+
+        update_expression = ""
+        if set_expressions:
+            update_expression = "SET " + ", ".join(set_expressions)
+        if remove_attributes:
+            update_expression += " REMOVE " + ", ".join(remove_attributes)
+
+        return update_expression.strip(), expression_names, expression_values
 
     def _dynamodb_item_to_document(self, item: Dict[str, Any]) -> Document:
         """
@@ -655,17 +669,26 @@ class DocumentDynamoDBService:
 
         return document.input_key
 
-    def update_document(self, document: Document) -> Document:
+    def update_document(
+        self, document: Document, changed: Optional[Iterable[str]] = None
+    ) -> Document:
         """
         Update an existing document in DynamoDB.
 
         Args:
             document: The Document object to update
+            changed: Optional names of the Document fields this caller changed
+                (keys of ``FIELD_ATTRIBUTES``, e.g. ``{"status"}``). Only their
+                attributes are written, and an empty set makes no write. By
+                default every attribute is written, which also repairs anything
+                another writer changed since the Document was loaded.
 
         Returns:
-            Updated Document object with any data returned from DynamoDB
+            Updated Document object with any data returned from DynamoDB (the
+            document itself when nothing was written)
 
         Raises:
+            ValueError: If ``changed`` names an unknown field
             DynamoDBError: If the DynamoDB operation fails
         """
         key = {
@@ -674,8 +697,11 @@ class DocumentDynamoDBService:
         }
 
         update_expression, expression_names, expression_values = (
-            self._document_to_update_expressions(document)
+            self._document_to_update_expressions(document, changed)
         )
+        if not update_expression:
+            logger.info(f"No changes to write for document: {document.input_key}")
+            return document
 
         response = self.client.update_item(
             key=key,
@@ -689,7 +715,10 @@ class DocumentDynamoDBService:
         updated_item = response.get("Attributes", {})
         updated_document = self._dynamodb_item_to_document(updated_item)
 
-        logger.info(f"Successfully updated document: {document.input_key}")
+        logger.info(
+            f"Successfully updated document: {document.input_key} "
+            f"({len(expression_names)} attributes)"
+        )
         return updated_document
 
     def get_document(self, object_key: str) -> Optional[Document]:
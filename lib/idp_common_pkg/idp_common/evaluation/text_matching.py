@@ -9,9 +9,13 @@ library (see ``service.py``). These small, dependency-free helpers remain in the
 codebase because OCR bounding-box grounding
 (``idp_common.assessment.ocr_grounding``) needs a normalized Levenshtein-based
 fuzzy score to match extracted values against OCR lines.
+
+Edit distances use Myers' bit-parallel algorithm; ``fuzz_scores`` scores one
+value against a whole page of OCR lines with a score-threshold early exit.
 """
 
 import re
+from typing import Dict, Iterable, List, Optional
 
 
 def strip_punctuation_space(text: str) -> str:
@@ -32,6 +36,85 @@ def strip_punctuation_space(text: str) -> str:
     return text
 
 
+def levenshtein_distance(s1: str, s2: str, max_distance: Optional[int] = None) -> int:
+    """
+    Levenshtein edit distance between two strings.
+
+    Uses Myers' bit-parallel algorithm (Hyyro's formulation for global edit
+    distance): the DP column for the shorter string is packed into Python
+    integers, so each character of the longer string costs a handful of
+    integer operations instead of a row of Python-level cell updates.
+
+    Args:
+        s1: First string
+        s2: Second string
+        max_distance: Optional cutoff. When the distance is certain to exceed
+            it, computation stops early and ``max_distance + 1`` is returned.
+
+    Returns:
+        Edit distance, or ``max_distance + 1`` if it exceeds ``max_distance``
+    """
+    if len(s1) > len(s2):
+        s1, s2 = s2, s1
+    if max_distance is not None and len(s2) - len(s1) > max_distance:
+        return max_distance + 1
+    if not s1:
+        return len(s2)
+    return _myers_distance(_pattern_masks(s1), len(s1), s2, max_distance)
+
+
+def _pattern_masks(pattern: str) -> Dict[str, int]:
+    """Bit mask of the positions of each character in ``pattern``."""
+    masks: Dict[str, int] = {}
+    for i, char in enumerate(pattern):
+        masks[char] = masks.get(char, 0) | (1 << i)
+    return masks
+
+
+def _myers_distance(
+    masks: Dict[str, int],
+    pattern_len: int,
+    text: str,
+    max_distance: Optional[int] = None,
+) -> int:
+    """Bit-parallel global edit distance between a pre-masked pattern and text."""
+    all_ones = (1 << pattern_len) - 1
+    high_bit = 1 << (pattern_len - 1)
+    vp, vn = all_ones, 0
+    score = pattern_len
+    remaining = len(text)
+    for char in text:
+        eq = masks.get(char, 0)
+        x = eq | vn
+        d0 = (((x & vp) + vp) ^ vp) | x
+        hp = vn | (all_ones & ~(d0 | vp))
+        hn = vp & d0
+        if hp & high_bit:
+            score += 1
+        elif hn & high_bit:
+            score -= 1
+        hp = ((hp << 1) | 1) & all_ones
+        hn = (hn << 1) & all_ones
+        vp = hn | (all_ones & ~(d0 | hp))
+        vn = hp & d0
+        remaining -= 1
+        # Each remaining character can lower the final distance by at most one
+        if max_distance is not None and score - remaining > max_distance:
+            return max_distance + 1
+    return score
+
+
+def _max_distance_for(min_score: float, max_len: int) -> int:
+    """Largest distance whose normalized score still reaches ``min_score``."""
+    distance = int((1.0 - min_score) * max_len)
+    # Step off float rounding so the cutoff agrees with 1.0 - d / max_len
+    while distance >= 0 and 1.0 - distance / max_len < min_score:
+        distance -= 1
+    while distance < max_len and 1.0 - (distance + 1) / max_len >= min_score:
+        distance += 1
+    return distance
+
+
 def fuzz_score(s1: str, s2: str) -> float:
     """
     Calculate a normalized fuzzy match score between two strings.
@@ -58,24 +141,51 @@ def fuzz_score(s1: str, s2: str) -> float:
     if not s1 or not s2:
         return 0.0
 
-    # Calculate Levenshtein distance (simplified implementation)
-    len_s1, len_s2 = len(s1), len(s2)
-    d = [[0 for _ in range(len_s2 + 1)] for _ in range(len_s1 + 1)]
+    # Convert to similarity score (1.0 for identical, approaching 0.0 for very different)
+    max_len = max(len(s1), len(s2))
+    return 1.0 - levenshtein_distance(s1, s2) / max_len
 
-    for i in range(len_s1 + 1):
-        d[i][0] = i
-    for j in range(len_s2 + 1):
-        d[0][j] = j
 
-    for i in range(1, len_s1 + 1):
-        for j in range(1, len_s2 + 1):
-            cost = 0 if s1[i - 1] == s2[j - 1] else 1
-            d[i][j] = min(
-                d[i - 1][j] + 1,  # deletion
-                d[i][j - 1] + 1,  # insertion
-                d[i - 1][j - 1] + cost,  # substitution
-            )
+def fuzz_scores(
+    query: str, candidates: Iterable[str], min_score: float = 0.0
+) -> List[float]:
+    """
+    Score one query against many candidates, e.g. every OCR line on a page.
 
-    # Convert to similarity score (1.0 for identical, approaching 0.0 for very different)
-    max_len = max(len_s1, len_s2)
-    return 1.0 - (d[len_s1][len_s2] / max_len if max_len > 0 else 0.0)
+    Equivalent to ``[fuzz_score(query, c) for c in candidates]``, but the query
+    is normalized and bit-masked once, and with ``min_score`` each comparison
+    stops as soon as the candidate provably cannot reach it.
+
+    Args:
+        query: String to match
+        candidates: Strings to score against ``query``
+        min_score: Candidates scoring below this get 0.0 instead of their
+            exact score, which lets most of them exit early
+
+    Returns:
+        One score per candidate, in order
+    """
+    query = strip_punctuation_space(query)
+    masks = _pattern_masks(query)
+    scores: List[float] = []
+    for candidate in candidates:
+        candidate = strip_punctuation_space(candidate)
+        if candidate == query:
+            scores.append(1.0)
+            continue
+        if not query or not candidate:
+            scores.append(0.0)
+            continue
+        max_len = max(len(query), len(candidate))
+        max_distance = _max_distance_for(min_score, max_len) if min_score else None
+        if max_distance is not None and (
+            max_distance < 0 or abs(len(query) - len(candidate)) > max_distance
+        ):
+            scores.append(0.0)
+            continue
+        distance = _myers_distance(masks, len(query), candidate, max_distance)
+        if max_distance is not None and distance > max_distance:
+            scores.append(0.0)
+        else:
+            scores.append(1.0 - distance / max_len)
+    return scores
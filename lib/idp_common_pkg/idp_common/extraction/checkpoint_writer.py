@@ -0,0 +1,159 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""Coalescing background writer for agentic extraction checkpoints.
+
+The agentic loop checkpoints after every ``extraction_tool`` call, JSON patch
+and buffer write so a Lambda timeout can resume where it stopped
+(``agentic_idp._invoke_checkpoint_callback``). Each checkpoint is the *whole*
+current extraction, so on a large table with dozens of incremental patches the
+agent serialized and uploaded an ever-growing document on its critical path
+every time, although only the latest one is ever read back.
+
+:class:`CoalescingCheckpointWriter` wraps the synchronous save callable and
+moves it to a background thread:
+
+- **Latest wins** — an update replaces any update still waiting to be written;
+  intermediate states are never uploaded.
+- **Debounce** — a write happens once updates have been quiet for
+  ``debounce_seconds``, but never later than ``max_delay_seconds`` after the
+  first unwritten update, so a steady stream of patches still checkpoints.
+- **Deadline** — within ``deadline_margin_seconds`` of ``deadline_epoch`` (the
+  Lambda's end) every update is written synchronously, so the state a timeout
+  interrupts is already persisted.
+
+``flush()`` writes the pending update now; ``close()`` flushes and stops the
+thread. Call ``close(discard=True)`` before deleting the checkpoint on success,
+or a late background write would recreate it.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Any, Callable
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DEBOUNCE_SECONDS = 2.0
+DEFAULT_MAX_DELAY_SECONDS = 10.0
+DEFAULT_DEADLINE_MARGIN_SECONDS = 30.0
+
+
+class CoalescingCheckpointWriter:
+    """Callable checkpoint sink that persists only the latest update, off-thread."""
+
+    def __init__(
+        self,
+        save: Callable[[Any], None],
+        debounce_seconds: float = DEFAULT_DEBOUNCE_SECONDS,
+        max_delay_seconds: float = DEFAULT_MAX_DELAY_SECONDS,
+        deadline_epoch: float | None = None,
+        deadline_margin_seconds: float = DEFAULT_DEADLINE_MARGIN_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._save = save
+        self.debounce_seconds = debounce_seconds
+        self.max_delay_seconds = max(max_delay_seconds, debounce_seconds)
+        self.deadline_epoch = deadline_epoch
+        self.deadline_margin_seconds = deadline_margin_seconds
+        self._clock = clock
+        self._cond = threading.Condition()
+        # Held for the whole of a write so writes happen one at a time, each
+        # taking the newest pending update.
+        self._write_lock = threading.Lock()
+        self._pending: Any = None
+        self._has_pending = False
+        self._first_pending_at = 0.0
+        self._last_update_at = 0.0
+        self._closed = False
+        self._thread: threading.Thread | None = None
+        self.stats = {"submitted": 0, "written": 0, "failed": 0}
+
+    def __call__(self, payload: Any) -> None:
+        self.submit(payload)
+
+    def submit(self, payload: Any) -> None:
+        """Queue ``payload`` as the latest checkpoint (replacing any pending one).
+
+        The payload must not be mutated afterwards; agent state hands out deep
+        copies, so checkpoints from ``_invoke_checkpoint_callback`` are safe.
+        """
+        with self._cond:
+            now = self._clock()
+            if not self._has_pending:
+                self._first_pending_at = now
+            self._pending = payload
+            self._has_pending = True
+            self._last_update_at = now
+            self.stats["submitted"] += 1
+            synchronous = self._closed or self._near_deadline()
+            if not synchronous:
+                if self._thread is None:
+                    self._thread = threading.Thread(
+                        target=self._run, name="checkpoint-writer", daemon=True
+                    )
+                    self._thread.start()
+                self._cond.notify_all()
+        if synchronous:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write the pending update now, in the calling thread (no-op if none)."""
+        with self._write_lock:
+            with self._cond:
+                if not self._has_pending:
+                    return
+                payload = self._pending
+                self._pending = None
+                self._has_pending = False
+            try:
+                self._save(payload)
+                self.stats["written"] += 1
+            except Exception as e:
+                # The next update retries with newer data.
+                self.stats["failed"] += 1
+                logger.warning(f"Checkpoint save failed, continuing extraction: {e}")
+
+    def close(self, timeout: float | None = None, discard: bool = False) -> None:
+        """Stop the background thread, writing the pending update unless
+        ``discard`` is set. Later updates are written synchronously."""
+        with self._cond:
+            if discard:
+                self._pending = None
+                self._has_pending = False
+            self._closed = True
+            self._cond.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+        self.flush()
+        logger.info(
+            f"Checkpoint writer closed: {self.stats['submitted']} updates, "
+            f"{self.stats['written']} written, {self.stats['failed']} failed"
+        )
+
+    def _near_deadline(self) -> bool:
+        return (
+            self.deadline_epoch is not None
+            and time.time() >= self.deadline_epoch - self.deadline_margin_seconds
+        )
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._has_pending and not self._closed:
+                    self._cond.wait()
+                if not self._has_pending:
+                    return
+                while self._has_pending and not self._closed:
+                    due = min(
+                        self._last_update_at + self.debounce_seconds,
+                        self._first_pending_at + self.max_delay_seconds,
+                    )
+                    wait = due - self._clock()
+                    if wait <= 0 or self._near_deadline():
+                        break
+                    self._cond.wait(wait)
+            self.flush()
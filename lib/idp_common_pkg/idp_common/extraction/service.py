@@ -53,6 +53,13 @@ from idp_common.extraction.validation import (
     validate_extraction,
 )
 from idp_common.models import Document, Section
+from idp_common.page_artifacts import (
+    CONFIDENCE,
+    IMAGE,
+    TEXT,
+    PageArtifactBundle,
+    PageArtifactLoader,
+)
 from idp_common.utils.few_shot_example_builder import (
     build_few_shot_extraction_examples_content,
 )
@@ -125,6 +132,7 @@ class ExtractionService:
         self,
         region: str | None = None,
         config: dict[str, Any] | IDPConfig | None = None,
+        cache_scope: str | None = None,
     ):
         """
         Initialize the extraction service.
@@ -132,6 +140,8 @@ class ExtractionService:
         Args:
             region: AWS region for Bedrock
             config: Configuration dictionary or IDPConfig model
+            cache_scope: Optional Bedrock response cache scope (normally the
+                document's config version)
         """
         # Convert dict to IDPConfig if needed
         if config is not None and isinstance(config, dict):
@@ -143,6 +153,7 @@ class ExtractionService:
 
         self.config = config_model
         self.region = region or os.environ.get("AWS_REGION")
+        self.cache_scope = cache_scope
 
         # Instance variables for prompt context
         # These are initialized here and populated during each process_document_section call
@@ -959,27 +970,53 @@ class ExtractionService:
             end_page=end_page,
         )
 
+    def _load_section_artifacts(
+        self,
+        document: Document,
+        sorted_page_ids: list[str],
+        confidence: bool = False,
+    ) -> PageArtifactBundle:
+        """Fetch page text, images and (optionally) OCR confidence concurrently.
+
+        One :class:`PageArtifactLoader` pass replaces the per-page serial
+        loops, so the section's S3 reads overlap instead of queueing.
+        """
+        return PageArtifactLoader(step="extraction").load(
+            document,
+            sorted_page_ids,
+            text=True,
+            images=True,
+            image_size=(
+                self.config.extraction.image.target_width,
+                self.config.extraction.image.target_height,
+            ),
+            confidence="text" if confidence else None,
+        )
+
     def _load_page_texts(
-        self, document: Document, sorted_page_ids: list[str]
+        self,
+        document: Document,
+        sorted_page_ids: list[str],
+        bundle: PageArtifactBundle | None = None,
     ) -> dict[str, str]:
         """Load OCR text for each page in the section, preserving page IDs.
 
         Pages missing from ``document.pages`` are recorded as errors and
-        omitted from the result.
+        omitted from the result. Uses ``bundle`` when the artifacts were
+        already fetched by :meth:`_load_section_artifacts`.
         """
-        t0 = time.time()
-        page_id_to_text: dict[str, str] = {}
-        for page_id in sorted_page_ids:
-            if page_id not in document.pages:
-                error_msg = f"Page {page_id} not found in document"
-                logger.error(error_msg)
-                document.errors.append(error_msg)
-                continue
-            page = document.pages[page_id]
-            text_path = page.parsed_text_uri
-            page_id_to_text[page_id] = s3.get_text_content(text_path)
-        logger.info(f"Time taken to read text content: {time.time() - t0:.2f} seconds")
-        return page_id_to_text
+        if bundle is None:
+            bundle = PageArtifactLoader(step="extraction").load(
+                document, sorted_page_ids, text=True
+            )
+        for page_id in bundle.missing_page_ids:
+            error_msg = f"Page {page_id} not found in document"
+            logger.error(error_msg)
+            document.errors.append(error_msg)
+        bundle.raise_for_errors(TEXT)
+        return {
+            page_id: artifacts.text or "" for page_id, artifacts in bundle.pages.items()
+        }
 
     def _format_document_text(
         self,
@@ -1022,7 +1059,10 @@ class ExtractionService:
         return self._format_document_text(sorted_page_ids, page_id_to_text)
 
     def _load_confidence_data(
-        self, document: Document, sorted_page_ids: list[str]
+        self,
+        document: Document,
+        sorted_page_ids: list[str],
+        bundle: PageArtifactBundle | None = None,
     ) -> dict[str, str]:
         """
         Load OCR confidence data for pages in a section.
@@ -1033,29 +1073,31 @@ class ExtractionService:
         Args:
             document: Document containing pages
             sorted_page_ids: Sorted list of page IDs
+            bundle: Artifacts already fetched by :meth:`_load_section_artifacts`
 
         Returns:
             Dict mapping page IDs to confidence data strings
         """
+        if bundle is None:
+            bundle = PageArtifactLoader(step="extraction").load(
+                document, sorted_page_ids, confidence="text"
+            )
         confidence_data: dict[str, str] = {}
-        for page_id in sorted_page_ids:
-            if page_id not in document.pages:
-                continue
-            page = document.pages[page_id]
-            confidence_uri = getattr(page, "text_confidence_uri", None)
-            if confidence_uri:
-                try:
-                    conf_text = s3.get_text_content(confidence_uri)
-                    if conf_text:
-                        confidence_data[page_id] = conf_text
-                except Exception as e:
-                    logger.warning(
-                        f"Failed to load confidence data for page {page_id}: {e}"
-                    )
+        for page_id, artifacts in bundle.pages.items():
+            if CONFIDENCE in artifacts.errors:
+                logger.warning(
+                    f"Failed to load confidence data for page {page_id}: "
+                    f"{artifacts.errors[CONFIDENCE]}"
+                )
+            elif artifacts.confidence:
+                confidence_data[page_id] = artifacts.confidence
         return confidence_data
 
     def _load_document_images(
-        self, document: Document, sorted_page_ids: list[str]
+        self,
+        document: Document,
+        sorted_page_ids: list[str],
+        bundle: PageArtifactBundle | None = None,
     ) -> list[Any]:
         """
         Load images from all pages.
@@ -1063,28 +1105,23 @@ class ExtractionService:
         Args:
             document: Document containing pages
             sorted_page_ids: Sorted list of page IDs
+            bundle: Artifacts already fetched by :meth:`_load_section_artifacts`
 
         Returns:
             List of prepared images
         """
-        t0 = time.time()
-        target_width = self.config.extraction.image.target_width
-        target_height = self.config.extraction.image.target_height
-
-        page_images = []
-        for page_id in sorted_page_ids:
-            if page_id not in document.pages:
-                continue
-
-            page = document.pages[page_id]
-            image_uri = page.image_uri
-            image_content = image.prepare_image(image_uri, target_width, target_height)
-            page_images.append(image_content)
-
-        t1 = time.time()
-        logger.info(f"Time taken to read images: {t1 - t0:.2f} seconds")
-
-        return page_images
+        if bundle is None:
+            bundle = PageArtifactLoader(step="extraction").load(
+                document,
+                sorted_page_ids,
+                images=True,
+                image_size=(
+                    self.config.extraction.image.target_width,
+                    self.config.extraction.image.target_height,
+                ),
+            )
+        bundle.raise_for_errors(IMAGE)
+        return bundle.images()
 
     def _initialize_extraction_context(
         self,
@@ -3146,6 +3183,7 @@ Benefits: Faster, more accurate, handles OCR artifacts automatically.
                 context="Extraction",
                 model_lambda_hook_arn=self.config.extraction.model_lambda_hook_arn,
                 reasoning_effort=reasoning_effort,
+                cache_scope=self.cache_scope,
             )
 
             extracted_text = bedrock.extract_text_from_response(
@@ -4133,9 +4171,25 @@ Benefits: Faster, more accurate, handles OCR artifacts automatically.
         # _invoke_extraction_model.
         self._document = document
 
-        # Load per-page text first so the page-type resolver and the
-        # prompt-formatter can both consume it without re-reading S3.
-        page_id_to_text = self._load_page_texts(document, section_info.sorted_page_ids)
+        # Confidence data is only available from Textract OCR backend.
+        # For Bedrock OCR or other backends, skip loading — the tool
+        # handles missing confidence gracefully (confidence_available=false).
+        load_confidence = bool(
+            AGENTIC_AVAILABLE
+            and self.config.extraction.agentic.enabled
+            and self.config.extraction.agentic.table_parsing.enabled
+            and self.config.extraction.agentic.table_parsing.use_confidence_data
+            and self.config.ocr.backend == "textract"
+        )
+        # Fetch every page artifact the section needs in one concurrent pass;
+        # per-page text is shared by the page-type resolver and the
+        # prompt-formatter without re-reading S3.
+        artifacts = self._load_section_artifacts(
+            document, section_info.sorted_page_ids, confidence=load_confidence
+        )
+        page_id_to_text = self._load_page_texts(
+            document, section_info.sorted_page_ids, artifacts
+        )
         class_schema_for_resolver = self._get_class_schema(section_info.class_label)
         section_info.page_type_presence = resolve_page_types(
             class_schema_for_resolver, page_id_to_text
@@ -4152,7 +4206,9 @@ Benefits: Faster, more accurate, handles OCR artifacts automatically.
             page_id_to_text,
             section_info.page_type_presence,
         )
-        page_images = self._load_document_images(document, section_info.sorted_page_ids)
+        page_images = self._load_document_images(
+            document, section_info.sorted_page_ids, artifacts
+        )
         # Stash the per-page OCR text (in section page order) so the agentic
         # path can shard the input by page range when concurrent batches are
         # configured. Pages missing from page_id_to_text contribute "".
@@ -4180,18 +4236,9 @@ Benefits: Faster, more accurate, handles OCR artifacts automatically.
         content, system_prompt = self._build_extraction_content(document, page_images)
 
         # Load OCR confidence data for table parsing tool (if enabled)
-        # Confidence data is only available from Textract OCR backend.
-        # For Bedrock OCR or other backends, skip loading — the tool
-        # handles missing confidence gracefully (confidence_available=false).
-        if (
-            AGENTIC_AVAILABLE
-            and self.config.extraction.agentic.enabled
-            and self.config.extraction.agentic.table_parsing.enabled
-            and self.config.extraction.agentic.table_parsing.use_confidence_data
-            and self.config.ocr.backend == "textract"
-        ):
+        if load_confidence:
             confidence_data_by_page = self._load_confidence_data(
-                document, section_info.sorted_page_ids
+                document, section_info.sorted_page_ids, artifacts
             )
             set_confidence_data(confidence_data_by_page)
             logger.info(
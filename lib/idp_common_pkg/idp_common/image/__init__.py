@@ -4,18 +4,45 @@
 from PIL import Image, ImageFilter, ImageChops, ImageOps
 import io
 import logging
+import os
 from typing import Tuple, Optional, Dict, Any, Union
 from ..s3 import get_binary_content
 from ..utils import parse_s3_uri
+from .cache import get_image_cache, make_key
+from .cache import get_image_cache_stats as get_image_cache_stats
 
 logger = logging.getLogger(__name__)
 
+# JPEG encoder quality for resized images; IMAGE_JPEG_QUALITY overrides the
+# default used by prepare_image
+DEFAULT_JPEG_QUALITY = 95
+
+# Fast resize pre-shrinks with an integer box reduction (Image.reduce) as long
+# as at least this much headroom over the target size remains for the final
+# LANCZOS resample
+FAST_RESIZE_MIN_HEADROOM = 1.25
+
+
+def _get_jpeg_quality() -> int:
+    try:
+        return int(os.environ.get("IMAGE_JPEG_QUALITY", DEFAULT_JPEG_QUALITY))
+    except ValueError:
+        return DEFAULT_JPEG_QUALITY
+
+
+def _fast_resize_enabled() -> bool:
+    """Whether prepare_image takes the fast path (IMAGE_FAST_RESIZE=true)."""
+    return os.environ.get("IMAGE_FAST_RESIZE", "").lower() == "true"
+
 
 def resize_image(
     image_data: bytes,
     target_width: Optional[int] = None,
     target_height: Optional[int] = None,
     allow_upscale: bool = False,
+    fast: bool = False,
+    quality: int = DEFAULT_JPEG_QUALITY,
+    optimize: bool = True,
 ) -> bytes:
     """
     Resize an image to fit within target dimensions while preserving aspect ratio.
@@ -27,6 +54,14 @@ def resize_image(
         target_width: Target width in pixels (None or empty string = no resize)
         target_height: Target height in pixels (None or empty string = no resize)
         allow_upscale: Whether to allow making the image larger than original
+        fast: Speed up downscaling: JPEGs are decoded at a reduced DCT scale
+            (``Image.draft``) and large reductions pre-shrink by an integer
+            factor (``Image.reduce``) before the final LANCZOS resample.
+            Output dimensions are identical to the default path.
+        quality: JPEG encoder quality
+        optimize: Spend extra encode time on smaller output (JPEG Huffman
+            optimization, default PNG compression); worth it for stored
+            images, not for transient model payloads
 
     Returns:
         Resized image bytes in original format (or JPEG if format cannot be preserved)
@@ -96,7 +131,20 @@ def resize_image(
         logger.info(
             f"Resizing image from {current_width}x{current_height} to {new_width}x{new_height} (scale: {scale_factor:.3f})"
         )
-        image = image.resize((new_width, new_height), Image.Resampling.LANCZOS)
+        if fast and scale_factor < 1.0:
+            if original_format == "JPEG":
+                # Decode directly at the smallest DCT scale (1/2, 1/4, 1/8)
+                # that still covers the target size
+                image.draft(image.mode, (new_width, new_height))
+            reduce_factor = int(
+                min(image.width / new_width, image.height / new_height)
+                / FAST_RESIZE_MIN_HEADROOM
+            )
+            if reduce_factor > 1:
+                image = image.reduce(reduce_factor)
+            image = image.resize((new_width, new_height), Image.Resampling.LANCZOS)
+        else:
+            image = image.resize((new_width, new_height), Image.Resampling.LANCZOS)
 
         # Save in original format if possible
         img_byte_array = io.BytesIO()
@@ -120,8 +168,12 @@ def resize_image(
 
         # Add quality parameters for JPEG
         if save_format in ["JPEG", "JPG"]:
-            save_kwargs["quality"] = 95  # High quality
-            save_kwargs["optimize"] = True
+            save_kwargs["quality"] = quality
+            if optimize:
+                save_kwargs["optimize"] = True
+        elif save_format == "PNG" and not optimize:
+            # Fastest zlib level; the payload is decoded once and discarded
+            save_kwargs["compress_level"] = 1
 
         # Handle format-specific requirements
         if save_format == "PNG" and image.mode not in ["RGBA", "LA", "L", "P"]:
@@ -144,31 +196,82 @@ def prepare_image(
     target_width: Optional[int] = None,
     target_height: Optional[int] = None,
     allow_upscale: bool = False,
+    use_cache: bool = True,
+    fast_resize: Optional[bool] = None,
+    quality: Optional[int] = None,
 ) -> bytes:
     """
     Prepare an image for model input from either S3 URI or raw bytes
 
+    Resized variants are cached by source content and target size (see
+    ``idp_common.image.cache``), so repeated calls for the same page and size
+    across retries and pipeline steps skip the resize, and with S3 sidecars
+    enabled also the download.
+
     Args:
         image_source: Either an S3 URI (s3://bucket/key) or raw image bytes
         target_width: Target width in pixels (None or empty string = no resize)
         target_height: Target height in pixels (None or empty string = no resize)
         allow_upscale: Whether to allow making the image larger than original
+        use_cache: Whether to use the resized image cache
+        fast_resize: Use the draft/reduce fast downscale path (see resize_image)
+            and skip the encoder's optimize pass, for payloads that are decoded
+            once and discarded (default: IMAGE_FAST_RESIZE env, off)
+        quality: JPEG encoder quality (default: IMAGE_JPEG_QUALITY env or 95)
 
     Returns:
         Processed image bytes ready for model input (preserves format when possible)
     """
-    # Get the image data
-    if isinstance(image_source, str) and image_source.startswith("s3://"):
-        image_data = get_binary_content(image_source)
-    elif isinstance(image_source, bytes):
-        image_data = image_source
-    else:
+    is_s3_uri = isinstance(image_source, str) and image_source.startswith("s3://")
+    if not is_s3_uri and not isinstance(image_source, bytes):
         raise ValueError(
             f"Invalid image source: {type(image_source)}. Must be S3 URI or bytes."
         )
 
+    if fast_resize is None:
+        fast_resize = _fast_resize_enabled()
+    if quality is None:
+        quality = _get_jpeg_quality()
+    variant = f"q{quality}{'-fast' if fast_resize else ''}"
+
+    cache = get_image_cache()
+    key = None
+    image_data = None if is_s3_uri else image_source
+    if use_cache and cache.enabled:
+        _, width, height, _, _ = make_key("", target_width, target_height, False)
+        # Raw bytes without a resize come back unchanged; nothing to cache
+        if is_s3_uri or width is not None or height is not None:
+            if is_s3_uri and not cache.s3_sidecar:
+                # Only a sidecar hit saves the download, so without one the
+                # source is fetched first and keyed by the ETag of the GET
+                image_data, identity = cache.fetch_source(image_source)
+            else:
+                identity = cache.source_identity(image_source)
+            if identity is not None:
+                key = make_key(
+                    identity, target_width, target_height, allow_upscale, variant
+                )
+                cached = cache.get(key)
+                if cached is not None:
+                    return cached
+
+    # Get the image data
+    if image_data is None:
+        image_data = get_binary_content(image_source)
+
     # Resize and process
-    return resize_image(image_data, target_width, target_height, allow_upscale)
+    result = resize_image(
+        image_data,
+        target_width,
+        target_height,
+        allow_upscale,
+        fast=fast_resize,
+        quality=quality,
+        optimize=not fast_resize,
+    )
+    if key is not None:
+        cache.put(key, result, source_changed=result is not image_data)
+    return result
 
 
 def apply_adaptive_binarization(image_data: bytes) -> bytes:
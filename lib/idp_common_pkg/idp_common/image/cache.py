@@ -0,0 +1,274 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Content-addressed cache for resized page images.
+
+Classification, extraction, assessment and summarization each call
+``prepare_image`` on the same page images, usually with the same target size,
+and every call downloads the source and re-runs the resize and re-encode.
+``ResizedImageCache`` keys each resized variant by the identity of the source
+content (S3 ETag, or a SHA-256 of raw bytes) plus the resize parameters, so a
+variant is computed once and reused:
+
+- In-process tier: an LRU bounded by total bytes, shared by all threads.
+  Covers retries and repeated loads within one Lambda execution environment.
+  S3 sources are still downloaded (the GET returns the ETag that keys the
+  entry); a hit skips the resize and re-encode.
+- Optional S3 sidecar tier: the resized bytes are written next to the source
+  object (``<key>.resized/<etag>-<w>x<h>``) so later pipeline steps, running
+  in other Lambda functions, fetch the ready-made variant instead of
+  re-resizing it.
+
+Configured from environment variables:
+- ``IMAGE_CACHE_MAX_MB``: in-process budget in MB (default 64, 0 disables)
+- ``IMAGE_CACHE_S3_SIDECAR``: ``true`` to read and write S3 sidecar objects
+"""
+
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple, Union
+
+from ..s3 import get_s3_client
+from ..utils import parse_s3_uri
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_MB = 64
+SIDECAR_SUFFIX = ".resized"
+
+# (source identity, target_width, target_height, allow_upscale, encoding variant)
+CacheKey = Tuple[str, Optional[int], Optional[int], bool, str]
+
+
+class ResizedImageCache:
+    """Two-tier (in-process LRU + optional S3 sidecar) cache of resized images."""
+
+    def __init__(self, max_bytes: int, s3_sidecar: bool = False):
+        self.max_bytes = max(0, max_bytes)
+        self.s3_sidecar = s3_sidecar
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[CacheKey, bytes]" = OrderedDict()
+        self._bytes = 0
+        self._stats = {"memory_hits": 0, "s3_hits": 0, "misses": 0, "evictions": 0}
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0 or self.s3_sidecar
+
+    # --- keys -----------------------------------------------------------------
+
+    @staticmethod
+    def source_identity(image_source: Union[str, bytes]) -> Optional[str]:
+        """
+        Identify source content: the S3 ETag for URIs, a SHA-256 for raw bytes.
+
+        For URIs this costs a HeadObject, which only pays off when a sidecar
+        hit can skip the download; see ``fetch_source`` otherwise.
+
+        Returns None when the identity cannot be determined (e.g. HeadObject
+        fails), in which case the caller should bypass the cache.
+        """
+        if isinstance(image_source, bytes):
+            return "sha256:" + hashlib.sha256(image_source).hexdigest()
+        try:
+            bucket, key = parse_s3_uri(image_source)
+            etag = get_s3_client().head_object(Bucket=bucket, Key=key)["ETag"]
+            return f"{image_source}#{etag.strip(chr(34))}"
+        except Exception as e:
+            logger.debug(f"Image cache bypassed, cannot identify {image_source}: {e}")
+            return None
+
+    @staticmethod
+    def fetch_source(s3_uri: str) -> Tuple[bytes, Optional[str]]:
+        """
+        Download an S3 source together with its identity.
+
+        The identity comes from the ETag of the GET response, so no separate
+        HeadObject is needed; it is None if the response carries no ETag.
+        """
+        bucket, key = parse_s3_uri(s3_uri)
+        response = get_s3_client().get_object(Bucket=bucket, Key=key)
+        etag = response.get("ETag")
+        identity = f"{s3_uri}#{etag.strip(chr(34))}" if etag else None
+        return response["Body"].read(), identity
+
+    @staticmethod
+    def sidecar_uri(
+        source_uri: str,
+        etag: str,
+        target_width: Optional[int],
+        target_height: Optional[int],
+        allow_upscale: bool,
+        variant: str = "",
+    ) -> str:
+        """S3 URI of the sidecar object holding one resized variant."""
+        size = f"{target_width or 'auto'}x{target_height or 'auto'}"
+        return (
+            f"{source_uri}{SIDECAR_SUFFIX}/{etag}-{size}"
+            f"{'-upscale' if allow_upscale else ''}"
+            f"{f'-{variant}' if variant else ''}"
+        )
+
+    # --- lookups --------------------------------------------------------------
+
+    def get(self, key: CacheKey) -> Optional[bytes]:
+        """Look up a variant in memory, then in its S3 sidecar."""
+        if self.max_bytes:
+            with self._lock:
+                data = self._entries.get(key)
+                if data is not None:
+                    self._entries.move_to_end(key)
+                    self._stats["memory_hits"] += 1
+                    return data
+
+        if self.s3_sidecar and key[0].startswith("s3://"):
+            data = self._read_sidecar(key)
+            if data is not None:
+                with self._lock:
+                    self._stats["s3_hits"] += 1
+                self._remember(key, data)
+                return data
+
+        with self._lock:
+            self._stats["misses"] += 1
+        return None
+
+    def put(self, key: CacheKey, data: bytes, source_changed: bool = True) -> None:
+        """
+        Store a computed variant.
+
+        Args:
+            key: Cache key from ``make_key``
+            data: Resized image bytes
+            source_changed: False when resizing returned the source unchanged;
+                such variants are not written to S3 (the source already is one)
+        """
+        self._remember(key, data)
+        if self.s3_sidecar and source_changed and key[0].startswith("s3://"):
+            self._write_sidecar(key, data)
+
+    def _remember(self, key: CacheKey, data: bytes) -> None:
+        if not self.max_bytes or len(data) > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= len(previous)
+            self._entries[key] = data
+            self._bytes += len(data)
+            while self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= len(evicted)
+                self._stats["evictions"] += 1
+
+    # --- S3 sidecar -----------------------------------------------------------
+
+    def _sidecar_location(self, key: CacheKey) -> Tuple[str, str]:
+        identity, target_width, target_height, allow_upscale, variant = key
+        source_uri, _, etag = identity.rpartition("#")
+        return parse_s3_uri(
+            self.sidecar_uri(
+                source_uri, etag, target_width, target_height, allow_upscale, variant
+            )
+        )
+
+    def _read_sidecar(self, key: CacheKey) -> Optional[bytes]:
+        try:
+            bucket, sidecar_key = self._sidecar_location(key)
+            response = get_s3_client().get_object(Bucket=bucket, Key=sidecar_key)
+            return response["Body"].read()
+        except Exception:
+            # Missing sidecar (NoSuchKey) is the normal miss path
+            return None
+
+    def _write_sidecar(self, key: CacheKey, data: bytes) -> None:
+        try:
+            bucket, sidecar_key = self._sidecar_location(key)
+            get_s3_client().put_object(Bucket=bucket, Key=sidecar_key, Body=data)
+        except Exception as e:
+            logger.warning(f"Failed to write resized image sidecar: {e}")
+
+    # --- stats ----------------------------------------------------------------
+
+    def stats(self) -> Dict[str, Union[int, float]]:
+        """
+        Hit/miss counters since the cache was created.
+
+        Returns:
+            Dict with ``memory_hits``, ``s3_hits``, ``misses``, ``evictions``,
+            ``hit_ratio`` (hits / lookups), ``entries`` and ``bytes``
+        """
+        with self._lock:
+            stats: Dict[str, Union[int, float]] = dict(self._stats)
+            stats["entries"] = len(self._entries)
+            stats["bytes"] = self._bytes
+        lookups = stats["memory_hits"] + stats["s3_hits"] + stats["misses"]
+        stats["hit_ratio"] = (
+            (stats["memory_hits"] + stats["s3_hits"]) / lookups if lookups else 0.0
+        )
+        return stats
+
+    def clear(self) -> None:
+        """Drop all in-process entries and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            for name in self._stats:
+                self._stats[name] = 0
+
+
+def make_key(
+    identity: str,
+    target_width: Optional[int],
+    target_height: Optional[int],
+    allow_upscale: bool,
+    variant: str = "",
+) -> CacheKey:
+    """
+    Build a cache key, normalizing empty-string dimensions to None.
+
+    ``variant`` distinguishes encodings of the same size (quality, fast path).
+    """
+
+    def _dim(value) -> Optional[int]:
+        if value is None or (isinstance(value, str) and not value.strip()):
+            return None
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            return None
+
+    return (
+        identity,
+        _dim(target_width),
+        _dim(target_height),
+        bool(allow_upscale),
+        variant,
+    )
+
+
+_cache: Optional[ResizedImageCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_image_cache() -> ResizedImageCache:
+    """Get the process-wide resized image cache, configured from the environment."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            try:
+                max_mb = float(os.environ.get("IMAGE_CACHE_MAX_MB", DEFAULT_MAX_MB))
+            except ValueError:
+                max_mb = DEFAULT_MAX_MB
+            sidecar = os.environ.get("IMAGE_CACHE_S3_SIDECAR", "").lower() == "true"
+            _cache = ResizedImageCache(int(max_mb * 1024 * 1024), sidecar)
+        return _cache
+
+
+def get_image_cache_stats() -> Dict[str, Union[int, float]]:
+    """Hit/miss counters of the process-wide resized image cache."""
+    return get_image_cache().stats()
@@ -1,11 +1,16 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 # SPDX-License-Identifier: MIT-0
 
-import boto3
-import os
+import atexit
+import functools
+import json
 import logging
+import os
 import threading
-from typing import List, Dict, Any, Optional
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import boto3
 
 logger = logging.getLogger(__name__)
 
@@ -14,6 +19,25 @@ _cloudwatch_client = None
 _client_lock = threading.Lock()
 _metric_lock = threading.Lock()
 
+# PutMetricData accepts up to 1000 metric data entries per request, and each
+# entry up to 150 distinct values in its Values/Counts arrays.
+MAX_DATUMS_PER_REQUEST = 1000
+MAX_VALUES_PER_DATUM = 150
+# Embedded Metric Format allows up to 100 metrics per document and 100 values
+# per metric array.
+MAX_EMF_METRICS_PER_DOCUMENT = 100
+MAX_EMF_VALUES_PER_METRIC = 100
+
+# Publishing modes (METRICS_MODE environment variable)
+MODE_DIRECT = "direct"  # one synchronous PutMetricData call per put_metric
+MODE_BUFFERED = "buffered"  # buffer in process, flush in PutMetricData batches
+MODE_EMF = "emf"  # buffer in process, flush as EMF log lines on stdout
+
+DEFAULT_FLUSH_INTERVAL_SECONDS = 60.0
+
+# Datum key: (namespace, metric name, unit, dimensions, timestamp minute)
+_DatumKey = Tuple[str, str, str, Tuple[Tuple[str, str], ...], int]
+
 
 def get_cloudwatch_client():
     """
@@ -29,6 +53,258 @@ def get_cloudwatch_client():
         return _cloudwatch_client
 
 
+class MetricBuffer:
+    """
+    Thread-safe in-process buffer of metric datapoints.
+
+    Datapoints with the same namespace, name, unit, dimensions and minute are
+    aggregated into a value -> count map, so thousands of ``put_metric`` calls
+    from worker threads collapse into a handful of CloudWatch datums. Adding a
+    datapoint only takes a short in-memory lock; no network I/O happens until
+    ``drain`` is called by a flush.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._datums: Dict[_DatumKey, Dict[float, int]] = {}
+        self._datapoints = 0
+        self._oldest: Optional[float] = None
+
+    def add(
+        self,
+        namespace: str,
+        name: str,
+        value: float,
+        unit: str,
+        dimensions: List[Dict[str, str]],
+        timestamp: Optional[float] = None,
+    ) -> int:
+        """
+        Add a datapoint.
+
+        Returns:
+            Number of distinct datums currently buffered
+        """
+        timestamp = time.time() if timestamp is None else timestamp
+        dims = tuple((d["Name"], d["Value"]) for d in dimensions)
+        key = (namespace, name, unit, dims, int(timestamp // 60))
+        with self._lock:
+            values = self._datums.setdefault(key, {})
+            values[value] = values.get(value, 0) + 1
+            self._datapoints += 1
+            if self._oldest is None:
+                self._oldest = timestamp
+            return len(self._datums)
+
+    def age(self) -> float:
+        """Seconds since the oldest buffered datapoint was added (0 if empty)."""
+        with self._lock:
+            return 0.0 if self._oldest is None else time.time() - self._oldest
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._datapoints
+
+    def drain(self) -> Dict[_DatumKey, Dict[float, int]]:
+        """Atomically remove and return all buffered datums."""
+        with self._lock:
+            datums = self._datums
+            self._datums = {}
+            self._datapoints = 0
+            self._oldest = None
+            return datums
+
+
+_buffer = MetricBuffer()
+_flush_lock = threading.Lock()
+_batch_depth = 0
+_batch_depth_lock = threading.Lock()
+_stats = {"datapoints": 0, "flushes": 0, "requests": 0}
+
+
+def _get_mode() -> str:
+    """Publishing mode from METRICS_MODE; unset means direct unless batching."""
+    return os.environ.get("METRICS_MODE", "").strip().lower()
+
+
+def _is_buffering() -> bool:
+    mode = _get_mode()
+    if mode == MODE_DIRECT:
+        return False
+    return mode in (MODE_BUFFERED, MODE_EMF) or _batch_depth > 0
+
+
+def _flush_interval() -> float:
+    try:
+        return float(
+            os.environ.get(
+                "METRICS_FLUSH_INTERVAL_SECONDS", DEFAULT_FLUSH_INTERVAL_SECONDS
+            )
+        )
+    except ValueError:
+        return DEFAULT_FLUSH_INTERVAL_SECONDS
+
+
+def _to_put_metric_data(
+    key: _DatumKey, values: Dict[float, int]
+) -> List[Dict[str, Any]]:
+    """Convert one buffered datum into PutMetricData entries (<=150 values each)."""
+    _, name, unit, dims, minute = key
+    items = sorted(values.items())
+    entries = []
+    for start in range(0, len(items), MAX_VALUES_PER_DATUM):
+        chunk = items[start : start + MAX_VALUES_PER_DATUM]
+        entries.append(
+            {
+                "MetricName": name,
+                "Unit": unit,
+                "Dimensions": [{"Name": n, "Value": v} for n, v in dims],
+                "Timestamp": minute * 60,
+                "Values": [v for v, _ in chunk],
+                "Counts": [float(c) for _, c in chunk],
+            }
+        )
+    return entries
+
+
+def _publish_put_metric_data(datums: Dict[_DatumKey, Dict[float, int]]) -> int:
+    """Publish datums with PutMetricData, up to 1000 entries per request."""
+    by_namespace: Dict[str, List[Dict[str, Any]]] = {}
+    for key, values in datums.items():
+        by_namespace.setdefault(key[0], []).extend(_to_put_metric_data(key, values))
+
+    requests = 0
+    cloudwatch = get_cloudwatch_client()
+    for namespace, entries in by_namespace.items():
+        for start in range(0, len(entries), MAX_DATUMS_PER_REQUEST):
+            batch = entries[start : start + MAX_DATUMS_PER_REQUEST]
+            try:
+                cloudwatch.put_metric_data(Namespace=namespace, MetricData=batch)
+                requests += 1
+            except Exception as e:
+                logger.error(
+                    f"Error publishing {len(batch)} buffered metrics to {namespace}: {e}"
+                )
+    return requests
+
+
+def _publish_emf(datums: Dict[_DatumKey, Dict[float, int]]) -> int:
+    """Write datums to stdout as CloudWatch Embedded Metric Format documents."""
+    # Group metrics sharing namespace, dimensions and minute into one document
+    groups: Dict[Tuple, List[Tuple[str, str, List[float]]]] = {}
+    for (namespace, name, unit, dims, minute), values in datums.items():
+        expanded = [v for v, count in sorted(values.items()) for _ in range(count)]
+        groups.setdefault((namespace, dims, minute), []).append((name, unit, expanded))
+
+    documents = 0
+    for (namespace, dims, minute), metrics in groups.items():
+        # Metrics with more than 100 values spill into follow-up documents
+        while metrics:
+            batch = metrics[:MAX_EMF_METRICS_PER_DOCUMENT]
+            metrics = metrics[MAX_EMF_METRICS_PER_DOCUMENT:]
+            document: Dict[str, Any] = {
+                "_aws": {
+                    "Timestamp": minute * 60 * 1000,
+                    "CloudWatchMetrics": [
+                        {
+                            "Namespace": namespace,
+                            "Dimensions": [[n for n, _ in dims]],
+                            "Metrics": [
+                                {"Name": name, "Unit": unit} for name, unit, _ in batch
+                            ],
+                        }
+                    ],
+                },
+                **{n: v for n, v in dims},
+            }
+            spill = []
+            for name, unit, values in batch:
+                head = values[:MAX_EMF_VALUES_PER_METRIC]
+                document[name] = head[0] if len(head) == 1 else head
+                if len(values) > MAX_EMF_VALUES_PER_METRIC:
+                    spill.append((name, unit, values[MAX_EMF_VALUES_PER_METRIC:]))
+            metrics = spill + metrics
+            print(json.dumps(document), flush=True)
+            documents += 1
+    return documents
+
+
+def flush_metrics() -> int:
+    """
+    Publish all buffered datapoints.
+
+    Uses EMF log lines when METRICS_MODE is ``emf``, otherwise batched
+    PutMetricData calls. Safe to call from any thread and when nothing is
+    buffered.
+
+    Returns:
+        Number of datapoints flushed
+    """
+    with _flush_lock:
+        datapoints = len(_buffer)
+        datums = _buffer.drain()
+        if not datums:
+            return 0
+        if _get_mode() == MODE_EMF:
+            requests = _publish_emf(datums)
+        else:
+            requests = _publish_put_metric_data(datums)
+        _stats["datapoints"] += datapoints
+        _stats["flushes"] += 1
+        _stats["requests"] += requests
+        logger.debug(
+            f"Flushed {datapoints} metric datapoints as {len(datums)} datums "
+            f"in {requests} requests"
+        )
+        return datapoints
+
+
+def get_metrics_stats() -> Dict[str, int]:
+    """
+    Cumulative buffered-publishing stats for this process.
+
+    Returns:
+        Dict with ``datapoints`` flushed, ``flushes`` performed, ``requests``
+        sent (PutMetricData calls or EMF documents) and ``buffered`` datapoints
+        not yet flushed
+    """
+    return {**_stats, "buffered": len(_buffer)}
+
+
+def batch_metrics(handler: Callable) -> Callable:
+    """
+    Decorator that buffers metrics for the duration of a Lambda handler call.
+
+    While the handler (and any threads it starts) runs, ``put_metric`` only
+    appends to an in-process buffer instead of calling CloudWatch. The buffer
+    is flushed in batches when it fills up and always when the handler returns
+    or raises, so no datapoints are left behind when Lambda freezes the
+    environment. Set ``METRICS_MODE=direct`` to disable buffering.
+
+    Example:
+        @batch_metrics
+        def handler(event, context):
+            ...
+    """
+
+    @functools.wraps(handler)
+    def wrapper(*args, **kwargs):
+        global _batch_depth
+        with _batch_depth_lock:
+            _batch_depth += 1
+        try:
+            return handler(*args, **kwargs)
+        finally:
+            with _batch_depth_lock:
+                _batch_depth -= 1
+            try:
+                flush_metrics()
+            except Exception as e:
+                logger.error(f"Error flushing metrics: {e}")
+
+    return wrapper
+
+
 def put_metric(
     name: str,
     value: float,
@@ -39,6 +315,10 @@ def put_metric(
     """
     Publish a metric to CloudWatch in a thread-safe manner
 
+    Inside a ``@batch_metrics`` handler, or when METRICS_MODE is ``buffered``
+    or ``emf``, the datapoint is buffered and published by ``flush_metrics``.
+    Otherwise it is sent immediately with its own PutMetricData call.
+
     Args:
         name: The name of the metric
         value: The value of the metric
@@ -52,6 +332,12 @@ def put_metric(
     if namespace is None:
         namespace = os.environ.get("METRIC_NAMESPACE", "GENAIDP")
 
+    if _is_buffering():
+        buffered = _buffer.add(namespace, name, value, unit, dimensions)
+        if buffered >= MAX_DATUMS_PER_REQUEST or _buffer.age() >= _flush_interval():
+            flush_metrics()
+        return
+
     # Use thread lock to ensure thread safety when publishing metrics
     with _metric_lock:
         logger.debug(f"Publishing metric {name}: {value}")
@@ -87,6 +373,16 @@ def create_client_performance_metrics(
         is_success: Whether the operation succeeded
         error_type: Optional error type for failures
     """
+    if _is_buffering():
+        put_metric(f"{name}Latency", duration_ms, "Milliseconds")
+        if is_success:
+            put_metric(f"{name}Success", 1)
+        else:
+            put_metric(f"{name}Failure", 1)
+            if error_type:
+                put_metric(f"{name}Error.{error_type}", 1)
+        return
+
     # Use a single lock for all metrics to ensure they are published as a group
     with _metric_lock:
         # Get namespace from environment
@@ -139,3 +435,14 @@ def create_client_performance_metrics(
             logger.debug(f"Published {len(metric_data)} metrics for {name}")
         except Exception as e:
             logger.error(f"Error publishing performance metrics for {name}: {e}")
+
+
+def _flush_at_exit():
+    try:
+        flush_metrics()
+    except Exception as e:
+        logger.error(f"Error flushing metrics at exit: {e}")
+
+
+# Local scripts and the CLI run to completion, so flush whatever is left
+atexit.register(_flush_at_exit)
@@ -643,6 +643,13 @@ class Document:
         input_key = event.get("detail", {}).get("object", {}).get("key", "")
         initial_event_time = event.get("time", "")
 
+        # Admission hints for queue_processor: object size from the event,
+        # page count and priority from S3 metadata when the uploader sets them
+        admission_metadata: Dict[str, Any] = {}
+        object_size = event.get("detail", {}).get("object", {}).get("size")
+        if object_size is not None:
+            admission_metadata["object_size"] = object_size
+
         # Read S3 metadata to get configuration version if available
         config_version = None
         try:
@@ -657,6 +664,10 @@ class Document:
                 logger.info(f"Found config version in S3 metadata: {config_version}")
             else:
                 logger.info(f"No config-version found in metadata for {input_key}")
+            if metadata.get("page-count", "").isdigit():
+                admission_metadata["page_count"] = int(metadata["page-count"])
+            if metadata.get("priority"):
+                admission_metadata["priority"] = metadata["priority"].lower()
         except Exception as e:
             logger.warning(f"Could not read S3 metadata for {input_key}: {e}")
 
@@ -668,6 +679,7 @@ class Document:
             initial_event_time=initial_event_time,
             status=Status.QUEUED,
             config_version=config_version,  # Add config version to document
+            metadata=admission_metadata,
         )
 
     def to_json(self) -> str:
@@ -837,6 +849,9 @@ class Document:
         """
         Store full document in S3 and return lightweight wrapper for Step Functions.
 
+        The state object is JSON, or the compact ``idp-docstate`` binary format
+        when ``DOCUMENT_STATE_FORMAT=binary`` (see ``idp_common.document_state``).
+
         Args:
             bucket: S3 bucket to store the full document
             step_name: Name of the processing step (for unique S3 key)
@@ -844,29 +859,55 @@ class Document:
         Returns:
             Lightweight wrapper containing essential fields and section IDs for Map step
         """
+        return self._store_state(bucket, step_name, self.to_dict())
+
+    def _store_state(
+        self,
+        bucket: str,
+        step_name: str,
+        document_dict: Dict[str, Any],
+        document_json: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Write ``document_dict`` to S3 in the configured state format."""
         import logging
 
         import boto3
 
+        from idp_common import document_state
+
         logger = logging.getLogger(__name__)
         s3_client = boto3.client("s3")
 
+        binary = document_state.state_format() == document_state.BINARY_FORMAT
+        extension = "idpds" if binary else "json"
+
         # Generate unique S3 key with timestamp
         timestamp = str(int(time.time() * 1000))  # milliseconds for uniqueness
-        s3_key = f"compressed_documents/{self.id}/{timestamp}_{step_name}_state.json"
+        s3_key = (
+            f"compressed_documents/{self.id}/{timestamp}_{step_name}_state.{extension}"
+        )
 
         try:
             # Store full document in S3
-            full_document_json = self.to_json()
+            if binary:
+                body: Any = document_state.encode(document_dict)
+                content_type = "application/octet-stream"
+            else:
+                body = document_json or json.dumps(document_dict, default=str)
+                content_type = "application/json"
             s3_client.put_object(
                 Bucket=bucket,
                 Key=s3_key,
-                Body=full_document_json,
-                ContentType="application/json",
+                Body=body,
+                ContentType=content_type,
             )
 
             s3_uri = f"s3://{bucket}/{s3_key}"
-            logger.info(f"Compressed document {self.id} to {s3_uri}")
+            state_bytes = len(body) if binary else len(body.encode("utf-8"))
+            logger.info(
+                f"Compressed document {self.id} to {s3_uri} "
+                f"({extension}, {state_bytes} bytes)"
+            )
 
             # Create lightweight wrapper with just section IDs for Map step
             # This significantly reduces payload size for large documents
@@ -891,13 +932,23 @@ class Document:
             raise
 
     @classmethod
-    def decompress(cls, bucket: str, compressed_data: Dict[str, Any]) -> "Document":
+    def decompress(
+        cls,
+        bucket: str,
+        compressed_data: Dict[str, Any],
+        section_ids: Optional[List[str]] = None,
+    ) -> "Document":
         """
         Restore full Document from S3 using compressed wrapper data.
 
+        Reads both the JSON and the ``idp-docstate`` binary state formats.
+
         Args:
             bucket: S3 bucket containing the compressed document
             compressed_data: Lightweight wrapper from compress() method
+            section_ids: Optional section IDs to hydrate. When given, the
+                document only contains those sections and the pages they
+                reference; with the binary format the rest is never decoded.
 
         Returns:
             Full Document object with all content restored
@@ -906,6 +957,7 @@ class Document:
 
         import boto3
 
+        from idp_common import document_state
         from idp_common.utils import parse_s3_uri
 
         logger = logging.getLogger(__name__)
@@ -921,12 +973,34 @@ class Document:
 
             # Retrieve full document from S3
             response = s3_client.get_object(Bucket=bucket, Key=s3_key)
-            document_json = response["Body"].read().decode("utf-8")
+            data = response["Body"].read()
 
             # Restore full document
-            document = cls.from_json(document_json)
-
-            logger.info(f"Decompressed document {document.id} from {s3_uri}")
+            started = time.perf_counter()
+            if document_state.is_binary_state(data):
+                state_format = document_state.FORMAT_NAME
+                document_dict = document_state.decode(data, section_ids)
+            else:
+                state_format = document_state.JSON_FORMAT
+                document_dict = json.loads(data.decode("utf-8"))
+                if section_ids is not None:
+                    document_dict = document_state.filter_sections(
+                        document_dict, section_ids
+                    )
+            document = cls.from_dict(document_dict)
+            load_ms = (time.perf_counter() - started) * 1000
+
+            hydrated = (
+                f", {len(document.sections)} of "
+                f"{len(compressed_data.get('sections') or [])} sections hydrated"
+                if section_ids is not None
+                else ""
+            )
+            logger.info(
+                f"Decompressed document {document.id} from {s3_uri} "
+                f"({state_format}, {len(data)} bytes, loaded in {load_ms:.1f} ms"
+                f"{hydrated})"
+            )
             return document
 
         except Exception as e:
@@ -953,7 +1027,7 @@ class Document:
             return cls.from_dict(data)
 
     @classmethod
-    def load_document(cls, event_data, working_bucket, logger=None):
+    def load_document(cls, event_data, working_bucket, logger=None, section_ids=None):
         """
         Utility method to handle document input from Lambda events.
         Automatically handles both compressed and uncompressed documents.
@@ -962,6 +1036,9 @@ class Document:
             event_data: The document data from the Lambda event
             working_bucket: S3 bucket for decompression
             logger: Optional logger for debug messages
+            section_ids: Optional section IDs to hydrate (e.g. the one section
+                a Map iteration processes). The document then only contains
+                those sections and their pages.
 
         Returns:
             Document: The document instance
@@ -969,12 +1046,31 @@ class Document:
         if isinstance(event_data, dict) and event_data.get("compressed") is True:
             if logger:
                 logger.info("Decompressed document from S3")
-            return cls.decompress(working_bucket, event_data)
+            return cls.decompress(working_bucket, event_data, section_ids=section_ids)
         else:
             if logger:
                 logger.info("Loaded uncompressed document")
+            if section_ids is not None and isinstance(event_data, dict):
+                from idp_common import document_state
+
+                event_data = document_state.filter_sections(event_data, section_ids)
             return cls.from_dict(event_data)
 
+    @staticmethod
+    def section_ids_from_event(event_data) -> List[str]:
+        """
+        Section IDs, in document order, of a compressed or uncompressed document.
+
+        Reads the compressed wrapper's Map list without touching S3, so a Map
+        iteration can locate its section before hydrating only that section.
+        """
+        if not isinstance(event_data, dict):
+            return []
+        sections = event_data.get("sections") or []
+        if event_data.get("compressed") is True:
+            return [str(s) for s in sections]
+        return [str(s.get("section_id")) for s in sections if isinstance(s, dict)]
+
     def serialize_document(
         self, working_bucket, step_name, logger=None, size_threshold_kb=0
     ):
@@ -991,24 +1087,38 @@ class Document:
         Returns:
             dict: Response data with either compressed reference or document dict
         """
-        document_json = json.dumps(self.to_dict(), default=str)
-        document_size = len(document_json.encode("utf-8"))
-        threshold_bytes = size_threshold_kb * 1024
+        from idp_common import document_state
 
-        if logger:
-            logger.info(f"Document size after {step_name}: {document_size} bytes")
+        # Build the dict (and the JSON, when it is needed) once and reuse it
+        # for the size check and the stored state.
+        document_dict = self.to_dict()
+        threshold_bytes = size_threshold_kb * 1024
+        binary = document_state.state_format() == document_state.BINARY_FORMAT
+        document_json = None
+        if threshold_bytes or not working_bucket or not binary:
+            document_json = json.dumps(document_dict, default=str)
+            document_size = len(document_json.encode("utf-8"))
+            if logger:
+                logger.info(f"Document size after {step_name}: {document_size} bytes")
+        else:
+            # Always compressing to binary state: the JSON size is never used
+            document_size = threshold_bytes + 1
 
         # Compress if document is larger than threshold (default 0KB means always compress)
         if working_bucket and document_size > threshold_bytes:
             if logger:
                 logger.info(
                     f"Document size ({document_size} bytes) exceeds {size_threshold_kb}KB threshold, compressing to S3"
+                    if document_json is not None
+                    else f"Compressing document state after {step_name} to S3"
                 )
-            compressed_data = self.compress(working_bucket, step_name)
+            compressed_data = self._store_state(
+                working_bucket, step_name, document_dict, document_json
+            )
             return compressed_data
         else:
             if logger:
                 logger.info(
                     f"Document size ({document_size} bytes) is under {size_threshold_kb}KB threshold, returning as JSON"
                 )
-            return self.to_dict()
+            return document_dict
@@ -7,6 +7,20 @@ OCR module for IDP Common Package.
 Provides a service for processing PDF documents with AWS Textract.
 """
 
-from idp_common.ocr.service import OcrService
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from idp_common.ocr.service import OcrService as OcrService
+
+
+def __getattr__(name):
+    """Lazy load OcrService so lightweight submodules (e.g. page_renderer, which
+    render worker processes import) do not pull in boto3 and Textract deps."""
+    if name == "OcrService":
+        from idp_common.ocr.service import OcrService
+
+        return OcrService
+    raise AttributeError(f"module 'idp_common.ocr' has no attribute '{name}'")
+
 
 __all__ = ["OcrService"]
@@ -0,0 +1,353 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+PDF page rendering for the OCR service.
+
+pypdfium2 (PDFium) is not thread-safe, so a single process can only render one
+page at a time. This module renders pages either in-process or, for large
+documents, across several worker processes. Each worker opens its own
+``PdfDocument`` from a shared file-backed copy of the PDF in the temp directory
+and renders a contiguous page range, streaming encoded JPEG pages back to the
+parent over a pipe.
+
+Worker processes use plain ``multiprocessing.Process`` + ``Pipe`` with the
+``spawn`` start method. ``multiprocessing.Pool``, ``Queue`` and
+``shared_memory`` all need ``/dev/shm``, which AWS Lambda does not provide.
+"""
+
+from __future__ import annotations
+
+import io
+import logging
+import multiprocessing
+import os
+import tempfile
+from multiprocessing.connection import wait
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import pypdfium2 as pdfium
+
+logger = logging.getLogger(__name__)
+
+# Spawning a worker costs roughly an interpreter start plus imports, so each
+# worker needs enough pages to amortize it.
+MIN_PAGES_PER_RENDER_PROCESS = 8
+
+
+def render_page_image(
+    page: pdfium.PdfPage,
+    is_pdf: bool,
+    page_id: int,
+    dpi: Optional[int] = None,
+    resize_config: Optional[Dict[str, Any]] = None,
+) -> bytes:
+    """
+    Extract image bytes from a page at optimal size to prevent memory issues.
+
+    If resize config is provided, images are extracted directly at target dimensions
+    to avoid creating oversized images that cause OutOfMemory errors.
+
+    Args:
+        page: pypdfium2 page object
+        is_pdf: Whether the document is a PDF file
+        page_id: Page number for logging
+        dpi: Rendering DPI for PDF pages (defaults to 150)
+        resize_config: Optional dict with ``target_width`` / ``target_height``
+
+    Returns:
+        Image bytes in JPEG format (at target size if resize config exists)
+    """
+    pil_img = None
+    try:
+        # Check if we should extract at target size to avoid memory issues
+        if resize_config:
+            target_width = resize_config.get("target_width")
+            target_height = resize_config.get("target_height")
+
+            if target_width and target_height:
+                # Get page dimensions to calculate scaling
+                # pypdfium2 page dimensions are in PDF points (1/72 inch)
+                page_width = page.get_width()
+                page_height = page.get_height()
+
+                if is_pdf:
+                    # For PDF files, calculate dimensions at specified DPI (default to 150 if None)
+                    dpi = dpi or 150
+                    original_width = int(page_width * (dpi / 72))
+                    original_height = int(page_height * (dpi / 72))
+                else:
+                    # For image files, use actual dimensions
+                    original_width = int(page_width)
+                    original_height = int(page_height)
+
+                # Apply same logic as image.resize_image - preserve aspect ratio, never upscale
+                width_ratio = target_width / original_width
+                height_ratio = target_height / original_height
+                scale_factor = min(width_ratio, height_ratio)  # Preserve aspect ratio
+
+                # Only resize if scale_factor < 1.0 (never upscale)
+                if scale_factor < 1.0:
+                    # Extract at reduced size using matrix transformation
+                    if is_pdf:
+                        # For PDF, combine DPI scaling with size reduction
+                        dpi = dpi or 150
+                        base_scale = dpi / 72  # Convert PDF points to pixels
+                        final_scale = base_scale * scale_factor
+                        matrix = final_scale
+                    else:
+                        # For images, just apply the scale factor
+                        matrix = scale_factor
+
+                    pil_img = page.render(scale=matrix).to_pil()  # type: ignore[attr-defined]
+
+                    actual_width, actual_height = pil_img.size
+                    logger.info(
+                        f"Extracted page {page_id} at target size: {actual_width}x{actual_height} (scale: {scale_factor:.3f})"
+                    )
+
+                else:
+                    # No resize needed - image is already smaller than targets
+                    if is_pdf:
+                        dpi = dpi or 150
+                        pil_img = page.render(scale=dpi / 72).to_pil()  # type: ignore[attr-defined]
+                    else:
+                        pil_img = page.render().to_pil()  # type: ignore[attr-defined]
+
+                    # Log actual extracted dimensions
+                    actual_width, actual_height = pil_img.size
+                    logger.info(
+                        f"Page {page_id} already fits target size, extracted at: {actual_width}x{actual_height}"
+                    )
+            else:
+                # No valid target dimensions - use original extraction
+                if is_pdf:
+                    dpi = dpi or 150
+                    pil_img = page.render(scale=dpi / 72).to_pil()  # type: ignore[attr-defined]
+                else:
+                    pil_img = page.render().to_pil()  # type: ignore[attr-defined]
+
+                # Log actual extracted dimensions
+                actual_width, actual_height = pil_img.size
+                logger.info(
+                    f"Page {page_id} extracted at original size: {actual_width}x{actual_height}"
+                )
+        else:
+            # No resize config - extract at original size
+            if is_pdf:
+                dpi = dpi or 150
+                pil_img = page.render(scale=dpi / 72).to_pil()  # type: ignore[attr-defined]
+            else:
+                pil_img = page.render().to_pil()  # type: ignore[attr-defined]
+
+            # Log actual extracted dimensions
+            actual_width, actual_height = pil_img.size
+            logger.info(
+                f"Page {page_id} extracted at original size: {actual_width}x{actual_height}"
+            )
+
+        img_buffer = io.BytesIO()
+        pil_img.save(img_buffer, format="JPEG", quality=95)
+        image_bytes = img_buffer.getvalue()
+        return image_bytes
+    finally:
+        # Cleanup pypdfium2 page rendering resources
+        if pil_img is not None:
+            pil_img = None
+
+
+def resolve_render_processes(requested: Optional[int], num_pages: int) -> int:
+    """
+    Resolve how many worker processes to render ``num_pages`` pages with.
+
+    Args:
+        requested: Configured process count. ``0`` means one per available CPU;
+            ``None`` or ``1`` means render in-process.
+        num_pages: Number of pages to render
+
+    Returns:
+        Number of worker processes to use; ``1`` means render in-process
+    """
+    if requested is None or requested == 1:
+        return 1
+    cpus = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else 0
+    cpus = cpus or os.cpu_count() or 1
+    processes = cpus if requested == 0 else min(requested, cpus)
+    processes = min(processes, num_pages // MIN_PAGES_PER_RENDER_PROCESS)
+    return max(processes, 1)
+
+
+def _flatten_and_render(
+    pdf_document: pdfium.PdfDocument,
+    page_index: int,
+    dpi: Optional[int],
+    resize_config: Optional[Dict[str, Any]],
+) -> bytes:
+    """Render one page of an open PDF, flattening form fields first."""
+    page = pdf_document[page_index]
+    # Flatten form fields into page content before rendering.
+    # Many fillable PDFs (e.g., government forms) lack appearance
+    # streams for form fields — flatten() forces PDFium to generate
+    # them and merge into page content so render() can display them.
+    # Only applies when PDF has form fields (formenv is set by init_forms).
+    if page.formenv is not None:
+        page.flatten()
+    return render_page_image(page, True, page_index + 1, dpi, resize_config)
+
+
+def _render_range_worker(
+    conn,
+    pdf_path: str,
+    page_indices: List[int],
+    dpi: Optional[int],
+    resize_config: Optional[Dict[str, Any]],
+) -> None:
+    """
+    Worker process entry point: render a contiguous page range.
+
+    Sends ``("page", index, jpeg_bytes)`` per rendered page, or
+    ``("error", index, message)`` and stops if a page fails to render.
+    ``send`` blocks once the pipe buffer is full, so a worker runs at most
+    about one page ahead of the parent.
+    """
+    pdf_document = None
+    try:
+        pdf_document = pdfium.PdfDocument(pdf_path)
+        pdf_document.init_forms()
+        for page_index in page_indices:
+            try:
+                img_bytes = _flatten_and_render(
+                    pdf_document, page_index, dpi, resize_config
+                )
+            except Exception as e:
+                conn.send(("error", page_index, str(e)))
+                return
+            conn.send(("page", page_index, img_bytes))
+    finally:
+        if pdf_document is not None:
+            pdf_document.close()
+        conn.close()
+
+
+def _split_contiguous(page_indices: List[int], parts: int) -> List[List[int]]:
+    """Split page indices into ``parts`` contiguous, near-equal ranges."""
+    size, remainder = divmod(len(page_indices), parts)
+    ranges = []
+    start = 0
+    for part in range(parts):
+        end = start + size + (1 if part < remainder else 0)
+        ranges.append(page_indices[start:end])
+        start = end
+    return [r for r in ranges if r]
+
+
+def iter_rendered_pages(
+    pdf_document: pdfium.PdfDocument,
+    page_indices: List[int],
+    dpi: Optional[int] = None,
+    resize_config: Optional[Dict[str, Any]] = None,
+    pdf_bytes: Optional[bytes] = None,
+    processes: int = 1,
+) -> Iterator[Tuple[int, bytes]]:
+    """
+    Render PDF pages, yielding ``(page_index, jpeg_bytes)`` as each page is ready.
+
+    With ``processes > 1`` and ``pdf_bytes`` available, pages are rendered by
+    worker processes, each owning a contiguous range of ``page_indices``, and
+    are yielded in completion order. Otherwise pages are rendered one by one
+    from ``pdf_document`` in the calling thread, in order.
+
+    If worker processes cannot be started, or a worker exits before finishing
+    its range, the remaining pages are rendered in-process from
+    ``pdf_document``, so callers always receive every page exactly once.
+
+    Args:
+        pdf_document: Open pypdfium2 document (form rendering initialized)
+        page_indices: Zero-based indices of pages to render
+        dpi: Rendering DPI for PDF pages
+        resize_config: Optional dict with ``target_width`` / ``target_height``
+        pdf_bytes: Raw PDF bytes shared with worker processes
+        processes: Number of worker processes (see ``resolve_render_processes``)
+
+    Yields:
+        Tuples of (zero-based page index, JPEG bytes)
+
+    Raises:
+        RuntimeError: If a worker process fails to render a page
+    """
+    if processes <= 1 or pdf_bytes is None or len(page_indices) < 2:
+        for page_index in page_indices:
+            yield (
+                page_index,
+                _flatten_and_render(pdf_document, page_index, dpi, resize_config),
+            )
+        return
+
+    ranges = _split_contiguous(page_indices, processes)
+    remaining: Dict[Any, List[int]] = {}
+    workers = []
+    fd, pdf_path = tempfile.mkstemp(suffix=".pdf")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(pdf_bytes)
+
+        try:
+            ctx = multiprocessing.get_context("spawn")
+            for page_range in ranges:
+                parent_conn, child_conn = ctx.Pipe(duplex=False)
+                proc = ctx.Process(
+                    target=_render_range_worker,
+                    args=(child_conn, pdf_path, page_range, dpi, resize_config),
+                    daemon=True,
+                )
+                proc.start()
+                child_conn.close()
+                workers.append(proc)
+                remaining[parent_conn] = list(page_range)
+        except Exception as e:
+            logger.warning(
+                f"Could not start render worker processes ({e}), "
+                f"rendering in-process instead"
+            )
+
+        logger.info(
+            f"Rendering {len(page_indices)} pages with {len(workers)} worker processes"
+        )
+        unstarted = [i for r in ranges[len(workers) :] for i in r]
+
+        while remaining:
+            for conn in wait(list(remaining)):
+                try:
+                    kind, page_index, payload = conn.recv()
+                except EOFError:
+                    # Worker exited; anything it did not send is rendered below
+                    unstarted.extend(remaining.pop(conn))
+                    conn.close()
+                    continue
+                if kind == "error":
+                    raise RuntimeError(
+                        f"Error rendering page {page_index + 1}: {payload}"
+                    )
+                remaining[conn].remove(page_index)
+                yield page_index, payload
+
+        if unstarted:
+            logger.warning(
+                f"Rendering {len(unstarted)} pages in-process after worker failure"
+            )
+            for page_index in sorted(unstarted):
+                yield (
+                    page_index,
+                    _flatten_and_render(pdf_document, page_index, dpi, resize_config),
+                )
+    finally:
+        for conn in remaining:
+            conn.close()
+        for proc in workers:
+            if proc.is_alive():
+                proc.terminate()
+            proc.join()
+        try:
+            os.unlink(pdf_path)
+        except OSError:
+            pass
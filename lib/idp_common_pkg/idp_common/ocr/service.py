@@ -18,7 +18,7 @@ import logging
 import os
 import threading
 import time
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 import boto3
 import pypdfium2 as pdfium
@@ -28,6 +28,11 @@ from idp_common import bedrock, image, s3, utils
 from idp_common.config.models import IDPConfig
 from idp_common.models import Document, Page, Status
 from idp_common.ocr.document_converter import DocumentConverter
+from idp_common.ocr.page_renderer import (
+    iter_rendered_pages,
+    render_page_image,
+    resolve_render_processes,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -41,12 +46,15 @@ class OcrService:
         config: Optional[Union[Dict[str, Any], "IDPConfig"]] = None,
         backend: Optional[str] = None,
         max_workers: Optional[int] = None,
+        max_inflight_pages: Optional[int] = None,
+        render_processes: Optional[int] = None,
         # Deprecated parameters for backward compatibility
         enhanced_features: Optional[Union[bool, List[str]]] = None,
         dpi: Optional[int] = None,
         resize_config: Optional[Dict[str, Any]] = None,
         bedrock_config: Optional[Dict[str, Any]] = None,
         preprocessing_config: Optional[Dict[str, Any]] = None,
+        cache_scope: Optional[str] = None,
     ):
         """
         Initialize the OCR service.
@@ -56,6 +64,12 @@ class OcrService:
             config: Configuration dictionary or IDPConfig model containing all OCR settings
             backend: OCR backend to use ("textract", "bedrock", or "none")
             max_workers: Maximum number of concurrent workers for page processing
+            max_inflight_pages: Maximum number of rendered page images waiting for
+                or undergoing OCR at once (defaults to 2 x max_workers)
+            render_processes: Number of worker processes used to render PDF pages
+                (1 renders in-process, 0 uses one per available CPU)
+            cache_scope: Optional Bedrock response cache scope (normally the
+                document's config version)
 
             Deprecated parameters (use config instead):
             enhanced_features: Controls Textract FeatureTypes for analyze_document API
@@ -67,6 +81,8 @@ class OcrService:
         Raises:
             ValueError: If invalid features are specified or if an invalid backend is specified
         """
+        self.cache_scope = cache_scope
+
         # Handle backward compatibility
         if config is None and any(
             [
@@ -84,6 +100,10 @@ class OcrService:
             # Use old parameters
             self.region = region or os.environ.get("AWS_REGION", "us-east-1")
             self.max_workers = max_workers or 20
+            self.max_inflight_pages = max_inflight_pages or self.max_workers * 2
+            self.render_processes = (
+                render_processes if render_processes is not None else 1
+            )
             self.dpi = dpi
             self.resize_config = resize_config
             self.backend = (backend or "textract").lower()
@@ -109,6 +129,20 @@ class OcrService:
             # Extract max_workers (automatic int conversion)
             self.max_workers = max_workers or self.config.ocr.max_workers
 
+            # Bound on rendered page images held in memory ahead of OCR
+            self.max_inflight_pages = (
+                max_inflight_pages
+                or self.config.ocr.max_inflight_pages
+                or self.max_workers * 2
+            )
+
+            # Worker processes for PDF page rendering (1 = in-process)
+            self.render_processes = (
+                render_processes
+                if render_processes is not None
+                else self.config.ocr.render_processes
+            )
+
             # Extract DPI from image configuration (Pydantic handles type conversion!)
             self.dpi = self.config.ocr.image.dpi
 
@@ -459,90 +493,9 @@ class OcrService:
                             f"rendering and processing {len(pages_to_render)} remaining pages"
                         )
 
-                    # Phase 1: Render ONLY needed page images SEQUENTIALLY
-                    # pypdfium2 (PDFium) is not thread-safe for concurrent access
-                    # to the same PdfDocument, so we render pages first, then
-                    # process OCR in parallel (which is the I/O-bound bottleneck).
-                    logger.info(
-                        f"Rendering {len(pages_to_render)} of {num_pages} page images sequentially (pypdfium2 is not thread-safe)"
+                    self._render_and_ocr_pages(
+                        document, pdf_document, pages_to_render, file_content
                     )
-                    page_images: Dict[int, bytes] = {}
-                    for i in pages_to_render:
-                        page = pdf_document[i]
-                        # Flatten form fields into page content before rendering.
-                        # Many fillable PDFs (e.g., government forms) lack appearance
-                        # streams for form fields — flatten() forces PDFium to generate
-                        # them and merge into page content so render() can display them.
-                        # Only applies when PDF has form fields (formenv is set by init_forms).
-                        if page.formenv is not None:
-                            page.flatten()
-                        page_images[i] = self._extract_page_image(page, True, i + 1)
-
-                    pdf_document.close()
-                    logger.info(f"Rendered {len(page_images)} page images")
-
-                    # Phase 2: Process OCR in PARALLEL (Textract/Bedrock API calls are I/O-bound)
-                    with concurrent.futures.ThreadPoolExecutor(
-                        max_workers=self.max_workers
-                    ) as executor:
-                        future_to_page = {
-                            executor.submit(
-                                self._process_page_with_image,
-                                i,
-                                page_images[i],
-                                document.output_bucket,
-                                document.input_key,
-                            ): i
-                            for i in page_images
-                        }
-
-                        # Start memory monitoring in background thread
-                        memory_monitor_shutdown = self._start_memory_monitoring()
-                        completed_pages = 0
-
-                        try:
-                            for future in concurrent.futures.as_completed(
-                                future_to_page
-                            ):
-                                page_index = future_to_page[future]
-                                page_id = str(page_index + 1)
-                                try:
-                                    ocr_result, page_metering = future.result()
-
-                                    document.pages[page_id] = Page(
-                                        page_id=page_id,
-                                        image_uri=ocr_result["image_uri"],
-                                        raw_text_uri=ocr_result["raw_text_uri"],
-                                        parsed_text_uri=ocr_result["parsed_text_uri"],
-                                        text_confidence_uri=ocr_result[
-                                            "text_confidence_uri"
-                                        ],
-                                        ocr_page_data_uri=ocr_result.get(
-                                            "ocr_page_data_uri"
-                                        ),
-                                    )
-
-                                    document.metering = utils.merge_metering_data(
-                                        document.metering, page_metering
-                                    )
-                                    completed_pages += 1
-
-                                except Exception as e:
-                                    import traceback
-
-                                    error_msg = f"Error processing page {page_index + 1}: {str(e)}"
-                                    stack_trace = traceback.format_exc()
-                                    logger.error(
-                                        f"{error_msg}\nStack trace:\n{stack_trace}"
-                                    )
-                                    document.errors.append(
-                                        f"{error_msg} (see logs for full trace)"
-                                    )
-                        finally:
-                            memory_monitor_shutdown.set()
-
-                    # Free page images after OCR processing
-                    page_images.clear()
 
                 else:
                     # Image files - single page, no threading needed
@@ -595,6 +548,205 @@ class OcrService:
         )
         return document
 
+    def _render_and_ocr_pages(
+        self,
+        document: Document,
+        pdf_document: pdfium.PdfDocument,
+        pages_to_render: List[int],
+        pdf_bytes: Optional[bytes] = None,
+    ) -> None:
+        """
+        Render PDF pages and OCR them as a bounded producer/consumer pipeline.
+
+        pypdfium2 (PDFium) is not thread-safe for concurrent access to the same
+        PdfDocument, so pages are rendered sequentially on the calling thread
+        (the producer), or by worker processes when ``render_processes`` is set
+        (see ``_iter_rendered_pages``). Each rendered page is handed to the OCR thread pool
+        immediately, so the I/O-bound Textract/Bedrock calls for page 1 start
+        while page 2 is still rendering. At most ``max_inflight_pages`` rendered
+        images are held at once: the producer blocks until an OCR worker
+        finishes a page, which bounds peak memory for very large PDFs.
+
+        The PDF document is closed once all pages have been rendered.
+
+        Args:
+            document: Document to update with page results, metering and errors
+            pdf_document: Open pypdfium2 document
+            pages_to_render: Zero-based indices of the pages to process
+            pdf_bytes: Raw PDF bytes, shared with render worker processes
+        """
+        budget = max(1, min(self.max_inflight_pages, len(pages_to_render) or 1))
+        inflight_slots = threading.BoundedSemaphore(budget)
+        stats: Dict[str, Any] = {
+            "inflight_pages": 0,
+            "peak_inflight_pages": 0,
+            "peak_memory_mb": 0.0,
+        }
+        stats_lock = threading.Lock()
+
+        def _page_started():
+            with stats_lock:
+                stats["inflight_pages"] += 1
+                stats["peak_inflight_pages"] = max(
+                    stats["peak_inflight_pages"], stats["inflight_pages"]
+                )
+
+        def _page_finished(_future):
+            with stats_lock:
+                stats["inflight_pages"] -= 1
+            inflight_slots.release()
+
+        logger.info(
+            f"Rendering {len(pages_to_render)} of {document.num_pages} page images "
+            f"sequentially (pypdfium2 is not thread-safe) and streaming them to OCR "
+            f"with {self.max_workers} workers, max {budget} pages in flight"
+        )
+
+        # Start memory monitoring in background thread
+        memory_monitor_shutdown = self._start_memory_monitoring(stats)
+        t_start = time.time()
+        render_seconds = 0.0
+        first_submit_time: Optional[float] = None
+        render_done_time = t_start
+        future_to_page: Dict[concurrent.futures.Future, int] = {}
+
+        try:
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.max_workers
+            ) as executor:
+                rendered_pages = self._iter_rendered_pages(
+                    pdf_document, pages_to_render, pdf_bytes
+                )
+                try:
+                    while True:
+                        # Wait for an OCR worker to free a slot before rendering more
+                        inflight_slots.acquire()
+                        try:
+                            t_render = time.time()
+                            rendered = next(rendered_pages, None)
+                            if rendered is None:
+                                inflight_slots.release()
+                                break
+                            i, img_bytes = rendered
+                            render_seconds += time.time() - t_render
+
+                            _page_started()
+                            future = executor.submit(
+                                self._process_page_with_image,
+                                i,
+                                img_bytes,
+                                document.output_bucket,
+                                document.input_key,
+                            )
+                        except BaseException:
+                            inflight_slots.release()
+                            raise
+                        if first_submit_time is None:
+                            first_submit_time = time.time()
+                        future.add_done_callback(_page_finished)
+                        future_to_page[future] = i
+                        # Drop our reference so the image is freed once OCR completes
+                        img_bytes = None
+                        rendered = None
+                finally:
+                    rendered_pages.close()
+                    pdf_document.close()
+                    render_done_time = time.time()
+
+                logger.info(f"Rendered {len(future_to_page)} page images")
+
+                for future in concurrent.futures.as_completed(future_to_page):
+                    page_index = future_to_page[future]
+                    page_id = str(page_index + 1)
+                    try:
+                        ocr_result, page_metering = future.result()
+
+                        document.pages[page_id] = Page(
+                            page_id=page_id,
+                            image_uri=ocr_result["image_uri"],
+                            raw_text_uri=ocr_result["raw_text_uri"],
+                            parsed_text_uri=ocr_result["parsed_text_uri"],
+                            text_confidence_uri=ocr_result["text_confidence_uri"],
+                            ocr_page_data_uri=ocr_result.get("ocr_page_data_uri"),
+                        )
+
+                        document.metering = utils.merge_metering_data(
+                            document.metering, page_metering
+                        )
+
+                    except Exception as e:
+                        import traceback
+
+                        error_msg = f"Error processing page {page_index + 1}: {str(e)}"
+                        stack_trace = traceback.format_exc()
+                        logger.error(f"{error_msg}\nStack trace:\n{stack_trace}")
+                        document.errors.append(f"{error_msg} (see logs for full trace)")
+        finally:
+            memory_monitor_shutdown.set()
+
+        # Overlap is the time OCR workers were busy while rendering was still
+        # running, i.e. the idle time the pipeline saved versus render-then-OCR.
+        total_seconds = time.time() - t_start
+        overlap_seconds = (
+            max(0.0, render_done_time - first_submit_time)
+            if first_submit_time is not None
+            else 0.0
+        )
+        logger.info(
+            f"OCR pipeline: {len(future_to_page)} pages in {total_seconds:.2f}s "
+            f"(render {render_seconds:.2f}s, OCR overlapped rendering for "
+            f"{overlap_seconds:.2f}s), peak in-flight pages "
+            f"{stats['peak_inflight_pages']}/{budget}, "
+            f"peak memory {stats['peak_memory_mb']:.1f} MB"
+        )
+
+    def _iter_rendered_pages(
+        self,
+        pdf_document: pdfium.PdfDocument,
+        pages_to_render: List[int],
+        pdf_bytes: Optional[bytes] = None,
+    ) -> Iterator[Tuple[int, bytes]]:
+        """
+        Yield ``(page_index, jpeg_bytes)`` for each page as it is rendered.
+
+        When ``render_processes`` resolves to more than one process for this
+        document, pages are rendered in parallel by worker processes that each
+        open their own PdfDocument (see ``page_renderer.iter_rendered_pages``).
+        Otherwise pages are rendered in order on the calling thread.
+
+        Args:
+            pdf_document: Open pypdfium2 document
+            pages_to_render: Zero-based indices of the pages to render
+            pdf_bytes: Raw PDF bytes, shared with render worker processes
+
+        Yields:
+            Tuples of (zero-based page index, JPEG bytes)
+        """
+        processes = resolve_render_processes(
+            self.render_processes, len(pages_to_render)
+        )
+        if processes > 1 and pdf_bytes is not None:
+            yield from iter_rendered_pages(
+                pdf_document,
+                pages_to_render,
+                dpi=self.dpi,
+                resize_config=self.resize_config,
+                pdf_bytes=pdf_bytes,
+                processes=processes,
+            )
+            return
+
+        for i in pages_to_render:
+            page = pdf_document[i]
+            # Flatten form fields into page content before rendering.
+            # Many fillable PDFs (e.g., government forms) lack appearance
+            # streams for form fields — flatten() forces PDFium to generate
+            # them and merge into page content so render() can display them.
+            # Only applies when PDF has form fields (formenv is set by init_forms).
+            if page.formenv is not None:
+                page.flatten()
+            yield i, self._extract_page_image(page, True, i + 1)
+
     def _feature_combo(self):
         """Return the pricing feature combination string based on enhanced_features.
 
@@ -933,6 +1085,7 @@ class OcrService:
                 reasoning_effort=getattr(self.config.ocr, "reasoning_effort", None)
                 if hasattr(self, "config")
                 else None,
+                cache_scope=getattr(self, "cache_scope", None),
                 context="OCR",
                 model_lambda_hook_arn=getattr(
                     self.config.ocr, "model_lambda_hook_arn", None
@@ -1122,9 +1275,9 @@ class OcrService:
         """
         Process a single page using pre-rendered image bytes.
 
-        This method is used in the thread-safe two-phase approach: page images are
-        rendered sequentially (pypdfium2 is not thread-safe), then this method is
-        called in parallel threads for the I/O-bound OCR processing.
+        This method is the consumer side of the render/OCR pipeline: page images are
+        rendered sequentially (pypdfium2 is not thread-safe) and each one is handed
+        to this method on a worker thread for the I/O-bound OCR processing.
 
         Args:
             page_index: Zero-based index of the page
@@ -1211,6 +1364,7 @@ class OcrService:
                 reasoning_effort=getattr(self.config.ocr, "reasoning_effort", None)
                 if hasattr(self, "config")
                 else None,
+                cache_scope=getattr(self, "cache_scope", None),
                 context="OCR",
                 model_lambda_hook_arn=getattr(
                     self.config.ocr, "model_lambda_hook_arn", None
@@ -1354,10 +1508,15 @@ class OcrService:
 
         return result, metering
 
-    def _start_memory_monitoring(self):
+    def _start_memory_monitoring(self, stats: Optional[Dict[str, Any]] = None):
         """
         Start background memory monitoring that logs usage every 5 seconds.
 
+        Args:
+            stats: Optional pipeline stats dict. When provided, the monitor records
+                the highest observed RSS in ``stats["peak_memory_mb"]`` and includes
+                the current ``stats["inflight_pages"]`` count in its log line.
+
         Returns:
             Event object that can be set to stop monitoring
         """
@@ -1376,7 +1535,16 @@ class OcrService:
                     memory_info = process.memory_info()
                     memory_mb = memory_info.rss / (1024 * 1024)  # Convert to MB
 
-                    logger.info(f"Memory usage: {memory_mb:.1f} MB")
+                    if stats is not None:
+                        stats["peak_memory_mb"] = max(
+                            stats.get("peak_memory_mb", 0.0), memory_mb
+                        )
+                        logger.info(
+                            f"Memory usage: {memory_mb:.1f} MB "
+                            f"({stats.get('inflight_pages', 0)} pages in flight)"
+                        )
+                    else:
+                        logger.info(f"Memory usage: {memory_mb:.1f} MB")
 
                     # Warning if memory usage is getting high
                     if memory_mb > 3500:
@@ -1541,104 +1709,7 @@ class OcrService:
         Returns:
             Image bytes in JPEG format (at target size if resize config exists)
         """
-        pil_img = None
-        try:
-            # Check if we should extract at target size to avoid memory issues
-            if self.resize_config:
-                target_width = self.resize_config.get("target_width")
-                target_height = self.resize_config.get("target_height")
-
-                if target_width and target_height:
-                    # Get page dimensions to calculate scaling
-                    # pypdfium2 page dimensions are in PDF points (1/72 inch)
-                    page_width = page.get_width()
-                    page_height = page.get_height()
-
-                    if is_pdf:
-                        # For PDF files, calculate dimensions at specified DPI (default to 150 if None)
-                        dpi = self.dpi or 150
-                        original_width = int(page_width * (dpi / 72))
-                        original_height = int(page_height * (dpi / 72))
-                    else:
-                        # For image files, use actual dimensions
-                        original_width = int(page_width)
-                        original_height = int(page_height)
-
-                    # Apply same logic as image.resize_image - preserve aspect ratio, never upscale
-                    width_ratio = target_width / original_width
-                    height_ratio = target_height / original_height
-                    scale_factor = min(
-                        width_ratio, height_ratio
-                    )  # Preserve aspect ratio
-
-                    # Only resize if scale_factor < 1.0 (never upscale)
-                    if scale_factor < 1.0:
-                        # Extract at reduced size using matrix transformation
-                        if is_pdf:
-                            # For PDF, combine DPI scaling with size reduction
-                            dpi = self.dpi or 150
-                            base_scale = dpi / 72  # Convert PDF points to pixels
-                            final_scale = base_scale * scale_factor
-                            matrix = final_scale
-                        else:
-                            # For images, just apply the scale factor
-                            matrix = scale_factor
-
-                        pil_img = page.render(scale=matrix).to_pil()  # type: ignore[attr-defined]
-
-                        actual_width, actual_height = pil_img.size
-                        logger.info(
-                            f"Extracted page {page_id} at target size: {actual_width}x{actual_height} (scale: {scale_factor:.3f})"
-                        )
-
-                    else:
-                        # No resize needed - image is already smaller than targets
-                        if is_pdf:
-                            dpi = self.dpi or 150
-                            pil_img = page.render(scale=dpi / 72).to_pil()  # type: ignore[attr-defined]
-                        else:
-                            pil_img = page.render().to_pil()  # type: ignore[attr-defined]
-
-                        # Log actual extracted dimensions
-                        actual_width, actual_height = pil_img.size
-                        logger.info(
-                            f"Page {page_id} already fits target size, extracted at: {actual_width}x{actual_height}"
-                        )
-                else:
-                    # No valid target dimensions - use original extraction
-                    if is_pdf:
-                        dpi = self.dpi or 150
-                        pil_img = page.render(scale=dpi / 72).to_pil()  # type: ignore[attr-defined]
-                    else:
-                        pil_img = page.render().to_pil()  # type: ignore[attr-defined]
-
-                    # Log actual extracted dimensions
-                    actual_width, actual_height = pil_img.size
-                    logger.info(
-                        f"Page {page_id} extracted at original size: {actual_width}x{actual_height}"
-                    )
-            else:
-                # No resize config - extract at original size
-                if is_pdf:
-                    dpi = self.dpi or 150
-                    pil_img = page.render(scale=dpi / 72).to_pil()  # type: ignore[attr-defined]
-                else:
-                    pil_img = page.render().to_pil()  # type: ignore[attr-defined]
-
-                # Log actual extracted dimensions
-                actual_width, actual_height = pil_img.size
-                logger.info(
-                    f"Page {page_id} extracted at original size: {actual_width}x{actual_height}"
-                )
-
-            img_buffer = io.BytesIO()
-            pil_img.save(img_buffer, format="JPEG", quality=95)
-            image_bytes = img_buffer.getvalue()
-            return image_bytes
-        finally:
-            # Cleanup pypdfium2 page rendering resources
-            if pil_img is not None:
-                pil_img = None
+        return render_page_image(page, is_pdf, page_id, self.dpi, self.resize_config)
 
     def _process_single_page_bedrock(
         self,
@@ -1707,6 +1778,7 @@ class OcrService:
             reasoning_effort=getattr(self.config.ocr, "reasoning_effort", None)
             if hasattr(self, "config")
             else None,
+            cache_scope=getattr(self, "cache_scope", None),
             context="OCR",
             model_lambda_hook_arn=getattr(
                 self.config.ocr, "model_lambda_hook_arn", None
@@ -2560,6 +2632,7 @@ class OcrService:
                     reasoning_effort=getattr(self.config.ocr, "reasoning_effort", None)
                     if hasattr(self, "config")
                     else None,
+                    cache_scope=getattr(self, "cache_scope", None),
                     context="OCR",
                 )
                 return bedrock.extract_text_from_response(response_with_metering)
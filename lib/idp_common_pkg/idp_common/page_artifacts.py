@@ -0,0 +1,223 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Concurrent loading of per-page artifacts (OCR text, page images, OCR
+confidence data) for the classification, extraction and assessment steps.
+
+Each step needs the same few S3 objects for every page of a section before its
+first model call. Fetching them one page at a time costs one S3 round trip per
+artifact, so a 100-page section waits on 300+ serial GETs. ``PageArtifactLoader``
+issues all of a step's fetches at once on a bounded thread pool, fetches each
+distinct URI only once, and returns a ``PageArtifactBundle`` keyed by page id
+along with per-artifact fetch timings.
+
+Fetches go through ``idp_common.s3`` and ``idp_common.image`` so they behave
+exactly like the serial loops they replace (JSON text unwrapping, image
+resizing, error logging).
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from idp_common import image, s3
+from idp_common.models import Document
+
+logger = logging.getLogger(__name__)
+
+# Matches botocore's default max_pool_connections for the shared S3 client, so
+# workers never wait on (or discard) pooled connections.
+DEFAULT_MAX_WORKERS = 10
+
+TEXT = "text"
+IMAGE = "image"
+CONFIDENCE = "confidence"
+
+
+@dataclass
+class PageArtifacts:
+    """Artifacts loaded for a single page.
+
+    ``None`` means the artifact was not requested, the page has no URI for it,
+    or the fetch failed; failures are recorded in ``errors`` by artifact kind.
+    """
+
+    page_id: str
+    text: Optional[str] = None
+    image: Optional[bytes] = None
+    confidence: Optional[Any] = None
+    errors: Dict[str, Exception] = field(default_factory=dict)
+
+
+@dataclass
+class PageArtifactBundle:
+    """All artifacts loaded for one step, keyed by page id in request order."""
+
+    pages: Dict[str, PageArtifacts] = field(default_factory=dict)
+    missing_page_ids: List[str] = field(default_factory=list)
+    # Cumulative fetch seconds per artifact kind, plus "wall" for the whole load
+    timings: Dict[str, float] = field(default_factory=dict)
+    requested: int = 0
+    fetched: int = 0
+
+    def texts(self) -> Dict[str, str]:
+        """Page id -> text for pages whose text loaded."""
+        return {
+            page_id: artifacts.text
+            for page_id, artifacts in self.pages.items()
+            if artifacts.text is not None
+        }
+
+    def images(self) -> List[bytes]:
+        """Loaded images in page order, skipping pages without one."""
+        return [a.image for a in self.pages.values() if a.image is not None]
+
+    def confidence(self) -> Dict[str, Any]:
+        """Page id -> confidence data for pages whose confidence data loaded."""
+        return {
+            page_id: artifacts.confidence
+            for page_id, artifacts in self.pages.items()
+            if artifacts.confidence is not None
+        }
+
+    def raise_for_errors(self, kind: str) -> None:
+        """Re-raise the first (in page order) failure for an artifact kind."""
+        for artifacts in self.pages.values():
+            if kind in artifacts.errors:
+                raise artifacts.errors[kind]
+
+
+class PageArtifactLoader:
+    """
+    Fetch the page artifacts a processing step needs concurrently.
+
+    Example:
+        loader = PageArtifactLoader(step="extraction")
+        bundle = loader.load(
+            document,
+            sorted_page_ids,
+            text=True,
+            images=True,
+            image_size=(target_width, target_height),
+        )
+        page_id_to_text = bundle.texts()
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS, step: str = ""):
+        """
+        Initialize the loader.
+
+        Args:
+            max_workers: Maximum concurrent S3 fetches
+            step: Step name used in the timing log line
+        """
+        self.max_workers = max(1, max_workers)
+        self.step = step
+
+    def load(
+        self,
+        document: Document,
+        page_ids: Optional[Iterable[str]] = None,
+        text: bool = False,
+        images: bool = False,
+        image_size: Tuple[Optional[int], Optional[int]] = (None, None),
+        confidence: Optional[str] = None,
+    ) -> PageArtifactBundle:
+        """
+        Load the requested artifacts for the given pages.
+
+        Args:
+            document: Document whose pages hold the artifact URIs
+            page_ids: Page ids to load, in the order results should keep;
+                defaults to every page of the document
+            text: Load ``parsed_text_uri`` via ``s3.get_text_content``
+            images: Load ``image_uri`` via ``image.prepare_image``
+            image_size: ``(target_width, target_height)`` passed to prepare_image
+            confidence: ``"text"`` to load ``text_confidence_uri`` as raw text,
+                ``"json"`` to load it parsed, ``None`` to skip it
+
+        Returns:
+            PageArtifactBundle with one PageArtifacts per page found in the
+            document; requested page ids not in the document are listed in
+            ``missing_page_ids``
+        """
+        t0 = time.time()
+        page_ids = list(document.pages.keys() if page_ids is None else page_ids)
+        bundle = PageArtifactBundle()
+
+        # Work out every (kind, uri) the step needs, deduplicating repeated URIs
+        targets: Dict[Tuple[str, str], List[PageArtifacts]] = {}
+        for page_id in page_ids:
+            page = document.pages.get(page_id)
+            if page is None:
+                bundle.missing_page_ids.append(page_id)
+                continue
+            artifacts = bundle.pages.setdefault(page_id, PageArtifacts(page_id))
+            wanted = [
+                (TEXT, text and page.parsed_text_uri),
+                (IMAGE, images and page.image_uri),
+                (CONFIDENCE, confidence and page.text_confidence_uri),
+            ]
+            for kind, uri in wanted:
+                if uri:
+                    bundle.requested += 1
+                    targets.setdefault((kind, uri), []).append(artifacts)
+
+        fetchers: Dict[str, Callable[[str], Any]] = {
+            TEXT: s3.get_text_content,
+            IMAGE: lambda uri: image.prepare_image(uri, *image_size),
+            CONFIDENCE: (
+                s3.get_json_content if confidence == "json" else s3.get_text_content
+            ),
+        }
+        timings = {kind: 0.0 for kind in (TEXT, IMAGE, CONFIDENCE)}
+
+        def fetch(kind: str, uri: str) -> Tuple[Any, Optional[Exception], float]:
+            start = time.time()
+            try:
+                return fetchers[kind](uri), None, time.time() - start
+            except Exception as e:
+                return None, e, time.time() - start
+
+        if targets:
+            workers = min(self.max_workers, len(targets))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {key: executor.submit(fetch, *key) for key in targets.keys()}
+                for (kind, uri), future in futures.items():
+                    value, error, elapsed = future.result()
+                    timings[kind] += elapsed
+                    for artifacts in targets[(kind, uri)]:
+                        if error is not None:
+                            artifacts.errors[kind] = error
+                        else:
+                            setattr(artifacts, kind, value)
+
+        bundle.fetched = len(targets)
+        bundle.timings = {k: v for k, v in timings.items() if v}
+        bundle.timings["wall"] = time.time() - t0
+
+        fetch_times = ", ".join(
+            f"{kind} {seconds:.2f}s"
+            for kind, seconds in bundle.timings.items()
+            if kind != "wall"
+        )
+        logger.info(
+            f"Loaded {bundle.requested} page artifacts ({bundle.fetched} unique) "
+            f"for {len(bundle.pages)} pages"
+            f"{f' in {self.step}' if self.step else ''}: "
+            f"{bundle.timings['wall']:.2f}s wall"
+            f"{f' (cumulative fetch: {fetch_times})' if fetch_times else ''}"
+        )
+        if images:
+            cache_stats = image.get_image_cache_stats()
+            logger.info(
+                f"Resized image cache: {cache_stats['hit_ratio']:.0%} hit ratio "
+                f"({cache_stats['memory_hits']} memory, {cache_stats['s3_hits']} S3, "
+                f"{cache_stats['misses']} misses)"
+            )
+        return bundle
@@ -111,6 +111,7 @@ class SummarizationService:
         region: str = None,
         config: Union[Dict[str, Any], IDPConfig] = None,
         backend: str = "bedrock",
+        cache_scope: Optional[str] = None,
     ):
         """
         Initialize the summarization service.
@@ -119,6 +120,8 @@ class SummarizationService:
             region: AWS region for backend services
             config: Configuration dictionary or IDPConfig model
             backend: Summarization backend to use ('bedrock')
+            cache_scope: Optional Bedrock response cache scope (normally the
+                document's config version)
         """
         # Convert dict to IDPConfig if needed
         if config is not None and isinstance(config, dict):
@@ -130,6 +133,7 @@ class SummarizationService:
 
         self.config = config_model
         self.region = region or os.environ.get("AWS_REGION")
+        self.cache_scope = cache_scope
         self.backend = backend.lower()
 
         # Validate backend choice
@@ -210,6 +214,7 @@ class SummarizationService:
             context="Summarization",
             model_lambda_hook_arn=self.config.summarization.model_lambda_hook_arn,
             reasoning_effort=config.get("reasoning_effort"),
+            cache_scope=self.cache_scope,
         )
 
     def _create_error_summary(self, error_message: str) -> DocumentSummary:
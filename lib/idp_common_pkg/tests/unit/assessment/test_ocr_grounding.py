@@ -9,6 +9,7 @@ fuzzy / no-match), repeated-value spatial disambiguation, 0-1 coordinate correct
 graceful fallback when geometry is absent, and the full tree-walking enrichment.
 """
 
+import random
 from textwrap import dedent
 from unittest.mock import patch
 
@@ -339,6 +340,201 @@ class TestExactIndexFastPath:
         assert page["__exact_index_cache__"].get("x")  # normalized key indexed
 
 
+def _linear_candidates(
+    norm_value, value_tokens, page_data, page_num, variants, raw, hint
+):
+    """Reference per-line ladder the inverted index replaced (no index lookups)."""
+    norm_lines = [(g._normalize(ln.get("text")), ln) for ln in page_data["lines"]]
+    norm_variant_list = g._dedup_norm_variants(variants, norm_value)
+    candidates = []
+    for norm_text, line in norm_lines:
+        if not norm_text:
+            continue
+        best_tier, is_variant_only = None, True
+        for i, nv in enumerate(norm_variant_list):
+            if norm_text == nv:
+                tier = g._TIER_EXACT
+            elif nv in norm_text:
+                tier = g._TIER_SUBSTRING
+            elif norm_text in nv:
+                tier = g._TIER_PARTIAL
+            else:
+                continue
+            if best_tier is None or tier < best_tier:
+                best_tier, is_variant_only = tier, i != 0
+        if best_tier is not None:
+            src = g._SOURCE_NORMALIZED if is_variant_only else None
+            match = g._build_match(line, page_num, best_tier, src)
+            if match is not None:
+                candidates.append(match)
+            continue
+        if hint in (g.HINT_DATE, g.HINT_NUMBER, g.HINT_PHONE) and g._type_equal(
+            raw, line.get("text"), hint
+        ):
+            match = g._build_match(line, page_num, g._TIER_TYPED, g._SOURCE_NORMALIZED)
+            if match is not None:
+                candidates.append(match)
+    best = min((t for t, *_ in candidates), default=None)
+    if best is None or best > g._TIER_SPAN:
+        candidates.extend(g._collect_span_candidates(norm_value, norm_lines, page_num))
+    if candidates:
+        return candidates
+    for norm_text, line in norm_lines:
+        if norm_text and (
+            g._jaccard(value_tokens, g._tokens(norm_text)) >= g._FUZZY_MATCH_THRESHOLD
+        ):
+            candidates.append(g._build_match(line, page_num, g._TIER_FUZZY))
+    texts = [nt for nt, _ in norm_lines]
+    sims = g._levenshtein_sims(norm_value, texts, g._LEVENSHTEIN_MATCH_THRESHOLD)
+    for (norm_text, line), sim in zip(norm_lines, sims):
+        if norm_text and sim >= g._LEVENSHTEIN_MATCH_THRESHOLD:
+            candidates.append(
+                g._build_match(line, page_num, g._TIER_LEVENSHTEIN, g._SOURCE_FUZZY)
+            )
+    return candidates
+
+
+def _random_page(rng):
+    words = ["acme", "corp", "total", "due", "net", "invoice", "ltd", "paid", "x"]
+    texts = []
+    for _ in range(rng.randint(5, 40)):
+        kind = rng.random()
+        if kind < 0.1:
+            texts.append(f"{rng.randint(1, 12):02d}/{rng.randint(1, 28):02d}/2022")
+        elif kind < 0.2:
+            texts.append(f"Mar {rng.randint(1, 28)} 2022")
+        elif kind < 0.4:
+            texts.append(f"${rng.randint(1, 3000):,}.{rng.randint(0, 99):02d}")
+        elif kind < 0.5:
+            texts.append(f"(555) {rng.randint(100, 999)}-{rng.randint(1000, 9999)}")
+        elif kind < 0.55:
+            texts.append(rng.choice(["", " ", "-", "ab"]))
+        else:
+            texts.append(" ".join(rng.choices(words, k=rng.randint(1, 4))))
+    lines = [_line(t, 0.1, i / 50) for i, t in enumerate(texts)]
+    return _page(lines), texts
+
+
+def _random_value(rng, texts):
+    text = rng.choice([t for t in texts if t.strip()] or ["acme"])
+    kind = rng.random()
+    if kind < 0.2:
+        return text
+    if kind < 0.35 and len(text) > 4:  # fragment of a line
+        start = rng.randint(0, len(text) // 2)
+        return text[start : start + rng.randint(3, len(text) - start)]
+    if kind < 0.5:  # span of consecutive lines
+        i = texts.index(text)
+        return " ".join(texts[i : i + rng.randint(2, 3)])
+    if kind < 0.7 and len(text) > 3:  # OCR noise
+        pos = rng.randrange(len(text))
+        return text[:pos] + rng.choice("aeo1") + text[pos + 1 :]
+    if kind < 0.85:  # reformatted / typed
+        digits = g._digits(text)
+        if text.startswith("(555)"):
+            return f"+1 555 {digits[3:6]} {digits[6:]}"
+        if text.startswith("Mar"):
+            return f"2022-03-{int(text.split()[1]):02d}"
+        return rng.choice(["2022-03-04", "1234.5", "12", "7"])
+    return f"{text} {rng.choice(['corp', 'co', 'inc', 'paid in full'])}"
+
+
+class TestInvertedIndexEquivalence:
+    """Every tier draws its lines from the page's inverted index; the candidates
+    (tiers, boxes, provenance and order) must equal the plain per-line ladder."""
+
+    def test_matches_linear_ladder_on_random_pages(self):
+        rng = random.Random(11)
+        for _ in range(150):
+            page, texts = _random_page(rng)
+            for _ in range(12):
+                value = _random_value(rng, texts)
+                norm_value = g._normalize(value)
+                if not norm_value:
+                    continue
+                hint = g._resolve_hint(value, None)
+                args = (
+                    norm_value,
+                    g._tokens(norm_value),
+                    page,
+                    1,
+                    g._value_variants(value, hint),
+                    value,
+                    hint,
+                )
+                expected = _linear_candidates(*args)
+                got = g._collect_candidates_in_page(
+                    *args[:4], norm_variants=args[4], raw_value=value, hint=hint
+                )
+                assert got == expected, value
+
+    def test_levenshtein_prefilter_keeps_every_line_that_can_score(self):
+        texts = ["Acrne Corporation Ltd", "Acme Corp", "unrelated text here"]
+        index = g._PageNgramIndex([(g._normalize(t), {}) for t in texts])
+
+        found = index.levenshtein_candidates("acme corporation ltd", 0.8)
+
+        assert found == [0]
+        # Too short for the trigram bound: every line is scored.
+        assert index.levenshtein_candidates("acme", 0.8) == [0, 1, 2]
+
+    def test_index_cached_on_page_data(self):
+        page = _page([_line("Net 30", 0.1, 0.1)])
+        g.match_value_to_geometry("net 30 days", {1: page})
+        index = page["__ngram_index_cache__"]
+        g.match_value_to_geometry("net 60 days", {1: page})
+        assert page["__ngram_index_cache__"] is index
+
+
+class TestBatchGrounding:
+    """ground_assessment_geometry looks each distinct value up once per pass."""
+
+    def test_repeated_value_collected_once_and_rows_get_own_boxes(self):
+        lines = [_line("USD", 0.8, 0.1 * (i + 1)) for i in range(5)]
+        pd = {1: _page(lines)}
+        assessment = {"rows": [{"c": {"confidence": 0.9}} for _ in range(5)]}
+        extraction = {"rows": [{"c": "USD"} for _ in range(5)]}
+
+        with patch.object(g, "_best_candidates", wraps=g._best_candidates) as collect:
+            out = g.ground_assessment_geometry(assessment, extraction, pd, "ocr_only")
+
+        assert collect.call_count == 1
+        geoms = [r["c"]["geometry"][0] for r in out["rows"]]
+        tops = [geom["boundingBox"]["top"] for geom in geoms]
+        assert tops == [pytest.approx(0.1 * (i + 1)) for i in range(5)]
+        assert len({id(geom["boundingBox"]) for geom in geoms}) == 5
+
+    def test_same_text_under_different_schema_types_collected_separately(self):
+        pd = {1: _page([_line("04/04/2022", 0.1, 0.1)])}
+        assessment = {"a": {"confidence": 0.9}, "b": {"confidence": 0.9}}
+        extraction = {"a": "2022-04-04", "b": "2022-04-04"}
+        schema = {"properties": {"a": {"format": "date"}, "b": {"type": "string"}}}
+
+        with patch.object(g, "_best_candidates", wraps=g._best_candidates) as collect:
+            g.ground_assessment_geometry(assessment, extraction, pd, "ocr_only", schema)
+
+        assert collect.call_count == 2
+
+    def test_batch_matches_per_value_grounding(self):
+        rng = random.Random(3)
+        page, texts = _random_page(rng)
+        pd = {1: page}
+        values = [_random_value(rng, texts) for _ in range(40)]
+        values += values[:10]
+        assessment = {"rows": [{"v": {"confidence": 0.9}} for _ in values]}
+        extraction = {"rows": [{"v": v} for v in values]}
+
+        out = g.ground_assessment_geometry(assessment, extraction, pd, "ocr_only")
+
+        for i, (row, value) in enumerate(zip(out["rows"], values)):
+            expected = g.match_value_to_geometry(value, pd, None, i)
+            if expected is None:
+                assert "geometry" not in row["v"]
+            else:
+                assert row["v"]["geometry"] == [expected[0]]
+                assert row["v"]["geometry_source"] == expected[1]
+
+
 class TestPageResolution:
     def test_multi_page_resolves_to_preferred_page(self):
         pd = {
@@ -0,0 +1,282 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""Adaptive per-model concurrency limits (idp_common.bedrock.concurrency)."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import pytest
+from botocore.exceptions import ClientError
+
+from idp_common.bedrock import concurrency
+from idp_common.bedrock.client import BedrockClient
+from idp_common.bedrock.concurrency import (
+    OUTCOME_ERROR,
+    OUTCOME_SUCCESS,
+    OUTCOME_THROTTLED,
+    AdaptiveConcurrencyLimiter,
+)
+
+pytestmark = pytest.mark.unit
+
+MODEL = "us.amazon.nova-lite-v1:0"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _throttle():
+    return ClientError(
+        {"Error": {"Code": "ThrottlingException", "Message": "Too many requests"}},
+        "Converse",
+    )
+
+
+@pytest.fixture(autouse=True)
+def _fresh_limiters(monkeypatch):
+    for name in (
+        "BEDROCK_ADAPTIVE_CONCURRENCY",
+        "BEDROCK_CONCURRENCY_INITIAL",
+        "BEDROCK_CONCURRENCY_MIN",
+        "BEDROCK_CONCURRENCY_MAX",
+    ):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setenv("BEDROCK_ADAPTIVE_CONCURRENCY", "true")
+    concurrency.reset_model_limiters()
+    yield
+    concurrency.reset_model_limiters()
+
+
+def _run_round(limiter, clock, outcome=OUTCOME_SUCCESS, latency=1.0):
+    """Fill the cap, then finish every call with ``outcome``."""
+    permits = [limiter.acquire() for _ in range(limiter.limit)]
+    clock.now += latency
+    for permit in permits:
+        limiter.release(permit, outcome)
+
+
+class TestAdaptiveConcurrencyLimiter:
+    def test_slow_start_then_additive_increase(self):
+        clock = FakeClock()
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=2, clock=clock)
+
+        _run_round(limiter, clock)
+        assert limiter.limit == 4  # +1 per saturated success
+
+        _run_round(limiter, clock, OUTCOME_THROTTLED)
+        assert limiter.limit == 2  # one decrease for the whole burst
+
+        _run_round(limiter, clock)
+        assert 2 < limiter._limit < 3  # about +1 per round out of slow start
+
+    def test_throttles_from_calls_started_before_a_decrease_count_once(self):
+        clock = FakeClock()
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=16, clock=clock)
+        early = [limiter.acquire() for _ in range(8)]
+        clock.now += 1
+
+        for permit in early:
+            limiter.release(permit, OUTCOME_THROTTLED)
+        assert limiter.limit == 8
+
+        late = limiter.acquire()
+        clock.now += 1
+        limiter.release(late, OUTCOME_THROTTLED)
+        assert limiter.limit == 4
+        assert limiter.snapshot()["decreases"] == 2
+        assert limiter.snapshot()["throttles"] == 9
+
+    def test_decrease_stops_at_min_and_increase_at_max(self):
+        clock = FakeClock()
+        limiter = AdaptiveConcurrencyLimiter(
+            initial_limit=3, min_limit=2, max_limit=4, clock=clock
+        )
+        for _ in range(3):
+            clock.now += 1
+            limiter.release(limiter.acquire(), OUTCOME_THROTTLED)
+        assert limiter.limit == 2
+
+        for _ in range(10):
+            _run_round(limiter, clock)
+        assert limiter.limit == 4
+
+    def test_idle_successes_and_errors_do_not_raise_the_cap(self):
+        clock = FakeClock()
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=4, clock=clock)
+
+        for _ in range(20):
+            limiter.release(limiter.acquire(), OUTCOME_SUCCESS)
+        _run_round(limiter, clock, OUTCOME_ERROR)
+
+        assert limiter.limit == 4
+
+    def test_slow_success_holds_the_cap(self):
+        clock = FakeClock()
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=2, clock=clock)
+        _run_round(limiter, clock, latency=1.0)
+        permits = [limiter.acquire() for _ in range(4)]
+        clock.now += 5.0
+
+        limiter.release(permits[-1], OUTCOME_SUCCESS)
+
+        assert limiter._limit == 4.0
+
+    def test_acquire_waits_for_a_free_slot(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=1)
+        first = limiter.acquire()
+        admitted = threading.Event()
+
+        def second():
+            permit = limiter.acquire()
+            admitted.set()
+            limiter.release(permit, OUTCOME_ERROR)
+
+        thread = threading.Thread(target=second)
+        thread.start()
+        assert not admitted.wait(0.1)
+        assert limiter.snapshot()["waiting"] == 1
+
+        limiter.release(first, OUTCOME_ERROR)
+        thread.join(5)
+        assert admitted.is_set()
+        assert limiter.snapshot()["queued"] == 1
+
+    def test_invalid_bounds_rejected(self):
+        with pytest.raises(ValueError):
+            AdaptiveConcurrencyLimiter(min_limit=5, max_limit=2)
+
+
+class TestModelLimiterRegistry:
+    def test_one_limiter_per_model_from_environment(self, monkeypatch):
+        monkeypatch.setenv("BEDROCK_CONCURRENCY_INITIAL", "5")
+        monkeypatch.setenv("BEDROCK_CONCURRENCY_MAX", "12")
+
+        limiter = concurrency.get_model_limiter(MODEL)
+
+        assert concurrency.get_model_limiter(MODEL) is limiter
+        assert concurrency.get_model_limiter("other-model") is not limiter
+        assert (limiter.limit, limiter.max_limit) == (5, 12)
+        assert set(concurrency.get_limiter_snapshots()) == {MODEL, "other-model"}
+
+    def test_disabled(self, monkeypatch):
+        monkeypatch.setenv("BEDROCK_ADAPTIVE_CONCURRENCY", "false")
+        assert concurrency.get_model_limiter(MODEL) is None
+
+    def test_disabled_by_default(self, monkeypatch):
+        monkeypatch.delenv("BEDROCK_ADAPTIVE_CONCURRENCY")
+        assert concurrency.get_model_limiter(MODEL) is None
+
+
+class TestBedrockClientIntegration:
+    @pytest.fixture
+    def client(self):
+        client = BedrockClient(region="us-east-1", metrics_enabled=False)
+        client._client = MagicMock()
+        return client
+
+    def test_throttle_cuts_the_model_limit_and_retry_succeeds(self, client):
+        client._client.converse.side_effect = [
+            _throttle(),
+            {"output": {"message": {"content": [{"text": "ok"}]}}, "usage": {}},
+        ]
+
+        with patch.object(client, "_calculate_backoff", return_value=0):
+            client.invoke_model(MODEL, "sys", [{"text": "hi"}])
+
+        snapshot = concurrency.get_limiter_snapshots()[MODEL]
+        assert snapshot["throttles"] == 1
+        assert snapshot["limit"] == concurrency.DEFAULT_INITIAL_LIMIT // 2
+        assert snapshot["in_flight"] == 0
+
+    def test_limit_change_and_queue_wait_are_published(self, client, monkeypatch):
+        monkeypatch.setenv("BEDROCK_CONCURRENCY_INITIAL", "2")
+        client._client.converse.side_effect = _throttle()
+        with patch.object(client, "_put_metric") as put_metric:
+            with pytest.raises(ClientError):
+                client._converse({"modelId": MODEL})
+
+        put_metric.assert_any_call("BedrockConcurrencyLimit", 1)
+
+    def test_disabled_limiter_calls_converse_directly(self, client, monkeypatch):
+        monkeypatch.setenv("BEDROCK_ADAPTIVE_CONCURRENCY", "off")
+        client._client.converse.return_value = {"usage": {}}
+
+        client._converse({"modelId": MODEL})
+
+        assert concurrency.get_limiter_snapshots() == {}
+
+    def test_connection_pool_sized_to_max_concurrency(self, monkeypatch):
+        monkeypatch.setenv("BEDROCK_CONCURRENCY_MAX", "48")
+        with patch("idp_common.bedrock.client.get_bedrock_session") as session:
+            BedrockClient(region="us-east-1").client
+
+        config = session.return_value.client.call_args.kwargs["config"]
+        assert config.max_pool_connections == 48
+
+    def test_connection_pool_keeps_botocore_default_when_disabled(self, monkeypatch):
+        monkeypatch.delenv("BEDROCK_ADAPTIVE_CONCURRENCY")
+        monkeypatch.setenv("BEDROCK_CONCURRENCY_MAX", "48")
+        with patch("idp_common.bedrock.client.get_bedrock_session") as session:
+            BedrockClient(region="us-east-1").client
+
+        config = session.return_value.client.call_args.kwargs["config"]
+        assert config.max_pool_connections == 10
+
+
+class FakeBedrock:
+    """Converse stand-in that throttles calls beyond ``capacity`` in flight."""
+
+    def __init__(self, capacity, latency):
+        self.capacity = capacity
+        self.latency = latency
+        self.in_flight = 0
+        self.throttles = 0
+        self.lock = threading.Lock()
+
+    def converse(self, **kwargs):
+        with self.lock:
+            if self.in_flight >= self.capacity:
+                self.throttles += 1
+                raise _throttle()
+            self.in_flight += 1
+        try:
+            time.sleep(self.latency)
+            return {"output": {"message": {"content": [{"text": "ok"}]}}, "usage": {}}
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+
+def _simulate(monkeypatch, enabled):
+    monkeypatch.setenv("BEDROCK_ADAPTIVE_CONCURRENCY", str(enabled).lower())
+    concurrency.reset_model_limiters()
+    fake = FakeBedrock(capacity=4, latency=0.02)
+    client = BedrockClient(region="us-east-1", metrics_enabled=False, max_retries=50)
+    client._client = fake
+    with patch.object(client, "_calculate_backoff", return_value=0.01):
+        with ThreadPoolExecutor(max_workers=24) as pool:
+            list(
+                pool.map(
+                    lambda _: client.invoke_model(MODEL, "sys", [{"text": "hi"}]),
+                    range(96),
+                )
+            )
+    return fake.throttles
+
+
+def test_simulated_throttling_storm_is_damped(monkeypatch):
+    """24 threads against a model that serves 4 at a time: every call completes,
+    and the shared limit turns most of the throttled retries into waits."""
+    unlimited = _simulate(monkeypatch, enabled=False)
+    limited = _simulate(monkeypatch, enabled=True)
+
+    assert limited < unlimited / 2
+    assert concurrency.get_limiter_snapshots()[MODEL]["limit"] <= 8
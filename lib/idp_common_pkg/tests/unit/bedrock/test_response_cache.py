@@ -0,0 +1,264 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""Fingerprint-keyed Bedrock response cache (idp_common.bedrock.response_cache)."""
+
+from unittest.mock import MagicMock
+
+import boto3
+import pytest
+from moto import mock_aws
+
+from idp_common.bedrock import response_cache
+from idp_common.bedrock.client import BedrockClient
+from idp_common.bedrock.response_cache import (
+    DynamoDBResponseCache,
+    S3ResponseCache,
+    SQLiteResponseCache,
+    request_fingerprint,
+)
+
+pytestmark = pytest.mark.unit
+
+MODEL = "us.amazon.nova-lite-v1:0"
+RESPONSE = {
+    "output": {"message": {"content": [{"text": "invoice"}]}},
+    "stopReason": "end_turn",
+    "usage": {"inputTokens": 1200, "outputTokens": 30, "totalTokens": 1230},
+    "ResponseMetadata": {"RequestId": "abc"},
+}
+
+
+def _params(image=b"\x89PNG page one", **overrides):
+    params = {
+        "modelId": MODEL,
+        "messages": [
+            {
+                "role": "user",
+                "content": [
+                    {"text": "Classify this page"},
+                    {"image": {"format": "png", "source": {"bytes": image}}},
+                ],
+            }
+        ],
+        "system": [{"text": "You are a classifier"}],
+        "inferenceConfig": {"topP": 0.1},
+        "additionalModelRequestFields": None,
+    }
+    params.update(overrides)
+    return params
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache(monkeypatch):
+    for name in (
+        "BEDROCK_RESPONSE_CACHE",
+        "BEDROCK_RESPONSE_CACHE_MODE",
+        "BEDROCK_RESPONSE_CACHE_SCOPE",
+        "BEDROCK_RESPONSE_CACHE_TTL_DAYS",
+    ):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setenv("BEDROCK_ADAPTIVE_CONCURRENCY", "false")
+    response_cache.reset_response_cache()
+    yield
+    response_cache.reset_response_cache()
+
+
+class TestRequestFingerprint:
+    def test_stable_across_key_order(self):
+        params = _params()
+        reordered = dict(reversed(list(params.items())))
+        assert request_fingerprint(params) == request_fingerprint(reordered)
+
+    def test_image_bytes_are_part_of_the_key(self):
+        assert request_fingerprint(_params()) != request_fingerprint(
+            _params(image=b"\x89PNG page two")
+        )
+
+    def test_prompt_and_model_are_part_of_the_key(self):
+        base = request_fingerprint(_params())
+        assert base != request_fingerprint(_params(system=[{"text": "Other"}]))
+        assert base != request_fingerprint(_params(modelId="us.amazon.nova-pro-v1:0"))
+
+    def test_service_tier_is_not(self):
+        assert request_fingerprint(_params()) == request_fingerprint(
+            _params(serviceTier={"type": "flex"})
+        )
+
+
+class TestBackends:
+    RECORD = {"response": {"output": {}}, "model_id": MODEL}
+
+    def test_sqlite_round_trip_scope_and_expiry(self, tmp_path):
+        cache = SQLiteResponseCache(str(tmp_path / "nested" / "cache.db"))
+        cache.put("v1", "abc", self.RECORD, ttl_seconds=60)
+        cache.put("v2", "old", self.RECORD, ttl_seconds=-1)
+
+        assert cache.get("v1", "abc") == self.RECORD
+        assert cache.get("v2", "abc") is None
+        assert cache.get("v2", "old") is None
+
+    @mock_aws
+    def test_s3(self):
+        s3 = boto3.client("s3", region_name="us-east-1")
+        s3.create_bucket(Bucket="cache-bucket")
+        cache = S3ResponseCache("cache-bucket", "llm/")
+        cache.put("v1", "abc", self.RECORD, ttl_seconds=60)
+
+        assert cache.get("v1", "abc")["model_id"] == MODEL
+        assert cache.get("v1", "missing") is None
+        keys = [o["Key"] for o in s3.list_objects_v2(Bucket="cache-bucket")["Contents"]]
+        assert keys == ["llm/v1/abc.json"]
+
+    @mock_aws
+    def test_dynamodb_ignores_items_past_their_ttl(self, monkeypatch):
+        monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+        boto3.client("dynamodb").create_table(
+            TableName="tracking",
+            KeySchema=[
+                {"AttributeName": "PK", "KeyType": "HASH"},
+                {"AttributeName": "SK", "KeyType": "RANGE"},
+            ],
+            AttributeDefinitions=[
+                {"AttributeName": "PK", "AttributeType": "S"},
+                {"AttributeName": "SK", "AttributeType": "S"},
+            ],
+            BillingMode="PAY_PER_REQUEST",
+        )
+        cache = DynamoDBResponseCache("tracking")
+        cache.put("v1", "abc", self.RECORD, ttl_seconds=60)
+        cache.put("v1", "old", self.RECORD, ttl_seconds=-5)
+
+        assert cache.get("v1", "abc") == self.RECORD
+        assert cache.get("v1", "old") is None
+
+    def test_backend_from_uri(self, tmp_path):
+        assert isinstance(
+            response_cache.backend_from_uri(f"sqlite://{tmp_path}/c.db"),
+            SQLiteResponseCache,
+        )
+        s3 = response_cache.backend_from_uri("s3://bucket")
+        assert (s3.bucket, s3.prefix) == ("bucket", "bedrock-response-cache")
+        assert response_cache.backend_from_uri("dynamodb://t").table_name == "t"
+        with pytest.raises(ValueError):
+            response_cache.backend_from_uri("redis://host")
+
+
+class TestBedrockClientCache:
+    @pytest.fixture
+    def client(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("BEDROCK_RESPONSE_CACHE", f"sqlite://{tmp_path}/cache.db")
+        client = BedrockClient(region="us-east-1", metrics_enabled=False)
+        client._client = MagicMock()
+        client._client.converse.return_value = RESPONSE
+        return client
+
+    def _invoke(self, client, text="Classify this page", **kwargs):
+        kwargs.setdefault("top_p", None)
+        return client.invoke_model(
+            MODEL,
+            "You are a classifier",
+            [{"text": text}, {"image": {"format": "png", "source": {"bytes": b"x"}}}],
+            context="Classification",
+            **kwargs,
+        )
+
+    def test_identical_request_is_replayed_with_zero_token_metering(self, client):
+        first = self._invoke(client)
+        second = self._invoke(client)
+
+        assert client._client.converse.call_count == 1
+        assert first["metering"]["Classification/bedrock/" + MODEL]["requests"] == 1
+        assert second["metering"] == {
+            "Classification/bedrock/" + MODEL: {
+                "inputTokens": 0,
+                "outputTokens": 0,
+                "totalTokens": 0,
+                "requests": 0,
+                "responseCacheHits": 1,
+            }
+        }
+        assert second["response"]["output"] == RESPONSE["output"]
+        assert second["response"]["usage"]["totalTokens"] == 0
+        assert "ResponseMetadata" not in second["response"]
+
+    def test_different_content_misses(self, client):
+        self._invoke(client)
+        self._invoke(client, text="Classify this other page")
+        assert client._client.converse.call_count == 2
+
+    def test_scope_isolates_config_versions(self, client):
+        self._invoke(client, cache_scope="v1")
+        self._invoke(client, cache_scope="v2")
+        self._invoke(client, cache_scope="v1")
+        self._invoke(client)
+
+        assert client._client.converse.call_count == 3
+
+    def test_refresh_overwrites_and_bypass_ignores(self, client, monkeypatch):
+        self._invoke(client)
+        client._client.converse.return_value = {
+            **RESPONSE,
+            "output": {"message": {"content": [{"text": "receipt"}]}},
+        }
+
+        monkeypatch.setenv("BEDROCK_RESPONSE_CACHE_MODE", "bypass")
+        self._invoke(client)
+        monkeypatch.setenv("BEDROCK_RESPONSE_CACHE_MODE", "refresh")
+        self._invoke(client)
+        monkeypatch.setenv("BEDROCK_RESPONSE_CACHE_MODE", "use")
+        replayed = self._invoke(client)
+
+        assert client._client.converse.call_count == 3
+        assert client.extract_text_from_response(replayed) == "receipt"
+
+    def test_sampling_requests_and_truncated_responses_are_not_cached(self, client):
+        self._invoke(client, temperature=0.7)
+        self._invoke(client, temperature=0.7)
+        assert client._client.converse.call_count == 2
+        # top_p drops temperature, so the service default temperature applies
+        self._invoke(client, text="nucleus", top_p=0.1)
+        self._invoke(client, text="nucleus", top_p=0.1)
+        assert client._client.converse.call_count == 4
+
+        client._client.converse.return_value = {**RESPONSE, "stopReason": "max_tokens"}
+        self._invoke(client, text="long")
+        self._invoke(client, text="long")
+        assert client._client.converse.call_count == 6
+
+    def test_only_explicit_zero_temperature_without_top_p_is_cacheable(self):
+        assert response_cache.is_cacheable_request(
+            _params(inferenceConfig={"temperature": 0.0, "maxTokens": 10})
+        )
+        # Claude 4.7+ requests carry no temperature at all
+        assert not response_cache.is_cacheable_request(_params(inferenceConfig={}))
+        assert not response_cache.is_cacheable_request(_params())
+        assert not response_cache.is_cacheable_request(
+            _params(inferenceConfig={"temperature": 0, "topP": 0.1})
+        )
+        assert not response_cache.is_cacheable_request(
+            _params(inferenceConfig={"temperature": 0.2})
+        )
+
+    def test_backend_failure_falls_through_to_bedrock(self, client, monkeypatch):
+        broken = MagicMock()
+        broken.get.side_effect = RuntimeError("disk full")
+        broken.put.side_effect = RuntimeError("disk full")
+        monkeypatch.setattr(
+            "idp_common.bedrock.client.get_response_cache", lambda: broken
+        )
+
+        result = self._invoke(client)
+
+        assert result["response"]["output"] == RESPONSE["output"]
+        assert client._client.converse.call_count == 1
+
+    def test_disabled_by_default(self, client, monkeypatch):
+        monkeypatch.delenv("BEDROCK_RESPONSE_CACHE")
+        self._invoke(client)
+        self._invoke(client)
+        assert client._client.converse.call_count == 2
+
+    def test_ttl(self, monkeypatch):
+        monkeypatch.setenv("BEDROCK_RESPONSE_CACHE_TTL_DAYS", "0.5")
+        assert response_cache.response_cache_ttl_seconds() == 43200
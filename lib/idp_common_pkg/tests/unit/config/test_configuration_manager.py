@@ -168,3 +168,38 @@ class TestConfigurationManagerResolveActiveVersion:
 
         manager = ConfigurationManager(table_name="test-table")
         assert manager.resolve_active_version() == "default"
+
+
+@pytest.mark.unit
+class TestConfigurationManagerGetVersionMetadata:
+    """Test get_version_metadata projected read."""
+
+    @patch("idp_common.config.configuration_manager.boto3")
+    def test_returns_metadata_without_config_body(self, mock_boto3):
+        mock_table = Mock()
+        mock_boto3.resource.return_value.Table.return_value = mock_table
+        mock_table.get_item.return_value = {
+            "Item": {"UpdatedAt": "2026-01-01T00:00:00Z", "IsActive": True}
+        }
+
+        manager = ConfigurationManager(table_name="test-table")
+
+        assert manager.get_version_metadata("v1") == {
+            "versionName": "v1",
+            "isActive": True,
+            "updatedAt": "2026-01-01T00:00:00Z",
+            "bdaProjectArn": None,
+        }
+        kwargs = mock_table.get_item.call_args.kwargs
+        assert kwargs["Key"] == {"Configuration": "Config#v1"}
+        assert kwargs["ProjectionExpression"] == "IsActive, UpdatedAt, BdaProjectArn"
+
+    @patch("idp_common.config.configuration_manager.boto3")
+    def test_missing_version_returns_none(self, mock_boto3):
+        mock_table = Mock()
+        mock_boto3.resource.return_value.Table.return_value = mock_table
+        mock_table.get_item.return_value = {}
+
+        manager = ConfigurationManager(table_name="test-table")
+
+        assert manager.get_version_metadata("missing") is None
@@ -0,0 +1,137 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Tests for the version-stamped merged configuration cache.
+
+get_merged_configuration caches validated full configs per (table, version)
+and compares a stamp of the stored item on every read, so writes from any
+process are picked up while repeat reads skip decompression and validation.
+"""
+
+from unittest.mock import patch
+
+import boto3
+import pytest
+from moto import mock_aws
+
+from idp_common.config import configuration_manager as cm
+from idp_common.config.configuration_manager import ConfigurationManager
+from idp_common.config.models import ExtractionConfig, IDPConfig
+
+TABLE = "test-config-table"
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+    monkeypatch.delenv(cm._MERGED_CACHE_TTL_ENV, raising=False)
+    monkeypatch.delenv(cm._MERGED_CACHE_DIR_ENV, raising=False)
+    cm.invalidate_merged_config_cache()
+    with mock_aws():
+        boto3.client("dynamodb", region_name="us-east-1").create_table(
+            TableName=TABLE,
+            KeySchema=[{"AttributeName": "Configuration", "KeyType": "HASH"}],
+            AttributeDefinitions=[
+                {"AttributeName": "Configuration", "AttributeType": "S"}
+            ],
+            BillingMode="PAY_PER_REQUEST",
+        )
+        manager = ConfigurationManager(table_name=TABLE)
+        manager.save_configuration("Config", _config(0.1), version="v1")
+        yield manager
+    cm.invalidate_merged_config_cache()
+
+
+def _config(temperature):
+    return IDPConfig(extraction=ExtractionConfig(temperature=temperature))
+
+
+def _count_validations():
+    return patch.object(
+        cm.ConfigurationRecord,
+        "from_dynamodb_item",
+        side_effect=cm.ConfigurationRecord.from_dynamodb_item,
+    )
+
+
+@pytest.mark.unit
+class TestMergedConfigCache:
+    def test_repeat_reads_validate_once(self, manager):
+        with _count_validations() as validate:
+            first = manager.get_merged_configuration("v1")
+            second = manager.get_merged_configuration("v1")
+
+        assert validate.call_count == 1
+        assert first == second
+        assert first.extraction.temperature == 0.1
+
+    def test_returns_independent_copies(self, manager):
+        first = manager.get_merged_configuration("v1")
+        first.extraction.temperature = 0.9
+
+        assert manager.get_merged_configuration("v1").extraction.temperature == 0.1
+
+    def test_save_configuration_invalidates(self, manager):
+        manager.get_merged_configuration("v1")
+
+        manager.save_configuration("Config", _config(0.7), version="v1")
+
+        assert manager.get_merged_configuration("v1").extraction.temperature == 0.7
+
+    def test_write_from_another_process_is_detected(self, manager):
+        manager.get_merged_configuration("v1")
+        with patch.object(cm, "invalidate_merged_config_cache"):
+            # Another container saving: this process's cache is not told
+            ConfigurationManager(table_name=TABLE).save_configuration(
+                "Config", _config(0.5), version="v1"
+            )
+
+        assert manager.get_merged_configuration("v1").extraction.temperature == 0.5
+
+    def test_activate_version_invalidates(self, manager):
+        manager.get_merged_configuration("v1")
+
+        manager.activate_version("v1")
+
+        assert cm._merged_cache == {}
+
+    def test_ttl_skips_the_stamp_read(self, manager, monkeypatch):
+        monkeypatch.setenv(cm._MERGED_CACHE_TTL_ENV, "300")
+        manager.get_merged_configuration("v1")
+
+        with patch.object(manager.table, "get_item") as get_item:
+            config = manager.get_merged_configuration("v1")
+
+        get_item.assert_not_called()
+        assert config.extraction.temperature == 0.1
+
+    def test_cache_dir_survives_a_new_process(self, manager, monkeypatch, tmp_path):
+        monkeypatch.setenv(cm._MERGED_CACHE_DIR_ENV, str(tmp_path))
+        manager.get_merged_configuration("v1")
+        assert len(list(tmp_path.glob("config-*.pkl"))) == 1
+        cm._merged_cache.clear()  # a cold container with the same /tmp
+
+        with _count_validations() as validate:
+            config = manager.get_merged_configuration("v1")
+
+        validate.assert_not_called()
+        assert config.extraction.temperature == 0.1
+
+    def test_invalidation_removes_cache_files(self, manager, monkeypatch, tmp_path):
+        monkeypatch.setenv(cm._MERGED_CACHE_DIR_ENV, str(tmp_path))
+        manager.get_merged_configuration("v1")
+
+        manager.invalidate_cache("v1")
+
+        assert list(tmp_path.glob("config-*.pkl")) == []
+        assert cm._merged_cache == {}
+
+    def test_stale_cache_file_is_ignored(self, manager, monkeypatch, tmp_path):
+        monkeypatch.setenv(cm._MERGED_CACHE_DIR_ENV, str(tmp_path))
+        manager.get_merged_configuration("v1")
+        with patch.object(cm, "invalidate_merged_config_cache"):
+            manager.save_configuration("Config", _config(0.3), version="v1")
+        cm._merged_cache.clear()
+
+        assert manager.get_merged_configuration("v1").extraction.temperature == 0.3
@@ -3,10 +3,16 @@
 
 """Unit tests for the ClusteringService."""
 
+from unittest.mock import patch
+
 import numpy as np
 import pytest
 
-from idp_common.discovery.clustering_service import ClusteringService, ClusterResult
+from idp_common.discovery.clustering_service import (
+    SCALABLE_K_SELECTION_THRESHOLD,
+    ClusteringService,
+    ClusterResult,
+)
 
 
 @pytest.fixture
@@ -166,6 +172,62 @@ class TestClusteringService:
         distances = [d["distance"] for d in docs]
         assert distances == sorted(distances)
 
+    def test_sample_cluster_matches_reference_max_min_selection(
+        self, clustering_service
+    ):
+        """Vectorized farthest-point sampling selects the same documents as a
+        pairwise max-min scan over candidates in index order."""
+        rng = np.random.RandomState(7)
+        embeddings = rng.randn(300, 16)
+        labels = rng.randint(0, 3, size=300)
+        result = clustering_service._build_cluster_result(embeddings, labels)
+
+        def reference(cluster_id, num_samples):
+            indices = result.get_cluster_indices(cluster_id)
+            centroid = result.centroids[cluster_id]
+            distances = [np.linalg.norm(embeddings[i] - centroid) for i in indices]
+            selected = [indices[int(np.argsort(distances)[0])]]
+            while len(selected) < num_samples:
+                candidates = [i for i in indices if i not in selected]
+                min_dists = [
+                    min(np.linalg.norm(embeddings[c] - embeddings[s]) for s in selected)
+                    for c in candidates
+                ]
+                selected.append(candidates[int(np.argmax(min_dists))])
+            return selected
+
+        for cluster_id in result.get_cluster_ids():
+            for num_samples in (1, 3, 10):
+                assert clustering_service.sample_cluster(
+                    result, cluster_id, num_samples=num_samples
+                ) == reference(cluster_id, num_samples)
+
+    def test_sample_cluster_with_duplicate_embeddings(self, clustering_service):
+        """Duplicates never get selected twice."""
+        embeddings = np.vstack([np.zeros((5, 4)), np.ones((1, 4))])
+        result = clustering_service._build_cluster_result(
+            embeddings, np.zeros(6, dtype=int)
+        )
+
+        samples = clustering_service.sample_cluster(result, 0, num_samples=4)
+
+        assert len(set(samples)) == 4
+        assert 5 in samples
+
+    def test_get_docs_by_distance_returns_all_with_doc_ids(self, clustering_service):
+        """Without max_docs every cluster member is returned, nearest first."""
+        embeddings = np.array([[3.0, 0.0], [1.0, 0.0], [2.0, 0.0], [9.0, 9.0]])
+        result = clustering_service._build_cluster_result(
+            embeddings, np.array([0, 0, 0, 1])
+        )
+
+        docs = clustering_service.get_docs_by_distance_to_centroid(result, 0)
+
+        assert [d["doc_id"] for d in docs] == [2, 0, 1]
+        assert docs[0]["distance"] == pytest.approx(0.0)
+        assert docs[1]["distance"] == pytest.approx(1.0)
+        assert all(isinstance(d["distance"], float) for d in docs)
+
     def test_filter_small_clusters(self, clustering_service):
         """Test that small clusters are filtered as noise."""
         # Create labels with one small cluster
@@ -197,3 +259,75 @@ class TestClusteringService:
         assert result.kdtree is not None
         # Centroid of cluster 0 should be near (1.05, 0.0)
         np.testing.assert_allclose(result.centroids[0], [1.05, 0.0], atol=0.01)
+
+
+class TestScalableKSelection:
+    """Tests for the MiniBatchKMeans / sampled-silhouette k-selection mode."""
+
+    def test_invalid_mode_raises(self):
+        """Test that unknown k-selection modes are rejected."""
+        with pytest.raises(ValueError, match="Unsupported k_selection"):
+            ClusteringService(k_selection="fastest")
+        with pytest.raises(ValueError, match="Unsupported k_selection"):
+            ClusteringService().cluster(np.zeros((3, 2)), k_selection="fastest")
+
+    def test_scalable_finds_well_separated_clusters(self):
+        """Test that scalable mode recovers the same clusters as exact mode."""
+        embeddings = _make_clustered_embeddings(n_per_cluster=40, n_clusters=4)
+
+        exact = ClusteringService(k_selection="exact").cluster(embeddings)
+        scalable = ClusteringService(
+            k_selection="scalable", silhouette_sample_size=60, max_workers=2
+        ).cluster(embeddings)
+
+        assert scalable.num_clusters == exact.num_clusters == 4
+        # Same partition up to label renumbering
+        pairs = set(
+            zip(exact.cluster_labels.tolist(), scalable.cluster_labels.tolist())
+        )
+        assert len(pairs) == 4
+
+    def test_per_call_override(self):
+        """Test that cluster(k_selection=...) overrides the service default."""
+        service = ClusteringService(k_selection="exact")
+        embeddings = _make_clustered_embeddings()
+
+        with patch.object(
+            service,
+            "_determine_optimal_k_scalable",
+            wraps=service._determine_optimal_k_scalable,
+        ) as scalable:
+            service.cluster(embeddings, k_selection="scalable")
+
+        scalable.assert_called_once()
+
+    def test_auto_switches_on_document_count(self):
+        """Test that auto mode only goes scalable above the threshold."""
+        assert not ClusteringService._use_scalable_k_selection(
+            SCALABLE_K_SELECTION_THRESHOLD, "auto"
+        )
+        assert ClusteringService._use_scalable_k_selection(
+            SCALABLE_K_SELECTION_THRESHOLD + 1, "auto"
+        )
+        assert ClusteringService._use_scalable_k_selection(10, "scalable")
+        assert not ClusteringService._use_scalable_k_selection(10**6, "exact")
+
+    def test_stratified_sample_keeps_small_clusters(self):
+        """Test that every cluster is represented in the silhouette sample."""
+        service = ClusteringService(silhouette_sample_size=100)
+        labels = np.array([0] * 990 + [1] * 5 + [2] * 5)
+
+        sample = service._stratified_sample(labels)
+
+        assert len(sample) == len(set(sample.tolist()))
+        assert 90 <= len(sample) <= 110
+        counts = np.bincount(labels[sample])
+        assert counts[1] >= 2 and counts[2] >= 2
+
+    def test_stratified_sample_small_input_uses_everything(self):
+        """Test that inputs below the sample size are scored in full."""
+        service = ClusteringService(silhouette_sample_size=100)
+
+        sample = service._stratified_sample(np.array([0, 1, 0, 1]))
+
+        np.testing.assert_array_equal(sample, [0, 1, 2, 3])
@@ -0,0 +1,278 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""Unit tests for the persistent discovery embedding cache."""
+
+import os
+from unittest.mock import MagicMock, patch
+
+import boto3
+import numpy as np
+import pytest
+from moto import mock_aws
+
+from idp_common.discovery import embedding_cache
+from idp_common.discovery.embedding_cache import EmbeddingCache, s3_content_id
+from idp_common.discovery.embedding_service import EmbeddingService
+
+NAMESPACE = {"model_id": "us.cohere.embed-v4:0", "input_type": "clustering"}
+
+
+@pytest.fixture
+def mock_bedrock_client():
+    """BedrockClient mock returning one 2-d embedding per item."""
+    client = MagicMock()
+    client.region = "us-east-1"
+    client.generate_embeddings_batch.side_effect = lambda items, **kwargs: [
+        [float(len(item["image_bytes"])), 1.0] for item in items
+    ]
+    return client
+
+
+@pytest.fixture
+def fake_s3():
+    """boto3 S3 client mock with per-key ETags."""
+    objects = {"a.pdf": "etag-a", "b.pdf": "etag-b", "c.pdf": "etag-c"}
+    client = MagicMock()
+    client.head_object.side_effect = lambda Bucket, Key: {
+        "ETag": f'"{objects[Key]}"',
+        "ContentLength": 100,
+    }
+    with patch("boto3.client", return_value=client):
+        yield objects
+
+
+def _service(client, location, model_id="us.cohere.embed-v4:0"):
+    return EmbeddingService(
+        bedrock_client=client,
+        model_id=model_id,
+        input_type="clustering",
+        cache_location=str(location),
+    )
+
+
+def _prepared(key_to_bytes):
+    return lambda bucket, key: key_to_bytes.get(key)
+
+
+class TestEmbeddingCache:
+    """Tests for the EmbeddingCache store."""
+
+    def test_round_trip_local(self, tmp_path):
+        """Test that saved embeddings load in a fresh cache instance."""
+        cache = EmbeddingCache(str(tmp_path), NAMESPACE)
+        assert cache.get_many(["x"]) == {}
+        cache.put_many({"x": [1.0, 2.0], "y": [3.0, 4.0]})
+        assert cache.save() is True
+
+        reloaded = EmbeddingCache(str(tmp_path), NAMESPACE).get_many(["x", "z"])
+
+        assert list(reloaded) == ["x"]
+        np.testing.assert_array_equal(reloaded["x"], [1.0, 2.0])
+
+    def test_namespace_selects_file(self, tmp_path):
+        """Test that other models/preprocessing never share embeddings."""
+        cache = EmbeddingCache(str(tmp_path), NAMESPACE)
+        cache.put_many({"x": [1.0, 2.0]})
+        cache.save()
+
+        other = EmbeddingCache(str(tmp_path), {**NAMESPACE, "model_id": "titan"})
+
+        assert other.uri != cache.uri
+        assert other.get_many(["x"]) == {}
+
+    def test_save_without_changes_is_noop(self, tmp_path):
+        """Test that a fully cached run does not rewrite the cache."""
+        cache = EmbeddingCache(str(tmp_path), NAMESPACE)
+        assert cache.save() is False
+        assert not list(tmp_path.iterdir())
+
+    def test_max_entries_keeps_current_run(self, tmp_path):
+        """Test that the cap drops entries unused by the current run first."""
+        cache = EmbeddingCache(str(tmp_path), NAMESPACE, shards=1)
+        cache.put_many({"old1": [1.0], "old2": [2.0]})
+        cache.save()
+
+        capped = EmbeddingCache(str(tmp_path), NAMESPACE, max_entries=2, shards=1)
+        capped.get_many(["old2"])
+        capped.put_many({"new": [3.0]})
+        capped.save()
+
+        kept = EmbeddingCache(str(tmp_path), NAMESPACE, shards=1).get_many(
+            ["old1", "old2", "new"]
+        )
+        assert sorted(kept) == ["new", "old2"]
+
+    def test_corrupt_cache_is_ignored(self, tmp_path):
+        """Test that an unreadable cache file behaves like a cold cache."""
+        cache = EmbeddingCache(str(tmp_path), NAMESPACE)
+        os.makedirs(cache.uri)
+        with open(cache.shard_uri(cache.shard_of("x")), "wb") as f:
+            f.write(b"not an npz file")
+
+        assert cache.get_many(["x"]) == {}
+
+    def test_save_rewrites_only_changed_shards(self, tmp_path):
+        """Test that adding one embedding leaves the other shard files alone."""
+        cache = EmbeddingCache(str(tmp_path), NAMESPACE)
+        cache.put_many({f"doc-{i}": [float(i)] for i in range(64)})
+        cache.save()
+        before = {p.name: p.stat().st_mtime_ns for p in tmp_path.glob("*/*.npz")}
+
+        warm = EmbeddingCache(str(tmp_path), NAMESPACE)
+        warm.put_many({"new": [1.0]})
+        warm.save()
+
+        after = {p.name: p.stat().st_mtime_ns for p in tmp_path.glob("*/*.npz")}
+        changed = [name for name in after if after[name] != before.get(name)]
+        assert changed == [f"{warm.shard_of('new'):02d}.npz"]
+
+    def test_concurrent_local_saves_merge(self, tmp_path):
+        """Test that a save after another run's save keeps both runs' entries."""
+        first = EmbeddingCache(str(tmp_path), NAMESPACE, shards=1)
+        second = EmbeddingCache(str(tmp_path), NAMESPACE, shards=1)
+        first.get_many(["x"])
+        second.get_many(["x"])
+
+        first.put_many({"a": [1.0]})
+        second.put_many({"b": [2.0]})
+        assert first.save() is True
+        assert second.save() is True
+
+        kept = EmbeddingCache(str(tmp_path), NAMESPACE, shards=1).get_many(["a", "b"])
+        assert sorted(kept) == ["a", "b"]
+
+    def test_concurrent_s3_saves_merge_with_conditional_writes(self):
+        """Test that S3 shards are only replaced at the version that was read."""
+        with mock_aws():
+            s3 = boto3.client("s3", region_name="us-east-1")
+            s3.create_bucket(Bucket="discovery")
+            with patch.object(embedding_cache, "get_s3_client", return_value=s3):
+                location = "s3://discovery/embedding-cache"
+                runs = [EmbeddingCache(location, NAMESPACE, shards=1) for _ in range(3)]
+                for i, run in enumerate(runs):
+                    run.get_many(["x"])
+                    run.put_many({f"doc-{i}": [float(i)]})
+                assert [run.save() for run in runs] == [True, True, True]
+
+                kept = EmbeddingCache(location, NAMESPACE, shards=1).get_many(
+                    ["doc-0", "doc-1", "doc-2"]
+                )
+                keys = [
+                    o["Key"] for o in s3.list_objects_v2(Bucket="discovery")["Contents"]
+                ]
+
+        assert sorted(kept) == ["doc-0", "doc-1", "doc-2"]
+        assert keys == [runs[0].shard_uri(0).split("discovery/", 1)[1]]
+
+    def test_s3_content_id(self):
+        """Test that quoted ETags and sizes form the identity."""
+        assert s3_content_id('"abc"', 12) == "etag:abc:12"
+
+
+class TestEmbeddingServiceCache:
+    """Tests for cache reuse in EmbeddingService.embed_document_images."""
+
+    def test_second_run_reuses_unchanged_documents(
+        self, tmp_path, mock_bedrock_client, fake_s3
+    ):
+        """Test that only new or changed documents are embedded again."""
+        images = {"a.pdf": b"aa", "b.pdf": b"bbb", "c.pdf": b"c"}
+        first = _service(mock_bedrock_client, tmp_path)
+        with patch.object(
+            first, "_download_and_prepare_image", side_effect=_prepared(images)
+        ):
+            cold = first.embed_document_images("bucket", ["a.pdf", "b.pdf"])
+
+        assert (cold.num_reused, cold.num_computed) == (0, 2)
+
+        # b.pdf changed, c.pdf is new
+        fake_s3["b.pdf"] = "etag-b2"
+        images["b.pdf"] = b"bbbb"
+        second = _service(mock_bedrock_client, tmp_path)
+        with patch.object(
+            second, "_download_and_prepare_image", side_effect=_prepared(images)
+        ) as download:
+            warm = second.embed_document_images("bucket", ["a.pdf", "b.pdf", "c.pdf"])
+
+        assert sorted(call.args[1] for call in download.call_args_list) == [
+            "b.pdf",
+            "c.pdf",
+        ]
+        assert (warm.num_reused, warm.num_computed) == (1, 2)
+        assert warm.valid_keys == ["a.pdf", "b.pdf", "c.pdf"]
+        np.testing.assert_array_equal(
+            warm.embeddings, [[2.0, 1.0], [4.0, 1.0], [1.0, 1.0]]
+        )
+        assert warm.to_serializable()["num_reused"] == 1
+
+    def test_fully_cached_run_makes_no_model_calls(
+        self, tmp_path, mock_bedrock_client, fake_s3
+    ):
+        """Test that an unchanged bucket is served entirely from the cache."""
+        images = {"a.pdf": b"aa", "b.pdf": b"bbb"}
+        for _ in range(2):
+            service = _service(mock_bedrock_client, tmp_path)
+            with patch.object(
+                service,
+                "_download_and_prepare_image",
+                side_effect=_prepared(images),
+            ):
+                result = service.embed_document_images("bucket", ["a.pdf", "b.pdf"])
+
+        assert mock_bedrock_client.generate_embeddings_batch.call_count == 1
+        assert (result.num_reused, result.num_computed) == (2, 0)
+
+    def test_failed_documents_are_not_cached(
+        self, tmp_path, mock_bedrock_client, fake_s3
+    ):
+        """Test that documents that failed to prepare are retried next run."""
+        service = _service(mock_bedrock_client, tmp_path)
+        with patch.object(
+            service,
+            "_download_and_prepare_image",
+            side_effect=_prepared({"a.pdf": b"aa"}),
+        ):
+            result = service.embed_document_images("bucket", ["a.pdf", "b.pdf"])
+
+        assert result.valid_keys == ["a.pdf"]
+        assert result.failed_keys == ["b.pdf"]
+        assert service.cache.get_many([s3_content_id("etag-b", 100)]) == {}
+
+
+class TestLocalDiscoveryCache:
+    """Tests for cache reuse in MultiDocumentDiscovery.generate_embeddings_local."""
+
+    def test_local_files_keyed_by_content(self, tmp_path, mock_bedrock_client):
+        """Test that unchanged local files are not rendered or embedded again."""
+        from idp_common.discovery.multi_document_discovery import (
+            MultiDocumentDiscovery,
+        )
+
+        docs = tmp_path / "docs"
+        docs.mkdir()
+        paths = []
+        for name, content in (("a.png", b"aa"), ("b.png", b"bbb")):
+            (docs / name).write_bytes(content)
+            paths.append(str(docs / name))
+
+        def run():
+            discovery = MultiDocumentDiscovery(
+                region="us-east-1",
+                config={"embedding_cache_location": str(tmp_path / "cache")},
+                bedrock_client=mock_bedrock_client,
+            )
+            with patch.object(
+                discovery.embedding_service,
+                "_compress_image_bytes",
+                side_effect=lambda data: data,
+            ):
+                return discovery.generate_embeddings_local(paths)
+
+        cold = run()
+        (docs / "b.png").write_bytes(b"bbbb")
+        warm = run()
+
+        assert (cold.num_reused, cold.num_computed) == (0, 2)
+        assert (warm.num_reused, warm.num_computed) == (1, 1)
+        np.testing.assert_array_equal(warm.embeddings, [[2.0, 1.0], [4.0, 1.0]])
@@ -0,0 +1,157 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Unit tests for changed-field updates in update_document.
+"""
+
+import boto3
+import pytest
+from moto import mock_aws
+
+from idp_common.dynamodb.client import DynamoDBClient
+from idp_common.dynamodb.service import DocumentDynamoDBService
+from idp_common.models import Document, Page, Section, Status
+
+TABLE = "tracking-table"
+
+
+@pytest.fixture
+def table(monkeypatch):
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+    with mock_aws():
+        boto3.client("dynamodb", region_name="us-east-1").create_table(
+            TableName=TABLE,
+            KeySchema=[
+                {"AttributeName": "PK", "KeyType": "HASH"},
+                {"AttributeName": "SK", "KeyType": "RANGE"},
+            ],
+            AttributeDefinitions=[
+                {"AttributeName": "PK", "AttributeType": "S"},
+                {"AttributeName": "SK", "AttributeType": "S"},
+            ],
+            BillingMode="PAY_PER_REQUEST",
+        )
+        yield boto3.resource("dynamodb", region_name="us-east-1").Table(TABLE)
+
+
+def _service():
+    return DocumentDynamoDBService(
+        dynamodb_client=DynamoDBClient(table_name=TABLE, region="us-east-1")
+    )
+
+
+def _document(num_sections=3):
+    document = Document(
+        id="doc.pdf",
+        input_key="doc.pdf",
+        status=Status.CLASSIFYING,
+        queued_time="2026-01-01T00:00:00Z",
+        num_pages=num_sections,
+        metering={"step": {"pages": 1}},
+    )
+    for i in range(1, num_sections + 1):
+        document.pages[str(i)] = Page(page_id=str(i), classification="Invoice")
+        document.sections.append(
+            Section(section_id=str(i), classification="Invoice", page_ids=[str(i)])
+        )
+    return document
+
+
+def _spy_updates(service):
+    calls = []
+    update_item = service.client.update_item
+
+    def spy(**kwargs):
+        calls.append(kwargs)
+        return update_item(**kwargs)
+
+    service.client.update_item = spy
+    return calls
+
+
+def _item(table):
+    return table.get_item(Key={"PK": "doc#doc.pdf", "SK": "none"})["Item"]
+
+
+@pytest.mark.unit
+class TestChangedFieldUpdates:
+    def test_default_writes_every_attribute(self, table):
+        service = _service()
+        document = _document()
+        service.update_document(document)
+        calls = _spy_updates(service)
+
+        service.update_document(document)
+
+        names = set(calls[0]["expression_attribute_names"].values())
+        assert {"ObjectStatus", "Pages", "Sections", "Metering"} <= names
+
+    def test_default_overwrites_attributes_changed_by_other_writers(self, table):
+        service = _service()
+        document = _document()
+        service.update_document(document)
+        # Another writer (e.g. update_document_status) moves the item on
+        service.update_document_status("doc.pdf", Status.FAILED)
+
+        service.update_document(document)
+
+        assert _item(table)["ObjectStatus"] == "CLASSIFYING"
+
+    def test_changed_fields_write_only_their_attributes(self, table):
+        service = _service()
+        document = _document()
+        service.update_document(document)
+        calls = _spy_updates(service)
+
+        document.status = Status.COMPLETED
+        document.completion_time = "2026-01-01T00:05:00Z"
+        service.update_document(document, changed={"status", "completion_time"})
+
+        names = set(calls[0]["expression_attribute_names"].values())
+        assert names == {"ObjectStatus", "WorkflowStatus", "CompletionTime"}
+        assert _item(table)["WorkflowStatus"] == "SUCCEEDED"
+        assert len(_item(table)["Sections"]) == 3
+
+    def test_changed_sections_rewrite_the_whole_list(self, table):
+        service = _service()
+        document = _document()
+        service.update_document(document)
+        calls = _spy_updates(service)
+
+        document.sections[1].extraction_result_uri = "s3://out/doc.pdf/2.json"
+        service.update_document(document, changed=["sections"])
+
+        assert "#Sections = :Sections" in calls[0]["update_expression"]
+        assert "[" not in calls[0]["update_expression"]
+        assert _item(table)["Sections"][1]["OutputJSONUri"] == "s3://out/doc.pdf/2.json"
+
+    def test_empty_changed_set_makes_no_write(self, table):
+        service = _service()
+        document = _document()
+        calls = _spy_updates(service)
+
+        result = service.update_document(document, changed=[])
+
+        assert calls == []
+        assert result is document
+
+    def test_unknown_field_is_rejected(self, table):
+        with pytest.raises(ValueError, match="ObjectStatus"):
+            _service().update_document(_document(), changed=["ObjectStatus"])
+
+    def test_pending_review_is_removed_only_with_hitl_status(self, table):
+        service = _service()
+        document = _document()
+        document.hitl_status = "PendingReview"
+        service.update_document(document)
+        assert _item(table)["HITLPendingReview"] == "true"
+
+        document.hitl_status = "Completed"
+        calls = _spy_updates(service)
+        service.update_document(document, changed={"status"})
+        service.update_document(document, changed={"hitl_status"})
+
+        assert "REMOVE" not in calls[0]["update_expression"]
+        assert "REMOVE HITLPendingReview" in calls[1]["update_expression"]
+        assert "HITLPendingReview" not in _item(table)
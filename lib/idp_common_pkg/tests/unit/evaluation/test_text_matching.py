@@ -0,0 +1,99 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Unit tests for the evaluation text-matching helpers used by OCR grounding.
+"""
+
+import random
+
+import pytest
+
+from idp_common.evaluation.text_matching import (
+    fuzz_score,
+    fuzz_scores,
+    levenshtein_distance,
+)
+
+
+def _reference_distance(s1: str, s2: str) -> int:
+    """Full-matrix Levenshtein DP (the previous fuzz_score implementation)."""
+    d = [[0] * (len(s2) + 1) for _ in range(len(s1) + 1)]
+    for i in range(len(s1) + 1):
+        d[i][0] = i
+    for j in range(len(s2) + 1):
+        d[0][j] = j
+    for i in range(1, len(s1) + 1):
+        for j in range(1, len(s2) + 1):
+            cost = 0 if s1[i - 1] == s2[j - 1] else 1
+            d[i][j] = min(d[i - 1][j] + 1, d[i][j - 1] + 1, d[i - 1][j - 1] + cost)
+    return d[len(s1)][len(s2)]
+
+
+def _random_pairs(count: int, seed: int = 7):
+    rng = random.Random(seed)
+    for _ in range(count):
+        # Small alphabet so pairs share characters and distances vary
+        a = "".join(rng.choice("abcd ") for _ in range(rng.randint(0, 80)))
+        b = "".join(rng.choice("abcd ") for _ in range(rng.randint(0, 80)))
+        yield a, b
+
+
+@pytest.mark.unit
+class TestLevenshteinDistance:
+    @pytest.mark.parametrize(
+        "s1,s2,expected",
+        [
+            ("", "", 0),
+            ("abc", "", 3),
+            ("kitten", "sitting", 3),
+            ("flaw", "lawn", 2),
+            ("invoice total", "invoice tota1", 1),
+        ],
+    )
+    def test_known_distances(self, s1, s2, expected):
+        assert levenshtein_distance(s1, s2) == expected
+        assert levenshtein_distance(s2, s1) == expected
+
+    def test_matches_full_matrix_dp(self):
+        for a, b in _random_pairs(2000):
+            assert levenshtein_distance(a, b) == _reference_distance(a, b), (a, b)
+
+    def test_long_strings_beyond_machine_word(self):
+        a = "account number 1234567890 " * 10
+        b = a.replace("5", "S")
+
+        assert levenshtein_distance(a, b) == 10
+
+    def test_max_distance_cutoff(self):
+        for a, b in _random_pairs(500, seed=11):
+            exact = _reference_distance(a, b)
+            for cutoff in (0, 3, 10):
+                result = levenshtein_distance(a, b, max_distance=cutoff)
+                assert result == (exact if exact <= cutoff else cutoff + 1)
+
+
+@pytest.mark.unit
+class TestFuzzScores:
+    def test_fuzz_score_normalizes_and_scores(self):
+        assert fuzz_score("Invoice #123", "invoice 123") == 1.0
+        assert fuzz_score("", "abc") == 0.0
+        assert fuzz_score("kitten", "sitting") == pytest.approx(1 - 3 / 7)
+
+    def test_batch_matches_pairwise_scores(self):
+        candidates = [b for _, b in _random_pairs(300)] + ["", "ABCD!"]
+
+        assert fuzz_scores("abcd abcd", candidates) == [
+            fuzz_score("abcd abcd", c) for c in candidates
+        ]
+
+    def test_min_score_zeroes_only_candidates_below_threshold(self):
+        query = "Total Amount Due"
+        candidates = ["total amount due", "total amount dve", "page 1 of 3", "tot"]
+
+        scores = fuzz_scores(query, candidates, min_score=0.8)
+        pairwise = [fuzz_score(query, c) for c in candidates]
+
+        assert scores == [p if p >= 0.8 else 0.0 for p in pairwise]
+        assert scores[:2] == pairwise[:2]
+        assert scores[2:] == [0.0, 0.0]
@@ -0,0 +1,117 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""Unit tests for the coalescing agentic extraction checkpoint writer."""
+
+import threading
+import time
+
+import pytest
+
+from idp_common.extraction.checkpoint_writer import CoalescingCheckpointWriter
+
+pytestmark = pytest.mark.unit
+
+
+class RecordingSave:
+    def __init__(self, delay=0.0, fail_first=0):
+        self.delay = delay
+        self.fail_first = fail_first
+        self.saved = []
+        self.threads = set()
+
+    def __call__(self, payload):
+        self.threads.add(threading.current_thread().name)
+        time.sleep(self.delay)
+        if self.fail_first:
+            self.fail_first -= 1
+            raise RuntimeError("S3 unavailable")
+        self.saved.append(payload)
+
+
+def _checkpoint(rows):
+    return {"source": "current_extraction", "data": {"rows": list(range(rows))}}
+
+
+def test_burst_of_patches_is_written_once_with_the_latest_state():
+    save = RecordingSave()
+    writer = CoalescingCheckpointWriter(save, debounce_seconds=0.2)
+
+    for rows in range(1, 51):
+        writer(_checkpoint(rows))
+    time.sleep(0.6)
+
+    assert save.saved == [_checkpoint(50)]
+    assert save.threads == {"checkpoint-writer"}
+    writer.close()
+    assert writer.stats == {"submitted": 50, "written": 1, "failed": 0}
+
+
+def test_steady_stream_still_checkpoints_within_max_delay():
+    save = RecordingSave()
+    writer = CoalescingCheckpointWriter(
+        save, debounce_seconds=0.05, max_delay_seconds=0.1
+    )
+
+    for rows in range(60):
+        writer(_checkpoint(rows))
+        time.sleep(0.01)
+
+    assert 2 <= len(save.saved) < 20
+    writer.close()
+    assert save.saved[-1] == _checkpoint(59)
+
+
+def test_submit_does_not_wait_for_a_slow_upload():
+    save = RecordingSave(delay=0.2)
+    writer = CoalescingCheckpointWriter(save, debounce_seconds=0)
+
+    t0 = time.perf_counter()
+    for rows in range(20):
+        writer(_checkpoint(rows))
+    elapsed = time.perf_counter() - t0
+
+    assert elapsed < 1.0  # 4 s if each upload blocked the agent
+    writer.close()
+    assert save.saved[-1] == _checkpoint(19)
+    assert len(save.saved) <= 3
+
+
+def test_near_the_deadline_every_update_is_written_synchronously():
+    save = RecordingSave()
+    writer = CoalescingCheckpointWriter(
+        save, debounce_seconds=10, deadline_epoch=time.time() + 5
+    )
+
+    writer(_checkpoint(1))
+    writer(_checkpoint(2))
+
+    assert save.saved == [_checkpoint(1), _checkpoint(2)]
+    assert save.threads == {threading.current_thread().name}
+
+
+def test_close_flushes_pending_and_discard_drops_it():
+    save = RecordingSave()
+    writer = CoalescingCheckpointWriter(save, debounce_seconds=10)
+    writer(_checkpoint(3))
+    writer.close()
+    assert save.saved == [_checkpoint(3)]
+
+    discarded = RecordingSave()
+    writer = CoalescingCheckpointWriter(discarded, debounce_seconds=10)
+    writer(_checkpoint(4))
+    writer.close(discard=True)
+    assert discarded.saved == []
+
+
+def test_failed_save_is_logged_and_the_next_update_retries():
+    save = RecordingSave(fail_first=1)
+    writer = CoalescingCheckpointWriter(save, debounce_seconds=10)
+
+    writer(_checkpoint(1))
+    writer.flush()
+    writer(_checkpoint(2))
+    writer.close()
+
+    assert save.saved == [_checkpoint(2)]
+    assert writer.stats["failed"] == 1
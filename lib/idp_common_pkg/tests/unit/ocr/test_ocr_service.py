@@ -467,6 +467,147 @@ class TestOcrService:
         assert "Error processing document" in result.errors[0]
         assert "PDF error" in result.errors[0]
 
+    def test_max_inflight_pages_defaults_to_twice_max_workers(self):
+        """Without explicit config the in-flight page budget is 2 x max_workers."""
+        with patch("boto3.client"):
+            service = OcrService(config={"ocr": {"max_workers": 4}})
+            assert service.max_inflight_pages == 8
+
+            service = OcrService(
+                config={"ocr": {"max_workers": 4, "max_inflight_pages": "3"}}
+            )
+            assert service.max_inflight_pages == 3
+
+            service = OcrService(max_workers=4, max_inflight_pages=5)
+            assert service.max_inflight_pages == 5
+
+    @patch("boto3.client")
+    @patch("idp_common.ocr.service.pdfium.PdfDocument")
+    def test_process_document_streams_pages_within_inflight_budget(
+        self, mock_pdfium_doc, mock_boto_client, mock_document, mock_pdf_content
+    ):
+        """OCR starts before rendering finishes and never exceeds the page budget."""
+        import threading
+        import time
+
+        mock_s3_client = MagicMock()
+        mock_s3_client.get_object.return_value = {"Body": BytesIO(mock_pdf_content)}
+        mock_boto_client.return_value = mock_s3_client
+
+        num_pages = 12
+        mock_pdf_doc = MagicMock()
+        mock_pdf_doc.__len__.return_value = num_pages
+        mock_pdfium_doc.return_value = mock_pdf_doc
+
+        events = []
+        lock = threading.Lock()
+        state = {"held": 0, "peak": 0}
+
+        def fake_extract(_self, page, is_pdf, page_id):
+            with lock:
+                events.append(("render", page_id))
+                state["held"] += 1
+                state["peak"] = max(state["peak"], state["held"])
+            return b"image_data"
+
+        def fake_process(_self, page_index, img_bytes, output_bucket, prefix):
+            with lock:
+                events.append(("ocr", page_index + 1))
+            time.sleep(0.01)
+            with lock:
+                state["held"] -= 1
+            return (
+                {
+                    "raw_text_uri": "s3://output/raw.json",
+                    "parsed_text_uri": "s3://output/parsed.json",
+                    "text_confidence_uri": "s3://output/confidence.json",
+                    "image_uri": "s3://output/image.jpg",
+                },
+                {"OCR/textract/detect_document_text": {"pages": 1}},
+            )
+
+        with (
+            patch.object(OcrService, "_extract_page_image", fake_extract),
+            patch.object(OcrService, "_process_page_with_image", fake_process),
+        ):
+            service = OcrService(max_workers=2, max_inflight_pages=3)
+            result = service.process_document(mock_document)
+
+        assert result.status != Status.FAILED
+        assert list(result.pages) == [str(i) for i in range(1, 13)]
+        assert (
+            result.metering["OCR/textract/detect_document_text"]["pages"] == num_pages
+        )
+        # Rendered images waiting for or undergoing OCR never exceed the budget
+        assert state["peak"] <= 3
+        # Page 1 OCR began before the last page was rendered
+        assert events.index(("ocr", 1)) < events.index(("render", num_pages))
+        mock_pdf_doc.close.assert_called_once()
+
+    def test_iter_rendered_pages_uses_worker_processes_for_large_documents(self):
+        """render_processes > 1 hands rendering to page_renderer worker processes."""
+        with patch("boto3.client"):
+            service = OcrService(config={"ocr": {"render_processes": 2}})
+        mock_pdf_doc = MagicMock()
+
+        with (
+            patch(
+                "idp_common.ocr.service.resolve_render_processes", return_value=2
+            ) as mock_resolve,
+            patch(
+                "idp_common.ocr.service.iter_rendered_pages",
+                return_value=iter([(0, b"a"), (1, b"b")]),
+            ) as mock_iter,
+        ):
+            pages = list(
+                service._iter_rendered_pages(mock_pdf_doc, [0, 1], b"%PDF-1.4")
+            )
+
+        assert pages == [(0, b"a"), (1, b"b")]
+        mock_resolve.assert_called_once_with(2, 2)
+        assert mock_iter.call_args.kwargs["processes"] == 2
+        assert mock_iter.call_args.kwargs["pdf_bytes"] == b"%PDF-1.4"
+        mock_pdf_doc.__getitem__.assert_not_called()
+
+    @patch("boto3.client")
+    @patch("idp_common.ocr.service.pdfium.PdfDocument")
+    def test_process_document_records_failed_pages_in_pipeline(
+        self, mock_pdfium_doc, mock_boto_client, mock_document, mock_pdf_content
+    ):
+        """A page whose OCR fails is reported as an error without blocking the rest."""
+        mock_s3_client = MagicMock()
+        mock_s3_client.get_object.return_value = {"Body": BytesIO(mock_pdf_content)}
+        mock_boto_client.return_value = mock_s3_client
+
+        mock_pdf_doc = MagicMock()
+        mock_pdf_doc.__len__.return_value = 4
+        mock_pdfium_doc.return_value = mock_pdf_doc
+
+        def fake_process(_self, page_index, img_bytes, output_bucket, prefix):
+            if page_index == 1:
+                raise RuntimeError("Textract throttled")
+            return (
+                {
+                    "raw_text_uri": "s3://output/raw.json",
+                    "parsed_text_uri": "s3://output/parsed.json",
+                    "text_confidence_uri": "s3://output/confidence.json",
+                    "image_uri": "s3://output/image.jpg",
+                },
+                {},
+            )
+
+        with (
+            patch.object(OcrService, "_extract_page_image", return_value=b"image_data"),
+            patch.object(OcrService, "_process_page_with_image", fake_process),
+        ):
+            service = OcrService(max_workers=2, max_inflight_pages=1)
+            result = service.process_document(mock_document)
+
+        assert result.status == Status.FAILED
+        assert list(result.pages) == ["1", "3", "4"]
+        assert len(result.errors) == 1
+        assert "Error processing page 2" in result.errors[0]
+
     def test_feature_combo_no_features(self):
         """Test feature combination with no enhanced features."""
         with patch("boto3.client"):
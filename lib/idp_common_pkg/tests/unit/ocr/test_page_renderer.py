@@ -0,0 +1,120 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Unit tests for PDF page rendering, including multi-process rendering.
+"""
+
+import io
+from unittest.mock import patch
+
+import pytest
+
+pdfium = pytest.importorskip("pypdfium2")
+Image = pytest.importorskip("PIL.Image")
+ImageDraw = pytest.importorskip("PIL.ImageDraw")
+
+from idp_common.ocr import page_renderer  # noqa: E402
+from idp_common.ocr.page_renderer import (  # noqa: E402
+    _split_contiguous,
+    iter_rendered_pages,
+    resolve_render_processes,
+)
+
+
+def _make_pdf(num_pages: int) -> bytes:
+    """Build a small multi-page PDF with distinct text on each page."""
+    images = []
+    for i in range(num_pages):
+        img = Image.new("RGB", (612, 792), "white")
+        ImageDraw.Draw(img).text((72, 72 + i * 12), f"Page {i + 1}", fill="black")
+        images.append(img)
+    buffer = io.BytesIO()
+    images[0].save(buffer, format="PDF", save_all=True, append_images=images[1:])
+    return buffer.getvalue()
+
+
+def _open(pdf_bytes: bytes):
+    pdf_document = pdfium.PdfDocument(pdf_bytes)
+    pdf_document.init_forms()
+    return pdf_document
+
+
+@pytest.mark.unit
+class TestResolveRenderProcesses:
+    @pytest.fixture(autouse=True)
+    def four_cpus(self):
+        with patch.object(
+            page_renderer.os,
+            "sched_getaffinity",
+            return_value={0, 1, 2, 3},
+            create=True,
+        ):
+            yield
+
+    def test_default_is_in_process(self):
+        assert resolve_render_processes(None, 500) == 1
+        assert resolve_render_processes(1, 500) == 1
+
+    def test_zero_uses_available_cpus(self):
+        assert resolve_render_processes(0, 500) == 4
+
+    def test_capped_by_cpus(self):
+        assert resolve_render_processes(16, 500) == 4
+
+    def test_small_documents_render_in_process(self):
+        # Each worker needs MIN_PAGES_PER_RENDER_PROCESS pages to be worth spawning
+        assert resolve_render_processes(4, 10) == 1
+        assert resolve_render_processes(4, 16) == 2
+
+
+@pytest.mark.unit
+def test_split_contiguous_covers_all_pages_in_order():
+    ranges = _split_contiguous(list(range(10)), 3)
+    assert ranges == [[0, 1, 2, 3], [4, 5, 6], [7, 8, 9]]
+    assert _split_contiguous([0, 1], 4) == [[0], [1]]
+
+
+@pytest.mark.unit
+def test_multiprocess_render_matches_serial_render():
+    pdf_bytes = _make_pdf(6)
+    resize_config = {"target_width": 400, "target_height": 500}
+    pdf_document = _open(pdf_bytes)
+    try:
+        serial = dict(
+            iter_rendered_pages(
+                pdf_document, list(range(6)), 150, resize_config, pdf_bytes, 1
+            )
+        )
+        parallel = dict(
+            iter_rendered_pages(
+                pdf_document, list(range(6)), 150, resize_config, pdf_bytes, 2
+            )
+        )
+    finally:
+        pdf_document.close()
+
+    assert sorted(parallel) == list(range(6))
+    assert parallel == serial
+
+
+@pytest.mark.unit
+def test_falls_back_to_in_process_when_workers_cannot_start():
+    pdf_bytes = _make_pdf(4)
+    pdf_document = _open(pdf_bytes)
+    try:
+        with patch.object(
+            page_renderer.multiprocessing,
+            "get_context",
+            side_effect=OSError("no /dev/shm"),
+        ):
+            pages = list(
+                iter_rendered_pages(
+                    pdf_document, [0, 1, 2, 3], 72, None, pdf_bytes, processes=2
+                )
+            )
+    finally:
+        pdf_document.close()
+
+    assert [index for index, _ in pages] == [0, 1, 2, 3]
+    assert all(img.startswith(b"\xff\xd8") for _, img in pages)
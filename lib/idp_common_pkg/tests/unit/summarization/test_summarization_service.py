@@ -243,6 +243,7 @@ class TestSummarizationService:
             context="Summarization",
             model_lambda_hook_arn=None,
             reasoning_effort=None,
+            cache_scope=None,
         )
 
         # Verify result
@@ -0,0 +1,215 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Unit tests for the sharded, weighted workflow admission controller.
+"""
+
+import boto3
+import pytest
+from moto import mock_aws
+
+from idp_common import admission
+from idp_common.admission import AdmissionController, AdmissionTicket
+
+TABLE = "concurrency-table"
+
+
+@pytest.fixture
+def table(monkeypatch):
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+    with mock_aws():
+        boto3.client("dynamodb", region_name="us-east-1").create_table(
+            TableName=TABLE,
+            KeySchema=[{"AttributeName": "counter_id", "KeyType": "HASH"}],
+            AttributeDefinitions=[
+                {"AttributeName": "counter_id", "AttributeType": "S"}
+            ],
+            BillingMode="PAY_PER_REQUEST",
+        )
+        table = boto3.resource("dynamodb", region_name="us-east-1").Table(TABLE)
+        # Created by the InitializeCounter custom resource at deploy time
+        table.put_item(Item={"counter_id": "workflow_counter", "active_count": 0})
+        yield table
+
+
+def _count(table, counter_id="workflow_counter"):
+    item = table.get_item(Key={"counter_id": counter_id}).get("Item") or {}
+    return item.get("active_count", 0)
+
+
+@pytest.mark.unit
+class TestDocumentAdmission:
+    def test_single_shard_admits_up_to_capacity(self, table):
+        controller = AdmissionController(table, capacity=3)
+
+        tickets = [controller.try_acquire(f"doc-{i}") for i in range(4)]
+
+        assert tickets[3] is None
+        assert all(t.shard_id == "workflow_counter" for t in tickets[:3])
+        assert _count(table) == 3
+
+    def test_single_shard_issues_the_original_counter_write(self):
+        calls = []
+
+        class Table:
+            def update_item(self, **kwargs):
+                calls.append(kwargs)
+                return {}
+
+        AdmissionController(Table(), capacity=5).try_acquire("doc.pdf")
+
+        assert calls == [
+            {
+                "Key": {"counter_id": "workflow_counter"},
+                "UpdateExpression": "ADD active_count :inc",
+                "ConditionExpression": "active_count <= :room",
+                "ExpressionAttributeValues": {":inc": 1, ":room": 4},
+                "ReturnValues": "UPDATED_NEW",
+            }
+        ]
+
+    def test_release_returns_capacity(self, table):
+        controller = AdmissionController(table, capacity=1)
+        ticket = controller.try_acquire("doc-1")
+        assert controller.try_acquire("doc-2") is None
+
+        assert controller.release(ticket) == 0
+        assert controller.try_acquire("doc-2") is not None
+
+
+@pytest.mark.unit
+class TestShardedAdmission:
+    def test_capacity_is_split_across_shards(self, table):
+        controller = AdmissionController(table, capacity=10, shards=4, probes=4)
+
+        assert controller.shard_ids() == [
+            "workflow_counter",
+            "workflow_counter#1",
+            "workflow_counter#2",
+            "workflow_counter#3",
+        ]
+        assert [controller.shard_capacity(i) for i in range(4)] == [3, 3, 2, 2]
+
+    def test_probing_all_shards_uses_full_capacity(self, table):
+        controller = AdmissionController(table, capacity=10, shards=4, probes=4)
+
+        tickets = [controller.try_acquire(f"doc-{i}") for i in range(11)]
+
+        assert sum(t is not None for t in tickets) == 10
+        assert sum(_count(table, s) for s in controller.shard_ids()) == 10
+
+    def test_release_decrements_the_admitting_shard(self, table):
+        controller = AdmissionController(table, capacity=8, shards=4)
+        ticket = controller.try_acquire("doc-1")
+
+        admission.release(table, AdmissionTicket.from_dict(ticket.to_dict()))
+
+        assert all(_count(table, s) == 0 for s in controller.shard_ids())
+
+    def test_shards_never_exceed_capacity(self, table):
+        controller = AdmissionController(table, capacity=3, shards=8)
+
+        assert controller.shards == 3
+
+
+@pytest.mark.unit
+class TestWeightedAdmission:
+    def test_page_weights_from_count_or_size(self):
+        controller = AdmissionController(
+            None, capacity=100, weight_mode="pages", bytes_per_page=1000
+        )
+
+        assert controller.weight(page_count=12) == 12
+        assert controller.weight(object_size=2500) == 3
+        assert controller.weight() == 1
+
+    def test_token_weights(self):
+        controller = AdmissionController(
+            None, capacity=10**6, weight_mode="tokens", tokens_per_page=1000
+        )
+
+        assert controller.weight(page_count=4) == 4000
+
+    def test_document_weight_ignores_pages(self):
+        assert AdmissionController(None, capacity=5).weight(page_count=500) == 1
+
+    def test_pages_share_capacity(self, table):
+        controller = AdmissionController(table, capacity=100, weight_mode="pages")
+
+        assert controller.try_acquire("big", weight=70).weight == 70
+        assert controller.try_acquire("medium", weight=40) is None
+        assert controller.try_acquire("small", weight=30) is not None
+        assert _count(table) == 100
+
+    def test_oversized_document_is_admitted_into_an_idle_shard(self, table):
+        controller = AdmissionController(table, capacity=100, weight_mode="pages")
+
+        ticket = controller.try_acquire("huge", weight=1000)
+
+        assert ticket.weight == 100
+        assert controller.try_acquire("small", weight=1) is None
+
+    def test_rejects_unknown_weight_mode(self):
+        with pytest.raises(ValueError, match="Unsupported admission weight mode"):
+            AdmissionController(None, capacity=5, weight_mode="bytes")
+
+
+@pytest.mark.unit
+class TestPriorityLanes:
+    def test_low_lane_leaves_headroom_for_high(self, table):
+        controller = AdmissionController(
+            table, capacity=10, lane_limits={"normal": 0.8, "low": 0.5}
+        )
+
+        low = [controller.try_acquire(f"low-{i}", lane="low") for i in range(6)]
+        normal = [controller.try_acquire(f"n-{i}", lane="normal") for i in range(4)]
+        high = [controller.try_acquire(f"h-{i}", lane="high") for i in range(3)]
+
+        assert sum(t is not None for t in low) == 5
+        assert sum(t is not None for t in normal) == 3
+        assert sum(t is not None for t in high) == 2
+        assert _count(table) == 10
+
+    def test_unknown_lane_is_normal(self, table):
+        controller = AdmissionController(table, capacity=10)
+
+        assert controller.try_acquire("doc", lane="urgent").lane == "normal"
+
+    def test_parse_lane_limits(self):
+        assert admission.parse_lane_limits("normal=0.8, LOW=0.25,bogus=1,low=x") == {
+            "normal": 0.8,
+            "low": 0.25,
+        }
+        assert admission.parse_lane_limits(None) == {}
+
+
+@pytest.mark.unit
+class TestConfiguration:
+    def test_from_environment_defaults_match_original_counter(self, monkeypatch):
+        for name in ("ADMISSION_CAPACITY", "ADMISSION_SHARDS", "ADMISSION_WEIGHT"):
+            monkeypatch.delenv(name, raising=False)
+        monkeypatch.setenv("MAX_CONCURRENT", "25")
+
+        controller = AdmissionController.from_environment(None)
+
+        assert (controller.capacity, controller.shards) == (25, 1)
+        assert controller.weight_mode == "documents"
+
+    def test_from_environment_reads_admission_settings(self, monkeypatch):
+        monkeypatch.setenv("MAX_CONCURRENT", "25")
+        monkeypatch.setenv("ADMISSION_CAPACITY", "2000")
+        monkeypatch.setenv("ADMISSION_SHARDS", "8")
+        monkeypatch.setenv("ADMISSION_WEIGHT", "Pages")
+        monkeypatch.setenv("ADMISSION_LANE_LIMITS", "low=0.5")
+
+        controller = AdmissionController.from_environment(None)
+
+        assert (controller.capacity, controller.shards) == (2000, 8)
+        assert controller.weight_mode == "pages"
+        assert controller.lane_limits == {"low": 0.5}
+
+    def test_ticket_without_admission_data_releases_original_counter(self):
+        ticket = AdmissionTicket.from_dict(None)
+
+        assert (ticket.shard_id, ticket.weight) == ("workflow_counter", 1)
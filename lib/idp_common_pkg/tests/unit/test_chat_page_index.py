@@ -0,0 +1,112 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""Unit tests for the Chat-with-Document page retrieval index."""
+
+import json
+
+import pytest
+
+from idp_common.chat_page_index import (
+    ChatPageIndex,
+    pages_from_full_text,
+    tokenize,
+)
+
+pytestmark = pytest.mark.unit
+
+
+def _full_text(pages):
+    return "\n".join(
+        f"<page-number>{i}</page-number>\n{text}\n"
+        for i, text in enumerate(pages, start=1)
+    )
+
+
+PAGES = [
+    "LEASE AGREEMENT between Northwind Properties and Contoso Ltd, dated 2024-01-05.",
+    "Rent is payable monthly. The tenant pays utilities.",
+    "The landlord maintains the roof and structural elements.",
+    "Termination: either party may terminate with ninety days notice.",
+    "Insurance: the tenant carries liability insurance of 2,000,000.",
+    "Schedule A lists the premises and parking spaces.",
+]
+
+
+def test_pages_from_full_text_splits_on_page_tags():
+    assert pages_from_full_text(_full_text(["first", "second"])) == [
+        ("1", "first"),
+        ("2", "second"),
+    ]
+    assert pages_from_full_text("untagged text") == [("1", "untagged text")]
+    assert pages_from_full_text("") == []
+
+
+def test_tokenize_drops_stopwords_and_single_letters_but_keeps_digits():
+    assert tokenize("What is the Rent on page 7 of a lease?") == [
+        "rent",
+        "page",
+        "7",
+        "lease",
+    ]
+
+
+def test_search_ranks_the_page_with_the_rare_term_first():
+    index = ChatPageIndex.from_full_text(_full_text(PAGES))
+
+    assert index.page_count == 6
+    assert index.search("Who carries liability insurance?", top_k=2)[0] == "5"
+    assert index.search("How much notice to terminate?", top_k=1) == ["4"]
+
+
+def test_search_without_matches_returns_leading_pages():
+    index = ChatPageIndex.from_full_text(_full_text(PAGES))
+
+    assert index.search("Summarize this", top_k=3) == ["1", "2", "3"]
+
+
+def test_embeddings_are_fused_with_bm25():
+    vectors = [[1.0, 0.0]] * 5 + [[0.0, 1.0]]
+    index = ChatPageIndex.from_full_text(
+        _full_text(PAGES),
+        embed_pages=lambda texts: vectors[: len(texts)],
+        embedding_model="amazon.titan-embed-text-v2:0",
+    )
+
+    # No word overlap with page 6, but its vector matches the question's
+    assert index.search("Where can I park?", top_k=1, query_embedding=[0.0, 1.0]) == [
+        "6"
+    ]
+    # BM25 and embeddings both contribute to the fused ranking
+    top = index.search("liability insurance", top_k=2, query_embedding=[0.0, 1.0])
+    assert set(top) == {"5", "6"}
+
+
+def test_render_adds_header_only_when_first_page_is_not_selected():
+    index = ChatPageIndex.from_full_text(_full_text(PAGES), header_chars=30)
+
+    text = index.render(["5", "3"])
+    assert text.startswith("The document has 6 pages. Only the 2 pages")
+    assert "<document-header>\nLEASE AGREEMENT between Northw\n" in text
+    assert text.index("<page-number>3</page-number>") < text.index(
+        "<page-number>5</page-number>"
+    )
+    assert "<page-number>4</page-number>" not in text
+
+    assert "<document-header>" not in index.render(["1", "5"])
+
+
+def test_round_trips_through_json():
+    index = ChatPageIndex.from_full_text(
+        _full_text(PAGES),
+        embed_pages=lambda texts: [[float(i), 1.0] for i in range(len(texts))],
+        embedding_model="model",
+        source='"etag"',
+    )
+
+    loaded = ChatPageIndex.from_dict(json.loads(json.dumps(index.to_dict())))
+
+    assert loaded.to_dict() == index.to_dict()
+    assert loaded.search("ninety days notice") == index.search("ninety days notice")
+    with pytest.raises(ValueError):
+        ChatPageIndex.from_dict({**index.to_dict(), "version": 0})
@@ -0,0 +1,216 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""Unit tests for bulk document deletion."""
+
+from unittest.mock import Mock
+
+import boto3
+import pytest
+from moto import mock_aws
+
+from idp_common import delete_documents as dd
+
+TABLE = "TrackingTable-test"
+INPUT_BUCKET = "input-bucket"
+OUTPUT_BUCKET = "output-bucket"
+
+
+@pytest.fixture
+def aws(monkeypatch):
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+    with mock_aws():
+        dynamodb = boto3.resource("dynamodb", region_name="us-east-1")
+        table = dynamodb.create_table(
+            TableName=TABLE,
+            KeySchema=[
+                {"AttributeName": "PK", "KeyType": "HASH"},
+                {"AttributeName": "SK", "KeyType": "RANGE"},
+            ],
+            AttributeDefinitions=[
+                {"AttributeName": "PK", "AttributeType": "S"},
+                {"AttributeName": "SK", "AttributeType": "S"},
+            ],
+            BillingMode="PAY_PER_REQUEST",
+        )
+        s3 = boto3.client("s3", region_name="us-east-1")
+        s3.create_bucket(Bucket=INPUT_BUCKET)
+        s3.create_bucket(Bucket=OUTPUT_BUCKET)
+        s3.put_bucket_versioning(
+            Bucket=OUTPUT_BUCKET, VersioningConfiguration={"Status": "Enabled"}
+        )
+        yield table, s3
+
+
+def _seed(table, s3, key, queued_time, list_time=None, runs=2):
+    date_part, shard = dd.calculate_shard(list_time or queued_time)
+    table.put_item(Item={"PK": f"doc#{key}", "SK": "none", "QueuedTime": queued_time})
+    table.put_item(
+        Item={
+            "PK": f"list#{date_part}#s#{shard}",
+            "SK": f"ts#{list_time or queued_time}#id#{key}",
+            "ObjectKey": key,
+        }
+    )
+    for run in range(runs):
+        table.put_item(Item={"PK": f"doc#{key}", "SK": f"run#{run}"})
+    s3.put_object(Bucket=INPUT_BUCKET, Key=key, Body=b"pdf")
+    for name in ("sections/1/result.json", "pages/1/result.json"):
+        s3.put_object(Bucket=OUTPUT_BUCKET, Key=f"{key}/{name}", Body=b"v1")
+    # A prior run's version, pinned by document version history
+    s3.put_object(Bucket=OUTPUT_BUCKET, Key=f"{key}/pages/1/result.json", Body=b"v2")
+
+
+def _table_keys(table):
+    return {(item["PK"], item["SK"]) for item in table.scan()["Items"]}
+
+
+@pytest.mark.unit
+class TestBulkDeleteDocuments:
+    def test_deletes_everything_delete_single_document_would(self, aws):
+        table, s3 = aws
+        keys = [f"batch/doc-{i:02d}.pdf" for i in range(23)]
+        for i, key in enumerate(keys):
+            _seed(table, s3, key, f"2025-09-10T{i:02d}:15:00+00:00")
+        _seed(table, s3, "keep/other.pdf", "2025-09-10T09:00:00+00:00")
+        progress = []
+
+        result = dd.bulk_delete_documents(
+            (key for key in keys),
+            table,
+            s3,
+            INPUT_BUCKET,
+            OUTPUT_BUCKET,
+            workers=3,
+            chunk_size=5,
+            progress_callback=lambda done, deleted: progress.append(done),
+        )
+
+        assert result["success"] is True
+        assert (result["deleted_count"], result["total_count"]) == (23, 23)
+        assert sorted(r["object_key"] for r in result["results"]) == keys
+        for r in result["results"]:
+            assert r["deleted"] == {
+                "input_file": True,
+                "output_files": 3,
+                "list_entries": True,
+                "document_record": True,
+                "run_records": 2,
+            }
+        assert sorted(progress)[-1] == 23 and len(progress) == 5
+        assert result["documents_per_second"] > 0
+
+        remaining = _table_keys(table)
+        assert {pk for pk, _ in remaining} == {
+            "doc#keep/other.pdf",
+            "list#2025-09-10#s#02",
+        }
+        assert len(remaining) == 4
+        inputs = s3.list_objects_v2(Bucket=INPUT_BUCKET)["Contents"]
+        assert [o["Key"] for o in inputs] == ["keep/other.pdf"]
+        versions = s3.list_object_versions(Bucket=OUTPUT_BUCKET)
+        assert {v["Key"].split("/")[0] for v in versions["Versions"]} == {"keep"}
+        assert "DeleteMarkers" not in versions
+
+    def test_list_entries_with_drifted_timestamps_are_found_by_shard_query(self, aws):
+        table, s3 = aws
+        # Same shard, different timestamp; and the previous shard
+        _seed(table, s3, "a.pdf", "2025-09-10T05:00:00+00:00", "2025-09-10T06:00:00")
+        _seed(table, s3, "b.pdf", "2025-09-10T08:00:00+00:00", "2025-09-10T07:59:00")
+
+        result = dd.bulk_delete_documents(
+            ["a.pdf", "b.pdf"], table, s3, INPUT_BUCKET, OUTPUT_BUCKET
+        )
+
+        assert all(r["deleted"]["list_entries"] for r in result["results"])
+        assert _table_keys(table) == set()
+
+    def test_dry_run_deletes_nothing_and_previews_cost(self, aws):
+        table, s3 = aws
+        keys = [f"doc-{i}.pdf" for i in range(12)]
+        for key in keys:
+            _seed(table, s3, key, "2025-09-10T12:00:00+00:00")
+        before = _table_keys(table)
+
+        result = dd.bulk_delete_documents(
+            keys + ["missing.pdf"],
+            table,
+            s3,
+            INPUT_BUCKET,
+            OUTPUT_BUCKET,
+            dry_run=True,
+            chunk_size=4,
+        )
+
+        assert result["dry_run"] is True
+        assert _table_keys(table) == before
+        assert len(s3.list_objects_v2(Bucket=INPUT_BUCKET)["Contents"]) == 12
+        preview = result["preview"]
+        assert preview["documents"] == 13
+        assert preview["document_records"] == 12
+        assert preview["list_entries"] == 12
+        assert preview["run_records"] == 24
+        assert preview["output_object_versions"] == 36
+        # Per chunk of 4: one BatchWriteItem for list and run items, one for
+        # document records, one DeleteObjects each for inputs and outputs
+        assert preview["bulk_requests"]["BatchWriteItem"] == 6
+        assert preview["bulk_requests"]["DeleteObjects"] == 7
+        assert preview["bulk_request_count"] < preview["per_document_request_count"]
+        assert preview["estimated_cost_usd"] > 0
+        assert result["requests"]["BatchWriteItem"] == 0
+
+
+@pytest.mark.unit
+class TestBatchedRequests:
+    def test_batch_write_retries_unprocessed_items(self, monkeypatch):
+        monkeypatch.setattr(dd, "_batch_backoff", lambda attempt: None)
+        client = Mock()
+        keys = [("doc#k", f"run#{i}") for i in range(30)]
+
+        def batch_write_item(RequestItems):
+            requests = RequestItems[TABLE]
+            assert len(requests) <= dd.DYNAMODB_WRITE_BATCH_SIZE
+            if len(requests) > 2:
+                return {"UnprocessedItems": {TABLE: requests[-2:]}}
+            return {"UnprocessedItems": {}}
+
+        client.batch_write_item.side_effect = batch_write_item
+        counts = {"BatchWriteItem": 0}
+
+        errors = dd._batch_delete_keys(client, TABLE, keys, counts)
+
+        assert errors == {}
+        # 25 + 5 keys, each batch retried once for its unprocessed pair
+        assert counts["BatchWriteItem"] == 4
+
+    def test_batch_write_reports_items_still_unprocessed(self, monkeypatch):
+        monkeypatch.setattr(dd, "_batch_backoff", lambda attempt: None)
+        client = Mock()
+        client.batch_write_item.side_effect = lambda RequestItems: {
+            "UnprocessedItems": RequestItems
+        }
+        counts = {"BatchWriteItem": 0}
+
+        errors = dd._batch_delete_keys(client, TABLE, [("doc#k", "none")], counts)
+
+        assert list(errors) == [("doc#k", "none")]
+        assert counts["BatchWriteItem"] == dd.BATCH_MAX_ATTEMPTS
+
+    def test_delete_objects_uses_1000_key_batches_and_reports_errors(self):
+        s3 = Mock()
+        s3.delete_objects.side_effect = [
+            {"Errors": [{"Key": "k7", "Code": "AccessDenied", "Message": "no"}]},
+            {},
+            {},
+        ]
+        counts = {"DeleteObjects": 0}
+        objects = [{"Key": f"k{i}"} for i in range(2500)]
+
+        errors = dd._delete_s3_objects(s3, OUTPUT_BUCKET, objects, counts)
+
+        sizes = [
+            len(call.kwargs["Delete"]["Objects"])
+            for call in s3.delete_objects.call_args_list
+        ]
+        assert sizes == [1000, 1000, 500]
+        assert errors == {"k7": "AccessDenied: no"}
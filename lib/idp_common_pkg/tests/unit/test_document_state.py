@@ -0,0 +1,215 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Unit tests for the idp-docstate binary Document state format.
+"""
+
+import json
+
+import boto3
+import pytest
+from moto import mock_aws
+
+from idp_common import document_state
+from idp_common.models import Document, Page, Section, Status
+
+BUCKET = "test-working-bucket"
+
+
+def _document(num_sections: int = 3, pages_per_section: int = 2) -> Document:
+    document = Document(
+        id="doc-1",
+        input_bucket="input-bucket",
+        input_key="doc-1.pdf",
+        output_bucket="output-bucket",
+        status=Status.CLASSIFYING,
+        num_pages=num_sections * pages_per_section,
+        config_version="v1",
+        metering={"OCR/textract/analyze_document": {"pages": 6}},
+    )
+    page_number = 1
+    for s in range(1, num_sections + 1):
+        page_ids = []
+        for _ in range(pages_per_section):
+            page_id = str(page_number)
+            document.pages[page_id] = Page(
+                page_id=page_id,
+                classification=f"class-{s}",
+                confidence=0.9,
+                parsed_text_uri=f"s3://output-bucket/doc-1/pages/{page_id}/text.json",
+                forms={"field": f"value {page_id}"},
+            )
+            page_ids.append(page_id)
+            page_number += 1
+        document.sections.append(
+            Section(
+                section_id=str(s),
+                classification=f"class-{s}",
+                page_ids=page_ids,
+                attributes={"total": s * 10},
+            )
+        )
+    return document
+
+
+@pytest.mark.unit
+class TestDocumentStateCodec:
+    def test_round_trip_matches_to_dict(self):
+        document_dict = _document().to_dict()
+
+        data = document_state.encode(document_dict)
+
+        assert document_state.is_binary_state(data)
+        assert json.loads(json.dumps(document_state.decode(data), default=str)) == (
+            json.loads(json.dumps(document_dict, default=str))
+        )
+
+    def test_lazy_decode_returns_requested_sections_and_their_pages(self):
+        data = document_state.encode(_document().to_dict())
+
+        decoded = document_state.decode(data, section_ids=["2"])
+
+        assert [s["section_id"] for s in decoded["sections"]] == ["2"]
+        assert sorted(decoded["pages"]) == ["3", "4"]
+        assert decoded["id"] == "doc-1"
+        assert decoded["metering"] == {"OCR/textract/analyze_document": {"pages": 6}}
+
+    def test_lazy_decode_spans_blocks(self, monkeypatch):
+        monkeypatch.setattr(document_state, "BLOCK_SIZE", 2)
+        data = document_state.encode(_document(num_sections=5).to_dict())
+
+        decoded = document_state.decode(data, section_ids=["5", "1"])
+
+        # Document order is preserved regardless of request order
+        assert [s["section_id"] for s in decoded["sections"]] == ["1", "5"]
+        assert sorted(decoded["pages"], key=int) == ["1", "2", "9", "10"]
+
+    def test_section_ids_read_from_index(self):
+        data = document_state.encode(_document(num_sections=4).to_dict())
+
+        assert document_state.section_ids(data) == ["1", "2", "3", "4"]
+
+    def test_filter_sections_matches_lazy_decode(self):
+        document_dict = _document().to_dict()
+        data = document_state.encode(document_dict)
+
+        filtered = document_state.filter_sections(document_dict, ["3"])
+
+        assert filtered["sections"] == document_state.decode(data, ["3"])["sections"]
+        assert sorted(filtered["pages"]) == ["5", "6"]
+        # The source dictionary is left untouched
+        assert len(document_dict["sections"]) == 3
+
+    def test_binary_state_is_smaller_than_json(self):
+        document_dict = _document(num_sections=40).to_dict()
+
+        data = document_state.encode(document_dict)
+
+        assert len(data) < len(json.dumps(document_dict, default=str)) / 3
+
+    def test_rejects_unknown_version(self):
+        data = bytearray(document_state.encode(_document().to_dict()))
+        data[len(document_state.MAGIC)] = 99
+
+        with pytest.raises(ValueError, match="Unsupported idp-docstate version 99"):
+            document_state.decode(bytes(data))
+
+    @pytest.mark.parametrize(
+        "value, expected",
+        [(None, "json"), ("json", "json"), ("BINARY", "binary"), ("other", "json")],
+    )
+    def test_state_format_from_environment(self, monkeypatch, value, expected):
+        if value is None:
+            monkeypatch.delenv("DOCUMENT_STATE_FORMAT", raising=False)
+        else:
+            monkeypatch.setenv("DOCUMENT_STATE_FORMAT", value)
+
+        assert document_state.state_format() == expected
+
+
+@pytest.fixture
+def s3_bucket(monkeypatch):
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+    with mock_aws():
+        boto3.client("s3", region_name="us-east-1").create_bucket(Bucket=BUCKET)
+        yield
+
+
+@pytest.mark.unit
+@pytest.mark.usefixtures("s3_bucket")
+class TestDocumentBinaryState:
+    def test_compress_writes_binary_state_when_configured(self, monkeypatch):
+        monkeypatch.setenv("DOCUMENT_STATE_FORMAT", "binary")
+        document = _document()
+
+        wrapper = document.compress(BUCKET, "classification")
+
+        assert wrapper["s3_uri"].endswith("_classification_state.idpds")
+        body = (
+            boto3.client("s3", region_name="us-east-1")
+            .get_object(Bucket=BUCKET, Key=wrapper["s3_uri"].split("/", 3)[3])["Body"]
+            .read()
+        )
+        assert document_state.is_binary_state(body)
+        restored = Document.decompress(BUCKET, wrapper)
+        assert restored.to_dict() == document.to_dict()
+
+    def test_decompress_reads_both_formats(self, monkeypatch):
+        document = _document()
+        json_wrapper = document.compress(BUCKET, "ocr")
+        monkeypatch.setenv("DOCUMENT_STATE_FORMAT", "binary")
+        binary_wrapper = document.compress(BUCKET, "classification")
+
+        assert json_wrapper["s3_uri"].endswith(".json")
+        for wrapper in (json_wrapper, binary_wrapper):
+            assert Document.decompress(BUCKET, wrapper).to_dict() == document.to_dict()
+
+    @pytest.mark.parametrize("state_format", ["json", "binary"])
+    def test_load_document_hydrates_only_requested_section(
+        self, monkeypatch, state_format
+    ):
+        monkeypatch.setenv("DOCUMENT_STATE_FORMAT", state_format)
+        wrapper = _document().compress(BUCKET, "classification")
+
+        section_document = Document.load_document(wrapper, BUCKET, section_ids=["2"])
+
+        assert [s.section_id for s in section_document.sections] == ["2"]
+        assert sorted(section_document.pages) == ["3", "4"]
+        assert section_document.config_version == "v1"
+
+    def test_load_document_filters_uncompressed_sections(self):
+        section_document = Document.load_document(
+            _document().to_dict(), BUCKET, section_ids=["3"]
+        )
+
+        assert [s.section_id for s in section_document.sections] == ["3"]
+        assert sorted(section_document.pages) == ["5", "6"]
+
+    def test_serialize_document_always_compress_binary(self, monkeypatch):
+        monkeypatch.setenv("DOCUMENT_STATE_FORMAT", "binary")
+        document = _document()
+
+        wrapper = document.serialize_document(BUCKET, "extraction_1")
+
+        assert wrapper["compressed"] is True
+        assert wrapper["sections"] == ["1", "2", "3"]
+        assert Document.decompress(BUCKET, wrapper).to_dict() == document.to_dict()
+
+
+@pytest.mark.unit
+class TestSectionIdsFromEvent:
+    def test_compressed_wrapper(self):
+        assert Document.section_ids_from_event(
+            {"compressed": True, "sections": ["1", "2"]}
+        ) == ["1", "2"]
+
+    def test_uncompressed_document(self):
+        assert Document.section_ids_from_event(_document().to_dict()) == [
+            "1",
+            "2",
+            "3",
+        ]
+
+    def test_missing_document(self):
+        assert Document.section_ids_from_event(None) == []
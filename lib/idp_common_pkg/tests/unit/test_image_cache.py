@@ -0,0 +1,180 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Unit tests for the resized image cache used by image.prepare_image.
+"""
+
+import io
+from unittest.mock import MagicMock, patch
+
+import pytest
+from botocore.exceptions import ClientError
+from PIL import Image
+
+from idp_common import image
+from idp_common.image import cache as image_cache
+from idp_common.image.cache import ResizedImageCache, make_key
+
+
+def _png(width: int = 400, height: int = 600) -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", (width, height), "white").save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+class FakeS3:
+    """Minimal in-memory S3 client supporting head/get/put_object."""
+
+    def __init__(self, objects):
+        self.objects = dict(objects)
+        self.get_object_calls = []
+        self.head_object_calls = []
+
+    def _etag(self, Bucket, Key):
+        return f'"etag-{len(self.objects[(Bucket, Key)])}"'
+
+    def head_object(self, Bucket, Key):
+        self.head_object_calls.append(Key)
+        if (Bucket, Key) not in self.objects:
+            raise ClientError({"Error": {"Code": "404"}}, "HeadObject")
+        return {"ETag": self._etag(Bucket, Key)}
+
+    def get_object(self, Bucket, Key):
+        self.get_object_calls.append(Key)
+        if (Bucket, Key) not in self.objects:
+            raise ClientError({"Error": {"Code": "NoSuchKey"}}, "GetObject")
+        body = MagicMock()
+        body.read.return_value = self.objects[(Bucket, Key)]
+        return {"Body": body, "ETag": self._etag(Bucket, Key)}
+
+    def put_object(self, Bucket, Key, Body):
+        self.objects[(Bucket, Key)] = Body
+
+
+@pytest.fixture
+def fake_s3():
+    client = FakeS3({("bucket", "doc/pages/1/image.png"): _png()})
+
+    def get_binary_content(uri):
+        return client.get_object("bucket", uri.split("bucket/", 1)[1])["Body"].read()
+
+    with (
+        patch.object(image_cache, "get_s3_client", return_value=client),
+        patch.object(image, "get_binary_content", side_effect=get_binary_content),
+    ):
+        yield client
+
+
+def _use_cache(cache):
+    return patch.object(image, "get_image_cache", return_value=cache)
+
+
+@pytest.mark.unit
+class TestResizedImageCache:
+    def test_repeated_prepare_image_hits_memory_without_head(self, fake_s3):
+        cache = ResizedImageCache(max_bytes=10 * 1024 * 1024)
+        uri = "s3://bucket/doc/pages/1/image.png"
+        with (
+            _use_cache(cache),
+            patch.object(image, "resize_image", wraps=image.resize_image) as resize,
+        ):
+            first = image.prepare_image(uri, 200, 300)
+            second = image.prepare_image(uri, 200, 300)
+            image.prepare_image(uri, "200", "300")
+
+        assert first == second
+        assert Image.open(io.BytesIO(first)).size == (200, 300)
+        assert resize.call_count == 1
+        # The memory tier is keyed by the ETag of the GET; no HeadObject
+        assert fake_s3.get_object_calls == ["doc/pages/1/image.png"] * 3
+        assert fake_s3.head_object_calls == []
+        stats = cache.stats()
+        assert stats["memory_hits"] == 2
+        assert stats["misses"] == 1
+        assert stats["hit_ratio"] == pytest.approx(2 / 3)
+
+    def test_different_sizes_and_upscale_are_separate_entries(self, fake_s3):
+        cache = ResizedImageCache(max_bytes=10 * 1024 * 1024)
+        uri = "s3://bucket/doc/pages/1/image.png"
+        with _use_cache(cache):
+            image.prepare_image(uri, 200, 300)
+            image.prepare_image(uri, 100, 150)
+            image.prepare_image(uri, 800, 1200, allow_upscale=True)
+
+        assert cache.stats()["misses"] == 3
+        assert cache.stats()["entries"] == 3
+
+    def test_changed_source_etag_misses(self, fake_s3):
+        cache = ResizedImageCache(max_bytes=10 * 1024 * 1024)
+        uri = "s3://bucket/doc/pages/1/image.png"
+        with _use_cache(cache):
+            image.prepare_image(uri, 200, 300)
+            fake_s3.objects[("bucket", "doc/pages/1/image.png")] = _png(500, 500)
+            resized = image.prepare_image(uri, 200, 300)
+
+        assert Image.open(io.BytesIO(resized)).size == (200, 200)
+        assert cache.stats()["misses"] == 2
+
+    def test_lru_evicts_by_bytes(self):
+        cache = ResizedImageCache(max_bytes=100)
+        cache.put(make_key("a", 1, 1, False), b"x" * 60)
+        cache.put(make_key("b", 1, 1, False), b"x" * 60)
+
+        assert cache.get(make_key("a", 1, 1, False)) is None
+        assert cache.get(make_key("b", 1, 1, False)) == b"x" * 60
+        assert cache.stats()["evictions"] == 1
+        assert cache.stats()["bytes"] == 60
+
+    def test_s3_sidecar_shared_across_processes(self, fake_s3):
+        uri = "s3://bucket/doc/pages/1/image.png"
+        with _use_cache(ResizedImageCache(max_bytes=0, s3_sidecar=True)):
+            first = image.prepare_image(uri, 200, 300)
+
+        sidecars = [k for _, k in fake_s3.objects if ".resized/" in k]
+        assert sidecars == [
+            "doc/pages/1/image.png.resized/etag-%d-200x300-q95"
+            % len(fake_s3.objects[("bucket", "doc/pages/1/image.png")])
+        ]
+
+        # A fresh cache (e.g. the next pipeline step's Lambda) reads the sidecar
+        later_step = ResizedImageCache(max_bytes=1024 * 1024, s3_sidecar=True)
+        fake_s3.get_object_calls.clear()
+        with _use_cache(later_step), patch.object(image, "resize_image") as resize:
+            second = image.prepare_image(uri, 200, 300)
+
+        resize.assert_not_called()
+        assert second == first
+        assert later_step.stats()["s3_hits"] == 1
+        # A sidecar hit never downloads the source
+        assert "doc/pages/1/image.png" not in fake_s3.get_object_calls
+
+    def test_unresized_variant_is_not_written_to_s3(self, fake_s3):
+        uri = "s3://bucket/doc/pages/1/image.png"
+        with _use_cache(ResizedImageCache(max_bytes=0, s3_sidecar=True)):
+            image.prepare_image(uri, 2000, 2000)
+
+        assert not [k for _, k in fake_s3.objects if ".resized/" in k]
+
+    def test_head_failure_bypasses_cache(self, fake_s3):
+        cache = ResizedImageCache(max_bytes=1024 * 1024, s3_sidecar=True)
+        fake_s3.objects[("bucket", "doc/other.png")] = _png()
+        with (
+            _use_cache(cache),
+            patch.object(fake_s3, "head_object", side_effect=Exception("AccessDenied")),
+        ):
+            resized = image.prepare_image("s3://bucket/doc/other.png", 200, 300)
+
+        assert Image.open(io.BytesIO(resized)).size == (200, 300)
+        assert cache.stats()["misses"] == 0
+
+    def test_bytes_source_is_content_addressed(self):
+        cache = ResizedImageCache(max_bytes=10 * 1024 * 1024)
+        data = _png()
+        with _use_cache(cache):
+            image.prepare_image(data, 200, 300)
+            image.prepare_image(bytes(data), 200, 300)
+            assert image.prepare_image(data) is data
+
+        assert cache.stats()["memory_hits"] == 1
+        assert cache.stats()["misses"] == 1
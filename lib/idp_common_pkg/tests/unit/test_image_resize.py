@@ -0,0 +1,106 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Unit tests for image.resize_image, including the fast downscale path.
+"""
+
+import io
+from unittest.mock import patch
+
+import pytest
+from PIL import Image, ImageChops, ImageDraw, ImageStat
+
+from idp_common import image
+from idp_common.image import resize_image
+
+
+def _page(fmt: str, width: int = 2550, height: int = 3300) -> bytes:
+    """A 300-DPI letter-size page render with some text-like content."""
+    img = Image.new("RGB", (width, height), "white")
+    draw = ImageDraw.Draw(img)
+    for y in range(100, height - 100, 40):
+        draw.line((150, y, width - 150, y), fill="black", width=3)
+    buffer = io.BytesIO()
+    img.save(buffer, format=fmt)
+    return buffer.getvalue()
+
+
+def _open(data: bytes) -> Image.Image:
+    return Image.open(io.BytesIO(data))
+
+
+@pytest.mark.unit
+class TestResizeImage:
+    @pytest.mark.parametrize("fmt", ["JPEG", "PNG"])
+    def test_fast_path_keeps_output_dimensions_and_format(self, fmt):
+        data = _page(fmt)
+
+        default = _open(resize_image(data, 951, 1268))
+        fast = _open(resize_image(data, 951, 1268, fast=True))
+
+        assert fast.size == default.size == (951, 1230)
+        assert fast.format == default.format == fmt
+
+    def test_fast_path_output_is_visually_equivalent(self):
+        data = _page("JPEG")
+
+        default = _open(resize_image(data, 951, 1268)).convert("L")
+        fast = _open(resize_image(data, 951, 1268, fast=True)).convert("L")
+
+        mean_abs_diff = ImageStat.Stat(ImageChops.difference(default, fast)).mean[0]
+        assert mean_abs_diff < 4
+
+    def test_quality_and_optimize_are_configurable(self):
+        data = _page("JPEG")
+
+        high = resize_image(data, 951, 1268, quality=95)
+        low = resize_image(data, 951, 1268, quality=60)
+        unoptimized = resize_image(data, 951, 1268, quality=95, optimize=False)
+
+        assert len(low) < len(high)
+        # optimize only changes Huffman tables, never the decoded pixels
+        assert _open(unoptimized).tobytes() == _open(high).tobytes()
+
+    def test_fast_path_does_not_affect_upscaling(self):
+        data = _page("PNG", 400, 500)
+
+        upscaled = _open(resize_image(data, 800, 1000, allow_upscale=True, fast=True))
+
+        assert upscaled.size == (800, 1000)
+
+    def test_image_within_bounds_is_returned_unchanged(self):
+        data = _page("JPEG", 800, 1000)
+
+        assert resize_image(data, 951, 1268, fast=True) is data
+
+
+@pytest.mark.unit
+class TestPrepareImageFastPath:
+    def _resize_kwargs(self, **kwargs):
+        with patch.object(image, "resize_image", return_value=b"x") as resize:
+            image.prepare_image(
+                _page("JPEG", 800, 1000), 400, 500, use_cache=False, **kwargs
+            )
+        return resize.call_args.kwargs
+
+    def test_default_is_the_full_quality_path(self, monkeypatch):
+        monkeypatch.delenv("IMAGE_FAST_RESIZE", raising=False)
+
+        kwargs = self._resize_kwargs()
+
+        assert kwargs["fast"] is False
+        assert kwargs["optimize"] is True
+
+    def test_env_flag_enables_fast_path(self, monkeypatch):
+        monkeypatch.setenv("IMAGE_FAST_RESIZE", "true")
+
+        kwargs = self._resize_kwargs()
+
+        assert kwargs["fast"] is True
+        assert kwargs["optimize"] is False
+
+    def test_call_site_overrides_env_flag(self, monkeypatch):
+        monkeypatch.setenv("IMAGE_FAST_RESIZE", "true")
+
+        assert self._resize_kwargs(fast_resize=False)["fast"] is False
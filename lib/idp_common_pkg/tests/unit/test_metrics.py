@@ -0,0 +1,193 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Unit tests for the metrics module, covering direct and buffered publishing.
+"""
+
+import json
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from idp_common import metrics
+
+
+@pytest.fixture
+def cloudwatch(monkeypatch):
+    monkeypatch.delenv("METRICS_MODE", raising=False)
+    monkeypatch.setenv("METRIC_NAMESPACE", "TestNamespace")
+    client = MagicMock()
+    metrics._buffer.drain()
+    with patch.object(metrics, "get_cloudwatch_client", return_value=client):
+        yield client
+    metrics._buffer.drain()
+
+
+@pytest.mark.unit
+class TestPutMetric:
+    def test_direct_publish_outside_handler(self, cloudwatch):
+        metrics.put_metric("InputDocuments", 1)
+
+        cloudwatch.put_metric_data.assert_called_once_with(
+            Namespace="TestNamespace",
+            MetricData=[
+                {
+                    "MetricName": "InputDocuments",
+                    "Value": 1,
+                    "Unit": "Count",
+                    "Dimensions": [],
+                }
+            ],
+        )
+
+    def test_batch_metrics_buffers_and_flushes_on_return(self, cloudwatch):
+        @metrics.batch_metrics
+        def handler(event, context):
+            for _ in range(5):
+                metrics.put_metric("BedrockRequestsTotal", 1)
+            metrics.put_metric("BedrockRequestLatency", 120, "Milliseconds")
+            metrics.put_metric("BedrockRequestLatency", 80, "Milliseconds")
+            assert cloudwatch.put_metric_data.call_count == 0
+            return "done"
+
+        assert handler({}, None) == "done"
+
+        cloudwatch.put_metric_data.assert_called_once()
+        data = {
+            d["MetricName"]: d
+            for d in cloudwatch.put_metric_data.call_args.kwargs["MetricData"]
+        }
+        assert data["BedrockRequestsTotal"]["Values"] == [1]
+        assert data["BedrockRequestsTotal"]["Counts"] == [5.0]
+        assert data["BedrockRequestLatency"]["Values"] == [80, 120]
+        assert data["BedrockRequestLatency"]["Unit"] == "Milliseconds"
+        assert len(metrics._buffer) == 0
+
+    def test_batch_metrics_flushes_when_handler_raises(self, cloudwatch):
+        @metrics.batch_metrics
+        def handler(event, context):
+            metrics.put_metric("OCRThrottles", 1)
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            handler({}, None)
+
+        cloudwatch.put_metric_data.assert_called_once()
+
+    def test_worker_threads_buffer_during_handler(self, cloudwatch):
+        @metrics.batch_metrics
+        def handler(event, context):
+            threads = [
+                threading.Thread(
+                    target=lambda: [metrics.put_metric("Pages", 1) for _ in range(50)]
+                )
+                for _ in range(8)
+            ]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+        handler({}, None)
+
+        cloudwatch.put_metric_data.assert_called_once()
+        (datum,) = cloudwatch.put_metric_data.call_args.kwargs["MetricData"]
+        assert datum["Counts"] == [400.0]
+
+    def test_direct_mode_disables_buffering(self, cloudwatch, monkeypatch):
+        monkeypatch.setenv("METRICS_MODE", "direct")
+
+        @metrics.batch_metrics
+        def handler(event, context):
+            metrics.put_metric("A", 1)
+            metrics.put_metric("A", 1)
+
+        handler({}, None)
+        assert cloudwatch.put_metric_data.call_count == 2
+
+    def test_dimensions_and_namespaces_are_kept_apart(self, cloudwatch):
+        @metrics.batch_metrics
+        def handler(event, context):
+            dims = [{"Name": "Model", "Value": "nova"}]
+            metrics.put_metric("Tokens", 10, dimensions=dims)
+            metrics.put_metric("Tokens", 10)
+            metrics.put_metric("Tokens", 10, namespace="Other")
+
+        handler({}, None)
+
+        calls = {
+            c.kwargs["Namespace"]: c.kwargs["MetricData"]
+            for c in cloudwatch.put_metric_data.call_args_list
+        }
+        assert set(calls) == {"TestNamespace", "Other"}
+        assert len(calls["TestNamespace"]) == 2
+        assert len(calls["Other"]) == 1
+
+
+@pytest.mark.unit
+class TestFlushLimits:
+    def test_values_split_at_150_per_datum(self, cloudwatch):
+        @metrics.batch_metrics
+        def handler(event, context):
+            for i in range(320):
+                metrics.put_metric("Latency", i, "Milliseconds")
+
+        handler({}, None)
+
+        data = cloudwatch.put_metric_data.call_args.kwargs["MetricData"]
+        assert [len(d["Values"]) for d in data] == [150, 150, 20]
+
+    def test_requests_split_at_1000_datums(self, cloudwatch, monkeypatch):
+        monkeypatch.setenv("METRICS_MODE", "buffered")
+        for i in range(1200):
+            metrics.put_metric(f"Metric{i}", 1)
+        metrics.flush_metrics()
+
+        sizes = [
+            len(c.kwargs["MetricData"])
+            for c in cloudwatch.put_metric_data.call_args_list
+        ]
+        assert sum(sizes) == 1200
+        assert max(sizes) <= metrics.MAX_DATUMS_PER_REQUEST
+
+    def test_flush_with_empty_buffer_is_noop(self, cloudwatch):
+        assert metrics.flush_metrics() == 0
+        cloudwatch.put_metric_data.assert_not_called()
+
+
+@pytest.mark.unit
+def test_emf_mode_writes_log_lines(cloudwatch, monkeypatch, capsys):
+    monkeypatch.setenv("METRICS_MODE", "emf")
+    metrics.put_metric("InputDocuments", 1)
+    metrics.put_metric("Latency", 5, "Milliseconds")
+    metrics.put_metric("Latency", 7, "Milliseconds")
+
+    assert metrics.flush_metrics() == 3
+
+    cloudwatch.put_metric_data.assert_not_called()
+    (line,) = capsys.readouterr().out.strip().splitlines()
+    document = json.loads(line)
+    directive = document["_aws"]["CloudWatchMetrics"][0]
+    assert directive["Namespace"] == "TestNamespace"
+    assert {m["Name"] for m in directive["Metrics"]} == {"InputDocuments", "Latency"}
+    assert document["InputDocuments"] == 1
+    assert document["Latency"] == [5, 7]
+
+
+@pytest.mark.unit
+def test_client_performance_metrics_buffered(cloudwatch):
+    @metrics.batch_metrics
+    def handler(event, context):
+        metrics.create_client_performance_metrics(
+            "Textract", 250, is_success=False, error_type="Throttling"
+        )
+
+    handler({}, None)
+
+    names = {
+        d["MetricName"]
+        for d in cloudwatch.put_metric_data.call_args.kwargs["MetricData"]
+    }
+    assert names == {"TextractLatency", "TextractFailure", "TextractError.Throttling"}
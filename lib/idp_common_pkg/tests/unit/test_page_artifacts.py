@@ -0,0 +1,122 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Unit tests for the concurrent page artifact loader.
+"""
+
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from idp_common.models import Document, Page
+from idp_common.page_artifacts import IMAGE, TEXT, PageArtifactLoader
+
+
+def _document(num_pages: int) -> Document:
+    return Document(
+        id="doc",
+        pages={
+            str(i): Page(
+                page_id=str(i),
+                parsed_text_uri=f"s3://bucket/doc/pages/{i}/result.json",
+                image_uri=f"s3://bucket/doc/pages/{i}/image.jpg",
+                text_confidence_uri=f"s3://bucket/doc/pages/{i}/textConfidence.json",
+            )
+            for i in range(1, num_pages + 1)
+        },
+    )
+
+
+@pytest.mark.unit
+class TestPageArtifactLoader:
+    def test_loads_requested_artifacts_in_page_order(self):
+        document = _document(3)
+        with (
+            patch("idp_common.s3.get_text_content", side_effect=lambda u: f"text {u}"),
+            patch(
+                "idp_common.image.prepare_image",
+                side_effect=lambda u, w, h: f"img {u} {w}x{h}".encode(),
+            ),
+        ):
+            bundle = PageArtifactLoader().load(
+                document, ["3", "1", "2"], text=True, images=True, image_size=(10, 20)
+            )
+
+        assert list(bundle.pages) == ["3", "1", "2"]
+        assert bundle.pages["1"].text == "text s3://bucket/doc/pages/1/result.json"
+        assert bundle.images()[0] == b"img s3://bucket/doc/pages/3/image.jpg 10x20"
+        assert bundle.pages["1"].confidence is None
+        assert bundle.requested == bundle.fetched == 6
+        assert "wall" in bundle.timings
+
+    def test_repeated_uris_are_fetched_once(self):
+        document = _document(4)
+        for page in document.pages.values():
+            page.image_uri = "s3://bucket/doc/shared.jpg"
+        with patch("idp_common.image.prepare_image", return_value=b"img") as prepare:
+            bundle = PageArtifactLoader().load(document, images=True)
+
+        prepare.assert_called_once()
+        assert bundle.requested == 4
+        assert bundle.fetched == 1
+        assert bundle.images() == [b"img"] * 4
+
+    def test_fetches_run_concurrently(self):
+        document = _document(8)
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def slow_get(uri):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.05)
+            with lock:
+                active -= 1
+            return uri
+
+        with patch("idp_common.s3.get_text_content", side_effect=slow_get):
+            PageArtifactLoader(max_workers=4).load(document, text=True)
+
+        assert peak == 4
+
+    def test_failures_and_missing_pages_are_recorded(self):
+        document = _document(2)
+        document.pages["2"].image_uri = None
+
+        def get_text(uri):
+            if "/1/" in uri:
+                raise RuntimeError("NoSuchKey")
+            return "ok"
+
+        with (
+            patch("idp_common.s3.get_text_content", side_effect=get_text),
+            patch("idp_common.image.prepare_image", return_value=b"img"),
+        ):
+            bundle = PageArtifactLoader().load(
+                document, ["1", "2", "9"], text=True, images=True
+            )
+
+        assert bundle.missing_page_ids == ["9"]
+        assert isinstance(bundle.pages["1"].errors[TEXT], RuntimeError)
+        assert bundle.texts() == {"2": "ok"}
+        assert bundle.pages["2"].image is None
+        assert IMAGE not in bundle.pages["2"].errors
+        with pytest.raises(RuntimeError, match="NoSuchKey"):
+            bundle.raise_for_errors(TEXT)
+        bundle.raise_for_errors(IMAGE)
+
+    def test_confidence_json_uses_json_reader(self):
+        document = _document(1)
+        with patch(
+            "idp_common.s3.get_json_content", return_value={"text_blocks": []}
+        ) as get_json:
+            bundle = PageArtifactLoader().load(document, confidence="json")
+
+        get_json.assert_called_once_with("s3://bucket/doc/pages/1/textConfidence.json")
+        assert bundle.confidence() == {"1": {"text_blocks": []}}
@@ -8,13 +8,19 @@ Handles batch document upload and processing through SQS queue.
 """
 
 import glob as glob_module
+import hashlib
 import json
 import logging
 import os
+import re
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
 from datetime import datetime, timezone
 from typing import Dict, List, Optional
 
 import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 from idp_sdk._core.manifest_parser import parse_manifest
@@ -22,6 +28,171 @@ from idp_sdk._core.stack_info import StackInfo
 
 logger = logging.getLogger(__name__)
 
+# Documents submitted concurrently by _process_documents
+DEFAULT_SUBMIT_WORKERS = 16
+
+# Objects downloaded concurrently by download_batch_results
+DEFAULT_DOWNLOAD_WORKERS = 16
+
+# Per-output-dir record of downloaded objects, used to skip unchanged ones
+_DOWNLOAD_STATE_FILE = ".idp-download-state.jsonl"
+
+# Where submission journals are kept so an interrupted batch can be resumed
+# (overridable with IDP_CHECKPOINT_DIR)
+DEFAULT_CHECKPOINT_DIR = os.path.join(os.path.expanduser("~"), ".idp-cli", "batches")
+
+# Each worker may run a multipart transfer with max_concurrency threads, so the
+# client pool is sized for several in flight at once
+_S3_MAX_POOL_CONNECTIONS = 64
+_S3_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=16 * 1024 * 1024,
+    multipart_chunksize=16 * 1024 * 1024,
+    max_concurrency=4,
+    use_threads=True,
+)
+
+_PROGRESS_LOG_INTERVAL = 500
+
+
+class SubmissionJournal:
+    """
+    Append-only local record of the documents already submitted for a batch.
+
+    One JSON line is appended per document once its upload or copy (and
+    baseline) has completed, so a batch interrupted part way through can be
+    resumed by skipping the documents recorded here. Submission is
+    at-least-once: a document whose upload finished but whose line was not
+    yet written is submitted again on resume.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = None
+
+    @classmethod
+    def for_batch(
+        cls, batch_id: str, checkpoint_dir: Optional[str] = None
+    ) -> "SubmissionJournal":
+        safe_id = re.sub(r"[^A-Za-z0-9._-]", "_", batch_id)
+        checkpoint_dir = (
+            checkpoint_dir
+            or os.environ.get("IDP_CHECKPOINT_DIR")
+            or DEFAULT_CHECKPOINT_DIR
+        )
+        return cls(os.path.join(checkpoint_dir, f"{safe_id}.jsonl"))
+
+    def exists(self) -> bool:
+        return os.path.exists(self.path)
+
+    def load(self) -> Dict[str, Dict]:
+        """Return submitted entries keyed by document source path."""
+        entries: Dict[str, Dict] = {}
+        if not self.exists():
+            return entries
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # A line cut short by the interruption; that document is resubmitted
+                    continue
+                entries[entry["source"]] = entry
+        return entries
+
+    def open(self, append: bool) -> None:
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self._file = open(self.path, "a" if append else "w", encoding="utf-8")
+        except OSError as e:
+            # Submission still works, it just cannot be resumed
+            logger.warning(f"Checkpoint journal disabled ({self.path}): {e}")
+
+    def record(self, source: str, s3_key: str, uploaded: bool, baseline: bool) -> None:
+        if self._file is None:
+            return
+        entry = {
+            "source": source,
+            "s3_key": s3_key,
+            "uploaded": uploaded,
+            "baseline": baseline,
+        }
+        self._file.write(json.dumps(entry) + "\n")
+        self._file.flush()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class _DownloadState:
+    """
+    ETag, size and local mtime of each object download_batch_results fetched.
+
+    An object is current when its listed ETag and size match the recorded
+    download and the local file has not been modified since. Files with no
+    record (e.g. downloaded by an older CLI) are still recognised when the
+    object is single-part, whose ETag is the MD5 of its content.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.entries: Dict[str, Dict] = {}
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                        self.entries[entry["key"]] = entry
+                    except (json.JSONDecodeError, KeyError):
+                        continue
+        self._dirty = False
+
+    @staticmethod
+    def _etag(obj: Dict) -> str:
+        return obj.get("ETag", "").strip('"')
+
+    def is_current(self, s3_key: str, obj: Dict, local_path: str) -> bool:
+        try:
+            stat = os.stat(local_path)
+        except FileNotFoundError:
+            return False
+        etag = self._etag(obj)
+        if stat.st_size != obj.get("Size"):
+            return False
+        entry = self.entries.get(s3_key)
+        if entry is not None:
+            return entry["etag"] == etag and entry["mtime_ns"] == stat.st_mtime_ns
+        if not etag or "-" in etag:
+            return False
+        digest = hashlib.md5(usedforsecurity=False)
+        with open(local_path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+        if digest.hexdigest() != etag:
+            return False
+        self.record(s3_key, obj, local_path)
+        return True
+
+    def record(self, s3_key: str, obj: Dict, local_path: str) -> None:
+        self.entries[s3_key] = {
+            "key": s3_key,
+            "etag": self._etag(obj),
+            "size": obj.get("Size"),
+            "mtime_ns": os.stat(local_path).st_mtime_ns,
+        }
+        self._dirty = True
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for entry in self.entries.values():
+                f.write(json.dumps(entry) + "\n")
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+
 
 class BatchListDict(dict):
     """Dict that acts like a list when iterated for backward compatibility"""
@@ -63,7 +234,11 @@ class BatchProcessor:
         self.region = region
 
         # Initialize AWS clients
-        self.s3 = boto3.client("s3", region_name=region)
+        self.s3 = boto3.client(
+            "s3",
+            region_name=region,
+            config=Config(max_pool_connections=_S3_MAX_POOL_CONNECTIONS),
+        )
         self.dynamodb = boto3.resource("dynamodb", region_name=region)
 
         # Get stack resources
@@ -89,6 +264,9 @@ class BatchProcessor:
         config_version: Optional[str] = None,
         config_path: Optional[str] = None,
         batch_prefix: Optional[str] = None,
+        max_workers: int = DEFAULT_SUBMIT_WORKERS,
+        resume: bool = False,
+        checkpoint_dir: Optional[str] = None,
     ) -> Dict:
         """
         Universal entry point for batch processing - routes to appropriate method
@@ -105,6 +283,9 @@ class BatchProcessor:
             config_version: Configuration version to use
             config_path: Optional path to configuration YAML file
             batch_prefix: Alias for output_prefix (for CLI compatibility)
+            max_workers: Documents submitted concurrently
+            resume: Skip documents already recorded in batch_id's checkpoint journal
+            checkpoint_dir: Directory for checkpoint journals (default: ~/.idp-cli/batches)
 
         Returns:
             Dictionary with batch processing results
@@ -117,9 +298,19 @@ class BatchProcessor:
         if config_path is not None:
             self.config_path = config_path
 
+        submit_options = {
+            "max_workers": max_workers,
+            "resume": resume,
+            "checkpoint_dir": checkpoint_dir,
+        }
         if manifest_path:
             return self._process_from_manifest(
-                manifest_path, output_prefix, batch_id, number_of_files, config_version
+                manifest_path,
+                output_prefix,
+                batch_id,
+                number_of_files,
+                config_version,
+                **submit_options,
             )
         elif directory:
             return self.process_batch_from_directory(
@@ -130,10 +321,16 @@ class BatchProcessor:
                 batch_id,
                 number_of_files,
                 config_version,
+                **submit_options,
             )
         elif s3_uri:
             return self.process_batch_from_s3_uri(
-                s3_uri, file_pattern, recursive, output_prefix, batch_id
+                s3_uri,
+                file_pattern,
+                recursive,
+                output_prefix,
+                batch_id,
+                **submit_options,
             )
         else:
             raise ValueError("Must specify one of: manifest_path, directory, or s3_uri")
@@ -145,6 +342,9 @@ class BatchProcessor:
         batch_id: Optional[str] = None,
         number_of_files: Optional[int] = None,
         config_version: Optional[str] = None,
+        max_workers: int = DEFAULT_SUBMIT_WORKERS,
+        resume: bool = False,
+        checkpoint_dir: Optional[str] = None,
     ) -> Dict:
         """
         Process batch of documents from manifest
@@ -155,6 +355,9 @@ class BatchProcessor:
             batch_id: Optional custom batch ID (auto-generated if not provided)
             number_of_files: Limit number of files to process
             config_version: Configuration version to use
+            max_workers: Documents submitted concurrently
+            resume: Skip documents already recorded in the checkpoint journal
+            checkpoint_dir: Directory for checkpoint journals
 
         Returns:
             Dictionary with batch processing results
@@ -177,7 +380,14 @@ class BatchProcessor:
 
         # Process documents
         return self._process_documents(
-            documents, batch_id, output_prefix, manifest_path, config_version
+            documents,
+            batch_id,
+            output_prefix,
+            manifest_path,
+            config_version,
+            max_workers=max_workers,
+            resume=resume,
+            checkpoint_dir=checkpoint_dir,
         )
 
     def process_batch_from_directory(
@@ -189,6 +399,9 @@ class BatchProcessor:
         batch_id: Optional[str] = None,
         number_of_files: Optional[int] = None,
         config_version: Optional[str] = None,
+        max_workers: int = DEFAULT_SUBMIT_WORKERS,
+        resume: bool = False,
+        checkpoint_dir: Optional[str] = None,
     ) -> Dict:
         """
         Process batch of documents from local directory
@@ -199,6 +412,9 @@ class BatchProcessor:
             recursive: Include subdirectories
             output_prefix: Prefix for output organization
             batch_id: Optional custom batch ID (auto-generated if not provided)
+            max_workers: Documents submitted concurrently
+            resume: Skip documents already recorded in the checkpoint journal
+            checkpoint_dir: Directory for checkpoint journals
 
         Returns:
             Dictionary with batch processing results
@@ -232,6 +448,9 @@ class BatchProcessor:
             dir_path,
             config_version,
             base_dir=dir_path,
+            max_workers=max_workers,
+            resume=resume,
+            checkpoint_dir=checkpoint_dir,
         )
 
     def process_batch_from_s3_uri(
@@ -241,6 +460,10 @@ class BatchProcessor:
         recursive: bool = True,
         output_prefix: str = "cli-batch",
         batch_id: Optional[str] = None,
+        config_version: Optional[str] = None,
+        max_workers: int = DEFAULT_SUBMIT_WORKERS,
+        resume: bool = False,
+        checkpoint_dir: Optional[str] = None,
     ) -> Dict:
         """
         Process batch of documents from S3 URI
@@ -251,6 +474,10 @@ class BatchProcessor:
             recursive: Include sub-prefixes
             output_prefix: Prefix for output organization
             batch_id: Optional custom batch ID (auto-generated if not provided)
+            config_version: Configuration version to use
+            max_workers: Documents submitted concurrently
+            resume: Skip documents already recorded in the checkpoint journal
+            checkpoint_dir: Directory for checkpoint journals
 
         Returns:
             Dictionary with batch processing results
@@ -287,6 +514,10 @@ class BatchProcessor:
             batch_id,
             output_prefix,
             s3_uri,
+            config_version,
+            max_workers=max_workers,
+            resume=resume,
+            checkpoint_dir=checkpoint_dir,
         )
 
     def _process_documents(
@@ -297,20 +528,35 @@ class BatchProcessor:
         source: str,
         config_version: Optional[str] = None,
         base_dir: Optional[str] = None,
+        max_workers: int = DEFAULT_SUBMIT_WORKERS,
+        resume: bool = False,
+        checkpoint_dir: Optional[str] = None,
     ) -> Dict:
         """
         Process list of documents
 
+        Documents are submitted by a pool of max_workers threads, with at most
+        four submissions queued per worker. Each completed submission is appended
+        to the batch's SubmissionJournal, including those still finishing when
+        the run is interrupted; with resume=True the documents already in the
+        journal are skipped and counted as queued.
+
         Args:
             documents: List of document specifications
             batch_id: Batch identifier
-            steps: Steps to execute
             output_prefix: Output prefix
             source: Source path/manifest for metadata
+            config_version: Configuration version to use
             base_dir: Base directory for path preservation (optional)
+            max_workers: Documents submitted concurrently
+            resume: Skip documents already recorded in the checkpoint journal
+            checkpoint_dir: Directory for checkpoint journals
 
         Returns:
             Dictionary with batch processing results
+
+        Raises:
+            ValueError: If resume is set and the batch has no checkpoint journal
         """
         results = {
             "batch_id": batch_id,
@@ -319,55 +565,158 @@ class BatchProcessor:
             "queued": 0,
             "failed": 0,
             "baselines_uploaded": 0,
+            "resumed": 0,
             "source": source,
             "output_prefix": output_prefix,
             "timestamp": datetime.now(timezone.utc).isoformat(),
         }
 
-        for doc in documents:
-            try:
-                # Upload baseline if specified
-                if doc.get("baseline_source"):
-                    try:
-                        self._upload_baseline(doc, batch_id, base_dir)
-                        results["baselines_uploaded"] += 1
-                        logger.info(f"Uploaded baseline for {doc['filename']}")
-                    except Exception as e:
-                        logger.error(
-                            f"Failed to upload baseline for {doc['filename']}: {e}"
-                        )
-                        # Continue processing document even if baseline fails
-
-                # Handle document upload/reference
-                # S3 upload automatically triggers EventBridge -> QueueSender -> SQS
-                s3_key = self._process_document_with_base(
-                    doc, batch_id, base_dir, config_version
-                )
-
-                results["document_ids"].append(
-                    s3_key
-                )  # Use s3_key as document_id for tracking
-                results["queued"] += 1
-
-                if doc["type"] == "local":
-                    results["uploaded"] += 1
+        journal = SubmissionJournal.for_batch(batch_id, checkpoint_dir)
+        if resume and not journal.exists():
+            raise ValueError(
+                f"Cannot resume batch {batch_id}: no checkpoint journal at {journal.path}"
+            )
+        submitted = journal.load() if resume else {}
+
+        outcomes: List[Optional[Dict]] = [None] * len(documents)
+        pending = []
+        for index, doc in enumerate(documents):
+            entry = submitted.get(doc.get("path"))
+            if entry:
+                outcomes[index] = entry
+                results["resumed"] += 1
+            else:
+                pending.append(index)
+        if resume:
+            logger.info(
+                f"Resuming batch {batch_id}: {results['resumed']} documents already "
+                f"submitted, {len(pending)} remaining"
+            )
 
-            except Exception as e:
-                filename = doc.get(
-                    "filename", os.path.basename(doc.get("path", "unknown"))
-                )
-                logger.error(f"Failed to process document {filename}: {e}")
-                results["failed"] += 1
+        started = time.monotonic()
+        completed = 0
+        max_in_flight = max(1, max_workers) * 4
+        journal.open(append=resume)
+        try:
+            with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+                in_flight: Dict = {}
+
+                def collect(futures):
+                    nonlocal completed
+                    for future in futures:
+                        index = in_flight.pop(future)
+                        doc = documents[index]
+                        try:
+                            outcome = future.result()
+                        except Exception as e:
+                            filename = doc.get(
+                                "filename", os.path.basename(doc.get("path", "unknown"))
+                            )
+                            logger.error(f"Failed to process document {filename}: {e}")
+                            results["failed"] += 1
+                            continue
+                        journal.record(doc.get("path"), **outcome)
+                        outcomes[index] = outcome
+                        completed += 1
+                        if completed % _PROGRESS_LOG_INTERVAL == 0:
+                            elapsed = time.monotonic() - started
+                            logger.info(
+                                f"Submitted {completed}/{len(pending)} documents "
+                                f"({completed / elapsed:.1f} docs/sec)"
+                            )
+
+                try:
+                    for index in pending:
+                        future = executor.submit(
+                            self._submit_document,
+                            documents[index],
+                            batch_id,
+                            base_dir,
+                            config_version,
+                        )
+                        in_flight[future] = index
+                        if len(in_flight) >= max_in_flight:
+                            done, _ = wait(list(in_flight), return_when=FIRST_COMPLETED)
+                            collect(done)
+                    collect(list(as_completed(list(in_flight))))
+                except BaseException:
+                    # Interrupted (e.g. Ctrl-C): drop queued submissions, let the
+                    # running ones finish, and journal those that succeeded so a
+                    # resume does not upload them again
+                    executor.shutdown(wait=True, cancel_futures=True)
+                    finished = [f for f in in_flight if f.done() and not f.cancelled()]
+                    try:
+                        collect(finished)
+                    except BaseException as e:
+                        logger.warning(f"Could not journal finished submissions: {e}")
+                    raise
+        finally:
+            journal.close()
+        elapsed = time.monotonic() - started
+
+        # Results keep manifest order regardless of completion order
+        for outcome in outcomes:
+            if outcome is None:
+                continue
+            # Use s3_key as document_id for tracking
+            results["document_ids"].append(outcome["s3_key"])
+            results["queued"] += 1
+            results["uploaded"] += int(outcome["uploaded"])
+            results["baselines_uploaded"] += int(outcome["baseline"])
+        results["elapsed_seconds"] = round(elapsed, 3)
+        results["docs_per_second"] = round(completed / elapsed, 2) if elapsed else 0.0
 
         # Store batch metadata
         self._store_batch_metadata(batch_id, results)
 
         logger.info(
             f"Batch processing complete: {results['queued']} queued, "
-            f"{results['failed']} failed, {results['baselines_uploaded']} baselines uploaded"
+            f"{results['failed']} failed, {results['baselines_uploaded']} baselines uploaded, "
+            f"{completed} submitted in {elapsed:.1f}s ({results['docs_per_second']} docs/sec)"
         )
         return results
 
+    def _submit_document(
+        self,
+        doc: Dict,
+        batch_id: str,
+        base_dir: Optional[str] = None,
+        config_version: Optional[str] = None,
+    ) -> Dict:
+        """
+        Submit one document (and its baseline) to the stack
+
+        Args:
+            doc: Document specification
+            batch_id: Batch identifier
+            base_dir: Base directory for path preservation
+            config_version: Configuration version to use
+
+        Returns:
+            Journal fields: s3_key, uploaded, baseline
+        """
+        baseline = False
+        # Upload baseline if specified
+        if doc.get("baseline_source"):
+            try:
+                self._upload_baseline(doc, batch_id, base_dir)
+                baseline = True
+                logger.info(f"Uploaded baseline for {doc['filename']}")
+            except Exception as e:
+                logger.error(f"Failed to upload baseline for {doc['filename']}: {e}")
+                # Continue processing document even if baseline fails
+
+        # Handle document upload/reference
+        # S3 upload automatically triggers EventBridge -> QueueSender -> SQS
+        s3_key = self._process_document_with_base(
+            doc, batch_id, base_dir, config_version
+        )
+        return {
+            "s3_key": s3_key,
+            "uploaded": doc["type"] == "local",
+            "baseline": baseline,
+        }
+
     def _scan_local_directory(
         self, dir_path: str, pattern: str, recursive: bool
     ) -> List[Dict]:
@@ -557,22 +906,21 @@ class BatchProcessor:
         # Upload file with config version as S3 metadata instead of filename suffix
         input_bucket = self.resources["InputBucket"]
 
+        # Managed transfer: large files go up as parallel multipart uploads
+        upload_args = {
+            "Filename": local_path,
+            "Bucket": input_bucket,
+            "Key": s3_key,
+            "Config": _S3_TRANSFER_CONFIG,
+        }
         if config_version:
-            # Use put_object with metadata for config version
             logger.info(f"Adding config-version metadata: {config_version} to {s3_key}")
-            with open(local_path, "rb") as file_data:
-                self.s3.put_object(
-                    Bucket=input_bucket,
-                    Key=s3_key,
-                    Body=file_data,
-                    Metadata={"config-version": config_version},
-                )
+            upload_args["ExtraArgs"] = {"Metadata": {"config-version": config_version}}
         else:
             logger.info(
                 f"No config version specified, uploading without metadata to {s3_key}"
             )
-            # Use upload_file for files without config version
-            self.s3.upload_file(Filename=local_path, Bucket=input_bucket, Key=s3_key)
+        self.s3.upload_file(**upload_args)
 
         return s3_key
 
@@ -633,7 +981,28 @@ class BatchProcessor:
         else:
             logger.info(f"No config version specified for copied file {dest_key}")
 
-        self.s3.copy_object(**copy_args)
+        try:
+            # Server-side copy: the object's bytes never pass through this client
+            self.s3.copy_object(**copy_args)
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") != "InvalidRequest":
+                raise
+            # CopyObject is limited to 5 GB; larger sources need a (still
+            # server-side) multipart UploadPartCopy
+            logger.info(f"Using multipart copy for large object {s3_uri}")
+            extra_args = {}
+            if config_version:
+                extra_args = {
+                    "Metadata": {"config-version": config_version},
+                    "MetadataDirective": "REPLACE",
+                }
+            self.s3.copy(
+                copy_source,
+                input_bucket,
+                dest_key,
+                ExtraArgs=extra_args or None,
+                Config=_S3_TRANSFER_CONFIG,
+            )
 
         return dest_key
 
@@ -879,18 +1248,31 @@ class BatchProcessor:
             return BatchListDict({"batches": [], "count": 0})
 
     def download_batch_results(
-        self, batch_id: str, output_dir: str, file_types: List[str]
+        self,
+        batch_id: str,
+        output_dir: str,
+        file_types: List[str],
+        max_workers: int = DEFAULT_DOWNLOAD_WORKERS,
+        skip_unchanged: bool = True,
     ) -> Dict:
         """
         Download batch processing results from OutputBucket with progress display
 
+        Listing and downloading are streamed: each listed page is handed to a
+        pool of max_workers threads while the next page is fetched, with a
+        bounded number of downloads in flight. Objects already downloaded with
+        the same ETag and size (and untouched locally since) are skipped, so a
+        re-run only fetches new or changed results.
+
         Args:
             batch_id: Batch identifier
             output_dir: Local directory to download to
             file_types: List of file types to download (pages, sections, summary)
+            max_workers: Objects downloaded concurrently
+            skip_unchanged: Skip objects whose local copy is already current
 
         Returns:
-            Dictionary with download statistics
+            Dictionary with download and throughput statistics
         """
         from rich.console import Console
         from rich.progress import (
@@ -905,72 +1287,119 @@ class BatchProcessor:
 
         # Create output directory
         os.makedirs(output_dir, exist_ok=True)
-
-        # First pass: count files to download
-        batch_prefix = f"{batch_id}/"
-        paginator = self.s3.get_paginator("list_objects_v2")
-        pages = paginator.paginate(Bucket=output_bucket, Prefix=batch_prefix)
-
-        files_to_download = []
-        for page in pages:
-            for obj in page.get("Contents", []):
-                s3_key = obj["Key"]
-
-                # Skip if not in requested file types
-                if "all" not in file_types:
-                    if not any(f"/{file_type}/" in s3_key for file_type in file_types):
-                        continue
-
-                files_to_download.append(s3_key)
-
-        total_files = len(files_to_download)
-        console.print(f"Found {total_files} files to download")
-        console.print()
-
-        # Download with progress bar
-        files_downloaded = 0
+        state = _DownloadState(os.path.join(output_dir, _DOWNLOAD_STATE_FILE))
+
+        stats = {
+            "files_listed": 0,
+            "files_downloaded": 0,
+            "files_skipped": 0,
+            "files_failed": 0,
+            "bytes_downloaded": 0,
+        }
         documents_downloaded = set()
+        max_in_flight = max(1, max_workers) * 4
+        started = time.monotonic()
+
+        with (
+            Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                BarColumn(),
+                TextColumn("{task.completed}/{task.total} files"),
+                TextColumn("•"),
+                TextColumn("{task.fields[skipped]} unchanged"),
+                console=console,
+            ) as progress,
+            ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor,
+        ):
+            task = progress.add_task("Downloading results...", total=0, skipped=0)
+            in_flight: Dict = {}
+
+            def collect(futures):
+                for future in futures:
+                    s3_key, obj = in_flight.pop(future)
+                    try:
+                        local_path = future.result()
+                    except Exception as e:
+                        logger.error(f"Failed to download {s3_key}: {e}")
+                        stats["files_failed"] += 1
+                    else:
+                        state.record(s3_key, obj, local_path)
+                        stats["files_downloaded"] += 1
+                        stats["bytes_downloaded"] += obj.get("Size", 0)
+                        # Track document
+                        doc_key = s3_key.split("/")[1] if "/" in s3_key else s3_key
+                        documents_downloaded.add(doc_key)
+                        logger.debug(f"Downloaded: {s3_key}")
+                    progress.update(task, advance=1)
 
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-            TextColumn("•"),
-            TextColumn("{task.completed}/{task.total} files"),
-            console=console,
-        ) as progress:
-            task = progress.add_task("Downloading results...", total=total_files)
-
-            for s3_key in files_to_download:
-                # Construct local file path
-                local_path = os.path.join(output_dir, s3_key)
-
-                # Create directory if needed
-                local_dir = os.path.dirname(local_path)
-                os.makedirs(local_dir, exist_ok=True)
-
-                # Download file
-                self.s3.download_file(
-                    Bucket=output_bucket, Key=s3_key, Filename=local_path
-                )
-
-                files_downloaded += 1
-
-                # Track document
-                doc_key = s3_key.split("/")[1] if "/" in s3_key else s3_key
-                documents_downloaded.add(doc_key)
-
-                # Update progress
-                progress.update(task, advance=1)
-                logger.debug(f"Downloaded: {s3_key}")
+            try:
+                for obj in self._iter_result_objects(
+                    output_bucket, f"{batch_id}/", file_types
+                ):
+                    s3_key = obj["Key"]
+                    stats["files_listed"] += 1
+                    progress.update(task, total=stats["files_listed"])
+
+                    # Construct local file path
+                    local_path = os.path.join(output_dir, s3_key)
+                    if skip_unchanged and state.is_current(s3_key, obj, local_path):
+                        stats["files_skipped"] += 1
+                        progress.update(task, advance=1, skipped=stats["files_skipped"])
+                        continue
 
+                    future = executor.submit(
+                        self._download_object, output_bucket, s3_key, local_path
+                    )
+                    in_flight[future] = (s3_key, obj)
+                    if len(in_flight) >= max_in_flight:
+                        done, _ = wait(list(in_flight), return_when=FIRST_COMPLETED)
+                        collect(done)
+                collect(list(as_completed(list(in_flight))))
+            finally:
+                state.save()
+
+        elapsed = time.monotonic() - started
+        console.print(
+            f"Listed {stats['files_listed']} files: {stats['files_downloaded']} downloaded, "
+            f"{stats['files_skipped']} unchanged, {stats['files_failed']} failed"
+        )
         return {
-            "files_downloaded": files_downloaded,
+            **stats,
             "documents_downloaded": len(documents_downloaded),
             "output_dir": output_dir,
+            "elapsed_seconds": round(elapsed, 3),
+            "files_per_second": round(stats["files_downloaded"] / elapsed, 2)
+            if elapsed
+            else 0.0,
+            "megabytes_per_second": round(
+                stats["bytes_downloaded"] / (1024 * 1024) / elapsed, 2
+            )
+            if elapsed
+            else 0.0,
         }
 
+    def _iter_result_objects(self, bucket: str, prefix: str, file_types: List[str]):
+        """Yield listed objects under prefix that match file_types, page by page"""
+        paginator = self.s3.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=bucket, Prefix=prefix):
+            for obj in page.get("Contents", []):
+                # Skip if not in requested file types
+                if "all" not in file_types:
+                    if not any(
+                        f"/{file_type}/" in obj["Key"] for file_type in file_types
+                    ):
+                        continue
+                yield obj
+
+    def _download_object(self, bucket: str, s3_key: str, local_path: str) -> str:
+        """Download one object, creating its directory; returns local_path"""
+        os.makedirs(os.path.dirname(local_path), exist_ok=True)
+        self.s3.download_file(
+            Bucket=bucket, Key=s3_key, Filename=local_path, Config=_S3_TRANSFER_CONFIG
+        )
+        return local_path
+
     # ------------------------------------------------------------------ #
     # Document version history (processing runs)
     # ------------------------------------------------------------------ #
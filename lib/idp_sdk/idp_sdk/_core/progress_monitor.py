@@ -9,6 +9,7 @@ Monitors batch processing progress by querying document status via LookupFunctio
 
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List
 
 import boto3
@@ -31,6 +32,12 @@ _SUCCESS_STATES = frozenset({"COMPLETED", "REDACTED_SUPERSEDED"})
 # Accepted but not yet being worked on.
 _NOT_STARTED_STATES = frozenset({"QUEUED", "PENDING_UPLOAD", "UNKNOWN"})
 
+# Documents per LookupFunction invocation. Keeps each response well under the
+# 6 MB synchronous invoke limit and within the function's 30 s timeout.
+_LOOKUP_CHUNK_SIZE = 1000
+# Lookup invocations in flight at once when a poll spans several chunks
+_LOOKUP_CONCURRENCY = 4
+
 
 class ProgressMonitor:
     """Monitors document processing progress"""
@@ -103,10 +110,20 @@ class ProgressMonitor:
             f"Querying {len(docs_to_query)} active documents ({len(self.finished_docs)} cached)"
         )
 
-        # Batch query active documents
-        try:
-            statuses = self._batch_query_documents(docs_to_query)
+        # Batch query active documents, a chunk per Lambda invocation
+        chunks = [
+            docs_to_query[i : i + _LOOKUP_CHUNK_SIZE]
+            for i in range(0, len(docs_to_query), _LOOKUP_CHUNK_SIZE)
+        ]
+        if len(chunks) == 1:
+            chunk_statuses = [self._query_chunk(chunks[0])]
+        else:
+            with ThreadPoolExecutor(
+                max_workers=min(_LOOKUP_CONCURRENCY, len(chunks))
+            ) as executor:
+                chunk_statuses = list(executor.map(self._query_chunk, chunks))
 
+        for statuses in chunk_statuses:
             for status in statuses:
                 self._categorize_document(status, status_summary)
 
@@ -114,28 +131,39 @@ class ProgressMonitor:
                 if status["status"] in _TERMINAL_STATES:
                     self.finished_docs[status["document_id"]] = status
 
-        except Exception as e:
-            logger.error(f"Error in batch query: {e}", exc_info=True)
-            # Fall back to individual queries if batch fails
-            for doc_id in docs_to_query:
-                try:
-                    status = self.get_document_status(doc_id)
-                    self._categorize_document(status, status_summary)
-
-                    if status["status"] in _TERMINAL_STATES:
-                        self.finished_docs[status["document_id"]] = status
-                except Exception as e:
-                    logger.error(f"Error getting status for {doc_id}: {e}")
-                    status_summary["queued"].append(
-                        {"document_id": doc_id, "status": "UNKNOWN", "error": str(e)}
-                    )
-
         # Check if all complete
         finished = len(status_summary["completed"]) + len(status_summary["failed"])
         status_summary["all_complete"] = finished == len(document_ids)
 
         return status_summary
 
+    def _query_chunk(self, document_ids: List[str]) -> List[Dict]:
+        """
+        Query one chunk of documents, falling back to individual queries
+
+        Args:
+            document_ids: Document IDs for a single batch invocation
+
+        Returns:
+            List of document status dictionaries
+        """
+        try:
+            return self._batch_query_documents(document_ids)
+        except Exception as e:
+            logger.error(f"Error in batch query: {e}", exc_info=True)
+
+        # Fall back to individual queries if batch fails
+        statuses = []
+        for doc_id in document_ids:
+            try:
+                statuses.append(self.get_document_status(doc_id))
+            except Exception as e:
+                logger.error(f"Error getting status for {doc_id}: {e}")
+                statuses.append(
+                    {"document_id": doc_id, "status": "UNKNOWN", "error": str(e)}
+                )
+        return statuses
+
     def _batch_query_documents(self, document_ids: List[str]) -> List[Dict]:
         """
         Query multiple documents in a single Lambda invocation
@@ -4,7 +4,7 @@
 """Batch processing models."""
 
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -25,6 +25,16 @@ class BatchDeletionResult(BaseModel):
     results: List[DocumentDeletionResult] = Field(
         default_factory=list, description="Per-document deletion results"
     )
+    elapsed_seconds: Optional[float] = Field(
+        default=None, description="Wall time spent deleting documents"
+    )
+    docs_per_second: Optional[float] = Field(
+        default=None, description="Documents processed per second"
+    )
+    preview: Optional[Dict[str, Any]] = Field(
+        default=None,
+        description="Dry run only: items, requests and estimated cost of the deletion",
+    )
 
 
 class BatchProcessResult(BaseModel):
@@ -44,9 +54,20 @@ class BatchProcessResult(BaseModel):
     baselines_uploaded: int = Field(
         default=0, description="Number of baseline files uploaded for evaluation"
     )
+    documents_resumed: int = Field(
+        default=0,
+        alias="resumed",
+        description="Documents skipped because an earlier run already submitted them",
+    )
     source: str = Field(description="Source path (manifest, directory, or S3 URI)")
     output_prefix: str = Field(description="Output prefix for results")
     timestamp: datetime = Field(description="Batch submission timestamp")
+    elapsed_seconds: Optional[float] = Field(
+        default=None, description="Wall time spent submitting documents"
+    )
+    docs_per_second: Optional[float] = Field(
+        default=None, description="Documents submitted per second in this run"
+    )
 
     model_config = ConfigDict(populate_by_name=True)
 
@@ -107,6 +128,21 @@ class BatchDownloadResult(BaseModel):
     files_downloaded: int = Field(description="Number of files downloaded")
     documents_downloaded: int = Field(description="Number of documents with downloads")
     output_dir: str = Field(description="Local output directory path")
+    files_listed: int = Field(default=0, description="Matching files in the batch")
+    files_skipped: int = Field(
+        default=0, description="Files skipped because the local copy was current"
+    )
+    files_failed: int = Field(default=0, description="Files that failed to download")
+    bytes_downloaded: int = Field(default=0, description="Bytes downloaded")
+    elapsed_seconds: Optional[float] = Field(
+        default=None, description="Wall time of the download"
+    )
+    files_per_second: Optional[float] = Field(
+        default=None, description="Files downloaded per second"
+    )
+    megabytes_per_second: Optional[float] = Field(
+        default=None, description="Download throughput in MiB per second"
+    )
 
 
 class BatchListResult(BaseModel):
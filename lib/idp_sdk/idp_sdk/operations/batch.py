@@ -36,6 +36,10 @@ class BatchOperation:
 
     def __init__(self, client):
         self._client = client
+        # (stack, batch_id) -> (ProgressMonitor, document IDs). Reusing the
+        # monitor across get_status polls keeps its cache of finished
+        # documents, so each poll only looks up documents still in progress.
+        self._monitor_cache: Dict[tuple, tuple] = {}
 
     def process(
         self,
@@ -53,6 +57,8 @@ class BatchOperation:
         config_path: Optional[str] = None,
         config_version: Optional[str] = None,
         context: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        resume: bool = False,
         **kwargs,
     ) -> BatchProcessResult:
         """Process multiple documents through the IDP pipeline.
@@ -72,6 +78,9 @@ class BatchOperation:
             config_path: Path to custom configuration file
             config_version: Configuration version to use for processing
             context: Context for test set processing
+            max_workers: Documents submitted concurrently (default: 16)
+            resume: Resume the interrupted batch ``batch_id``, skipping documents
+                its local checkpoint journal records as already submitted
             **kwargs: Additional parameters
 
         Returns:
@@ -100,6 +109,14 @@ class BatchOperation:
             raise IDPConfigurationError(
                 "Specify exactly one source: manifest, directory, s3_uri, or test_set"
             )
+        if resume and not batch_id:
+            raise IDPConfigurationError(
+                "resume requires the batch_id of the interrupted batch"
+            )
+
+        submit_kwargs: Dict[str, Any] = {"resume": resume}
+        if max_workers:
+            submit_kwargs["max_workers"] = max_workers
 
         try:
             # BatchProcessor.__init__ signature: (stack_name, config_path=None, region=None)
@@ -124,6 +141,7 @@ class BatchOperation:
                     output_prefix=batch_prefix,
                     batch_id=batch_id,
                     number_of_files=number_of_files,
+                    **submit_kwargs,
                 )
                 if "config_version" in manifest_sig.parameters and config_version:
                     manifest_kwargs["config_version"] = config_version
@@ -139,6 +157,7 @@ class BatchOperation:
                     output_prefix=batch_prefix,
                     batch_id=batch_id,
                     number_of_files=number_of_files,
+                    **submit_kwargs,
                 )
                 if "config_version" in dir_sig.parameters and config_version:
                     dir_kwargs["config_version"] = config_version
@@ -152,6 +171,7 @@ class BatchOperation:
                     recursive=recursive,
                     output_prefix=batch_prefix,
                     batch_id=batch_id,
+                    **submit_kwargs,
                 )
                 sig = inspect.signature(processor.process_batch_from_s3_uri)
                 if "config_version" in sig.parameters and config_version:
@@ -165,11 +185,14 @@ class BatchOperation:
                 uploaded=result.get("uploaded", 0),
                 failed=result.get("failed", 0),
                 baselines_uploaded=result.get("baselines_uploaded", 0),
+                resumed=result.get("resumed", 0),
                 source=result.get("source", ""),
                 output_prefix=result.get("output_prefix", batch_prefix),
                 timestamp=datetime.fromisoformat(
                     result.get("timestamp", datetime.now(timezone.utc).isoformat())
                 ),
+                elapsed_seconds=result.get("elapsed_seconds"),
+                docs_per_second=result.get("docs_per_second"),
             )
         except Exception as e:
             raise IDPProcessingError(f"Batch processing failed: {e}") from e
@@ -375,6 +398,10 @@ class BatchOperation:
         if not document_ids and not batch_id:
             raise IDPConfigurationError("Must specify either document_ids or batch_id")
 
+        # Reprocessed documents leave their terminal state
+        for cache_key in [k for k in self._monitor_cache if k[0] == name]:
+            del self._monitor_cache[cache_key]
+
         try:
             processor = RerunProcessor(stack_name=name, region=self._client._region)
 
@@ -464,33 +491,31 @@ class BatchOperation:
         self,
         batch_id: str,
         stack_name: Optional[str] = None,
+        refresh: bool = False,
         **kwargs,
     ) -> BatchStatus:
         """Get status of a batch.
 
+        Repeated calls for the same batch on one client are incremental:
+        documents already in a terminal state are answered from the previous
+        poll and only the remaining ones are looked up.
+
         Args:
             batch_id: Batch identifier
             stack_name: Optional stack name override
+            refresh: Re-read the batch and look up every document again, e.g.
+                after its documents were reprocessed by another client
             **kwargs: Additional parameters
 
         Returns:
             BatchStatus with batch processing information
         """
-        from idp_sdk._core.batch_processor import BatchProcessor
-        from idp_sdk._core.progress_monitor import ProgressMonitor
-
         name = self._client._require_stack(stack_name)
-        processor = BatchProcessor(stack_name=name, region=self._client._region)
+        cache_key = (name, batch_id)
+        if refresh or cache_key not in self._monitor_cache:
+            self._monitor_cache[cache_key] = self._create_monitor(name, batch_id)
+        monitor, document_ids = self._monitor_cache[cache_key]
 
-        batch_info = processor.get_batch_info(batch_id)
-        if not batch_info:
-            raise IDPResourceNotFoundError(f"Batch not found: {batch_id}")
-
-        document_ids = batch_info["document_ids"]
-
-        monitor = ProgressMonitor(
-            stack_name=name, resources=processor.resources, region=self._client._region
-        )
         status_data = monitor.get_batch_status(document_ids)
         stats = monitor.calculate_statistics(status_data)
 
@@ -528,6 +553,24 @@ class BatchOperation:
             all_complete=stats.get("all_complete", False),
         )
 
+    def _create_monitor(self, stack_name: str, batch_id: str) -> tuple:
+        """Create a ProgressMonitor for a batch and load its document IDs."""
+        from idp_sdk._core.batch_processor import BatchProcessor
+        from idp_sdk._core.progress_monitor import ProgressMonitor
+
+        processor = BatchProcessor(stack_name=stack_name, region=self._client._region)
+
+        batch_info = processor.get_batch_info(batch_id)
+        if not batch_info:
+            raise IDPResourceNotFoundError(f"Batch not found: {batch_id}")
+
+        monitor = ProgressMonitor(
+            stack_name=stack_name,
+            resources=processor.resources,
+            region=self._client._region,
+        )
+        return monitor, batch_info["document_ids"]
+
     def list(
         self,
         limit: int = 10,
@@ -575,6 +618,8 @@ class BatchOperation:
         output_dir: str,
         file_types: Optional[List[str]] = None,
         stack_name: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        skip_unchanged: bool = True,
         **kwargs,
     ) -> BatchDownloadResult:
         """Download processing results from OutputBucket.
@@ -584,6 +629,9 @@ class BatchOperation:
             output_dir: Local directory to save results
             file_types: List of file types to download
             stack_name: Optional stack name override
+            max_workers: Files downloaded concurrently (default: 16)
+            skip_unchanged: Skip files whose local copy already matches the
+                object's ETag and size, so re-runs are incremental
             **kwargs: Additional parameters
 
         Returns:
@@ -598,14 +646,27 @@ class BatchOperation:
         if "all" in types_list:
             types_list = ["pages", "sections", "summary", "evaluation"]
 
+        download_kwargs: Dict[str, Any] = {"skip_unchanged": skip_unchanged}
+        if max_workers:
+            download_kwargs["max_workers"] = max_workers
         result = processor.download_batch_results(
-            batch_id=batch_id, output_dir=output_dir, file_types=types_list
+            batch_id=batch_id,
+            output_dir=output_dir,
+            file_types=types_list,
+            **download_kwargs,
         )
 
         return BatchDownloadResult(
             files_downloaded=result.get("files_downloaded", 0),
             documents_downloaded=result.get("documents_downloaded", 0),
             output_dir=result.get("output_dir", output_dir),
+            files_listed=result.get("files_listed", 0),
+            files_skipped=result.get("files_skipped", 0),
+            files_failed=result.get("files_failed", 0),
+            bytes_downloaded=result.get("bytes_downloaded", 0),
+            elapsed_seconds=result.get("elapsed_seconds"),
+            files_per_second=result.get("files_per_second"),
+            megabytes_per_second=result.get("megabytes_per_second"),
         )
 
     def list_versions(
@@ -732,6 +793,7 @@ class BatchOperation:
         stack_name: Optional[str] = None,
         dry_run: bool = False,
         continue_on_error: bool = True,
+        workers: int = 8,
         **kwargs,
     ) -> BatchDeletionResult:
         """Permanently delete documents and their associated data.
@@ -744,7 +806,11 @@ class BatchOperation:
             status_filter: Optional status filter (e.g., 'FAILED', 'COMPLETED')
             stack_name: Optional stack name override
             dry_run: If True, only simulate deletion without actually deleting
-            continue_on_error: If True, continue deleting other documents if one fails
+            continue_on_error: If True, continue deleting other documents if one
+                fails; documents are then deleted in bulk (batched requests,
+                ``workers`` chunks at a time). If False, they are deleted one at a
+                time, stopping at the first failure.
+            workers: Document chunks deleted concurrently in bulk mode
             **kwargs: Additional parameters
 
         Returns:
@@ -753,6 +819,7 @@ class BatchOperation:
         import boto3
 
         from idp_common.delete_documents import (
+            bulk_delete_documents,
             delete_documents,
             get_documents_by_batch,
             get_documents_by_pattern,
@@ -803,15 +870,26 @@ class BatchOperation:
                     results=[],
                 )
 
-            result = delete_documents(
-                object_keys=document_ids,
-                tracking_table=tracking_table,
-                s3_client=s3_client,
-                input_bucket=input_bucket,
-                output_bucket=output_bucket,
-                dry_run=dry_run,
-                continue_on_error=continue_on_error,
-            )
+            if continue_on_error:
+                result = bulk_delete_documents(
+                    object_keys=document_ids,
+                    tracking_table=tracking_table,
+                    s3_client=s3_client,
+                    input_bucket=input_bucket,
+                    output_bucket=output_bucket,
+                    dry_run=dry_run,
+                    workers=workers,
+                )
+            else:
+                result = delete_documents(
+                    object_keys=document_ids,
+                    tracking_table=tracking_table,
+                    s3_client=s3_client,
+                    input_bucket=input_bucket,
+                    output_bucket=output_bucket,
+                    dry_run=dry_run,
+                    continue_on_error=False,
+                )
 
             single_results = [
                 DocumentDeletionResult(
@@ -830,6 +908,9 @@ class BatchOperation:
                 total_count=result.get("total_count", 0),
                 dry_run=result.get("dry_run", dry_run),
                 results=single_results,
+                elapsed_seconds=result.get("elapsed_seconds"),
+                docs_per_second=result.get("documents_per_second"),
+                preview=result.get("preview"),
             )
         except Exception as e:
             raise IDPProcessingError(f"Batch deletion failed: {e}") from e
@@ -5,6 +5,7 @@
 Unit tests for Batch operations (mocked).
 """
 
+import json
 from datetime import datetime
 from unittest.mock import Mock, patch
 
@@ -77,3 +78,79 @@ class TestBatchOperationsMocked:
 
         with pytest.raises(Exception):
             client.batch.list()
+
+
+def _lookup_response(statuses):
+    payload = {
+        "results": [
+            {"object_key": key, "status": status} for key, status in statuses.items()
+        ]
+    }
+    return {"Payload": Mock(read=Mock(return_value=json.dumps(payload).encode()))}
+
+
+@pytest.mark.unit
+@pytest.mark.batch
+class TestIncrementalBatchStatus:
+    """get_status polls only look up documents that are not finished yet."""
+
+    @pytest.fixture
+    def lookup(self):
+        with (
+            patch("idp_sdk._core.batch_processor.BatchProcessor") as processor,
+            patch("idp_sdk._core.progress_monitor.boto3") as boto3,
+        ):
+            processor.return_value.get_batch_info.return_value = {
+                "document_ids": ["b1/a.pdf", "b1/b.pdf", "b1/c.pdf"]
+            }
+            processor.return_value.resources = {"LookupFunctionName": "lookup"}
+            lambda_client = boto3.client.return_value
+            yield processor, lambda_client
+
+    @staticmethod
+    def _queried(lambda_client):
+        payload = lambda_client.invoke.call_args.kwargs["Payload"]
+        return json.loads(payload)["object_keys"]
+
+    def test_second_poll_queries_only_active_documents(self, lookup):
+        processor, lambda_client = lookup
+        client = IDPClient(stack_name="test-stack")
+        lambda_client.invoke.return_value = _lookup_response(
+            {"b1/a.pdf": "COMPLETED", "b1/b.pdf": "FAILED", "b1/c.pdf": "RUNNING"}
+        )
+        first = client.batch.get_status("b1")
+
+        lambda_client.invoke.return_value = _lookup_response({"b1/c.pdf": "COMPLETED"})
+        second = client.batch.get_status("b1")
+
+        assert self._queried(lambda_client) == ["b1/c.pdf"]
+        assert (first.completed, first.in_progress) == (1, 1)
+        assert (second.completed, second.failed, second.all_complete) == (2, 1, True)
+        processor.return_value.get_batch_info.assert_called_once()
+
+    def test_refresh_queries_every_document(self, lookup):
+        _, lambda_client = lookup
+        client = IDPClient(stack_name="test-stack")
+        lambda_client.invoke.return_value = _lookup_response(
+            {"b1/a.pdf": "COMPLETED", "b1/b.pdf": "COMPLETED", "b1/c.pdf": "COMPLETED"}
+        )
+        client.batch.get_status("b1")
+
+        client.batch.get_status("b1", refresh=True)
+
+        assert self._queried(lambda_client) == ["b1/a.pdf", "b1/b.pdf", "b1/c.pdf"]
+
+    def test_reprocess_forgets_finished_documents(self, lookup):
+        _, lambda_client = lookup
+        client = IDPClient(stack_name="test-stack")
+        lambda_client.invoke.return_value = _lookup_response(
+            {"b1/a.pdf": "COMPLETED", "b1/b.pdf": "COMPLETED", "b1/c.pdf": "COMPLETED"}
+        )
+        client.batch.get_status("b1")
+
+        with patch("idp_sdk._core.rerun_processor.RerunProcessor") as rerun:
+            rerun.return_value.rerun_documents.return_value = {"documents_queued": 1}
+            client.batch.reprocess(step="extraction", document_ids=["b1/a.pdf"])
+        client.batch.get_status("b1")
+
+        assert self._queried(lambda_client) == ["b1/a.pdf", "b1/b.pdf", "b1/c.pdf"]
@@ -8,7 +8,7 @@ import os
 import time
 
 from aws_xray_sdk.core import patch_all, xray_recorder
-from idp_common import assessment, get_config, s3
+from idp_common import assessment, get_config, metrics, s3
 from idp_common.docs_service import create_document_service
 from idp_common.models import Document, Status
 from idp_common.utils import (
@@ -94,6 +94,7 @@ def check_document_for_throttling_errors(document):
     return False, None
 
 @xray_recorder.capture('assessment_function')
+@metrics.batch_metrics
 def handler(event, context):
     """
     Lambda handler for document assessment.
@@ -241,7 +242,9 @@ def handler(event, context):
 
     # Standalone assessment service (batches large lists via
     # extraction.confidence.list_batch_size; granular assessment is retired).
-    assessment_service = assessment.AssessmentService(config=config)
+    assessment_service = assessment.AssessmentService(
+        config=config, cache_scope=config_version
+    )
     logger.info("Using assessment service")
 
     # Process the document section for assessment
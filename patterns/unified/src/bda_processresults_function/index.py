@@ -1348,6 +1348,7 @@ def handle_skip_bda(event):
     return response
 
 
+@metrics.batch_metrics
 def handler(event, context):
     """
     Process the BDA results and build a Document object with pages and sections.
@@ -28,6 +28,7 @@ logger.setLevel(os.environ.get("LOG_LEVEL", "INFO"))
 logging.getLogger('idp_common.bedrock.client').setLevel(os.environ.get("BEDROCK_LOG_LEVEL", "INFO"))
 
 @xray_recorder.capture('classification_function')
+@metrics.batch_metrics
 def handler(event, context):
     """
     Lambda handler for document classification.
@@ -94,7 +95,11 @@ def handler(event, context):
     document.workflow_execution_arn = event.get("execution_arn")
     document_service = create_document_service()
     logger.info(f"Updating document status to {document.status}")
-    document_service.update_document(document)
+    # OCR does not write its results, so its pages and metering land here
+    document_service.update_document(
+        document,
+        changed={"status", "workflow_execution_arn", "pages", "num_pages", "metering"},
+    )
     
     if not document.pages:
         error_message = "Document has no pages to classify"
@@ -114,7 +119,8 @@ def handler(event, context):
         region=region,
         max_workers=MAX_WORKERS,
         config=config,
-        cache_table=cache_table
+        cache_table=cache_table,
+        cache_scope=config_version
     )
     
     # Classify the document - the service will update the Document directly
@@ -164,7 +170,9 @@ def handler(event, context):
     # Persist classifications and sections to DynamoDB for immediate UI visibility
     # This allows the UI to show document classes and empty sections right after classification
     logger.info("Persisting classification results to DynamoDB for UI visibility")
-    document_service.update_document(document)
+    document_service.update_document(
+        document, changed={"status", "pages", "num_pages", "sections", "metering"}
+    )
     
     # Prepare output with automatic compression if needed
     response = {
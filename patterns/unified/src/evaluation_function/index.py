@@ -16,7 +16,7 @@ import boto3
 from enum import Enum
 from typing import Dict, Any, Optional
 
-from idp_common import get_config, evaluation
+from idp_common import get_config, evaluation, metrics
 from idp_common.models import Document, Status
 from idp_common.docs_service import create_document_service
 
@@ -56,7 +56,9 @@ def update_document_evaluation_status(document: Document, status: EvaluationStat
     document.status = Status.EVALUATING
     document.evaluation_status = status.value
     logger.info(f"Updating document via document service: {document.input_key} with status: {status.value}")
-    return document_service.update_document(document)
+    return document_service.update_document(
+        document, changed={"status", "evaluation_status", "evaluation_report_uri"}
+    )
 
 def extract_document_from_event(event: Dict[str, Any]) -> Optional[Document]:
     """
@@ -144,6 +146,7 @@ def create_response(status_code: int, message: str, additional_data: Dict[str, A
     }
     return response
 
+@metrics.batch_metrics
 def handler(event, context):
     """
     Lambda function handler
@@ -181,7 +184,7 @@ def handler(event, context):
         
         # Set document status to EVALUATING before processing
         actual_document.status = Status.EVALUATING
-        document_service.update_document(actual_document)
+        document_service.update_document(actual_document, changed={"status"})
         
         # Update document evaluation status to RUNNING
         update_document_evaluation_status(actual_document, EvaluationStatus.RUNNING)
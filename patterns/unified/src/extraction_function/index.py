@@ -10,6 +10,7 @@ import logging
 import boto3
 from idp_common import metrics, get_config, extraction
 from idp_common.models import Document, Section, Status
+from idp_common.extraction.checkpoint_writer import CoalescingCheckpointWriter
 from idp_common.docs_service import create_document_service
 from idp_common.utils import calculate_lambda_metering, merge_metering_data
 from aws_xray_sdk.core import xray_recorder, patch_all
@@ -139,6 +140,7 @@ def _count_extraction_items(extraction_data: dict) -> int:
     return count
 
 @xray_recorder.capture('extraction_function')
+@metrics.batch_metrics
 def handler(event, context):
     """
     Process a single section of a document for information extraction
@@ -149,7 +151,19 @@ def handler(event, context):
     # For Map state, we get just one section from the document
     # Extract the document and section from the event - handle both compressed and uncompressed
     working_bucket = os.environ.get('WORKING_BUCKET')
-    full_document = Document.load_document(event.get("document", {}), working_bucket, logger)
+    document_data = event.get("document", {})
+    section_id = event.get("section_id")
+    if not section_id:
+        raise ValueError("No section_id found in event")
+    
+    # Capture section index from the document's section list BEFORE hydrating,
+    # so only this section and its pages need to be loaded from the state object.
+    # This is needed for atomic section updates to DynamoDB
+    document_section_ids = Document.section_ids_from_event(document_data)
+    if section_id not in document_section_ids:
+        raise ValueError(f"Section {section_id} not found in document")
+    section_index = document_section_ids.index(section_id)
+    full_document = Document.load_document(document_data, working_bucket, logger, section_ids=[section_id])
     
     # Load configuration - use document's version if specified, otherwise use active version
     config_version = getattr(full_document, 'config_version', None)
@@ -173,13 +187,6 @@ def handler(event, context):
     xray_recorder.put_annotation('document_id', {full_document.id})
     xray_recorder.put_annotation('processing_stage', 'extraction')
     
-    # Get the section ID directly from the Map state input
-    # Now using the simplified array of section IDs format
-    section_id = event.get("section_id")
-    
-    if not section_id:
-        raise ValueError("No section_id found in event")
-    
     # Look up the full section from the decompressed document
     section = None
     for doc_section in full_document.sections:
@@ -192,9 +199,6 @@ def handler(event, context):
     
     logger.info(f"Processing section {section_id} with {len(section.page_ids)} pages")
     
-    # Capture section index BEFORE modifying full_document.sections
-    # This is needed for atomic section updates to DynamoDB
-    section_index = next(i for i, s in enumerate(full_document.sections) if s.section_id == section_id)
     logger.info(f"Section {section_id} is at index {section_index} in the Sections array")
     
     # Intelligent Extraction detection: Skip if section already has extraction data
@@ -248,12 +252,25 @@ def handler(event, context):
     section_document.pages = needed_pages
     
     # Initialize the extraction service
-    extraction_service = extraction.ExtractionService(config=config)
+    extraction_service = extraction.ExtractionService(
+        config=config, cache_scope=config_version
+    )
     
     # --- Checkpoint: load any existing checkpoint for resume-on-timeout ---
     execution_arn = getattr(full_document, 'workflow_execution_arn', '') or event.get('execution_arn', '')
     agentic_enabled = config.extraction.agentic.enabled if config.extraction and config.extraction.agentic else False
     checkpoint_data = None
+    checkpoint_writer = None
+    
+    # Wall-clock deadline for the in-shard assessment self-healing ladder (1.5)
+    # and the checkpoint writer: convert the Lambda's remaining-time budget into
+    # an absolute epoch so the assessment escalation ladder stops, and pending
+    # checkpoints are written, before a hard task timeout.
+    deadline_epoch = None
+    try:
+        deadline_epoch = time.time() + (context.get_remaining_time_in_millis() / 1000.0)
+    except Exception:  # noqa: BLE001 - context may be absent in local/test runs
+        deadline_epoch = None
     
     if agentic_enabled and working_bucket and execution_arn:
         checkpoint = load_extraction_checkpoint(working_bucket, execution_arn, section_id)
@@ -280,11 +297,15 @@ def handler(event, context):
                 # Tag as buffer checkpoint so service layer handles it
                 checkpoint_data = {"_checkpoint_source": "intermediate_extraction", **checkpoint_data}
         
-        # Set up incremental checkpoint callback on the extraction service
+        # Set up incremental checkpoint callback on the extraction service.
+        # Checkpoints are coalesced and uploaded off the agent's critical path
+        # (latest wins); near the Lambda deadline every update is written
+        # synchronously so a timeout still resumes from the latest state.
         def _checkpoint_cb(extraction_data: dict) -> None:
             save_extraction_checkpoint(working_bucket, execution_arn, section_id, extraction_data)
 
-        extraction_service._checkpoint_callback = _checkpoint_cb
+        checkpoint_writer = CoalescingCheckpointWriter(_checkpoint_cb, deadline_epoch=deadline_epoch)
+        extraction_service._checkpoint_callback = checkpoint_writer
 
         # Wire per-shard persistence so the concurrent/sharded path can resume
         # only the incomplete shards if this Lambda times out and Step Functions
@@ -317,23 +338,24 @@ def handler(event, context):
     metrics.put_metric('InputDocuments', 1)
     metrics.put_metric('InputDocumentPages', len(section.page_ids))
     
-    # Wall-clock deadline for the in-shard assessment self-healing ladder (1.5):
-    # convert the Lambda's remaining-time budget into an absolute epoch so the
-    # assessment escalation ladder stops before a hard task timeout.
-    deadline_epoch = None
-    try:
-        deadline_epoch = time.time() + (context.get_remaining_time_in_millis() / 1000.0)
-    except Exception:  # noqa: BLE001 - context may be absent in local/test runs
-        deadline_epoch = None
-
     # Process the section in our focused document
     t0 = time.time()
-    section_document = extraction_service.process_document_section(
-        document=section_document,
-        section_id=section_id,
-        checkpoint_data=checkpoint_data,
-        deadline_epoch=deadline_epoch,
-    )
+    try:
+        section_document = extraction_service.process_document_section(
+            document=section_document,
+            section_id=section_id,
+            checkpoint_data=checkpoint_data,
+            deadline_epoch=deadline_epoch,
+        )
+    except BaseException:
+        # Persist the latest coalesced checkpoint so the retry resumes from it
+        if checkpoint_writer is not None:
+            checkpoint_writer.close()
+        raise
+    # The checkpoint is deleted below; stop the writer first (dropping any
+    # pending update) so a late background write cannot recreate it.
+    if checkpoint_writer is not None:
+        checkpoint_writer.close(discard=True)
     t1 = time.time()
     logger.info(f"Total extraction time: {t1-t0:.2f} seconds")
     
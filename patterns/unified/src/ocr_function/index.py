@@ -177,6 +177,7 @@ def discover_existing_ocr_pages(output_bucket, input_key):
     return completed_pages
 
 @xray_recorder.capture('ocr_function')
+@metrics.batch_metrics
 def handler(event, context): 
     """
     Lambda handler for OCR processing.
@@ -239,7 +240,7 @@ def handler(event, context):
     document.workflow_execution_arn = event.get("execution_arn")
     document_service = create_document_service()
     logger.info(f"Updating document status to {document.status}")
-    document_service.update_document(document)
+    document_service.update_document(document, changed={"status", "workflow_execution_arn"})
     
     t0 = time.time()
     
@@ -253,7 +254,8 @@ def handler(event, context):
     service = ocr.OcrService(
         region=region,
         config=config,
-        backend=backend
+        backend=backend,
+        cache_scope=config_version
     )
     
     # Retry-safe: discover OCR pages from previous (throttled) attempts in S3.
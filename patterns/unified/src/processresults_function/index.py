@@ -7,7 +7,7 @@ import logging
 import os
 
 import boto3
-from idp_common import s3, utils
+from idp_common import metrics, s3, utils
 from idp_common.config import get_config
 from idp_common.docs_service import create_document_service
 from idp_common.models import Document, HitlMetadata, Status
@@ -32,6 +32,7 @@ def is_hitl_enabled(config_version=None):
         return False  # Default to disabled if config unavailable
 
 
+@metrics.batch_metrics
 def handler(event, context):
     """
     Consolidates the results from multiple extraction steps into a single output.
@@ -77,7 +78,7 @@ def handler(event, context):
         logger.info(f"Current HITL status from DynamoDB: {document.hitl_status}")
     
     logger.info(f"Updating document status to {document.status}")
-    document_service.update_document(document)
+    document_service.update_document(document, changed={"status"})
 
     # Clear sections list to rebuild from extraction results
     document.sections = []
@@ -89,7 +90,14 @@ def handler(event, context):
     for i, result in enumerate(extraction_results):
         # New optimized format - document is at the top level
         document_data = result.get("document", {})
-        section_document = Document.load_document(document_data, working_bucket, logger)
+        # Each Map iteration returns one section; hydrate only that section
+        section_id = result.get("section_id")
+        section_document = Document.load_document(
+            document_data,
+            working_bucket,
+            logger,
+            section_ids=[section_id] if section_id else None,
+        )
         logger.info(f"section_document: {section_document}")
         if section_document:
             # Add section to document if present
@@ -173,7 +181,19 @@ def handler(event, context):
 
     # Update final status in AppSync / Document Service (includes Review Status)
     logger.info(f"Updating document status to {document.status}")
-    document_service.update_document(document)
+    document_service.update_document(
+        document,
+        changed={
+            "status",
+            "pages",
+            "sections",
+            "metering",
+            "hitl_status",
+            "hitl_sections_pending",
+            "hitl_sections_completed",
+            "confidence_alert_count",
+        },
+    )
 
     # Check if rule validation is enabled in config AND has rules configured
     rule_validation_enabled = False
@@ -29,6 +29,7 @@ logger.setLevel(os.environ.get("LOG_LEVEL", "INFO"))
 logging.getLogger('idp_common.bedrock.client').setLevel(os.environ.get("BEDROCK_LOG_LEVEL", "INFO"))
 
 @xray_recorder.capture('rule_validation_function')
+@metrics.batch_metrics
 def handler(event, context):
     """
     Process a single section of a document for rule validation
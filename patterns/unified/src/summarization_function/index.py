@@ -10,7 +10,7 @@ import logging
 import time
 
 # Import the SummarizationService from idp_common
-from idp_common import get_config, summarization
+from idp_common import get_config, metrics, summarization
 from idp_common.models import Document, Status
 from idp_common.docs_service import create_document_service
 from idp_common.utils import calculate_lambda_metering, merge_metering_data
@@ -21,6 +21,7 @@ logger = logging.getLogger()
 logger.setLevel(os.environ.get("LOG_LEVEL", "INFO"))
 logging.getLogger('idp_common.bedrock.client').setLevel(os.environ.get("BEDROCK_LOG_LEVEL", "INFO"))
 
+@metrics.batch_metrics
 def handler(event, context):
     """
     Lambda handler for document summarization using the SummarizationService.
@@ -69,7 +70,9 @@ def handler(event, context):
         document.status = Status.SUMMARIZING
         document_service = create_document_service()
         logger.info(f"Updating document status to {document.status}")
-        document_service.update_document(document)
+        # Status only: HITL review runs alongside the workflow, and a full write
+        # would put back the review status recorded when process results ran
+        document_service.update_document(document, changed={"status"})
         
         # Load configuration - use document's version if specified, otherwise use active version
         config_version = getattr(document, 'config_version', None)
@@ -82,7 +85,7 @@ def handler(event, context):
         
         # Create the summarization service
         summarization_service = summarization.SummarizationService(
-            config=config
+            config=config, cache_scope=config_version
         )        
         # Process the document using the service
         logger.info(f"Processing document with SummarizationService, document ID: {document.id}")
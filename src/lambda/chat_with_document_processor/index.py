@@ -12,7 +12,11 @@ budget:
   3. Loads the ``chat`` section from the document's config version via
      ``idp_common.config.get_config``.
   4. Fetches the full document text from S3 (cached per-document under
-     ``<objectKey>/summary/fulltext.txt``).
+     ``<objectKey>/summary/fulltext.txt``). For documents of at least
+     ``chat.retrieval_min_pages`` pages, only the pages most relevant to the
+     question plus a document header are sent, picked by a per-document
+     ``ChatPageIndex`` (cached in memory and under
+     ``<objectKey>/summary/chat_index.json``).
   5. Invokes Bedrock via the Converse Stream API and publishes incremental
      token deltas (``assistant_stream``) to the AppSync subscription with
      light throttling (~200 ms / 200-char batches) so the UI can render the
@@ -27,9 +31,12 @@ them inline instead of leaving the user with a spinning wheel.
 
 from __future__ import annotations
 
+import json
 import logging
 import os
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 import boto3
@@ -37,6 +44,12 @@ from botocore.exceptions import ClientError
 from idp_common.bedrock.client import is_claude_4_7_model
 from idp_common.bedrock.model_utils import parse_model_id
 from idp_common.bedrock.openai_responses import is_openai_responses_model
+from idp_common.chat_page_index import (
+    DEFAULT_MIN_PAGES,
+    DEFAULT_TOP_K_PAGES,
+    ChatPageIndex,
+    estimate_tokens,
+)
 from idp_common.config import get_config
 
 logger = logging.getLogger()
@@ -61,6 +74,17 @@ DEFAULT_SYSTEM_PROMPT = (
 STREAM_FLUSH_INTERVAL_S = 0.2
 STREAM_FLUSH_CHAR_THRESHOLD = 200
 
+# Page texts downloaded concurrently when assembling the full text.
+PAGE_TEXT_FETCH_WORKERS = 16
+
+# Page retrieval indexes built or loaded by this container, keyed by object
+# key. An entry is only used while its ``source`` matches the ETag of the
+# document's fulltext.txt, so reprocessing the document rebuilds it. A chat
+# session stays on one document, so a few entries cover the warm container;
+# older ones are evicted least recently used first.
+CHAT_INDEX_CACHE_SIZE = 4
+_chat_indexes: OrderedDict[str, ChatPageIndex] = OrderedDict()
+
 
 # --- Emission sink -------------------------------------------------------
 #
@@ -205,13 +229,13 @@ def _default_model_for_region() -> str:
     return "us.anthropic.claude-opus-4-8:1m"
 
 
-def _s3_object_exists(bucket: str, key: str) -> bool:
+def _s3_object_etag(bucket: str, key: str) -> str | None:
+    """ETag of an S3 object, or ``None`` when it does not exist."""
     try:
-        _s3.head_object(Bucket=bucket, Key=key)
-        return True
+        return _s3.head_object(Bucket=bucket, Key=key).get("ETag", "")
     except ClientError as e:
         if e.response["Error"]["Code"] == "404":
-            return False
+            return None
         raise
 
 
@@ -248,25 +272,150 @@ def _get_user_allowed_config_versions(caller_sub: str) -> list[str] | None:
         return None
 
 
+def _get_page_text(bucket: str, page: dict) -> str | None:
+    text_key = page["TextUri"].replace(f"s3://{bucket}/", "")
+    try:
+        resp = _s3.get_object(Bucket=bucket, Key=text_key)
+        return resp["Body"].read().decode("utf-8")
+    except Exception as e:  # noqa: BLE001
+        logger.warning("Failed to load page %s: %s", page.get("Id"), e)
+        return None
+
+
 def _get_full_text(bucket: str, object_key: str, document: dict) -> str:
     pages = document.get("Pages") or []
-    sorted_pages = sorted(pages, key=lambda p: p.get("Id", 0))
-    parts: list[str] = []
-    for page in sorted_pages:
-        text_uri = page.get("TextUri")
-        if not text_uri:
-            continue
-        text_key = text_uri.replace(f"s3://{bucket}/", "")
+    sorted_pages = [
+        page
+        for page in sorted(pages, key=lambda p: p.get("Id", 0))
+        if page.get("TextUri")
+    ]
+    with ThreadPoolExecutor(max_workers=PAGE_TEXT_FETCH_WORKERS) as pool:
+        texts = list(pool.map(lambda page: _get_page_text(bucket, page), sorted_pages))
+    parts = [
+        f"<page-number>{page.get('Id')}</page-number>\n" + text + "\n"
+        for page, text in zip(sorted_pages, texts)
+        if text is not None
+    ]
+    return "\n".join(parts)
+
+
+def _get_chat_index(
+    bucket: str,
+    object_key: str,
+    fulltext_etag: str,
+    load_full_text,  # noqa: ANN001
+    embedding_model: str | None,
+) -> ChatPageIndex:
+    """Return the page retrieval index for the document's current full text.
+
+    Looks in this container's cache, then ``<objectKey>/summary/chat_index.json``,
+    and otherwise builds the index from the full text (``load_full_text()``)
+    and stores it there for other containers and later turns.
+    """
+
+    def _is_current(chat_index: ChatPageIndex) -> bool:
+        return (
+            chat_index.source == fulltext_etag
+            and chat_index.embedding_model == (embedding_model or None)
+        )
+
+    cached = _chat_indexes.get(object_key)
+    if cached is not None and _is_current(cached):
+        _chat_indexes.move_to_end(object_key)
+        return cached
+
+    index_key = object_key + "/summary/chat_index.json"
+    try:
+        resp = _s3.get_object(Bucket=bucket, Key=index_key)
+        stored = ChatPageIndex.from_dict(json.loads(resp["Body"].read()))
+        if _is_current(stored):
+            _remember_chat_index(object_key, stored)
+            return stored
+    except ClientError as e:
+        if e.response["Error"]["Code"] not in ("NoSuchKey", "404"):
+            logger.warning("Could not read chat index %s: %s", index_key, e)
+    except (ValueError, KeyError) as e:
+        logger.warning("Ignoring unreadable chat index %s: %s", index_key, e)
+
+    t_start = time.time()
+    embed_pages = None
+    if embedding_model:
+        from idp_common.bedrock.client import default_client
+
+        def embed_pages(texts: list[str]):  # noqa: ANN202
+            return default_client.generate_embeddings_batch(
+                [{"text": text} for text in texts], model_id=embedding_model
+            )
+
+    chat_index = ChatPageIndex.from_full_text(
+        load_full_text(),
+        embed_pages=embed_pages,
+        embedding_model=embedding_model,
+        source=fulltext_etag,
+    )
+    try:
+        _s3.put_object(
+            Bucket=bucket,
+            Key=index_key,
+            Body=json.dumps(chat_index.to_dict()).encode("utf-8"),
+            ContentType="application/json",
+        )
+    except Exception as e:  # noqa: BLE001
+        logger.warning("Could not store chat index %s: %s", index_key, e)
+    logger.info(
+        "Built chat index for %s: %d pages in %.0f ms (embeddings=%s)",
+        object_key,
+        chat_index.page_count,
+        (time.time() - t_start) * 1000,
+        embedding_model or "none",
+    )
+    _remember_chat_index(object_key, chat_index)
+    return chat_index
+
+
+def _remember_chat_index(object_key: str, chat_index: ChatPageIndex) -> None:
+    """Cache ``chat_index`` in this container, evicting the least recently used."""
+    _chat_indexes[object_key] = chat_index
+    _chat_indexes.move_to_end(object_key)
+    while len(_chat_indexes) > CHAT_INDEX_CACHE_SIZE:
+        _chat_indexes.popitem(last=False)
+
+
+def _retrieve_pages(chat_index: ChatPageIndex, prompt: str, chat_settings: dict) -> str:
+    """Prompt context with the pages most relevant to ``prompt``.
+
+    Logs retrieval latency and the input tokens saved versus sending the
+    entire document text.
+    """
+    t_start = time.time()
+    query_embedding = None
+    if chat_index.embedding_model:
+        from idp_common.bedrock.client import default_client
+
         try:
-            resp = _s3.get_object(Bucket=bucket, Key=text_key)
-            parts.append(
-                f"<page-number>{page.get('Id')}</page-number>\n"
-                + resp["Body"].read().decode("utf-8")
-                + "\n"
+            query_embedding = default_client.generate_embedding(
+                text=prompt,
+                model_id=chat_index.embedding_model,
+                input_type="search_query",
             )
         except Exception as e:  # noqa: BLE001
-            logger.warning("Failed to load page %s: %s", page.get("Id"), e)
-    return "\n".join(parts)
+            logger.warning("Query embedding failed, using BM25 only: %s", e)
+    top_k = chat_settings.get("retrieval_top_k_pages") or DEFAULT_TOP_K_PAGES
+    page_ids = chat_index.search(prompt, top_k=top_k, query_embedding=query_embedding)
+    context_str = chat_index.render(page_ids)
+    full_tokens = chat_index.full_text_tokens()
+    sent_tokens = estimate_tokens(context_str)
+    logger.info(
+        "Chat retrieval: pages %s of %d in %.1f ms; ~%d document tokens sent "
+        "instead of ~%d (~%d saved)",
+        ",".join(page_ids),
+        chat_index.page_count,
+        (time.time() - t_start) * 1000,
+        sent_tokens,
+        full_tokens,
+        max(full_tokens - sent_tokens, 0),
+    )
+    return context_str
 
 
 def _resolve_chat_settings(config_version: str | None):
@@ -340,6 +489,13 @@ def _resolve_chat_settings(config_version: str | None):
         "temperature": _to_float(chat_cfg.get("temperature"), 0.0),
         "max_tokens": _resolve_max_tokens(),
         "reasoning_effort": chat_cfg.get("reasoning_effort") or "medium",
+        "retrieval_min_pages": _to_int(
+            chat_cfg.get("retrieval_min_pages"), DEFAULT_MIN_PAGES
+        ),
+        "retrieval_top_k_pages": _to_int(
+            chat_cfg.get("retrieval_top_k_pages"), DEFAULT_TOP_K_PAGES
+        ),
+        "retrieval_embedding_model": chat_cfg.get("retrieval_embedding_model") or None,
     }
 
 
@@ -682,23 +838,45 @@ def handler(event, _context):  # noqa: ANN001
         # --- 4. Assemble or load cached full text ---------------------------
         output_bucket = os.environ["OUTPUT_BUCKET"]
         fulltext_key = object_key + "/summary/fulltext.txt"
-        if not _s3_object_exists(output_bucket, fulltext_key):
-            page_count = len(document.get("Pages") or [])
+        page_count = len(document.get("Pages") or [])
+        # Holds the full text once assembled or downloaded, so it is read at most once
+        full_text_cache: list[str] = []
+        fulltext_etag = _s3_object_etag(output_bucket, fulltext_key)
+        if fulltext_etag is None:
             _emit(
                 session_id=session_id,
                 method="assistant_status",
                 status="LOADING_DOCUMENT",
                 content=f"Loading document text ({page_count} pages)…",
             )
-            content_str = _get_full_text(output_bucket, object_key, document)
-            _s3.put_object(
+            full_text_cache.append(
+                _get_full_text(output_bucket, object_key, document)
+            )
+            put_resp = _s3.put_object(
                 Bucket=output_bucket,
                 Key=fulltext_key,
-                Body=content_str.encode("utf-8"),
+                Body=full_text_cache[0].encode("utf-8"),
+            )
+            fulltext_etag = (put_resp or {}).get("ETag", "")
+
+        def _load_full_text() -> str:
+            if not full_text_cache:
+                resp = _s3.get_object(Bucket=output_bucket, Key=fulltext_key)
+                full_text_cache.append(resp["Body"].read().decode("utf-8"))
+            return full_text_cache[0]
+
+        min_pages = chat_settings.get("retrieval_min_pages", DEFAULT_MIN_PAGES)
+        if min_pages and page_count >= min_pages:
+            chat_index = _get_chat_index(
+                output_bucket,
+                object_key,
+                fulltext_etag,
+                _load_full_text,
+                chat_settings.get("retrieval_embedding_model"),
             )
+            content_str = _retrieve_pages(chat_index, prompt, chat_settings)
         else:
-            resp = _s3.get_object(Bucket=output_bucket, Key=fulltext_key)
-            content_str = resp["Body"].read().decode("utf-8")
+            content_str = _load_full_text()
 
         # --- 5. Invoke Bedrock (streaming) ---------------------------------
         _emit(
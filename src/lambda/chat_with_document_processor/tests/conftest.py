@@ -10,8 +10,10 @@ locally.
 
 from __future__ import annotations
 
+import importlib.util
 import os
 import sys
+from pathlib import Path
 from unittest.mock import MagicMock
 
 os.environ.setdefault("AWS_ACCESS_KEY_ID", "testing")
@@ -85,3 +87,17 @@ def _fake_parse_model_id(model_id):
 _model_utils_mod = MagicMock()
 _model_utils_mod.parse_model_id = _fake_parse_model_id
 sys.modules["idp_common.bedrock.model_utils"] = _model_utils_mod
+
+
+# idp_common.chat_page_index is plain Python with no dependencies, so load the
+# real module: page retrieval is processor behavior under test, not a stub.
+_chat_page_index_path = (
+    Path(__file__).resolve().parents[4]
+    / "lib/idp_common_pkg/idp_common/chat_page_index.py"
+)
+_spec = importlib.util.spec_from_file_location(
+    "idp_common.chat_page_index", _chat_page_index_path
+)
+_chat_page_index_mod = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(_chat_page_index_mod)
+sys.modules["idp_common.chat_page_index"] = _chat_page_index_mod
@@ -450,3 +450,122 @@ class TestProcessorModelIdSuffixes:
         assert "serviceTier" not in kwargs
         assert "performanceConfig" not in kwargs
         assert "additionalModelRequestFields" not in kwargs
+
+
+class TestProcessorPageRetrieval:
+    """Documents of at least ``retrieval_min_pages`` pages send only the pages
+    most relevant to the question (plus the document header), and the page
+    index is built once per document, not per turn."""
+
+    @staticmethod
+    def _full_text(pages: int) -> bytes:
+        parts = []
+        for page in range(1, pages + 1):
+            text = f"Statement page {page}. Routine account activity and balances."
+            if page == 1:
+                text = "ACME LOAN AGREEMENT between ACME Bank and J. Doe. " + text
+            if page == 17:
+                text += " The borrower shall provide indemnification for losses."
+            parts.append(f"<page-number>{page}</page-number>\n{text}\n")
+        return "\n".join(parts).encode("utf-8")
+
+    def _turn(self, index, s3, prompt: str) -> str:
+        tracking_table = MagicMock()
+        tracking_table.get_item.return_value = {
+            "Item": {
+                "PK": "doc#uploads/loan.pdf",
+                "SK": "none",
+                "ConfigVersion": "default",
+                "Pages": [{"Id": i, "TextUri": f"s3://b/{i}.txt"} for i in range(1, 31)],
+            }
+        }
+        dyn_resource = MagicMock()
+        dyn_resource.Table.return_value = tracking_table
+        bedrock = MagicMock()
+        bedrock.converse_stream.return_value = {
+            "stream": iter(_make_stream_events(["ok"]))
+        }
+        _install_capture_sink(index, [])
+
+        with (
+            patch.object(index, "_s3", s3),
+            patch.object(index, "_dynamodb", dyn_resource),
+            patch.object(index, "_get_bedrock_runtime", return_value=bedrock),
+            patch.object(
+                index, "_resolve_chat_settings",
+                return_value={
+                    "model_id": "us.amazon.nova-lite-v1:0",
+                    "system_prompt": "sys",
+                    "temperature": 0.0,
+                    "max_tokens": 128,
+                    "retrieval_min_pages": 20,
+                    "retrieval_top_k_pages": 3,
+                },
+            ),
+        ):
+            result = index.handler(
+                {
+                    "sessionId": "s-r",
+                    "turnId": "t-r",
+                    "prompt": prompt,
+                    "s3Uri": "uploads/loan.pdf",
+                    "modelId": "",
+                    "callerSub": "caller",
+                },
+                None,
+            )
+        assert result["ok"] is True, result
+        kwargs = bedrock.converse_stream.call_args.kwargs
+        return kwargs["messages"][0]["content"][0]["text"]
+
+    @pytest.mark.unit
+    def test_sends_relevant_pages_and_reuses_index_across_turns(self):
+        import index
+        from botocore.exceptions import ClientError
+
+        full_text = self._full_text(30)
+
+        def get_object(Bucket, Key):
+            if Key.endswith("chat_index.json"):
+                raise ClientError({"Error": {"Code": "NoSuchKey"}}, "GetObject")
+            return {"Body": MagicMock(read=MagicMock(return_value=full_text))}
+
+        s3 = MagicMock()
+        s3.head_object.return_value = {"ETag": '"v1"'}
+        s3.get_object.side_effect = get_object
+
+        user_text = self._turn(index, s3, "Who pays for indemnification?")
+
+        assert "<page-number>17</page-number>" in user_text
+        assert "<page-number>5</page-number>" not in user_text
+        # Header from page 1 tells the model what document this is
+        assert "ACME LOAN AGREEMENT" in user_text
+        assert "The document has 30 pages" in user_text
+        assert user_text.endswith("The user's question is: Who pays for indemnification?")
+        assert len(user_text) < len(full_text) / 3
+        stored = [c.kwargs["Key"] for c in s3.put_object.call_args_list]
+        assert stored == ["uploads/loan.pdf/summary/chat_index.json"]
+
+        gets = s3.get_object.call_count
+        self._turn(index, s3, "What does indemnification cover?")
+        assert s3.get_object.call_count == gets  # index served from memory
+        assert s3.put_object.call_count == 1
+
+    @pytest.mark.unit
+    def test_container_index_cache_evicts_least_recently_used(self):
+        import index
+
+        indexes = {f"doc-{i}.pdf": MagicMock(source='"v1"', embedding_model=None)
+                   for i in range(index.CHAT_INDEX_CACHE_SIZE + 1)}
+        with patch.dict(index._chat_indexes, clear=True):
+            keys = list(indexes)
+            for key in keys[:-1]:
+                index._remember_chat_index(key, indexes[key])
+            # A hit makes doc-0 the most recently used entry
+            assert index._get_chat_index("b", keys[0], '"v1"', None, None) is indexes[keys[0]]
+
+            index._remember_chat_index(keys[-1], indexes[keys[-1]])
+
+            assert len(index._chat_indexes) == index.CHAT_INDEX_CACHE_SIZE
+            assert keys[0] in index._chat_indexes
+            assert keys[1] not in index._chat_indexes
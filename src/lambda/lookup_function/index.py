@@ -5,6 +5,8 @@
 import boto3
 import json
 import os
+import random
+import time
 from datetime import datetime, timezone
 import logging
 
@@ -16,17 +18,17 @@ logging.getLogger('idp_common.bedrock.client').setLevel(os.environ.get("BEDROCK_
 def calculate_durations(timestamps):
     try:
         durations = {}
-        if 'QueuedTime' in timestamps and 'WorkflowStartTime' in timestamps:
+        if timestamps.get('QueuedTime') and timestamps.get('WorkflowStartTime'):
             queue_time = (datetime.fromisoformat(timestamps['WorkflowStartTime']) - 
                          datetime.fromisoformat(timestamps['QueuedTime'])).total_seconds() * 1000
             durations['queue'] = int(queue_time)
             
-        if 'WorkflowStartTime' in timestamps and 'CompletionTime' in timestamps:
+        if timestamps.get('WorkflowStartTime') and timestamps.get('CompletionTime'):
             processing_time = (datetime.fromisoformat(timestamps['CompletionTime']) - 
                              datetime.fromisoformat(timestamps['WorkflowStartTime'])).total_seconds() * 1000
             durations['processing'] = int(processing_time)
             
-        if 'InitialEventTime' in timestamps and 'CompletionTime' in timestamps:
+        if timestamps.get('InitialEventTime') and timestamps.get('CompletionTime'):
             total_time = (datetime.fromisoformat(timestamps['CompletionTime']) - 
                          datetime.fromisoformat(timestamps['InitialEventTime'])).total_seconds() * 1000
             durations['total'] = int(total_time)
@@ -36,6 +38,77 @@ def calculate_durations(timestamps):
         logger.error(f"Error calculating durations: {e}", exc_info=True)
         return {}
 
+# BatchGetItem accepts at most 100 keys per request
+BATCH_GET_MAX_KEYS = 100
+# Retries of UnprocessedKeys (throttling) before the keys are reported as ERROR
+BATCH_GET_MAX_ATTEMPTS = 6
+# status_only results are built from these attributes alone, so batch reads
+# project them instead of fetching whole tracking records
+STATUS_ONLY_ATTRIBUTES = ['PK', 'ObjectStatus', 'InitialEventTime', 'QueuedTime',
+                          'WorkflowStartTime', 'CompletionTime']
+
+_dynamodb = None
+
+
+def _get_dynamodb():
+    global _dynamodb
+    if _dynamodb is None:
+        _dynamodb = boto3.resource('dynamodb')
+    return _dynamodb
+
+
+def _build_status(object_key, item, status_only):
+    """Build the lookup result for a tracking record"""
+    # Always include status and timing
+    timestamps = {
+        'InitialEventTime': item.get('InitialEventTime'),
+        'QueuedTime': item.get('QueuedTime'),
+        'WorkflowStartTime': item.get('WorkflowStartTime'),
+        'CompletionTime': item.get('CompletionTime')
+    }
+
+    result = {
+        'object_key': object_key,
+        'status': item.get('ObjectStatus', 'UNKNOWN'),
+        'timing': {
+            'timestamps': timestamps,
+            'elapsed': calculate_durations(timestamps)
+        }
+    }
+
+    # If status_only mode, skip expensive Step Functions queries
+    if status_only:
+        return result
+
+    execution_arn = item.get('WorkflowExecutionArn')
+    if execution_arn:
+        try:
+            sfn = boto3.client('stepfunctions')
+            execution = sfn.describe_execution(executionArn=execution_arn)
+            history = sfn.get_execution_history(
+                executionArn=execution_arn,
+                maxResults=100
+            )
+
+            result['processingDetail'] = {
+                'executionArn': execution_arn,
+                'execution': {k: str(v) if isinstance(v, datetime) else v
+                            for k, v in execution.items()
+                            if k != 'ResponseMetadata'},
+                'events': [{k: str(v) if isinstance(v, datetime) else v
+                          for k, v in event.items()}
+                          for event in history['events']]
+            }
+        except Exception as e:
+            logger.error(f"Error getting Step Functions details: {e}", exc_info=True)
+            result['processingDetail'] = {
+                'executionArn': execution_arn,
+                'error': str(e)
+            }
+
+    return result
+
+
 def get_document_status(object_key, status_only=False):
     """
     Get status for a single document
@@ -47,8 +120,7 @@ def get_document_status(object_key, status_only=False):
     Returns:
         Dictionary with document status
     """
-    dynamodb = boto3.resource('dynamodb')
-    tracking_table = dynamodb.Table(os.environ['TRACKING_TABLE'])
+    tracking_table = _get_dynamodb().Table(os.environ['TRACKING_TABLE'])
     
     try:
         PK = f"doc#{object_key}"
@@ -60,56 +132,7 @@ def get_document_status(object_key, status_only=False):
         if 'Item' not in response:
             return {'object_key': object_key, 'status': 'NOT_FOUND'}
             
-        item = response['Item']
-        
-        # Always include status and timing
-        timestamps = {
-            'InitialEventTime': item.get('InitialEventTime'),
-            'QueuedTime': item.get('QueuedTime'),
-            'WorkflowStartTime': item.get('WorkflowStartTime'),
-            'CompletionTime': item.get('CompletionTime')
-        }
-        
-        result = {
-            'object_key': object_key,
-            'status': item.get('ObjectStatus', 'UNKNOWN'),
-            'timing': {
-                'timestamps': timestamps,
-                'elapsed': calculate_durations(timestamps)
-            }
-        }
-        
-        # If status_only mode, skip expensive Step Functions queries
-        if status_only:
-            return result
-        
-        execution_arn = item.get('WorkflowExecutionArn')
-        if execution_arn:
-            try:
-                sfn = boto3.client('stepfunctions')
-                execution = sfn.describe_execution(executionArn=execution_arn)
-                history = sfn.get_execution_history(
-                    executionArn=execution_arn,
-                    maxResults=100
-                )
-                
-                result['processingDetail'] = {
-                    'executionArn': execution_arn,
-                    'execution': {k: str(v) if isinstance(v, datetime) else v 
-                                for k, v in execution.items() 
-                                if k != 'ResponseMetadata'},
-                    'events': [{k: str(v) if isinstance(v, datetime) else v 
-                              for k, v in event.items()}
-                              for event in history['events']]
-                }
-            except Exception as e:
-                logger.error(f"Error getting Step Functions details: {e}", exc_info=True)
-                result['processingDetail'] = {
-                    'executionArn': execution_arn,
-                    'error': str(e)
-                }
-        
-        return result
+        return _build_status(object_key, response['Item'], status_only)
         
     except Exception as e:
         logger.error(f"Error looking up document {object_key}: {e}", exc_info=True)
@@ -120,6 +143,79 @@ def get_document_status(object_key, status_only=False):
         }
 
 
+def _batch_get_items(object_keys, status_only):
+    """
+    Read the tracking records of object_keys with BatchGetItem
+
+    Keys are read 100 per request; UnprocessedKeys are retried with
+    exponential backoff. Returns ({object_key: item}, {object_key: error})
+    for the keys that could not be read.
+    """
+    table_name = os.environ['TRACKING_TABLE']
+    dynamodb = _get_dynamodb()
+    items = {}
+    errors = {}
+
+    for start in range(0, len(object_keys), BATCH_GET_MAX_KEYS):
+        chunk = object_keys[start:start + BATCH_GET_MAX_KEYS]
+        request = {
+            'Keys': [{'PK': f"doc#{key}", 'SK': 'none'} for key in chunk],
+            'ConsistentRead': True,
+        }
+        if status_only:
+            names = {f"#a{i}": name for i, name in enumerate(STATUS_ONLY_ATTRIBUTES)}
+            request['ProjectionExpression'] = ', '.join(names)
+            request['ExpressionAttributeNames'] = names
+
+        request_items = {table_name: request}
+        try:
+            for attempt in range(BATCH_GET_MAX_ATTEMPTS):
+                response = dynamodb.batch_get_item(RequestItems=request_items)
+                for item in response.get('Responses', {}).get(table_name, []):
+                    items[item['PK'][len('doc#'):]] = item
+                request_items = response.get('UnprocessedKeys') or {}
+                if not request_items:
+                    break
+                time.sleep(min(0.05 * 2 ** attempt, 1.0) * (0.5 + random.random() / 2))  # nosec B311
+        except Exception as e:
+            logger.error(f"Error in batch lookup of {len(chunk)} documents: {e}", exc_info=True)
+            for key in chunk:
+                if key not in items:
+                    errors[key] = str(e)
+            continue
+
+        for unprocessed in request_items.get(table_name, {}).get('Keys', []):
+            errors[unprocessed['PK'][len('doc#'):]] = 'Lookup throttled, retry later'
+
+    return items, errors
+
+
+def get_document_statuses(object_keys, status_only=False):
+    """
+    Get status for many documents, in request order
+
+    Args:
+        object_keys: Document object keys (duplicates allowed)
+        status_only: If True, return status + timing (no Step Functions details)
+
+    Returns:
+        List of document status dictionaries, one per entry of object_keys
+    """
+    # BatchGetItem rejects duplicate keys within a request
+    unique_keys = list(dict.fromkeys(object_keys))
+    items, errors = _batch_get_items(unique_keys, status_only)
+
+    results = []
+    for key in object_keys:
+        if key in errors:
+            results.append({'object_key': key, 'status': 'ERROR', 'message': errors[key]})
+        elif key in items:
+            results.append(_build_status(key, items[key], status_only))
+        else:
+            results.append({'object_key': key, 'status': 'NOT_FOUND'})
+    return results
+
+
 def handler(event, context):
     """
     Lambda handler supporting both single and batch document queries
@@ -132,7 +228,11 @@ def handler(event, context):
         Single: {'status': 'RUNNING', 'timing': {...}, 'processingDetail': {...}}
         Batch: {'results': [{'object_key': 'doc-1', 'status': 'COMPLETED'}, ...]}
     """
-    logger.info(f"Event: {json.dumps(event)}")
+    # Batch events can carry thousands of keys on every monitor poll
+    if event.get('object_keys'):
+        logger.debug(f"Event: {json.dumps(event)}")
+    else:
+        logger.info(f"Event: {json.dumps(event)}")
 
     # Extract request parameters
     object_keys = event.get('object_keys')  # Batch mode
@@ -146,11 +246,7 @@ def handler(event, context):
     # Handle batch request
     if object_keys:
         logger.info(f"Batch query for {len(object_keys)} documents (status_only={status_only})")
-        results = []
-        for key in object_keys:
-            result = get_document_status(key, status_only)
-            results.append(result)
-        return {'results': results}
+        return {'results': get_document_statuses(object_keys, status_only)}
     
     # Handle single document request (backward compatible)
     logger.info(f"Single query for {object_key} (status_only={status_only})")
@@ -0,0 +1,123 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""Batch lookups in the lookup Lambda read the tracking table with BatchGetItem.
+
+The progress monitor sends up to 1000 keys per poll; these are read 100 per
+BatchGetItem request (projected to the status attributes for status_only),
+with UnprocessedKeys retried rather than dropped.
+"""
+
+import importlib.util
+import os
+from unittest.mock import patch
+
+import boto3
+import pytest
+from moto import mock_aws
+
+_INDEX = os.path.join(os.path.dirname(__file__), "index.py")
+TABLE = "test-tracking"
+
+
+@pytest.fixture
+def mod():
+    with (
+        patch.dict(os.environ, {"TRACKING_TABLE": TABLE, "AWS_DEFAULT_REGION": "us-east-1"}),
+        mock_aws(),
+    ):
+        table = boto3.resource("dynamodb").create_table(
+            TableName=TABLE,
+            KeySchema=[
+                {"AttributeName": "PK", "KeyType": "HASH"},
+                {"AttributeName": "SK", "KeyType": "RANGE"},
+            ],
+            AttributeDefinitions=[
+                {"AttributeName": "PK", "AttributeType": "S"},
+                {"AttributeName": "SK", "AttributeType": "S"},
+            ],
+            BillingMode="PAY_PER_REQUEST",
+        )
+        with table.batch_writer() as writer:
+            for i in range(250):
+                writer.put_item(
+                    Item={
+                        "PK": f"doc#b1/doc-{i}.pdf",
+                        "SK": "none",
+                        "ObjectStatus": "COMPLETED" if i % 2 else "RUNNING",
+                        "QueuedTime": "2025-01-10T10:00:00+00:00",
+                        "WorkflowStartTime": "2025-01-10T10:00:05+00:00",
+                        "Sections": ["large", "payload"],
+                    }
+                )
+        spec = importlib.util.spec_from_file_location("lookup_index", _INDEX)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        yield module
+
+
+def test_batch_reads_use_batch_get_item(mod):
+    keys = [f"b1/doc-{i}.pdf" for i in range(250)]
+    dynamodb = mod._get_dynamodb()
+
+    with patch.object(dynamodb, "batch_get_item", wraps=dynamodb.batch_get_item) as bgi:
+        response = mod.handler({"object_keys": keys, "status_only": True}, None)
+
+    assert bgi.call_count == 3
+    request = bgi.call_args_list[0].kwargs["RequestItems"][TABLE]
+    assert "Sections" not in request["ExpressionAttributeNames"].values()
+    results = response["results"]
+    assert [r["object_key"] for r in results] == keys
+    assert results[1]["status"] == "COMPLETED"
+    assert results[0]["timing"]["elapsed"] == {"queue": 5000}
+
+
+def test_missing_and_duplicate_keys(mod):
+    keys = ["b1/doc-1.pdf", "b1/missing.pdf", "b1/doc-1.pdf"]
+
+    results = mod.handler({"object_keys": keys, "status_only": True}, None)["results"]
+
+    assert [r["status"] for r in results] == ["COMPLETED", "NOT_FOUND", "COMPLETED"]
+
+
+def test_unprocessed_keys_are_retried(mod, monkeypatch):
+    dynamodb = mod._get_dynamodb()
+    real = dynamodb.batch_get_item
+    calls = []
+
+    def throttled_once(RequestItems):
+        calls.append(RequestItems)
+        if len(calls) > 1:
+            return real(RequestItems=RequestItems)
+        keys = RequestItems[TABLE]["Keys"]
+        response = real(RequestItems={TABLE: {**RequestItems[TABLE], "Keys": keys[:1]}})
+        response["UnprocessedKeys"] = {TABLE: {**RequestItems[TABLE], "Keys": keys[1:]}}
+        return response
+
+    monkeypatch.setattr(mod.time, "sleep", lambda seconds: None)
+    with patch.object(dynamodb, "batch_get_item", side_effect=throttled_once):
+        results = mod.get_document_statuses(["b1/doc-1.pdf", "b1/doc-2.pdf"], True)
+
+    assert len(calls) == 2
+    assert [r["status"] for r in results] == ["COMPLETED", "RUNNING"]
+
+
+def test_keys_still_unprocessed_are_reported_as_errors(mod, monkeypatch):
+    dynamodb = mod._get_dynamodb()
+
+    def always_throttled(RequestItems):
+        return {"Responses": {TABLE: []}, "UnprocessedKeys": RequestItems}
+
+    monkeypatch.setattr(mod.time, "sleep", lambda seconds: None)
+    with patch.object(dynamodb, "batch_get_item", side_effect=always_throttled) as bgi:
+        results = mod.get_document_statuses(["b1/doc-1.pdf"], True)
+
+    assert bgi.call_count == mod.BATCH_GET_MAX_ATTEMPTS
+    assert results[0]["status"] == "ERROR"
+
+
+def test_single_lookup_is_unchanged(mod):
+    result = mod.handler({"object_key": "b1/doc-3.pdf", "status_only": True}, None)
+
+    assert result["status"] == "COMPLETED"
+    assert "object_key" not in result
@@ -19,6 +19,7 @@ import numpy as np
 from idp_common.bedrock.client import BedrockClient
 from idp_common.config import ConfigurationReader
 from idp_common.discovery.embedding_service import EmbeddingService
+from idp_common.utils import normalize_boolean_value
 
 from appsync_status import update_status
 
@@ -26,6 +27,8 @@ logger = logging.getLogger()
 logger.setLevel(os.environ.get("LOG_LEVEL", "INFO"))
 
 DISCOVERY_BUCKET = os.environ.get("DISCOVERY_BUCKET", "")
+# Shared across jobs so re-running discovery only embeds new or changed documents
+EMBEDDING_CACHE_PREFIX = "multi-doc-discovery/embedding-cache"
 
 
 def handler(event, context):
@@ -43,6 +46,8 @@ def handler(event, context):
         validKeys: list[str] - keys that were successfully embedded
         failedKeys: list[str] - keys that failed
         embeddingDim: int
+        numReused: int - embeddings reused from the embedding cache
+        numComputed: int - embeddings generated in this run
     """
     job_id = event["jobId"]
     bucket = event["bucket"]
@@ -65,12 +70,18 @@ def handler(event, context):
     bedrock_client = BedrockClient(region=os.environ.get("AWS_REGION"))
     embedding_model_id = config.get("embedding_model_id", "us.cohere.embed-v4:0")
     max_concurrent = int(config.get("max_concurrent_embeddings", 5))
+    cache_location = (
+        f"s3://{DISCOVERY_BUCKET}/{EMBEDDING_CACHE_PREFIX}"
+        if DISCOVERY_BUCKET and normalize_boolean_value(config.get("embedding_cache", True))
+        else None
+    )
 
     embedding_service = EmbeddingService(
         bedrock_client=bedrock_client,
         model_id=embedding_model_id,
         max_concurrent=max_concurrent,
         input_type="clustering",  # Use clustering input type for discovery embeddings
+        cache_location=cache_location,
     )
 
     # Generate embeddings
@@ -106,6 +117,8 @@ def handler(event, context):
         "embeddingDim": result.embedding_dim,
         "numValid": len(result.valid_keys),
         "numFailed": len(result.failed_keys),
+        "numReused": result.num_reused,
+        "numComputed": result.num_computed,
     }
 
 
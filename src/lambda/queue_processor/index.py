@@ -4,10 +4,14 @@
 import boto3
 import json
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from botocore.exceptions import ClientError
 import logging
-from typing import Dict, Any, Tuple
+from typing import Dict, Any, Optional, Tuple
+from idp_common.admission import AdmissionController, AdmissionTicket
 from idp_common.models import Document, Status
 from idp_common.docs_service import create_document_service
 from idp_common.config import ConfigurationManager
@@ -26,52 +30,107 @@ dynamodb = boto3.resource('dynamodb')
 document_service = create_document_service()
 concurrency_table = dynamodb.Table(os.environ['CONCURRENCY_TABLE'])
 state_machine_arn = os.environ['STATE_MACHINE_ARN']
-MAX_CONCURRENT = int(os.environ.get('MAX_CONCURRENT', '5'))
-COUNTER_ID = 'workflow_counter'
+admission = AdmissionController.from_environment(concurrency_table)
 CIRCUIT_BREAKER_ID = 'circuit_breaker'
 CIRCUIT_BREAKER_ENABLED = os.environ.get('CIRCUIT_BREAKER_ENABLED', 'false').lower() == 'true'
 DOCUMENT_QUEUE_URL = os.environ.get('DOCUMENT_QUEUE_URL', '')
 RECOVERY_TIMEOUT_SECONDS = int(os.environ.get('RECOVERY_TIMEOUT_SECONDS', '300'))
+# Records of one SQS batch started concurrently. The sfn and sqs clients are
+# shared (boto3 clients are thread-safe; the default connection pool holds 10
+# connections per client), but boto3 resources are not, so every worker thread
+# builds its own resource-backed objects (see _init_record_worker)
+RECORD_CONCURRENCY = max(int(os.environ.get('RECORD_CONCURRENCY', '10')), 1)
+# How long resolved routing info is trusted before its UpdatedAt stamp is
+# re-checked, and how long the active version is reused
+CONFIG_CACHE_TTL_SECONDS = int(os.environ.get('CONFIG_CACHE_TTL_SECONDS', '60'))
 
-def update_counter(increment: bool = True) -> bool:
+# Config routing cache, shared by the records of a batch and by warm invocations.
+# Each entry is read, refreshed and written under its own lock from _cache_lock(),
+# so a slow reload of one version never blocks records pinned to another.
+_config_lock = threading.Lock()
+_cache_locks: Dict[str, threading.Lock] = {}
+_active_version: Optional[Tuple[float, str]] = None
+_routing_cache: Dict[str, Dict[str, Any]] = {}
+
+# Per-thread boto3 resources: the handler's own thread uses the module-level
+# objects above, record workers get theirs from _init_record_worker
+_thread_state = threading.local()
+
+
+def _init_record_worker() -> None:
+    """Give a record worker thread its own resource-backed objects."""
+    table = boto3.resource('dynamodb').Table(os.environ['CONCURRENCY_TABLE'])
+    _thread_state.concurrency_table = table
+    _thread_state.admission = AdmissionController.from_environment(table)
+    _thread_state.document_service = create_document_service()
+
+
+# Created once per container so workers (and their resources) are reused by
+# warm invocations; threads only start when a batch first needs them
+_record_executor = ThreadPoolExecutor(
+    max_workers=RECORD_CONCURRENCY,
+    thread_name_prefix='record',
+    initializer=_init_record_worker,
+)
+
+
+def _concurrency_table():
+    return getattr(_thread_state, 'concurrency_table', concurrency_table)
+
+
+def _admission() -> AdmissionController:
+    return getattr(_thread_state, 'admission', admission)
+
+
+def _document_service():
+    return getattr(_thread_state, 'document_service', document_service)
+
+
+def _cache_lock(key: str) -> threading.Lock:
+    """Lock guarding one config cache entry, created on first use."""
+    with _config_lock:
+        return _cache_locks.setdefault(key, threading.Lock())
+
+
+def _message_attribute(record: Dict[str, Any], name: str) -> Optional[str]:
+    """String value of an SQS message attribute, or None if absent."""
+    attribute = record.get('messageAttributes', {}).get(name) or {}
+    return attribute.get('stringValue')
+
+
+def _as_int(value: Optional[str]) -> Optional[int]:
+    try:
+        return int(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+def acquire_admission(document: Document, record: Dict[str, Any]) -> Optional[AdmissionTicket]:
     """
-    Update the concurrency counter
-    
+    Reserve workflow capacity for a document
+
+    The weight uses the document's page count when it is already known (e.g. a
+    reprocess), otherwise the PageCount / ObjectSize hints queue_sender attached
+    to the message. The Priority attribute selects the admission lane.
+
     Args:
-        increment: Whether to increment (True) or decrement (False) the counter
-        
+        document: The Document about to start
+        record: The SQS message record it arrived in
+
     Returns:
-        bool: True if update successful, False if at limit
-        
+        AdmissionTicket if admitted, None if at capacity
+
     Raises:
         ClientError: If DynamoDB operation fails
     """
-    logger.info(f"Updating counter: increment={increment}, max={MAX_CONCURRENT}")
-    try:
-        update_args = {
-            'Key': {'counter_id': COUNTER_ID},
-            'UpdateExpression': 'ADD active_count :inc',
-            'ExpressionAttributeValues': {
-                ':inc': 1 if increment else -1,
-                ':max': MAX_CONCURRENT
-            },
-            'ReturnValues': 'UPDATED_NEW'
-        }
-        
-        if increment:
-            update_args['ConditionExpression'] = 'active_count < :max'
-        
-        logger.info(f"Counter update args: {update_args}")
-        response = concurrency_table.update_item(**update_args)
-        logger.info(f"Counter update response: {response}")
-        return True
-        
-    except ClientError as e:
-        if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
-            logger.warning("Concurrency limit reached")
-            return False
-        logger.error(f"Error updating counter: {e}")
-        raise
+    page_count = document.num_pages or _as_int(_message_attribute(record, 'PageCount'))
+    controller = _admission()
+    weight = controller.weight(
+        page_count=page_count,
+        object_size=_as_int(_message_attribute(record, 'ObjectSize')),
+    )
+    lane = (_message_attribute(record, 'Priority') or 'normal').lower()
+    return controller.try_acquire(document.id, weight=weight, lane=lane)
 
 
 def check_circuit_breaker() -> tuple[bool, str]:
@@ -87,7 +146,7 @@ def check_circuit_breaker() -> tuple[bool, str]:
         return True, 'DISABLED'
 
     try:
-        response = concurrency_table.get_item(
+        response = _concurrency_table().get_item(
             Key={'counter_id': CIRCUIT_BREAKER_ID},
             ProjectionExpression='#state',
             ExpressionAttributeNames={'#state': 'state'}
@@ -135,12 +194,103 @@ def extend_visibility_for_outage(receipt_handle: str) -> None:
         logger.warning(f"Failed to extend visibility for OPEN-state message: {e}")
 
 
-def start_workflow(document: Document) -> Dict[str, Any]:
+def get_config_manager(table_name: str) -> ConfigurationManager:
+    """
+    Return the calling thread's ConfigurationManager for the table
+
+    The manager wraps a boto3 DynamoDB resource, which must not be shared
+    between threads; what it reads is shared through the caches below.
+    """
+    managers = getattr(_thread_state, 'config_managers', None)
+    if managers is None:
+        managers = _thread_state.config_managers = {}
+    if table_name not in managers:
+        managers[table_name] = ConfigurationManager(table_name=table_name)
+    return managers[table_name]
+
+
+def resolve_active_version(manager: ConfigurationManager) -> str:
+    """
+    Resolve the active config version, reusing it for CONFIG_CACHE_TTL_SECONDS
+
+    resolve_active_version() scans every Config# row, so without the cache a
+    batch of 50 unpinned documents paid for 50 scans. An activation made in the
+    console reaches new documents within the TTL.
+    """
+    global _active_version
+    cached = _active_version
+    if cached and cached[0] > time.monotonic():
+        return cached[1]
+    # Records that miss together wait for one scan instead of each running it
+    with _cache_lock('active-version'):
+        cached = _active_version
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+        version = manager.resolve_active_version()
+        _active_version = (time.monotonic() + CONFIG_CACHE_TTL_SECONDS, version)
+        return version
+
+
+def get_routing(manager: ConfigurationManager, config_version: str) -> Dict[str, Any]:
+    """
+    Resolve the state machine routing flags for a config version
+
+    Loading the merged configuration (gzip decompress, defaults merge, pydantic
+    validation) just to read use_bda costs far more than starting the
+    execution, so the result is cached per version. After CONFIG_CACHE_TTL_SECONDS
+    a projected read of the version's UpdatedAt and BdaProjectArn decides whether
+    the cached flags still hold; only a saved or re-linked version is reloaded.
+
+    Returns:
+        Dict with use_bda and bda_project_arn
+
+    Raises:
+        Exception: If the configuration cannot be read (nothing is cached)
+    """
+    cached = _routing_cache.get(config_version)
+    if cached and cached['expires'] > time.monotonic():
+        return cached
+    # Only records pinned to this version wait while it is re-checked or reloaded
+    with _cache_lock(f'routing#{config_version}'):
+        now = time.monotonic()
+        cached = _routing_cache.get(config_version)
+        if cached and cached['expires'] > now:
+            return cached
+
+        metadata = manager.get_version_metadata(config_version)
+        stamp = (
+            (metadata.get('updatedAt'), metadata.get('bdaProjectArn'))
+            if metadata else None
+        )
+        if cached and stamp and stamp[0] and cached['stamp'] == stamp:
+            cached['expires'] = now + CONFIG_CACHE_TTL_SECONDS
+            return cached
+
+        # Read use_bda from the full config (properly decompresses gzip storage)
+        config = manager.get_merged_configuration(config_version)
+        use_bda = bool(getattr(config, 'use_bda', False)) if config else False
+        # Read per-version BDA project ARN (stored as top-level DynamoDB metadata)
+        bda_project_arn = manager.get_bda_project_arn(config_version) if use_bda else None
+        routing = {
+            'use_bda': use_bda,
+            'bda_project_arn': bda_project_arn,
+            'stamp': stamp,
+            'expires': now + CONFIG_CACHE_TTL_SECONDS,
+        }
+        if stamp:
+            _routing_cache[config_version] = routing
+        logger.info(f"Resolved routing for config version '{config_version}': use_bda={use_bda}")
+        return routing
+
+
+def start_workflow(document: Document, admission_ticket: Optional[AdmissionTicket] = None) -> Dict[str, Any]:
     """
     Start Step Functions workflow
     
     Args:
         document: The Document object to process
+        admission_ticket: Capacity reserved for the document; carried in the
+            execution input so workflow_tracker releases the same shard and weight
         
     Returns:
         Dict containing execution details
@@ -173,9 +323,9 @@ def start_workflow(document: Document) -> Dict[str, Any]:
     config_table_name = os.environ.get('CONFIG_TABLE')
     if not document.config_version and config_table_name:
         try:
-            document.config_version = ConfigurationManager(
-                table_name=config_table_name
-            ).resolve_active_version()
+            document.config_version = resolve_active_version(
+                get_config_manager(config_table_name)
+            )
             logger.info(
                 f"Pinned config version '{document.config_version}' for document "
                 f"{document.id}"
@@ -207,16 +357,12 @@ def start_workflow(document: Document) -> Dict[str, Any]:
             # the pipeline are guaranteed to come from the same config version.
             # (Still tolerant of an unset pin: the pin block above is best-effort.)
             config_version = getattr(document, 'config_version', None) or 'default'
-            manager = ConfigurationManager(table_name=config_table_name)
-
-            # Read use_bda from the full config (properly decompresses gzip storage)
-            config = manager.get_merged_configuration(config_version)
-            use_bda = getattr(config, 'use_bda', False) if config else False
-            compressed_document['use_bda'] = bool(use_bda)
+            routing = get_routing(get_config_manager(config_table_name), config_version)
+            use_bda = routing['use_bda']
+            compressed_document['use_bda'] = use_bda
 
-            # Read per-version BDA project ARN (stored as top-level DynamoDB metadata)
             if use_bda:
-                bda_project_arn = manager.get_bda_project_arn(config_version)
+                bda_project_arn = routing['bda_project_arn']
                 if bda_project_arn:
                     compressed_document['bda_project_arn'] = bda_project_arn
                     logger.info(f"Config version '{config_version}': use_bda=True, bda_project_arn={bda_project_arn}")
@@ -236,6 +382,9 @@ def start_workflow(document: Document) -> Dict[str, Any]:
         logger.warning("CONFIG_TABLE env var not set. Cannot determine use_bda flag. Defaulting to pipeline mode.")
         compressed_document['use_bda'] = False
 
+    if admission_ticket:
+        compressed_document['admission'] = admission_ticket.to_dict()
+
     event = {
         "document": compressed_document
     }
@@ -287,7 +436,7 @@ def process_message(record: Dict[str, Any]) -> Tuple[bool, str]:
         # Check if document has been aborted before starting workflow.
         # Must run before CB check so aborted docs can be acked regardless
         # of outage state.
-        current_doc = document_service.get_document(object_key)
+        current_doc = _document_service().get_document(object_key)
         if current_doc and current_doc.status == Status.ABORTED:
             logger.info(f"Document {object_key} was aborted by user, skipping workflow start")
             return True, message_id  # Return success to remove message from queue
@@ -309,26 +458,37 @@ def process_message(record: Dict[str, Any]) -> Tuple[bool, str]:
             document.trace_id = current_segment.trace_id
             logger.info(f"Updated {document.id} trace_id: {document.trace_id}")
 
-        # Try to increment counter
-        if not update_counter(increment=True):
+        # Try to reserve capacity
+        ticket = acquire_admission(document, record)
+        if ticket is None:
             logger.warning(f"Concurrency limit reached for {object_key}")
             return False, message_id
         
         try:
             # Start workflow with the document
-            execution = start_workflow(document)
+            execution = start_workflow(document, ticket)
             
-            # Update document status in document service
-            updated_doc = document_service.update_document(document)
+            # Update document status in document service. Only the fields set
+            # since queue_sender created the item are written.
+            updated_doc = _document_service().update_document(
+                document,
+                changed={
+                    "status",
+                    "start_time",
+                    "workflow_execution_arn",
+                    "config_version",
+                    "trace_id",
+                },
+            )
             logger.info(f"Document updated: {updated_doc}")
             
             return True, message_id
             
         except Exception as e:
             logger.error(f"Error processing {object_key}: {str(e)}", exc_info=True)
-            # Decrement counter on failure
+            # Release the reserved capacity on failure
             try:
-                update_counter(increment=False)
+                _admission().release(ticket)
             except Exception as counter_error:
                 logger.error(f"Failed to decrement counter: {counter_error}", exc_info=True)
             return False, message_id
@@ -350,12 +510,20 @@ def handler(event, context):
     logger.info(f"Processing event: {json.dumps(event)}")
     logger.info(f"Processing batch of {len(event['Records'])} messages")
     
-    failed_message_ids = []
-    
-    for record in event['Records']:
-        success, message_id = process_message(record)
-        if not success:
-            failed_message_ids.append(message_id)
+    # Worker threads join the handler's X-Ray subsegment
+    trace_entity = xray_recorder.get_trace_entity()
+
+    def process(record: Dict[str, Any]) -> Tuple[bool, str]:
+        xray_recorder.set_trace_entity(trace_entity)
+        return process_message(record)
+
+    records = event['Records']
+    if RECORD_CONCURRENCY > 1 and len(records) > 1:
+        results = list(_record_executor.map(process, records))
+    else:
+        results = [process_message(record) for record in records]
+
+    failed_message_ids = [message_id for success, message_id in results if not success]
     
     return {
         "batchItemFailures": [
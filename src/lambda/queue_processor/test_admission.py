@@ -0,0 +1,183 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""process_message() reserves weighted capacity and hands the ticket to the workflow.
+
+The ticket rides in the execution input so workflow_tracker releases exactly
+what was reserved: the same counter shard, by the same weight.
+"""
+
+import importlib.util
+import json
+import os
+import sys
+from unittest.mock import MagicMock, patch
+
+import pytest
+from idp_common import admission as real_admission
+
+_INDEX_PATH = os.path.join(os.path.dirname(__file__), "index.py")
+_MODULE_NAME = "queue_processor_index_admission_test"
+
+
+class _Table:
+    """ConcurrencyTable stand-in recording conditional ADD writes."""
+
+    def __init__(self):
+        self.counts = {}
+        self.calls = []
+
+    def update_item(self, **kwargs):
+        self.calls.append(kwargs)
+        key = kwargs["Key"]["counter_id"]
+        values = kwargs["ExpressionAttributeValues"]
+        if ":room" in values and self.counts.get(key, 0) > values[":room"]:
+            from botocore.exceptions import ClientError
+
+            raise ClientError(
+                {"Error": {"Code": "ConditionalCheckFailedException"}}, "UpdateItem"
+            )
+        delta = values.get(":inc", values.get(":dec"))
+        self.counts[key] = self.counts.get(key, 0) + delta
+        return {"Attributes": {"active_count": self.counts[key]}}
+
+
+@pytest.fixture
+def index_module(monkeypatch):
+    """Import index with idp_common (except admission) and boto3 mocked out."""
+    env_vars = {
+        "CONCURRENCY_TABLE": "test-concurrency",
+        "STATE_MACHINE_ARN": "arn:aws:states:us-east-1:123456789012:stateMachine:t",
+        "MAX_CONCURRENT": "5",
+        "ADMISSION_CAPACITY": "100",
+        "ADMISSION_WEIGHT": "pages",
+    }
+
+    fake_docs_service = MagicMock()
+    fake_docs_service.create_document_service = MagicMock(return_value=MagicMock())
+    fake_xray_core = MagicMock()
+
+    module_patches = {
+        "idp_common": MagicMock(),
+        "idp_common.models": MagicMock(),
+        "idp_common.docs_service": fake_docs_service,
+        "idp_common.config": MagicMock(),
+        "idp_common.admission": real_admission,
+        "aws_xray_sdk": MagicMock(),
+        "aws_xray_sdk.core": fake_xray_core,
+    }
+    for name, mod in module_patches.items():
+        monkeypatch.setitem(sys.modules, name, mod)
+
+    table = _Table()
+    with (
+        patch.dict(os.environ, env_vars, clear=False),
+        patch("boto3.resource") as mock_resource,
+        patch("boto3.client") as mock_client,
+    ):
+        os.environ.pop("CONFIG_TABLE", None)
+        os.environ.pop("WORKING_BUCKET", None)
+        mock_resource.return_value.Table.return_value = table
+        mock_client.return_value = MagicMock()
+
+        spec = importlib.util.spec_from_file_location(_MODULE_NAME, _INDEX_PATH)
+        assert spec and spec.loader
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[_MODULE_NAME] = module
+        spec.loader.exec_module(module)
+
+        module.sfn = MagicMock()
+        module.sfn.start_execution.return_value = {
+            "executionArn": "arn:aws:states:us-east-1:1:execution:t:e"
+        }
+        module.check_circuit_breaker = MagicMock(return_value=(True, "CLOSED"))
+        module.document_service.get_document.return_value = None
+        yield module, table
+        sys.modules.pop(_MODULE_NAME, None)
+
+
+def _record(index_module, num_pages=0, **attributes):
+    document = MagicMock()
+    document.id = document.input_key = "doc.pdf"
+    document.num_pages = num_pages
+    document.to_dict.return_value = {"document_id": "doc.pdf"}
+    index_module.Document.load_document.return_value = document
+    return {
+        "body": "{}",
+        "messageId": "m-1",
+        "receiptHandle": "r-1",
+        "messageAttributes": {
+            name: {"stringValue": value, "dataType": "String"}
+            for name, value in attributes.items()
+        },
+    }
+
+
+def _sfn_input(index_module):
+    kwargs = index_module.sfn.start_execution.call_args.kwargs
+    return json.loads(kwargs["input"])["document"]
+
+
+@pytest.mark.unit
+class TestAdmission:
+    def test_page_count_attribute_sets_weight_and_ticket(self, index_module):
+        module, table = index_module
+
+        assert module.process_message(_record(module, PageCount="40")) == (
+            True,
+            "m-1",
+        )
+
+        assert table.counts == {"workflow_counter": 40}
+        assert _sfn_input(module)["admission"] == {
+            "shard_id": "workflow_counter",
+            "weight": 40,
+            "lane": "normal",
+        }
+
+    def test_known_page_count_wins_over_object_size(self, index_module):
+        module, table = index_module
+
+        module.process_message(_record(module, num_pages=7, ObjectSize="99999999"))
+
+        assert table.counts == {"workflow_counter": 7}
+
+    def test_at_capacity_message_is_retried(self, index_module):
+        module, table = index_module
+        table.counts["workflow_counter"] = 90
+
+        assert module.process_message(_record(module, PageCount="20")) == (
+            False,
+            "m-1",
+        )
+        module.sfn.start_execution.assert_not_called()
+
+    def test_priority_attribute_selects_lane(self, index_module):
+        module, _ = index_module
+
+        module.process_message(_record(module, PageCount="1", Priority="HIGH"))
+
+        assert _sfn_input(module)["admission"]["lane"] == "high"
+
+    def test_failed_start_releases_the_reserved_weight(self, index_module):
+        module, table = index_module
+        module.sfn.start_execution.side_effect = RuntimeError("throttled")
+
+        assert module.process_message(_record(module, PageCount="12"))[0] is False
+
+        assert table.counts == {"workflow_counter": 0}
+        assert table.calls[-1]["ExpressionAttributeValues"] == {":dec": -12}
+
+    def test_started_document_writes_only_the_fields_set_here(self, index_module):
+        module, _ = index_module
+
+        module.process_message(_record(module, PageCount="3"))
+
+        kwargs = module.document_service.update_document.call_args.kwargs
+        assert kwargs["changed"] == {
+            "status",
+            "start_time",
+            "workflow_execution_arn",
+            "config_version",
+            "trace_id",
+        }
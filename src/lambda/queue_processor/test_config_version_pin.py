@@ -53,6 +53,7 @@ def index_module(monkeypatch):
         "idp_common.models": fake_models,
         "idp_common.docs_service": fake_docs_service,
         "idp_common.config": fake_config,
+        "idp_common.admission": MagicMock(),
         "aws_xray_sdk": MagicMock(),
         "aws_xray_sdk.core": fake_xray_core,
     }
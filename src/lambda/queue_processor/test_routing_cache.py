@@ -0,0 +1,240 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""Routing info is resolved once per config version, not once per record.
+
+start_workflow only needs `use_bda` and `bda_project_arn`, but reading them
+means loading, decompressing and validating the whole merged configuration.
+The queue processor caches the result per version (shared by the records of
+a batch and by warm invocations) and re-checks the version's UpdatedAt stamp
+once the TTL expires, so an edited version still takes effect.
+"""
+
+import importlib.util
+import os
+import sys
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+_INDEX_PATH = os.path.join(os.path.dirname(__file__), "index.py")
+_MODULE_NAME = "queue_processor_index_routing_test"
+
+
+@pytest.fixture
+def index_module(monkeypatch):
+    """Import index with idp_common + boto3 mocked out."""
+    env_vars = {
+        "CONCURRENCY_TABLE": "test-concurrency",
+        "STATE_MACHINE_ARN": "arn:aws:states:us-east-1:123456789012:stateMachine:t",
+        "MAX_CONCURRENT": "5",
+        "CONFIG_TABLE": "test-config-table",
+        "RECORD_CONCURRENCY": "4",
+    }
+
+    fake_docs_service = MagicMock()
+    fake_docs_service.create_document_service = MagicMock(return_value=MagicMock())
+    fake_xray_core = MagicMock()
+    fake_xray_core.xray_recorder.capture = lambda name: lambda fn: fn
+
+    module_patches = {
+        "idp_common": MagicMock(),
+        "idp_common.models": MagicMock(),
+        "idp_common.docs_service": fake_docs_service,
+        "idp_common.config": MagicMock(),
+        "idp_common.admission": MagicMock(),
+        "aws_xray_sdk": MagicMock(),
+        "aws_xray_sdk.core": fake_xray_core,
+    }
+    for name, mod in module_patches.items():
+        monkeypatch.setitem(sys.modules, name, mod)
+
+    with (
+        patch.dict(os.environ, env_vars, clear=False),
+        patch("boto3.resource"),
+        patch("boto3.client"),
+    ):
+        os.environ.pop("WORKING_BUCKET", None)
+        spec = importlib.util.spec_from_file_location(_MODULE_NAME, _INDEX_PATH)
+        assert spec and spec.loader
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[_MODULE_NAME] = module
+        spec.loader.exec_module(module)
+
+        module.sfn = MagicMock()
+        module.sfn.start_execution.return_value = {"executionArn": "arn:e"}
+        yield module
+        sys.modules.pop(_MODULE_NAME, None)
+
+
+class _Doc:
+    def __init__(self, config_version="v1"):
+        self.id = "doc.pdf"
+        self.config_version = config_version
+        self.status = None
+        self.start_time = None
+        self.workflow_execution_arn = None
+
+    def to_dict(self):
+        return {"document_id": self.id, "config_version": self.config_version}
+
+
+def _manager(index_module, use_bda=True, updated_at="2026-01-01T00:00:00Z"):
+    manager = MagicMock()
+    manager.resolve_active_version.return_value = "v1"
+    manager.get_merged_configuration.return_value = MagicMock(use_bda=use_bda)
+    manager.get_bda_project_arn.return_value = "arn:aws:bedrock:::project/p"
+    manager.get_version_metadata.return_value = {
+        "updatedAt": updated_at,
+        "bdaProjectArn": "arn:aws:bedrock:::project/p",
+    }
+    index_module.ConfigurationManager = MagicMock(return_value=manager)
+    return manager
+
+
+def _expire(index_module):
+    for entry in index_module._routing_cache.values():
+        entry["expires"] = 0
+    index_module._active_version = None
+
+
+@pytest.mark.unit
+class TestRoutingCache:
+    def test_batch_loads_each_version_once(self, index_module):
+        manager = _manager(index_module)
+
+        for _ in range(5):
+            index_module.start_workflow(_Doc())
+
+        manager.get_merged_configuration.assert_called_once_with("v1")
+        manager.get_bda_project_arn.assert_called_once_with("v1")
+        index_module.ConfigurationManager.assert_called_once()
+
+    def test_unchanged_stamp_extends_the_entry(self, index_module):
+        manager = _manager(index_module)
+        index_module.start_workflow(_Doc())
+        _expire(index_module)
+
+        index_module.start_workflow(_Doc())
+
+        assert manager.get_version_metadata.call_count == 2
+        manager.get_merged_configuration.assert_called_once()
+
+    def test_saved_version_is_reloaded_after_ttl(self, index_module):
+        manager = _manager(index_module, use_bda=True)
+        index_module.start_workflow(_Doc())
+        manager.get_merged_configuration.return_value = MagicMock(use_bda=False)
+        manager.get_version_metadata.return_value = {
+            "updatedAt": "2026-02-01T00:00:00Z",
+            "bdaProjectArn": "arn:aws:bedrock:::project/p",
+        }
+        _expire(index_module)
+
+        index_module.start_workflow(_Doc())
+
+        assert manager.get_merged_configuration.call_count == 2
+        assert index_module._routing_cache["v1"]["use_bda"] is False
+
+    def test_version_without_stamp_reloads_after_ttl(self, index_module):
+        manager = _manager(index_module, updated_at=None)
+        index_module.start_workflow(_Doc())
+        _expire(index_module)
+
+        index_module.start_workflow(_Doc())
+
+        assert manager.get_merged_configuration.call_count == 2
+
+    def test_failed_load_is_not_cached(self, index_module):
+        manager = _manager(index_module)
+        manager.get_merged_configuration.side_effect = [RuntimeError("x"), None]
+
+        index_module.start_workflow(_Doc())
+        index_module.start_workflow(_Doc())
+
+        assert manager.get_merged_configuration.call_count == 2
+
+    def test_active_version_is_resolved_once_per_ttl(self, index_module):
+        manager = _manager(index_module)
+
+        for _ in range(3):
+            index_module.start_workflow(_Doc(config_version=None))
+
+        manager.resolve_active_version.assert_called_once()
+
+
+@pytest.mark.unit
+class TestConcurrentBatch:
+    def test_records_are_processed_concurrently(self, index_module):
+        barrier = threading.Barrier(4, timeout=5)
+
+        def process(record):
+            barrier.wait()  # deadlocks unless four records run at once
+            return record["messageId"] != "m-2", record["messageId"]
+
+        index_module.process_message = process
+        records = [{"messageId": f"m-{i}"} for i in range(4)]
+
+        result = index_module.handler({"Records": records}, None)
+
+        assert result == {"batchItemFailures": [{"itemIdentifier": "m-2"}]}
+
+    def test_worker_threads_get_their_own_resources(self, index_module):
+        index_module.create_document_service = MagicMock(
+            side_effect=lambda: MagicMock()
+        )
+        barrier = threading.Barrier(4, timeout=5)
+        seen = []
+
+        def process(record):
+            barrier.wait()
+            seen.append(
+                (index_module._concurrency_table(), index_module._document_service())
+            )
+            return True, record["messageId"]
+
+        index_module.process_message = process
+        records = [{"messageId": f"m-{i}"} for i in range(4)]
+        with patch("boto3.resource", side_effect=lambda *a, **k: MagicMock()):
+            index_module.handler({"Records": records}, None)
+
+        tables = {id(table) for table, _ in seen}
+        services = {id(service) for _, service in seen}
+        assert len(tables) == len(services) == 4
+        assert id(index_module.concurrency_table) not in tables
+
+    def test_reloading_one_version_does_not_block_another(self, index_module):
+        manager = _manager(index_module)
+        loading, release = threading.Event(), threading.Event()
+
+        def load(version):
+            if version == "slow":
+                loading.set()
+                assert release.wait(5)
+            return MagicMock(use_bda=False)
+
+        manager.get_merged_configuration.side_effect = load
+        slow = threading.Thread(target=index_module.get_routing, args=(manager, "slow"))
+        slow.start()
+        assert loading.wait(5)
+
+        assert index_module.get_routing(manager, "fast")["use_bda"] is False
+
+        release.set()
+        slow.join(5)
+
+    def test_concurrent_misses_load_a_version_once(self, index_module):
+        manager = _manager(index_module)
+        barrier = threading.Barrier(4, timeout=5)
+
+        def route():
+            barrier.wait()
+            index_module.get_routing(manager, "v1")
+
+        threads = [threading.Thread(target=route) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+
+        manager.get_merged_configuration.assert_called_once_with("v1")
@@ -143,6 +143,18 @@ def handler(event, context):
             "ObjectKey": {"StringValue": object_key, "DataType": "String"},
         },
     }
+    # Admission hints read by queue_processor (see idp_common.admission)
+    for name, key, data_type in (
+        ("ObjectSize", "object_size", "Number"),
+        ("PageCount", "page_count", "Number"),
+        ("Priority", "priority", "String"),
+    ):
+        value = document.metadata.get(key)
+        if value is not None:
+            message["MessageAttributes"][name] = {
+                "StringValue": str(value),
+                "DataType": data_type,
+            }
     logger.info(f"Sending document to SQS queue: {object_key}")
     response = sqs.send_message(**message)
     logger.info(f"SQS response: {response}")
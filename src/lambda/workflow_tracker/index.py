@@ -9,6 +9,7 @@ import logging
 from idp_common.models import Document, Status, Page, Section  # type: ignore[import-untyped]
 from idp_common.docs_service import create_document_service  # type: ignore[import-untyped]
 from idp_common.document_versions import build_run_id, snapshot_output_versions  # type: ignore[import-untyped]
+from idp_common import admission  # type: ignore[import-untyped]
 from botocore.exceptions import ClientError
 from typing import Dict, Any, Optional
 
@@ -44,7 +45,6 @@ lambda_client = boto3.client("lambda")
 sns = boto3.client("sns")
 document_service = create_document_service()
 concurrency_table: Table = dynamodb.Table(os.environ["CONCURRENCY_TABLE"])
-COUNTER_ID = "workflow_counter"
 CIRCUIT_BREAKER_ID = "circuit_breaker"
 CIRCUIT_BREAKER_ENABLED = (
     os.environ.get("CIRCUIT_BREAKER_ENABLED", "false").lower() == "true"
@@ -116,6 +116,9 @@ def update_document_completion(
         status=doc_status,
         completion_time=datetime.now(timezone.utc).isoformat(),
     )
+    # The fallback document only knows its status and completion time; writing
+    # it whole would reset counters such as ConfidenceAlertCount on the item.
+    changed = {"status", "completion_time"}
 
     # Get sections, pages, and metering data if workflow succeeded
     if workflow_status == "SUCCEEDED" and output_data:
@@ -197,6 +200,10 @@ def update_document_completion(
             )
             processed_doc.completion_time = datetime.now(timezone.utc).isoformat()
             document = processed_doc
+            # The final document is written whole: the pipeline's step-start
+            # writes send only their status, so this is where pages, hook
+            # changes and late results (summary, evaluation) all land.
+            changed = None
 
         except Exception as e:
             logger.error(f"Could not extract document data: {e}", exc_info=True)
@@ -207,7 +214,7 @@ def update_document_completion(
         f"Updating document via document service with {len(document.metering)} metering entries "
         f"and {len(document.sections)} sections"
     )
-    updated_doc = document_service.update_document(document)
+    updated_doc = document_service.update_document(document, changed=changed)
 
     # Save reporting data to reporting bucket if available
     if REPORTING_BUCKET and SAVE_REPORTING_FUNCTION_NAME:
@@ -409,9 +416,13 @@ def put_latency_metrics(document: Document) -> None:
         raise
 
 
-def decrement_counter() -> Optional[int]:
+def decrement_counter(admission_data: Optional[Dict[str, Any]] = None) -> Optional[int]:
     """
-    Decrement the concurrency counter
+    Release the capacity queue_processor reserved for the execution
+
+    Args:
+        admission_data: The admission ticket from the execution input; executions
+            started without one were charged 1 on the original workflow_counter
 
     Returns:
         The new counter value or None if operation failed
@@ -419,14 +430,9 @@ def decrement_counter() -> Optional[int]:
     Note: This function handles its own errors
     """
     try:
-        logger.info("Decrementing concurrency counter")
-        response = concurrency_table.update_item(
-            Key={"counter_id": COUNTER_ID},
-            UpdateExpression="ADD active_count :dec",
-            ExpressionAttributeValues={":dec": -1},
-            ReturnValues="UPDATED_NEW",
-        )
-        new_count = response.get("Attributes", {}).get("active_count")
+        ticket = admission.AdmissionTicket.from_dict(admission_data)
+        logger.info(f"Decrementing concurrency counter: {ticket}")
+        new_count = admission.release(concurrency_table, ticket)
         logger.info(f"Counter decremented. New value: {new_count}")
         return new_count
     except ClientError as e:
@@ -527,6 +533,7 @@ def notify_circuit_breaker_success() -> None:
 def handler(event, context):
     logger.info(f"Processing event: {json.dumps(event)}")
     counter_value = None
+    admission_data = None
 
     try:
         # Extract data from event
@@ -540,6 +547,7 @@ def handler(event, context):
         try:
             if "document" in input_data:
                 object_key = input_data["document"]["document_id"]
+                admission_data = input_data["document"].get("admission")
             else:
                 raise ValueError("Unable to find document_id in input")
         except (KeyError, TypeError) as e:
@@ -598,7 +606,7 @@ def handler(event, context):
             )
 
         # Always decrement counter
-        counter_value = decrement_counter()
+        counter_value = decrement_counter(admission_data)
 
         return {
             "statusCode": 200,
@@ -616,5 +624,5 @@ def handler(event, context):
         if (
             counter_value is None
         ):  # semgrep-ignore: identical-is-comparison - Correctly checking for None.
-            decrement_counter()
+            decrement_counter(admission_data)
         raise
@@ -0,0 +1,97 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""The tracker releases the admission ticket queue_processor put in the input."""
+
+import importlib.util
+import json
+import os
+import sys
+from unittest.mock import MagicMock, patch
+
+import pytest
+from idp_common import admission as real_admission
+
+_INDEX_PATH = os.path.join(os.path.dirname(__file__), "index.py")
+_MODULE_NAME = "workflow_tracker_index_admission_test"
+
+
+@pytest.fixture
+def index_module(monkeypatch):
+    """Import index with idp_common (except admission) and boto3 mocked out."""
+    env_vars = {"CONCURRENCY_TABLE": "test-concurrency", "METRIC_NAMESPACE": "NS"}
+
+    fake_idp_common = MagicMock()
+    fake_idp_common.admission = real_admission
+    fake_docs_service = MagicMock()
+    fake_docs_service.create_document_service = MagicMock(return_value=MagicMock())
+
+    module_patches = {
+        "idp_common": fake_idp_common,
+        "idp_common.models": MagicMock(),
+        "idp_common.docs_service": fake_docs_service,
+        "idp_common.document_versions": MagicMock(),
+        "idp_common.admission": real_admission,
+    }
+    for name, mod in module_patches.items():
+        monkeypatch.setitem(sys.modules, name, mod)
+
+    with (
+        patch.dict(os.environ, env_vars, clear=False),
+        patch("boto3.resource") as mock_resource,
+        patch("boto3.client"),
+    ):
+        table = MagicMock()
+        table.update_item.return_value = {"Attributes": {"active_count": 3}}
+        mock_resource.return_value.Table.return_value = table
+
+        spec = importlib.util.spec_from_file_location(_MODULE_NAME, _INDEX_PATH)
+        assert spec and spec.loader
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[_MODULE_NAME] = module
+        spec.loader.exec_module(module)
+
+        module.update_document_completion = MagicMock()
+        yield module, table
+        sys.modules.pop(_MODULE_NAME, None)
+
+
+def _event(document):
+    return {
+        "detail": {
+            "input": json.dumps({"document": document}),
+            "status": "FAILED",
+        }
+    }
+
+
+@pytest.mark.unit
+class TestAdmissionRelease:
+    def test_releases_the_ticketed_shard_and_weight(self, index_module):
+        module, table = index_module
+        ticket = {"shard_id": "workflow_counter#3", "weight": 42, "lane": "low"}
+
+        result = module.handler(
+            _event({"document_id": "doc.pdf", "admission": ticket}), None
+        )
+
+        table.update_item.assert_called_once_with(
+            Key={"counter_id": "workflow_counter#3"},
+            UpdateExpression="ADD active_count :dec",
+            ExpressionAttributeValues={":dec": -42},
+            ReturnValues="UPDATED_NEW",
+        )
+        assert result["body"]["counter_value"] == 3
+
+    def test_execution_without_ticket_releases_original_counter(self, index_module):
+        """Executions started before the upgrade still drain the old counter."""
+        module, table = index_module
+
+        module.handler(_event({"document_id": "doc.pdf"}), None)
+
+        table.update_item.assert_called_once_with(
+            Key={"counter_id": "workflow_counter"},
+            UpdateExpression="ADD active_count :dec",
+            ExpressionAttributeValues={":dec": -1},
+            ReturnValues="UPDATED_NEW",
+        )
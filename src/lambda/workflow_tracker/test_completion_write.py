@@ -0,0 +1,85 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""update_document_completion writes the fallback document narrowly and the
+final pipeline document whole."""
+
+import importlib.util
+import os
+import sys
+from unittest.mock import MagicMock, patch
+
+import pytest
+from idp_common.models import Status
+
+_INDEX_PATH = os.path.join(os.path.dirname(__file__), "index.py")
+_MODULE_NAME = "workflow_tracker_index_completion_test"
+
+
+@pytest.fixture
+def index_module(monkeypatch):
+    """Import index with idp_common and boto3 mocked out."""
+    env_vars = {"CONCURRENCY_TABLE": "test-concurrency", "METRIC_NAMESPACE": "NS"}
+
+    fake_models = MagicMock()
+    fake_models.Status = Status
+    fake_docs_service = MagicMock()
+    fake_docs_service.create_document_service = MagicMock(return_value=MagicMock())
+
+    module_patches = {
+        "idp_common": MagicMock(),
+        "idp_common.models": fake_models,
+        "idp_common.docs_service": fake_docs_service,
+        "idp_common.document_versions": MagicMock(),
+    }
+    for name, mod in module_patches.items():
+        monkeypatch.setitem(sys.modules, name, mod)
+
+    with (
+        patch.dict(os.environ, env_vars, clear=False),
+        patch("boto3.resource"),
+        patch("boto3.client"),
+    ):
+        os.environ.pop("REPORTING_BUCKET", None)
+        spec = importlib.util.spec_from_file_location(_MODULE_NAME, _INDEX_PATH)
+        assert spec and spec.loader
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[_MODULE_NAME] = module
+        spec.loader.exec_module(module)
+        yield module
+        sys.modules.pop(_MODULE_NAME, None)
+
+
+@pytest.mark.unit
+class TestCompletionWrite:
+    def test_failed_workflow_writes_only_status_and_completion_time(
+        self, index_module
+    ):
+        index_module.update_document_completion("doc.pdf", "FAILED", {})
+
+        kwargs = index_module.document_service.update_document.call_args.kwargs
+        assert kwargs["changed"] == {"status", "completion_time"}
+
+    def test_succeeded_workflow_writes_the_final_document_whole(self, index_module):
+        processed = MagicMock()
+        processed.status = Status.COMPLETED
+        index_module.Document.load_document.return_value = processed
+
+        index_module.update_document_completion(
+            "doc.pdf", "SUCCEEDED", {"document": {"document_id": "doc.pdf"}}
+        )
+
+        args, kwargs = index_module.document_service.update_document.call_args
+        assert args == (processed,)
+        assert kwargs["changed"] is None
+        assert processed.status == Status.COMPLETED
+
+    def test_unreadable_output_falls_back_to_the_narrow_write(self, index_module):
+        index_module.Document.load_document.side_effect = ValueError("bad output")
+
+        index_module.update_document_completion(
+            "doc.pdf", "SUCCEEDED", {"document": {"document_id": "doc.pdf"}}
+        )
+
+        kwargs = index_module.document_service.update_document.call_args.kwargs
+        assert kwargs["changed"] == {"status", "completion_time"}